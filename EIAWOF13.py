@@ -1,63 +1,109 @@
 #!/usr/bin/env python3
-"""Controller for PBB EIAWOF13; keeps EIFMNP03/06/07 separate."""
+"""Controller for PBB EIAWOF13; runs EIFMNP03/06/07 as one in-process job graph.
+
+EIFMNP03 -> EIFMNP06, with EIFMNP07 alongside (it does not need IIS):
+
+* loanMM.sas7bdat is read once and shared by all three steps;
+* EIFMNP06 takes the IIS frame EIFMNP03 returns instead of re-reading
+  iisMM.csv (which EIFMNP03 still writes);
+* each step's wall time and peak RSS are printed at the end (see
+  steprunner; the peak includes whatever ran alongside).
+"""
 from __future__ import annotations
 
 import argparse
+import importlib
 import os
-import subprocess
 import sys
 from datetime import date, timedelta
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from steprunner import InputCache, Step, StepInputs, run_steps
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_BASE = Path("Data_Warehouse/MIS/XMIS/input/prod")
 DEFAULT_OUTPUT_DIR = DEFAULT_BASE / "output"
 SCHEDULED_DAY = 27
+LOAN_PATTERN = "loan{mm}.sas7bdat"
+
+
+def load_program(program: str) -> ModuleType:
+    """Import a step module under its mainframe (upper-case) or lower-case name."""
+    for name in (program, program.lower()):
+        try:
+            return importlib.import_module(name)
+        except ModuleNotFoundError as error:
+            if error.name != name:
+                raise
+    raise SystemExit(
+        f"EIAWOF13: program module not found: {program} (searched {SCRIPT_DIR})"
+    )
 
 
-def run(
+def announced(
     program: str,
-    environment: dict[str, str] | None = None,
-) -> None:
-    candidates = [
-        SCRIPT_DIR / (program + ".py"),
-        SCRIPT_DIR / (program.lower() + ".py"),
+    action: Callable[[StepInputs], Any],
+) -> Callable[[StepInputs], Any]:
+    def step(inputs: StepInputs) -> Any:
+        # One write per line, so lines from parallel steps do not interleave.
+        sys.stdout.write(f"EIAWOF13: starting {program}\n")
+        result = action(inputs)
+        sys.stdout.write(f"EIAWOF13: {program} completed\n")
+        return result
+
+    return step
+
+
+def build_steps(
+    input_dir: Path,
+    output_dir: Path,
+    branch_map: Path | None,
+    month: str,
+) -> tuple[list[Step], ModuleType]:
+    """The EIAWOF13 job graph, and the module whose read_sas loads its inputs."""
+    eifmnp03 = load_program("EIFMNP03")
+    eifmnp06 = load_program("EIFMNP06")
+    eifmnp07 = load_program("EIFMNP07")
+
+    common = ["--input-dir", str(input_dir)]
+    if branch_map:
+        common.extend(["--branch-map", str(branch_map)])
+
+    loan = LOAN_PATTERN.format(mm=month)
+    args03 = eifmnp03.parse_args(common + ["--output-dir", str(output_dir / "eifmnp03")])
+    args06 = eifmnp06.parse_args(common + ["--output-dir", str(output_dir / "eifmnp06")])
+    args07 = eifmnp07.parse_args(common + ["--output-dir", str(output_dir / "eifmnp07")])
+
+    steps = [
+        Step(
+            "EIFMNP03",
+            announced("EIFMNP03", lambda inputs: eifmnp03.run(args03, loan=inputs.frame(loan))),
+            {loan: None},
+        ),
+        # NPL.IISMM is created by EIFMNP03 and consumed by EIFMNP06.
+        Step(
+            "EIFMNP06",
+            announced(
+                "EIFMNP06",
+                lambda inputs: eifmnp06.run(
+                    args06,
+                    loan=inputs.frame(loan),
+                    iis=inputs.result("EIFMNP03"),
+                ),
+            ),
+            {loan: None},
+            after=("EIFMNP03",),
+        ),
+        Step(
+            "EIFMNP07",
+            announced("EIFMNP07", lambda inputs: eifmnp07.run(args07, loan=inputs.frame(loan))),
+            {loan: None},
+        ),
     ]
-
-    script = next(
-        (candidate for candidate in candidates if candidate.is_file()),
-        None,
-    )
-
-    if script is None:
-        searched = ", ".join(str(candidate) for candidate in candidates)
-        raise SystemExit(
-            f"EIAWOF13: program file not found; searched: {searched}"
-        )
-
-    print(f"EIAWOF13: starting {program}")
-
-    child_environment = os.environ.copy()
-    if environment:
-        child_environment.update(environment)
-
-    # Input/output paths are passed through environment variables.
-    # This prevents sitecustomize from using paths containing "/" in
-    # its generated log filename.
-    result = subprocess.run(
-        [sys.executable, str(script)],
-        env=child_environment,
-        check=False,
-    )
-
-    if result.returncode:
-        raise SystemExit(
-            f"EIAWOF13: {program} failed "
-            f"with return code {result.returncode}"
-        )
-
-    print(f"EIAWOF13: {program} completed")
+    return steps, eifmnp03
 
 
 def main() -> None:
@@ -71,7 +117,7 @@ def main() -> None:
         return
 
     parser = argparse.ArgumentParser(
-        description="Run separate PBB EIFMNP03/06/07 steps"
+        description="Run the PBB EIFMNP03/06/07 steps"
     )
     parser.add_argument(
         "--input-dir",
@@ -104,49 +150,26 @@ def main() -> None:
     print(f"EIAWOF13: input directory  = {args.input_dir}")
     print(f"EIAWOF13: output directory = {args.output_dir}")
 
-    step03 = args.output_dir / "eifmnp03"
-    step06 = args.output_dir / "eifmnp06"
-    step07 = args.output_dir / "eifmnp07"
-
-    base_environment = {
-        "XMIS_INPUT_DIR": str(args.input_dir),
-    }
-
-    if args.branch_map:
-        base_environment["XMIS_BRANCH_MAP"] = str(
-            args.branch_map.resolve()
-        )
-
-    run(
-        "EIFMNP03",
-        {
-            **base_environment,
-            "XMIS_OUTPUT_DIR": str(step03),
-        },
+    # loanMM is read once per run; the Parquet cache (see sasio) lets a
+    # rerun, and other jobs reading the same month, skip SAS7BDAT parsing.
+    os.environ.setdefault(
+        "XMIS_SAS_CACHE_DIR",
+        str(args.output_dir / "sascache"),
     )
 
     month = f"{(today - timedelta(days=1)).month:02d}"
+    branch_map = args.branch_map.resolve() if args.branch_map else None
+    steps, eifmnp03 = build_steps(args.input_dir, args.output_dir, branch_map, month)
 
-    # IIS current month is produced by EIFMNP03,
-    # then passed to EIFMNP06.
-    run(
-        "EIFMNP06",
-        {
-            **base_environment,
-            "XMIS_OUTPUT_DIR": str(step06),
-            "XMIS_IIS_FILE": str(step03 / f"iis{month}.csv"),
-        },
-    )
-
-    run(
-        "EIFMNP07",
-        {
-            **base_environment,
-            "XMIS_OUTPUT_DIR": str(step07),
-        },
+    timings = run_steps(
+        steps,
+        InputCache(args.input_dir, steps, reader=eifmnp03.read_sas),
+        max_workers=2,
     )
 
-    print("EIAWOF13: all three separate PBB steps completed")
+    for timing in timings:
+        print(f"EIAWOF13: {timing}")
+    print("EIAWOF13: all three PBB steps completed")
 
 
 if __name__ == "__main__":
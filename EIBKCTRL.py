@@ -147,52 +147,32 @@ def write_sas7bdat(
     misc_rows: list[dict[str, str]],
     cisfmt_rows: list[dict[str, str]],
 ) -> dict[str, Path]:
-    """Write matching SAS7BDAT datasets using the configured SAS runtime."""
+    """Queue matching SAS7BDAT datasets on the shared SAS batch and run it."""
     try:
         import pandas as pd
-        import saspy
+        from sasbatch import shared_batch
     except ImportError as error:
-        raise RuntimeError(
-            "Writing SAS7BDAT requires pandas, saspy, and a configured SAS runtime"
-        ) from error
+        raise RuntimeError("Writing SAS7BDAT requires pandas") from error
 
     frames = {
-        f"occup_{suffix}": ("occup", pd.DataFrame(occup_rows, columns=OCCUP_COLUMNS)),
-        f"misc_{suffix}": ("misc", pd.DataFrame(misc_rows, columns=MISC_COLUMNS)),
-        f"cisfmt_{suffix}": ("cisfmt", pd.DataFrame(cisfmt_rows, columns=CISFMT_COLUMNS)),
+        "occup": pd.DataFrame(occup_rows, columns=OCCUP_COLUMNS),
+        "misc": pd.DataFrame(misc_rows, columns=MISC_COLUMNS),
+        "cisfmt": pd.DataFrame(cisfmt_rows, columns=CISFMT_COLUMNS),
     }
-    for _, (schema, frame) in frames.items():
+    batch = shared_batch()
+    destinations = {}
+    for schema, frame in frames.items():
         for column, length in CHAR_LENGTHS[schema].items():
             frame[column] = frame[column].fillna("").astype(str).str.slice(0, length)
-
-    sas = saspy.SASsession()
-    try:
-        sas_path = str(output_dir).replace("'", "''")
-        result = sas.submit(f"libname BKCTRL '{sas_path}';")
-        if "ERROR:" in result.get("LOG", ""):
-            raise RuntimeError(result["LOG"])
-
-        for table, (schema, frame) in frames.items():
-            sas.df2sd(
-                frame,
-                table=table,
-                libref="BKCTRL",
-                char_lengths=CHAR_LENGTHS[schema],
-            )
-    finally:
-        sas.endsas()
-
-    destinations = {
-        "occup_sas": output_dir / f"occup_{suffix}.sas7bdat",
-        "misc_sas": output_dir / f"misc_{suffix}.sas7bdat",
-        "cisfmt_sas": output_dir / f"cisfmt_{suffix}.sas7bdat",
-    }
-    missing = [path for path in destinations.values() if not path.is_file()]
-    if missing:
-        raise RuntimeError(
-            "SAS did not create the expected file(s): "
-            + ", ".join(str(path) for path in missing)
+        destinations[f"{schema}_sas"] = batch.dataset(
+            "BKCTRL",
+            output_dir,
+            f"{schema}_{suffix}",
+            frame,
+            char_lengths=CHAR_LENGTHS[schema],
         )
+    for timing in batch.run():
+        print(timing)
     return destinations
 
 
@@ -1,6 +1,9 @@
 import os
 import pandas as pd
 
+from reportwriter import ddmmyy, money, text, whole, write_report
+from steprunner import InputCache, Step, run_steps, standalone_inputs
+
 # ============================================================
 # CONFIG
 # ============================================================
@@ -26,7 +29,7 @@ OUTPUT_REPORTS = [
 # MAIN (JCL replacement)
 # ============================================================
 
-def main():
+def main(max_workers=None):
     os.makedirs(OUTPUT, exist_ok=True)
 
     # ---- DELETE STEP (IEFBR14 equivalent) ----
@@ -36,38 +39,55 @@ def main():
         except FileNotFoundError:
             pass
 
-    # ---- RUN JOBS IN JCL ORDER ----
-    eibmrb01()
-    eibmrb02()
-    eibmrb03()
-    eibmrb04()
-    eibmrb05()
-    eibmrb06()
-    eibmrb07()
-    eibmrb08()
-    eibmrb09()
+    # ---- RUN JOBS (independent steps, shared inputs read once) ----
+    return run_steps(STEPS, InputCache(INPUT, STEPS), max_workers)
+
+
+def run_step(name):
+    """Run one step on its own, reading only its declared inputs."""
+    step = next(step for step in STEPS if step.name == name)
+    step.run(standalone_inputs(INPUT, step))
 
 
 # ============================================================
 # COMMON: REPORT DATE
 # ============================================================
 
-def get_reptdate():
-    return pd.read_parquet(f"{INPUT}/DEPO_REPTDATE.parquet").iloc[0]["REPTDATE"]
+def get_reptdate(inputs):
+    return inputs.frame("DEPO_REPTDATE.parquet").iloc[0]["REPTDATE"]
+
+
+def report_header(report_id, title, rpt, heading):
+    return [f"REPORT ID : {report_id}", title, f"AS AT {rpt:%d/%m/%Y}", "", heading]
 
 
 # ============================================================
 # EIBMRB01
 # ============================================================
 
-def eibmrb01():
-    rpt = get_reptdate()
+def merge_fcy(fcyfd, fcy):
+    """DATA FCYFD; MERGE FCYFD(IN=A) FCY; BY ACCTNO; IF A;
+
+    As in the SAS merge, FCY's values of the variables both sides carry
+    (CUSTCODE, OPENDT) replace FCYFD's for accounts found in FCY, even when
+    they are missing there; other accounts keep FCYFD's own values.
+    """
+    df = fcyfd.merge(fcy, on="ACCTNO", how="left", suffixes=("", "_FCY"), indicator=True)
+    matched = df.pop("_merge").eq("both")
+    for column in fcy.columns.drop("ACCTNO"):
+        if f"{column}_FCY" in df:
+            df[column] = df.pop(f"{column}_FCY").where(matched, df[column])
+    return df
 
-    misfd = pd.read_parquet(f"{INPUT}/MISFD_FCYFD.parquet")
-    mis2fd = pd.read_parquet(f"{INPUT}/MIS2FD_FCYFD.parquet")
+
+def eibmrb01(inputs):
+    rpt = get_reptdate(inputs)
+
+    misfd = inputs.frame("MISFD_FCYFD.parquet")
+    mis2fd = inputs.frame("MIS2FD_FCYFD.parquet")
 
     fcy = mis2fd[["ACCTNO", "CUSTCODE", "OPENDT"]]
-    df = misfd.merge(fcy, on="ACCTNO", how="left")
+    df = merge_fcy(misfd, fcy)
 
     df = df[(df["CURCODE"] != "MYR") & (df["CURBAL"] > 0)]
     df["CURBAL"] = df["CURBAL"] / 1000
@@ -87,27 +107,33 @@ def eibmrb01():
 
     out.to_parquet(f"{OUTPUT}/EIBMRB01.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB01_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB01\n")
-        f.write("DAILY TOTAL OUTSTANDING BALANCE/ACCOUNT ON FCY FD\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("DATE;CUR;TOTAL AMT (RM 000);NO OF ACCT\n")
-        for _, r in out.iterrows():
-            f.write(
-                f"{r.REPTDATE:%d/%m/%Y};{r.CURCODE};"
-                f"{r.TOT_AMT_OS_RM:,.2f};{int(r.NO_OF_ACCT)}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB01_REPORT.txt",
+        report_header(
+            "EIBMRB01",
+            "DAILY TOTAL OUTSTANDING BALANCE/ACCOUNT ON FCY FD",
+            rpt,
+            "DATE;CUR;TOTAL AMT (RM 000);NO OF ACCT",
+        ),
+        out,
+        [
+            ("REPTDATE", ddmmyy),
+            ("CURCODE", text),
+            ("TOT_AMT_OS_RM", money),
+            ("NO_OF_ACCT", whole),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB02
 # ============================================================
 
-def eibmrb02():
-    rpt = get_reptdate()
+def eibmrb02(inputs):
+    rpt = get_reptdate(inputs)
 
-    depo = pd.read_parquet(f"{INPUT}/DEPO.parquet")
-    idepo = pd.read_parquet(f"{INPUT}/IDEPO.parquet")
+    depo = inputs.frame("DEPO.parquet")
+    idepo = inputs.frame("IDEPO.parquet")
 
     df = pd.concat([depo, idepo], ignore_index=True)
     df = df[df["CURBAL"] > 0]
@@ -118,28 +144,30 @@ def eibmrb02():
 
     out.to_parquet(f"{OUTPUT}/EIBMRB02.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB02_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB02\n")
-        f.write("MONTHLY SA/CA/FD OUTSTANDING AMOUNT\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;TOTAL (RM)\n")
-        for _, r in out.iterrows():
-            f.write(f"{r.BRANCH};{r.TOT_OUTSTANDING:,.2f}\n")
+    write_report(
+        f"{OUTPUT}/EIBMRB02_REPORT.txt",
+        report_header("EIBMRB02", "MONTHLY SA/CA/FD OUTSTANDING AMOUNT", rpt, "BRANCH;TOTAL (RM)"),
+        out,
+        [
+            ("BRANCH", text),
+            ("TOT_OUTSTANDING", money),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB03
 # ============================================================
 
-def eibmrb03():
-    rpt = get_reptdate()
+def eibmrb03(inputs):
+    rpt = get_reptdate(inputs)
 
     cur = pd.concat([
-        pd.read_parquet(f"{INPUT}/DEPO_CURRENT.parquet"),
-        pd.read_parquet(f"{INPUT}/IDEPO_CURRENT.parquet")
+        inputs.frame("DEPO_CURRENT.parquet"),
+        inputs.frame("IDEPO_CURRENT.parquet")
     ])
 
-    cis = pd.read_parquet(f"{INPUT}/CIS_DEPOSIT.parquet")
+    cis = inputs.frame("CIS_DEPOSIT.parquet")
 
     cur = cur[
         (cur["CURCODE"] == "MYR") &
@@ -152,31 +180,38 @@ def eibmrb03():
 
     cur.to_parquet(f"{OUTPUT}/EIBMRB03.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB03_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB03\n")
-        f.write("LISTING OF NEW CA OPENED FOR THE MONTH\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;ACCTNO;NAME;BAL;OPEN DATE\n")
-        for _, r in cur.iterrows():
-            f.write(
-                f"{r.BRANCH};{r.ACCTNO};{r.CUSTNAME};"
-                f"{r.CURBAL:,.2f};{r.OPENDT:%d/%m/%Y}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB03_REPORT.txt",
+        report_header(
+            "EIBMRB03",
+            "LISTING OF NEW CA OPENED FOR THE MONTH",
+            rpt,
+            "BRANCH;ACCTNO;NAME;BAL;OPEN DATE",
+        ),
+        cur,
+        [
+            ("BRANCH", text),
+            ("ACCTNO", text),
+            ("CUSTNAME", text),
+            ("CURBAL", money),
+            ("OPENDT", ddmmyy),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB04
 # ============================================================
 
-def eibmrb04():
-    rpt = get_reptdate()
+def eibmrb04(inputs):
+    rpt = get_reptdate(inputs)
 
     fd = pd.concat([
-        pd.read_parquet(f"{INPUT}/DEPO_FD.parquet"),
-        pd.read_parquet(f"{INPUT}/IDEPO_FD.parquet")
+        inputs.frame("DEPO_FD.parquet"),
+        inputs.frame("IDEPO_FD.parquet")
     ])
 
-    cis = pd.read_parquet(f"{INPUT}/CIS_DEPOSIT.parquet")
+    cis = inputs.frame("CIS_DEPOSIT.parquet")
 
     fd = fd[
         (fd["CURCODE"] == "MYR") &
@@ -188,29 +223,36 @@ def eibmrb04():
 
     fd.to_parquet(f"{OUTPUT}/EIBMRB04.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB04_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB04\n")
-        f.write("LISTING OF NEW FD OPENED FOR THE MONTH\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;ACCTNO;NAME;BAL;OPEN DATE\n")
-        for _, r in fd.iterrows():
-            f.write(
-                f"{r.BRANCH};{r.ACCTNO};{r.CUSTNAME};"
-                f"{r.CURBAL:,.2f};{r.OPENDT:%d/%m/%Y}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB04_REPORT.txt",
+        report_header(
+            "EIBMRB04",
+            "LISTING OF NEW FD OPENED FOR THE MONTH",
+            rpt,
+            "BRANCH;ACCTNO;NAME;BAL;OPEN DATE",
+        ),
+        fd,
+        [
+            ("BRANCH", text),
+            ("ACCTNO", text),
+            ("CUSTNAME", text),
+            ("CURBAL", money),
+            ("OPENDT", ddmmyy),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB05
 # ============================================================
 
-def eibmrb05():
-    rpt = get_reptdate()
+def eibmrb05(inputs):
+    rpt = get_reptdate(inputs)
 
     df = pd.concat([
-        pd.read_parquet(f"{INPUT}/DEPO.parquet"),
-        pd.read_parquet(f"{INPUT}/IDEPO.parquet"),
-        pd.read_parquet(f"{INPUT}/MISFD_FCYFD.parquet")
+        inputs.frame("DEPO.parquet"),
+        inputs.frame("IDEPO.parquet"),
+        inputs.frame("MISFD_FCYFD.parquet")
     ])
 
     out = df.groupby("BRANCH").agg(
@@ -219,24 +261,31 @@ def eibmrb05():
 
     out.to_parquet(f"{OUTPUT}/EIBMRB05.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB05_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB05\n")
-        f.write("MONTH END REPORT BY BRANCH (FCY FD & FCY CA)\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;TOTAL BALANCE\n")
-        for _, r in out.iterrows():
-            f.write(f"{r.BRANCH};{r.TOT_BALANCE:,.2f}\n")
+    write_report(
+        f"{OUTPUT}/EIBMRB05_REPORT.txt",
+        report_header(
+            "EIBMRB05",
+            "MONTH END REPORT BY BRANCH (FCY FD & FCY CA)",
+            rpt,
+            "BRANCH;TOTAL BALANCE",
+        ),
+        out,
+        [
+            ("BRANCH", text),
+            ("TOT_BALANCE", money),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB06
 # ============================================================
 
-def eibmrb06():
-    rpt = get_reptdate()
+def eibmrb06(inputs):
+    rpt = get_reptdate(inputs)
 
-    df = pd.read_parquet(f"{INPUT}/MISFD_FCYFD.parquet")
-    cis = pd.read_parquet(f"{INPUT}/CIS_DEPOSIT.parquet")
+    df = inputs.frame("MISFD_FCYFD.parquet")
+    cis = inputs.frame("CIS_DEPOSIT.parquet")
 
     df = df[
         (df["CURCODE"] != "MYR") &
@@ -248,31 +297,39 @@ def eibmrb06():
 
     df.to_parquet(f"{OUTPUT}/EIBMRB06.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB06_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB06\n")
-        f.write("LISTING OF NEW FCY FD OPENED FOR THE MONTH\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;ACCTNO;NAME;BAL;OPEN DATE;CUR\n")
-        for _, r in df.iterrows():
-            f.write(
-                f"{r.BRANCH};{r.ACCTNO};{r.CUSTNAME};"
-                f"{r.CURBAL:,.2f};{r.OPENDT:%d/%m/%Y};{r.CURCODE}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB06_REPORT.txt",
+        report_header(
+            "EIBMRB06",
+            "LISTING OF NEW FCY FD OPENED FOR THE MONTH",
+            rpt,
+            "BRANCH;ACCTNO;NAME;BAL;OPEN DATE;CUR",
+        ),
+        df,
+        [
+            ("BRANCH", text),
+            ("ACCTNO", text),
+            ("CUSTNAME", text),
+            ("CURBAL", money),
+            ("OPENDT", ddmmyy),
+            ("CURCODE", text),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB07
 # ============================================================
 
-def eibmrb07():
-    rpt = get_reptdate()
+def eibmrb07(inputs):
+    rpt = get_reptdate(inputs)
 
     df = pd.concat([
-        pd.read_parquet(f"{INPUT}/DEPO_CURRENT.parquet"),
-        pd.read_parquet(f"{INPUT}/IDEPO_CURRENT.parquet")
+        inputs.frame("DEPO_CURRENT.parquet"),
+        inputs.frame("IDEPO_CURRENT.parquet")
     ])
 
-    cis = pd.read_parquet(f"{INPUT}/CIS_DEPOSIT.parquet")
+    cis = inputs.frame("CIS_DEPOSIT.parquet")
 
     df = df[
         (df["CURCODE"] != "MYR") &
@@ -284,26 +341,34 @@ def eibmrb07():
 
     df.to_parquet(f"{OUTPUT}/EIBMRB07.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB07_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB07\n")
-        f.write("LISTING OF NEW FCY CA OPENED FOR THE MONTH\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("BRANCH;ACCTNO;NAME;BAL;OPEN DATE;CUR\n")
-        for _, r in df.iterrows():
-            f.write(
-                f"{r.BRANCH};{r.ACCTNO};{r.CUSTNAME};"
-                f"{r.CURBAL:,.2f};{r.OPENDT:%d/%m/%Y};{r.CURCODE}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB07_REPORT.txt",
+        report_header(
+            "EIBMRB07",
+            "LISTING OF NEW FCY CA OPENED FOR THE MONTH",
+            rpt,
+            "BRANCH;ACCTNO;NAME;BAL;OPEN DATE;CUR",
+        ),
+        df,
+        [
+            ("BRANCH", text),
+            ("ACCTNO", text),
+            ("CUSTNAME", text),
+            ("CURBAL", money),
+            ("OPENDT", ddmmyy),
+            ("CURCODE", text),
+        ],
+    )
 
 
 # ============================================================
 # EIBMRB08
 # ============================================================
 
-def eibmrb08():
-    rpt = get_reptdate()
+def eibmrb08(inputs):
+    rpt = get_reptdate(inputs)
 
-    w = pd.read_parquet(f"{INPUT}/MIS_FDWDRW.parquet")
+    w = inputs.frame("MIS_FDWDRW.parquet")
 
     rm = w[w["CURCODE"] == "MYR"]
     fcy = w[w["CURCODE"] != "MYR"]
@@ -312,26 +377,32 @@ def eibmrb08():
     fcy.to_parquet(f"{OUTPUT}/EIBMRB8B.parquet", index=False)
 
     for name, df in [("EIBMRB8A", rm), ("EIBMRB8B", fcy)]:
-        with open(f"{OUTPUT}/{name}_REPORT.txt", "w") as f:
-            f.write(f"REPORT ID : {name}\n")
-            f.write("MONTHLY FD RECEIPTS WITHDRAWALS\n")
-            f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-            f.write("ACCTNO;AMOUNT;REASON;PRODUCT\n")
-            for _, r in df.iterrows():
-                f.write(
-                    f"{r.ACCTNO};{r.TRANAMT:,.2f};"
-                    f"{r.RSONCODE};{r.PRODCD}\n"
-                )
+        write_report(
+            f"{OUTPUT}/{name}_REPORT.txt",
+            report_header(
+                name,
+                "MONTHLY FD RECEIPTS WITHDRAWALS",
+                rpt,
+                "ACCTNO;AMOUNT;REASON;PRODUCT",
+            ),
+            df,
+            [
+                ("ACCTNO", text),
+                ("TRANAMT", money),
+                ("RSONCODE", text),
+                ("PRODCD", text),
+            ],
+        )
 
 
 # ============================================================
 # EIBMRB09
 # ============================================================
 
-def eibmrb09():
-    rpt = get_reptdate()
+def eibmrb09(inputs):
+    rpt = get_reptdate(inputs)
 
-    w = pd.read_parquet(f"{INPUT}/MIS_FDWDRW.parquet")
+    w = inputs.frame("MIS_FDWDRW.parquet")
     rm = w[w["CURCODE"] == "MYR"]
 
     out = rm.groupby(["RSONCODE", "PRODCD"]).agg(
@@ -341,16 +412,55 @@ def eibmrb09():
 
     out.to_parquet(f"{OUTPUT}/EIBMRB09.parquet", index=False)
 
-    with open(f"{OUTPUT}/EIBMRB09_REPORT.txt", "w") as f:
-        f.write("REPORT ID : EIBMRB09\n")
-        f.write("MONTHLY FD WITHDRAWALS BY PRODUCT TYPE\n")
-        f.write(f"AS AT {rpt:%d/%m/%Y}\n\n")
-        f.write("REASON;PRODUCT;COUNT;AMOUNT\n")
-        for _, r in out.iterrows():
-            f.write(
-                f"{r.RSONCODE};{r.PRODCD};"
-                f"{int(r.COUNT)};{r.AMOUNT:,.2f}\n"
-            )
+    write_report(
+        f"{OUTPUT}/EIBMRB09_REPORT.txt",
+        report_header(
+            "EIBMRB09",
+            "MONTHLY FD WITHDRAWALS BY PRODUCT TYPE",
+            rpt,
+            "REASON;PRODUCT;COUNT;AMOUNT",
+        ),
+        out,
+        [
+            ("RSONCODE", text),
+            ("PRODCD", text),
+            ("COUNT", whole),
+            ("AMOUNT", money),
+        ],
+    )
+
+
+# ============================================================
+# STEPS (inputs and the columns each step reads)
+# ============================================================
+
+REPTDATE = {"DEPO_REPTDATE.parquet": ["REPTDATE"]}
+CUSTNAME = {"CIS_DEPOSIT.parquet": ["ACCTNO", "CUSTNAME"]}
+BALANCES = ["BRANCH", "CURBAL"]
+
+STEPS = [
+    Step("EIBMRB01", eibmrb01, {
+        **REPTDATE,
+        "MISFD_FCYFD.parquet": ["REPTDATE", "ACCTNO", "CURCODE", "CURBAL", "CLOSEDAT", "CUSTCODE", "OPENDT"],
+        "MIS2FD_FCYFD.parquet": ["ACCTNO", "CUSTCODE", "OPENDT"],
+    }),
+    Step("EIBMRB02", eibmrb02, {**REPTDATE, "DEPO.parquet": BALANCES, "IDEPO.parquet": BALANCES}),
+    Step("EIBMRB03", eibmrb03, {
+        **REPTDATE, **CUSTNAME, "DEPO_CURRENT.parquet": None, "IDEPO_CURRENT.parquet": None,
+    }),
+    Step("EIBMRB04", eibmrb04, {**REPTDATE, **CUSTNAME, "DEPO_FD.parquet": None, "IDEPO_FD.parquet": None}),
+    Step("EIBMRB05", eibmrb05, {
+        **REPTDATE, "DEPO.parquet": BALANCES, "IDEPO.parquet": BALANCES, "MISFD_FCYFD.parquet": BALANCES,
+    }),
+    Step("EIBMRB06", eibmrb06, {**REPTDATE, **CUSTNAME, "MISFD_FCYFD.parquet": None}),
+    Step("EIBMRB07", eibmrb07, {
+        **REPTDATE, **CUSTNAME, "DEPO_CURRENT.parquet": None, "IDEPO_CURRENT.parquet": None,
+    }),
+    Step("EIBMRB08", eibmrb08, {**REPTDATE, "MIS_FDWDRW.parquet": None}),
+    Step("EIBMRB09", eibmrb09, {
+        **REPTDATE, "MIS_FDWDRW.parquet": ["CURCODE", "RSONCODE", "PRODCD", "TRANAMT"],
+    }),
+]
 
 
 # ============================================================
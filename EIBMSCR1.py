@@ -4,6 +4,8 @@ import pandas as pd
 from datetime import datetime
 import os
 
+from sasio import read_sas
+
 
 # =========================================================
 # PATH CONFIGURATION
@@ -84,25 +86,15 @@ BRH["BRCHCD"] = BRH["BRCHCD"].str.strip()
 
 print("Reading SRSBR.sas7bdat ...")
 
-SRSBR = pd.read_sas(
+# Byte columns are decoded and stripped once per distinct value by sasio.
+
+SRSBR = read_sas(
     SRSBR_FILE,
-    format="sas7bdat"
+    encoding="utf-8",
+    strip="both"
 )
 
 
-# =========================================================
-# DECODE BYTE COLUMNS
-# =========================================================
-
-for col in SRSBR.select_dtypes(include="object").columns:
-
-    try:
-        SRSBR[col] = SRSBR[col].str.decode("utf-8").str.strip()
-
-    except Exception:
-        pass
-
-
 # =========================================================
 # REPLACE NULL ONLY FOR NUMERIC COLUMNS
 # =========================================================
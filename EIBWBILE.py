@@ -4715,8 +4715,15 @@ from __future__ import annotations
 
 import argparse
 from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+from fixedwidth import RecordLayout
+from sasbatch import shared_batch
+from saswriter import Column
 
 
 # Same default locations as the previous converted jobs.
@@ -4797,6 +4804,15 @@ TRANS_COLUMNS = (
     "MATUREDT",
 )
 REPTDATE_COLUMNS = ("REPTDATE", "EXTDATE")
+COLUMN_ORDER = {
+    "customer": CUSTOMER_COLUMNS,
+    "facility": FACILITY_COLUMNS,
+    "combined": COMBINED_COLUMNS,
+    "trans": TRANS_COLUMNS,
+    "reptdate": REPTDATE_COLUMNS,
+}
+# Lines parsed per batch, which bounds memory whatever the extract size.
+BATCH_LINES = 100_000
 
 CHAR_LENGTHS = {
     "customer": {
@@ -4877,35 +4893,52 @@ DATE_FORMATS = {
 }
 
 
-def text(value: str) -> str:
-    """Match SAS character informat behavior for fixed-width text."""
-    return value.strip()
-
-
-def sas_number(value: str, decimals: int = 0) -> float | None:
-    """Parse SAS fixed-width numeric informats such as 18.2 or 4."""
-    raw = value.strip()
-    if not raw:
-        return None
-    try:
-        if "." in raw:
-            return float(raw)
-        number = int(raw)
-        return number / (10**decimals) if decimals else float(number)
-    except ValueError:
-        return None
-
-
-def sas_date(value: str) -> int | None:
-    """Parse DDMMYY8. into a SAS date number."""
-    raw = value.strip()
-    if not raw:
-        return None
-    try:
-        parsed = datetime.strptime(raw, "%d%m%Y").date()
-    except ValueError:
-        return None
-    return (parsed - date(1960, 1, 1)).days
+# Record layouts use the column positions of the SAS INPUT statements below.
+# The $8. date strings read into EXPIRY/CREATE/UPDATE/MATURITY and converted
+# with INPUT(PUT(x,8.),DDMMYY8.) are read straight into the date variables.
+CUSTOMER_LAYOUT = RecordLayout.from_input(
+    """
+    @1   ACCTNO   $11.   @12  NAME     $40.   @52  BRANCH   $3.
+    @55  SECTOR   $4.    @59  CUSTCODE $3.    @62  PRODUCT  $3.
+    @65  RESIDENT $1.    @66  MALAYSN  $1.    @67  SMALL    $1.
+    @68  STATUS   $1.    @69  CUSTTYPE $1.    @70  ORGTYPE  $1.
+    @71  CORPCODE $1.    @72  RACE     $1.    @73  BLRCODE  $1.
+    @74  LEGALCD  $2.    @76  STATE    $2.
+    """
+)
+FACILITY_LAYOUT = RecordLayout.from_input(
+    """
+    @1   ACCTNO   $11.   @12  AANO     $13.   @25  FACILITY $2.
+    @27  LIMIT    18.2   @45  BLRRATE  6.2    @51  USANCEPD 4.
+    @55  LCCRATE  8.4    @63  FCCRATE  8.4    @71  LCIRATE  6.2
+    @77  FCIRATE  6.2    @83  EXIMRATE 6.2    @89  ARCODE   $1.
+    @90  EXPIRYDT DDMMYY8.
+    @98  COLLCD1  $3.    @101 COLLCD2  $3.    @104 COLLCD3  $3.
+    @107 COLLCD4  $3.    @110 COLLCD5  $3.
+    @113 COLLAMT1 18.2   @131 COLLAMT2 18.2   @149 COLLAMT3 18.2
+    @167 COLLAMT4 18.2   @185 COLLAMT5 18.2   @203 BALANCE  18.2
+    @221 PDBBA    18.2   @239 PDBBR    18.2   @257 BRLCBAL  18.2
+    @275 BRULCBAL 18.2
+    @293 CREATEDT DDMMYY8.
+    @301 UPDATEDT DDMMYY8.
+    """
+)
+COMBINED_LAYOUT = RecordLayout.from_input(
+    """
+    @1   ACCTNO   $11.   @12  AANO     $13.   @25  FACILITY $2.
+    @27  USANCEPD 4.     @31  LCCRATE  8.4    @39  FCCRATE  8.4
+    @47  LCIRATE  6.2    @53  FCIRATE  6.2    @59  BALANCE  18.2
+    """
+)
+TRANS_LAYOUT = RecordLayout.from_input(
+    """
+    @1   ACCTNO   $11.   @12  AANO     $13.   @25  BILLREF  $14.
+    @39  USANCEPD 4.     @43  INTRATE  6.2    @49  BILLAMT  18.2
+    @67  INTACCR  18.2   @85  IISACCR  18.2
+    @103 MATUREDT DDMMYY8.
+    """
+)
+REPTDATE_LAYOUT = RecordLayout.from_input("@1 REPTDATE DDMMYY8. @1 EXTDATE $8.")
 
 
 def output_suffix(run_date: date) -> str:
@@ -4926,176 +4959,86 @@ def resolve_input(directory: Path, filename: str) -> Path:
     )
 
 
-def read_lines(path: Path, encoding: str, firstobs: int = 1, obs: int | None = None) -> list[str]:
-    with path.open("r", encoding=encoding, errors="replace", newline="") as source:
-        lines = [line.rstrip("\r\n") for line in source if line.strip()]
+def read_lines(
+    path: Path, encoding: str, firstobs: int = 1, obs: int | None = None
+) -> Iterator[str]:
+    """Yield non-blank records lazily, honouring SAS FIRSTOBS=/OBS= counts."""
     start = max(firstobs - 1, 0)
-    sliced = lines[start:]
-    return sliced[:obs] if obs is not None else sliced
-
-
-def parse_customer(line: str) -> dict[str, Any]:
-    return {
-        "ACCTNO": text(line[0:11]),
-        "NAME": text(line[11:51]),
-        "BRANCH": text(line[51:54]),
-        "SECTOR": text(line[54:58]),
-        "CUSTCODE": text(line[58:61]),
-        "PRODUCT": text(line[61:64]),
-        "RESIDENT": text(line[64:65]),
-        "MALAYSN": text(line[65:66]),
-        "SMALL": text(line[66:67]),
-        "STATUS": text(line[67:68]),
-        "CUSTTYPE": text(line[68:69]),
-        "ORGTYPE": text(line[69:70]),
-        "CORPCODE": text(line[70:71]),
-        "RACE": text(line[71:72]),
-        "BLRCODE": text(line[72:73]),
-        "LEGALCD": text(line[73:75]),
-        "STATE": text(line[75:77]),
-    }
-
-
-def parse_facility(line: str) -> dict[str, Any]:
-    expiry = text(line[89:97])
-    created = text(line[292:300])
-    updated = text(line[300:308])
-    return {
-        "ACCTNO": text(line[0:11]),
-        "AANO": text(line[11:24]),
-        "FACILITY": text(line[24:26]),
-        "LIMIT": sas_number(line[26:44], 2),
-        "BLRRATE": sas_number(line[44:50], 2),
-        "USANCEPD": sas_number(line[50:54]),
-        "LCCRATE": sas_number(line[54:62], 4),
-        "FCCRATE": sas_number(line[62:70], 4),
-        "LCIRATE": sas_number(line[70:76], 2),
-        "FCIRATE": sas_number(line[76:82], 2),
-        "EXIMRATE": sas_number(line[82:88], 2),
-        "ARCODE": text(line[88:89]),
-        "EXPIRYDT": sas_date(expiry),
-        "COLLCD1": text(line[97:100]),
-        "COLLCD2": text(line[100:103]),
-        "COLLCD3": text(line[103:106]),
-        "COLLCD4": text(line[106:109]),
-        "COLLCD5": text(line[109:112]),
-        "COLLAMT1": sas_number(line[112:130], 2),
-        "COLLAMT2": sas_number(line[130:148], 2),
-        "COLLAMT3": sas_number(line[148:166], 2),
-        "COLLAMT4": sas_number(line[166:184], 2),
-        "COLLAMT5": sas_number(line[184:202], 2),
-        "BALANCE": sas_number(line[202:220], 2),
-        "PDBBA": sas_number(line[220:238], 2),
-        "PDBBR": sas_number(line[238:256], 2),
-        "BRLCBAL": sas_number(line[256:274], 2),
-        "BRULCBAL": sas_number(line[274:292], 2),
-        "CREATEDT": sas_date(created),
-        "UPDATEDT": sas_date(updated),
-    }
-
-
-def parse_combined(line: str) -> dict[str, Any]:
-    return {
-        "ACCTNO": text(line[0:11]),
-        "AANO": text(line[11:24]),
-        "FACILITY": text(line[24:26]),
-        "USANCEPD": sas_number(line[26:30]),
-        "LCCRATE": sas_number(line[30:38], 4),
-        "FCCRATE": sas_number(line[38:46], 4),
-        "LCIRATE": sas_number(line[46:52], 2),
-        "FCIRATE": sas_number(line[52:58], 2),
-        "BALANCE": sas_number(line[58:76], 2),
-    }
-
-
-def parse_trans(line: str) -> dict[str, Any]:
-    maturity = text(line[102:110])
-    return {
-        "ACCTNO": text(line[0:11]),
-        "AANO": text(line[11:24]),
-        "BILLREF": text(line[24:38]),
-        "USANCEPD": sas_number(line[38:42]),
-        "INTRATE": sas_number(line[42:48], 2),
-        "BILLAMT": sas_number(line[48:66], 2),
-        "INTACCR": sas_number(line[66:84], 2),
-        "IISACCR": sas_number(line[84:102], 2),
-        "MATUREDT": sas_date(maturity),
-    }
+    stop = None if obs is None else start + obs
+    with path.open("r", encoding=encoding, errors="replace", newline="") as source:
+        records = (line.rstrip("\r\n") for line in source if line.strip())
+        yield from islice(records, start, stop)
 
 
-def parse_reptdate(line: str) -> dict[str, Any]:
-    extdate = text(line[0:8])
-    return {"REPTDATE": sas_date(extdate), "EXTDATE": extdate}
+def split_header(lines: Iterator[str]) -> tuple[list[str], Iterator[str]]:
+    """Take the header record off a line source; the rest stays lazy."""
+    header = list(islice(lines, 1))
+    return header, lines
 
 
-def load_rows(input_dir: Path, encoding: str, filenames: dict[str, str]) -> dict[str, list[dict[str, Any]]]:
+def load_rows(
+    input_dir: Path,
+    encoding: str,
+    filenames: dict[str, str],
+    batch_lines: int = BATCH_LINES,
+) -> dict[str, Iterator[pd.DataFrame]]:
+    """Lazy DataFrame batches per dataset; every file is read in a single pass."""
     paths = {name: resolve_input(input_dir, filename) for name, filename in filenames.items()}
+    header, customer = split_header(read_lines(paths["customer"], encoding))
     return {
-        "customer": [parse_customer(line) for line in read_lines(paths["customer"], encoding, firstobs=2)],
-        "facility": [parse_facility(line) for line in read_lines(paths["facility"], encoding, firstobs=2)],
-        "combined": [parse_combined(line) for line in read_lines(paths["combined"], encoding, firstobs=2)],
-        "trans": [parse_trans(line) for line in read_lines(paths["trans"], encoding, firstobs=2)],
-        "reptdate": [parse_reptdate(line) for line in read_lines(paths["customer"], encoding, obs=1)],
+        "customer": CUSTOMER_LAYOUT.parse_batches(customer, batch_lines),
+        "facility": FACILITY_LAYOUT.parse_batches(
+            read_lines(paths["facility"], encoding, firstobs=2), batch_lines
+        ),
+        "combined": COMBINED_LAYOUT.parse_batches(
+            read_lines(paths["combined"], encoding, firstobs=2), batch_lines
+        ),
+        "trans": TRANS_LAYOUT.parse_batches(
+            read_lines(paths["trans"], encoding, firstobs=2), batch_lines
+        ),
+        "reptdate": iter([REPTDATE_LAYOUT.parse(header)]),
     }
 
 
-def write_sas7bdat(rows: dict[str, list[dict[str, Any]]], output_dir: Path, suffix: str) -> dict[str, Path]:
-    """Write the converted BILLS datasets as SAS7BDAT files."""
-    try:
-        import pandas as pd
-        import saspy
-    except ImportError as error:
-        raise RuntimeError(
-            "Writing SAS7BDAT requires pandas, saspy, and a configured SAS runtime"
-        ) from error
+def sas_columns(name: str) -> list[Column]:
+    """SAS variables of one output dataset, in output order."""
+    columns = []
+    for column in COLUMN_ORDER[name]:
+        fmt = DATE_FORMATS.get(name, {}).get(column, "")
+        if column in CHAR_LENGTHS.get(name, {}):
+            columns.append(Column(column, "char", CHAR_LENGTHS[name][column], fmt))
+        else:
+            columns.append(Column(column, "num", format=fmt))
+    return columns
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_dir = output_dir.resolve()
-    column_order = {
-        "customer": CUSTOMER_COLUMNS,
-        "facility": FACILITY_COLUMNS,
-        "combined": COMBINED_COLUMNS,
-        "trans": TRANS_COLUMNS,
-        "reptdate": REPTDATE_COLUMNS,
-    }
 
-    frames = {}
-    for name, columns in column_order.items():
-        frame = pd.DataFrame(rows[name], columns=columns)
+def prepared(name: str, batches: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Apply the output column order, CHAR_LENGTHS and numeric types per batch."""
+    for batch in batches:
+        frame = pd.DataFrame(batch, columns=COLUMN_ORDER[name])
         for column, length in CHAR_LENGTHS.get(name, {}).items():
             frame[column] = frame[column].fillna("").astype(str).str.slice(0, length)
         for column in NUMERIC_COLUMNS.get(name, set()):
             frame[column] = pd.to_numeric(frame[column], errors="coerce")
-        frames[f"{name}_{suffix}"] = (name, frame)
+        yield frame
 
-    sas = saspy.SASsession()
-    try:
-        sas_path = str(output_dir).replace("'", "''")
-        result = sas.submit(f"libname BILLS '{sas_path}';")
-        if "ERROR:" in result.get("LOG", ""):
-            raise RuntimeError(result["LOG"])
-
-        for table, (schema, frame) in frames.items():
-            sas.df2sd(
-                frame,
-                table=table,
-                libref="BILLS",
-                char_lengths=CHAR_LENGTHS.get(schema, {}),
-                outfmts=DATE_FORMATS.get(schema, {}),
-            )
-    finally:
-        sas.endsas()
 
+def write_sas7bdat(
+    rows: dict[str, Iterable[pd.DataFrame]], output_dir: Path, suffix: str
+) -> dict[str, Path]:
+    """Queue the converted BILLS datasets on the shared SAS batch and run it."""
+    batch = shared_batch()
     destinations = {
-        name: output_dir / f"{name}_{suffix}.sas7bdat"
-        for name in ("customer", "facility", "combined", "trans", "reptdate")
-    }
-    missing = [path for path in destinations.values() if not path.is_file()]
-    if missing:
-        raise RuntimeError(
-            "SAS did not create the expected file(s): "
-            + ", ".join(str(path) for path in missing)
+        name: batch.dataset(
+            "BILLS",
+            output_dir,
+            f"{name}_{suffix}",
+            prepared(name, rows[name]),
+            columns=sas_columns(name),
         )
+        for name in COLUMN_ORDER
+    }
+    batch.run()
     return destinations
 
 
@@ -5150,6 +5093,8 @@ def main() -> int:
     destinations = convert(args.input_root, args.output_root, args.encoding, filenames, suffix)
     for name, path in destinations.items():
         print(f"{name.upper()}: {path}")
+    for timing in shared_batch().timings:
+        print(timing)
     return 0
 
 
@@ -236,6 +236,8 @@
 import pandas as pd
 import numpy as np
 
+from bucketrules import HP_NPL_CATEGORIES, classify
+
 # =========================================================
 # ENTRY POINT
 # =========================================================
@@ -322,41 +324,9 @@ def run():
     )
 
     # -----------------------------------------------------
-    # CATEGORY ASSIGNMENT (exact SAS logic)
+    # CATEGORY ASSIGNMENT (exact SAS logic, first match wins)
     # -----------------------------------------------------
-    def assign_category(r):
-        if r["DAYARR"] <= 30 and r["BORSTAT"] not in ["F","I","R","E","W","Z"] \
-           and r["USER5"] != "N" and r["PAIDIND"] == "M":
-            return "CURRENT"
-
-        if 31 <= r["DAYARR"] <= 89 and r["BORSTAT"] not in ["F","I","R","E","W","Z"] \
-           and r["USER5"] != "N" and r["PAIDIND"] == "M":
-            return "1-2 MTHS"
-
-        if r["BORSTAT"] not in ["F","I","R","E","W","Z"] and (
-            (r["USER5"] == "N" and r["DAYARR"] <= 182) or
-            (90 <= r["DAYARR"] <= 182)
-        ) and r["PAIDIND"] == "M":
-            return "3-5 MTHS"
-
-        if r["BORSTAT"] not in ["F","I","R","E","W","Z"] and (
-            (r["USER5"] == "N" and r["DAYARR"] >= 183) or
-            (r["DAYARR"] >= 183)
-        ) and r["PAIDIND"] == "M":
-            return ">=6 MTHS"
-
-        if r["BORSTAT"] == "I" and r["PAIDIND"] == "M":
-            return "IRREGULAR"
-
-        if r["BORSTAT"] == "R" and r["PAIDIND"] == "M":
-            return "REPOSSESSED"
-
-        if r["BORSTAT"] == "F" and r["PAIDIND"] == "M":
-            return "DEFICIT"
-
-        return ""
-
-    HP["CATEGORY"] = HP.apply(assign_category, axis=1)
+    HP["CATEGORY"] = classify(HP, HP_NPL_CATEGORIES)
     HP = HP[HP["CATEGORY"] != ""]
 
     # -----------------------------------------------------
@@ -113,24 +113,33 @@ def split_buckets(hp):
 # Build group rows
 # ======================================================
 
+GRP_COLUMNS = [
+    "CATEGORY", "GROUPIND", "SUBGIND", "RATE", "RECRATE",
+    "BALANCE", "OBDEFAULT", "EXPECTEDREC", "CAPROVISION"
+]
+
 def build_grp(df, subg, rules):
+    # OBDEFAULT, EXPECTEDREC and CAPROVISION are linear in BALANCE, so each
+    # rule is applied once to the bucket total rather than to every account.
+    if df.empty:
+        return pd.DataFrame(columns=GRP_COLUMNS)
+    balance = df["BALANCE"].sum()
     rows = []
-    for _, r in df.iterrows():
-        for cat, rate, recrate, capflag in rules:
-            ob = r["BALANCE"] * rate / 100
-            exp = ob * recrate / 100
-            rows.append({
-                "CATEGORY": cat,
-                "GROUPIND": "OTHERS",
-                "SUBGIND": subg,
-                "RATE": rate,
-                "RECRATE": recrate,
-                "BALANCE": r["BALANCE"],
-                "OBDEFAULT": ob,
-                "EXPECTEDREC": exp,
-                "CAPROVISION": ob - exp if capflag else 0
-            })
-    return pd.DataFrame(rows)
+    for cat, rate, recrate, capflag in rules:
+        ob = balance * rate / 100
+        exp = ob * recrate / 100
+        rows.append({
+            "CATEGORY": cat,
+            "GROUPIND": "OTHERS",
+            "SUBGIND": subg,
+            "RATE": rate,
+            "RECRATE": recrate,
+            "BALANCE": balance,
+            "OBDEFAULT": ob,
+            "EXPECTEDREC": exp,
+            "CAPROVISION": ob - exp if capflag else 0
+        })
+    return pd.DataFrame(rows, columns=GRP_COLUMNS)
 
 # ======================================================
 # Rate calculations
@@ -305,6 +314,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from bucketrules import HP_NPL_CATEGORIES, classify
+
 # ======================================================
 # 1. REPORT DATE DERIVATION
 # ======================================================
@@ -373,42 +384,7 @@ def merge_ccris(hp, ccris):
 
 def assign_category(df):
     d = df.copy()
-    d["CATEGORY"] = ""
-
-    cond = d["PAIDIND"] == "M"
-
-    d.loc[
-        (d["DAYARR"] <= 30) &
-        ~d["BORSTAT"].isin(list("FIREWZ")) &
-        (d["USER5"] != "N") & cond,
-        "CATEGORY"
-    ] = "CURRENT"
-
-    d.loc[
-        d["DAYARR"].between(31, 89) &
-        ~d["BORSTAT"].isin(list("FIREWZ")) &
-        (d["USER5"] != "N") & cond,
-        "CATEGORY"
-    ] = "1-2 MTHS"
-
-    d.loc[
-        (~d["BORSTAT"].isin(list("FIREWZ"))) &
-        (((d["USER5"] == "N") & (d["DAYARR"] <= 182)) |
-         (d["DAYARR"].between(90, 182))) & cond,
-        "CATEGORY"
-    ] = "3-5 MTHS"
-
-    d.loc[
-        (~d["BORSTAT"].isin(list("FIREWZ"))) &
-        (((d["USER5"] == "N") & (d["DAYARR"] >= 183)) |
-         (d["DAYARR"] >= 183)) & cond,
-        "CATEGORY"
-    ] = ">=6 MTHS"
-
-    d.loc[(d["BORSTAT"] == "I") & cond, "CATEGORY"] = "IRREGULAR"
-    d.loc[(d["BORSTAT"] == "R") & cond, "CATEGORY"] = "REPOSSESSED"
-    d.loc[(d["BORSTAT"] == "F") & cond, "CATEGORY"] = "DEFICIT"
-
+    d["CATEGORY"] = classify(d, HP_NPL_CATEGORIES)
     return d[d["CATEGORY"] != ""]
 
 # ======================================================
@@ -716,6 +692,8 @@ def run_eiimnp43(icap_df, reptdate):
 import pandas as pd
 from datetime import datetime
 
+from fixedwidth import PutLayout
+
 # ======================================================
 # 1. REPORT DATE DERIVATION (same logic as SAS)
 # ======================================================
@@ -742,29 +720,13 @@ def derive_report_vars(reptdate: pd.Timestamp):
 # 2. FIXED-WIDTH FORMATTER (PUT @xxx equivalent)
 # ======================================================
 
-def format_ccris_line(row):
-    """
-    SAS:
+CCRIS_LAYOUT = PutLayout.from_put("""
     PUT @001 ACCTNO  10.
         @012 NOTENO  Z5.
         @018 BRANCH  Z5.
         @024 CAP     20.2
         @045 AANO    $CHAR13.
-    """
-
-    acctno = f"{int(row['ACCTNO']):>10}"
-    noteno = f"{int(row['NOTENO']):05d}"
-    branch = f"{int(row['BRANCH']):05d}"
-    cap = f"{row['CAP']:>20.2f}"
-    aano = f"{str(row['AANO']):<13}"
-
-    return (
-        acctno +
-        noteno +
-        branch +
-        cap +
-        aano
-    )
+""")
 
 # ======================================================
 # 3. MAIN EIIMNP44 PROCESS
@@ -790,15 +752,12 @@ def run_eiimnp44(
         raise ValueError(f"Missing required columns: {missing}")
 
     # Write CCRIS file (equivalent to DATA _NULL_ FILE CCRIS)
-    with open(output_file, "w", encoding="ascii") as f:
-        for _, row in icap_df.iterrows():
-            line = format_ccris_line(row)
-            f.write(line + "\n")
+    record_count = CCRIS_LAYOUT.write(icap_df, output_file)
 
     return {
         "OUTPUT_FILE": output_file,
         "REPTVARS": rept_vars,
-        "RECORD_COUNT": len(icap_df)
+        "RECORD_COUNT": record_count
     }
 
 
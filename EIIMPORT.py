@@ -31,6 +31,8 @@ from typing import Iterable
 
 import pandas as pd
 
+from sasio import read_sas as read_sas7bdat
+
 
 SA_PRODUCTS = {204, 207, 214, 215}
 CA_CONCEPTS = {
@@ -91,8 +93,7 @@ def locate(root: Path, filename: str, override: Path | None) -> Path:
 
 
 def load(path: Path, required: Iterable[str]) -> pd.DataFrame:
-    frame = pd.read_sas(path, format="sas7bdat", encoding="utf-8")
-    frame.columns = [str(column).upper() for column in frame.columns]
+    frame = read_sas7bdat(path, encoding="utf-8")
     missing = set(required) - set(frame.columns)
     if missing:
         raise ValueError(f"{path} is missing columns: {', '.join(sorted(missing))}")
@@ -279,8 +280,7 @@ def locate(root: Path, filename: str, override: Path | None) -> Path:
 
 
 def load(path: Path, required: Iterable[str]) -> pd.DataFrame:
-    frame = pd.read_sas(path, format="sas7bdat", encoding="utf-8")
-    frame.columns = [str(column).upper() for column in frame.columns]
+    frame = read_sas7bdat(path, encoding="utf-8")
     missing = set(required) - set(frame.columns)
     if missing:
         raise ValueError(f"{path} is missing columns: {', '.join(sorted(missing))}")
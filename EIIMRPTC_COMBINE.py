@@ -8,7 +8,8 @@ from typing import Iterable
 
 import pandas as pd
 
-from pbbdpfmt import ddcustcd
+from pbbdpfmt3 import ddcustcd_array
+from sasio import read_sas as read_sas7bdat
 
 
 # PBBDPFMT and PBBELF are intentionally not combined into this job.
@@ -62,9 +63,7 @@ def read_dataset(directory: Path, name: str) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Dataset {path} not found")
 
-    frame = pd.read_sas(path, format="sas7bdat", encoding="latin1")
-    frame.columns = [str(column).upper() for column in frame.columns]
-    return frame
+    return read_sas7bdat(path, encoding="latin1")
 
 
 def write_dataset(frame: pd.DataFrame, directory: Path, name: str) -> Path:
@@ -494,7 +493,7 @@ def run_curr(config: RunConfig) -> dict[str, Path]:
     curr = keep_open_or_closed_this_month(curr)
     curr = add_close_and_account_counts(curr, bank_customer_split=True)
 
-    curr["CUSTFISS"] = curr["CUSTCODE"].map(ddcustcd)
+    curr["CUSTFISS"] = pd.Series(ddcustcd_array(curr["CUSTCODE"]), index=curr.index).infer_objects()
     curr.loc[curr["PRODUCT"].eq(104), "CUSTFISS"] = "02"
     curr.loc[curr["PRODUCT"].eq(105), "CUSTFISS"] = "81"
     curr["DNBFI_ORI"] = curr.get("DNBFISME")
@@ -6,9 +6,13 @@ equivalents as Python lookups. Keep it separate from main jobs.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 from math import inf
-from typing import Any
+from typing import Any, Iterable, Sequence
+
+import numpy as np
 
 
 ACE = [40, 42, 43, 150, 151, 152, 181]
@@ -40,11 +44,111 @@ def lookup(code: int | str, mapping: dict[Any, Any], default: Any = None) -> Any
     return mapping.get(code, default)
 
 
-def lookup_range(value: float, rules: list[RangeRule], default: Any = None) -> Any:
+@dataclass(frozen=True)
+class RangeTable:
+    """Range rules compiled into a sorted partition of boundary points.
+
+    Every boundary point, and every open gap between neighbouring points,
+    carries the index of the first rule (in declaration order) covering it,
+    or -1.  A lookup is then one binary search, and lookup_array classifies
+    a whole column with np.searchsorted.
+    """
+
+    rules: tuple[RangeRule, ...]
+    points: tuple[float, ...]
+    point_rules: tuple[int, ...]
+    gap_rules: tuple[int, ...]
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[RangeRule],
+        contiguous: bool = False,
+        validate: bool = True,
+    ) -> "RangeTable":
+        rules = tuple(rules)
+        if validate:
+            validate_ranges(rules, contiguous)
+        points = sorted({bound for rule in rules for bound in (rule.start, rule.end)})
+
+        def first(covers: Any) -> int:
+            return next((index for index, rule in enumerate(rules) if covers(rule)), -1)
+
+        point_rules = [first(lambda rule: rule.start <= point <= rule.end) for point in points]
+        inner_gaps = [
+            first(lambda rule: rule.start <= left and right <= rule.end)
+            for left, right in zip(points, points[1:])
+        ]
+        gap_rules = [-1, *inner_gaps, -1] if points else [-1]
+        return cls(rules, tuple(points), tuple(point_rules), tuple(gap_rules))
+
+    def rule_index(self, value: float) -> int:
+        position = bisect_left(self.points, value)
+        if position < len(self.points) and self.points[position] == value:
+            return self.point_rules[position]
+        return self.gap_rules[position]
+
+    def lookup(self, value: float, default: Any = None) -> Any:
+        index = self.rule_index(value)
+        return default if index < 0 else self.rules[index].value
+
+    def lookup_array(self, values: Iterable[float], default: Any = None) -> np.ndarray:
+        numbers = np.asarray(values, dtype="float64")
+        choices = np.empty(len(self.rules) + 1, dtype=object)
+        choices[:-1] = [rule.value for rule in self.rules]
+        choices[-1] = default
+        if not self.points:
+            return choices[np.full(numbers.shape, -1)]
+        points = np.asarray(self.points, dtype="float64")
+        position = np.searchsorted(points, numbers, side="left")
+        clipped = np.minimum(position, len(points) - 1)
+        on_point = points[clipped] == numbers
+        indexes = np.where(
+            on_point,
+            np.asarray(self.point_rules)[clipped],
+            np.asarray(self.gap_rules)[position],
+        )
+        return choices[indexes]
+
+
+def validate_ranges(rules: Sequence[RangeRule], contiguous: bool = False) -> None:
+    """Reject inverted or overlapping ranges, and gaps when contiguous.
+
+    Ranges may share an endpoint (the closed-interval form of SAS a-<b);
+    the earlier rule then owns the point.
+    """
     for rule in rules:
-        if rule.start <= value <= rule.end:
-            return rule.value
-    return default
+        if rule.start > rule.end:
+            raise ValueError(f"range {rule.start}-{rule.end} ({rule.value!r}) is inverted")
+    ordered = sorted(rules, key=lambda rule: (rule.start, rule.end))
+    for previous, rule in zip(ordered, ordered[1:]):
+        if rule.start < previous.end:
+            raise ValueError(
+                f"ranges {previous.start}-{previous.end} ({previous.value!r}) and "
+                f"{rule.start}-{rule.end} ({rule.value!r}) overlap"
+            )
+        if contiguous and rule.start > previous.end:
+            raise ValueError(f"no range covers {previous.end} to {rule.start}")
+
+
+@lru_cache(maxsize=None)
+def _range_table(rules: tuple[RangeRule, ...]) -> RangeTable:
+    # Ad-hoc rule lists keep first-match semantics, overlapping or not.
+    return RangeTable.from_rules(rules, validate=False)
+
+
+def lookup_range(value: float, rules: Sequence[RangeRule] | RangeTable, default: Any = None) -> Any:
+    table = rules if isinstance(rules, RangeTable) else _range_table(tuple(rules))
+    return table.lookup(value, default)
+
+
+def lookup_range_array(
+    values: Iterable[float],
+    rules: Sequence[RangeRule] | RangeTable,
+    default: Any = None,
+) -> np.ndarray:
+    table = rules if isinstance(rules, RangeTable) else _range_table(tuple(rules))
+    return table.lookup_array(values, default)
 
 
 SADENOM = {
@@ -98,6 +202,7 @@ FDDENOM_RULES = [
     RangeRule(941, 967, "I"), RangeRule(987, 988, "I"),
     RangeRule(991, 993, "I"),
 ]
+FDDENOM_TABLE = RangeTable.from_rules(FDDENOM_RULES)
 FDDENOM_SINGLE = {
     422, 424, 426, 428, 475, 481, 487, 489, 491, 493, 495, 497,
     499, 555, 557, 575, 777,
@@ -107,7 +212,7 @@ FDDENOM_SINGLE = {
 def fddenom(code: int) -> str:
     if code in FDDENOM_SINGLE:
         return "I"
-    return lookup_range(code, FDDENOM_RULES, "D")
+    return FDDENOM_TABLE.lookup(code, "D")
 
 
 FDPROD: dict[int, str] = {}
@@ -184,10 +289,11 @@ FDPRD_RULES = [
     RangeRule(461, 469, "M"), RangeRule(580, 599, "M"),
     RangeRule(660, 740, "M"),
 ]
+FDPRD_TABLE = RangeTable.from_rules(FDPRD_RULES)
 
 
 def fdprd(code: int) -> str:
-    return lookup_range(code, FDPRD_RULES, " ")
+    return FDPRD_TABLE.lookup(code, " ")
 
 
 FDORGMT_RULES = [
@@ -199,10 +305,15 @@ FDORGMT_RULES = [
     RangeRule(36, 48, "25"), RangeRule(48, 60, "26"),
     RangeRule(60, inf, "30"),
 ]
+FDORGMT_TABLE = RangeTable.from_rules(FDORGMT_RULES, contiguous=True)
 
 
 def fdorgmt(months: float) -> str:
-    return lookup_range(months, FDORGMT_RULES)
+    return FDORGMT_TABLE.lookup(months)
+
+
+def fdorgmt_array(months: Iterable[float]) -> np.ndarray:
+    return FDORGMT_TABLE.lookup_array(months)
 
 
 FDRMMT_RULES = [
@@ -213,10 +324,15 @@ FDRMMT_RULES = [
     RangeRule(24, 36, "62"), RangeRule(36, 48, "63"),
     RangeRule(48, 60, "64"), RangeRule(60, inf, "70"),
 ]
+FDRMMT_TABLE = RangeTable.from_rules(FDRMMT_RULES, contiguous=True)
 
 
 def fdrmmt(months: float) -> str:
-    return lookup_range(months, FDRMMT_RULES)
+    return FDRMMT_TABLE.lookup(months)
+
+
+def fdrmmt_array(months: Iterable[float]) -> np.ndarray:
+    return FDRMMT_TABLE.lookup_array(months)
 
 
 RMFDORGMT = {
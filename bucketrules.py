@@ -0,0 +1,72 @@
+"""Declarative first-match bucket rules evaluated in one np.select.
+
+A bucket table is an ordered tuple of Bucket(label, when) rows, where when
+maps the whole frame to a boolean mask.  classify() evaluates every mask
+once over the frame and picks, per row, the label of the first bucket
+that matches (the nested IF/ELSE IF of the SAS step), or the default.
+Missing values in a mask count as no match.
+
+HP_NPL_CATEGORIES is the HP arrears classification shared by the PBB
+(EIFMNP42) and PIBB (EIIMNP42) NPL jobs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Bucket:
+    label: str
+    when: Callable[[pd.DataFrame], Any]
+
+
+def _mask(condition: Any, length: int) -> np.ndarray:
+    if isinstance(condition, pd.Series):
+        return condition.to_numpy(dtype=bool, na_value=False)
+    return np.broadcast_to(np.asarray(condition, dtype=bool), (length,))
+
+
+def classify(frame: pd.DataFrame, buckets: Sequence[Bucket], default: str = "") -> np.ndarray:
+    """Label of the first matching bucket per row (default where none match)."""
+    conditions = [_mask(bucket.when(frame), len(frame)) for bucket in buckets]
+    labels = np.array([bucket.label for bucket in buckets] + [default], dtype=object)
+    # np.select on the bucket index keeps labels as Python strings.
+    return labels[np.select(conditions, np.arange(len(buckets)), len(buckets))]
+
+
+# ---------------------------------------------------------------------
+# HP NPL categories (EIFMNP42 / EIIMNP42)
+# ---------------------------------------------------------------------
+
+NPL_EXCLUDED_BORSTAT = ["F", "I", "R", "E", "W", "Z"]
+
+
+def _paid(hp: pd.DataFrame) -> pd.Series:
+    return hp["PAIDIND"] == "M"
+
+
+def _active(hp: pd.DataFrame) -> pd.Series:
+    return ~hp["BORSTAT"].isin(NPL_EXCLUDED_BORSTAT) & _paid(hp)
+
+
+HP_NPL_CATEGORIES = (
+    Bucket("CURRENT", lambda hp: (hp["DAYARR"] <= 30) & _active(hp) & (hp["USER5"] != "N")),
+    Bucket("1-2 MTHS", lambda hp: hp["DAYARR"].between(31, 89) & _active(hp) & (hp["USER5"] != "N")),
+    Bucket(
+        "3-5 MTHS",
+        lambda hp: _active(hp)
+        & (((hp["USER5"] == "N") & (hp["DAYARR"] <= 182)) | hp["DAYARR"].between(90, 182)),
+    ),
+    Bucket(
+        ">=6 MTHS",
+        lambda hp: _active(hp) & (((hp["USER5"] == "N") & (hp["DAYARR"] >= 183)) | (hp["DAYARR"] >= 183)),
+    ),
+    Bucket("IRREGULAR", lambda hp: (hp["BORSTAT"] == "I") & _paid(hp)),
+    Bucket("REPOSSESSED", lambda hp: (hp["BORSTAT"] == "R") & _paid(hp)),
+    Bucket("DEFICIT", lambda hp: (hp["BORSTAT"] == "F") & _paid(hp)),
+)
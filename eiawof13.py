@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
-"""Controller for PBB EIAWOF13; keeps EIFMNP03/06/07 separate."""
+"""Controller for PBB EIAWOF13; runs EIFMNP03/06/07 as one in-process job graph.
+
+EIFMNP03 -> EIFMNP06, with EIFMNP07 alongside (it does not need IIS).
+loanMM.sas7bdat is read once and shared, EIFMNP06 takes the IIS frame that
+EIFMNP03 returns, and each step's wall time and peak RSS are printed at the
+end (see steprunner).
+"""
 from __future__ import annotations
 
 import argparse
-import subprocess
+import importlib
+import os
 import sys
 from datetime import date, timedelta
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from steprunner import InputCache, Step, StepInputs, run_steps
 
 
 # Input/output locations are relative to the working directory used to launch
@@ -14,26 +25,52 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_BASE = Path("Data_Warehouse/MIS/XMIS/input/prod")
 DEFAULT_OUTPUT_DIR = DEFAULT_BASE / "output"
+LOAN_PATTERN = "loan{mm}.sas7bdat"
+
+
+def load_program(program: str) -> ModuleType:
+    for name in (program, program.lower()):
+        try:
+            return importlib.import_module(name)
+        except ModuleNotFoundError as error:
+            if error.name != name:
+                raise
+    raise SystemExit(f"EIAWOF13: program module not found: {program} (searched {SCRIPT_DIR})")
 
 
-def run(program: str, arguments: list[str]) -> None:
-    candidates = [
-        SCRIPT_DIR / (program + ".py"),
-        SCRIPT_DIR / (program.lower() + ".py"),
+def announced(program: str, action: Callable[[StepInputs], Any]) -> Callable[[StepInputs], Any]:
+    def step(inputs: StepInputs) -> Any:
+        # One write per line, so lines from parallel steps do not interleave.
+        sys.stdout.write(f"EIAWOF13: starting {program}\n")
+        result = action(inputs)
+        sys.stdout.write(f"EIAWOF13: {program} completed\n")
+        return result
+    return step
+
+
+def build_steps(input_dir: Path, output_dir: Path, branch_map: Path | None, month: str) -> tuple[list[Step], ModuleType]:
+    """The EIAWOF13 job graph, and the module whose read_sas loads its inputs."""
+    eifmnp03, eifmnp06, eifmnp07 = (load_program(name) for name in ("EIFMNP03", "EIFMNP06", "EIFMNP07"))
+    common = ["--input-dir", str(input_dir)]
+    if branch_map:
+        common.extend(["--branch-map", str(branch_map)])
+    loan = LOAN_PATTERN.format(mm=month)
+    args03 = eifmnp03.parse_args(common + ["--output-dir", str(output_dir / "eifmnp03")])
+    args06 = eifmnp06.parse_args(common + ["--output-dir", str(output_dir / "eifmnp06")])
+    args07 = eifmnp07.parse_args(common + ["--output-dir", str(output_dir / "eifmnp07")])
+    steps = [
+        Step("EIFMNP03", announced("EIFMNP03", lambda inputs: eifmnp03.run(args03, loan=inputs.frame(loan))), {loan: None}),
+        # NPL.IISMM is created by EIFMNP03 and consumed by EIFMNP06.
+        Step("EIFMNP06", announced("EIFMNP06", lambda inputs: eifmnp06.run(
+            args06, loan=inputs.frame(loan), iis=inputs.result("EIFMNP03"),
+        )), {loan: None}, after=("EIFMNP03",)),
+        Step("EIFMNP07", announced("EIFMNP07", lambda inputs: eifmnp07.run(args07, loan=inputs.frame(loan))), {loan: None}),
     ]
-    script = next((candidate for candidate in candidates if candidate.is_file()), None)
-    if script is None:
-        searched = ", ".join(str(candidate) for candidate in candidates)
-        raise SystemExit(f"EIAWOF13: program file not found; searched: {searched}")
-    print(f"EIAWOF13: starting {program}")
-    result = subprocess.run([sys.executable, str(script), *arguments], check=False)
-    if result.returncode:
-        raise SystemExit(f"EIAWOF13: {program} failed with return code {result.returncode}")
-    print(f"EIAWOF13: {program} completed")
+    return steps, eifmnp03
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Run separate PBB EIFMNP03/06/07 steps")
+    parser = argparse.ArgumentParser(description="Run the PBB EIFMNP03/06/07 steps")
     parser.add_argument("--input-dir", type=Path, default=DEFAULT_BASE)
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
     parser.add_argument("--branch-map", type=Path)
@@ -45,22 +82,16 @@ def main() -> None:
     args.output_dir.mkdir(parents=True, exist_ok=True)
     print(f"EIAWOF13: input directory  = {args.input_dir}")
     print(f"EIAWOF13: output directory = {args.output_dir}")
-    common = ["--input-dir", str(args.input_dir)]
-    if args.branch_map:
-        common.extend(["--branch-map", str(args.branch_map)])
-
-    step03 = args.output_dir / "eifmnp03"
-    step06 = args.output_dir / "eifmnp06"
-    step07 = args.output_dir / "eifmnp07"
-    run("EIFMNP03", common + ["--output-dir", str(step03)])
+    # loanMM is read once per run; the Parquet cache (see sasio) lets a rerun,
+    # and other jobs reading the same month, skip SAS7BDAT parsing.
+    os.environ.setdefault("XMIS_SAS_CACHE_DIR", str(args.output_dir / "sascache"))
     month = f"{(date.today() - timedelta(days=1)).month:02d}"
-    # NPL.IISMM is created by EIFMNP03 and consumed by EIFMNP06.
-    run("EIFMNP06", common + [
-        "--output-dir", str(step06),
-        "--iis-file", str(step03 / f"iis{month}.csv"),
-    ])
-    run("EIFMNP07", common + ["--output-dir", str(step07)])
-    print("EIAWOF13: all three separate PBB steps completed")
+    branch_map = args.branch_map.resolve() if args.branch_map else None
+    steps, eifmnp03 = build_steps(args.input_dir, args.output_dir, branch_map, month)
+    timings = run_steps(steps, InputCache(args.input_dir, steps, reader=eifmnp03.read_sas), max_workers=2)
+    for timing in timings:
+        print(f"EIAWOF13: {timing}")
+    print("EIAWOF13: all three PBB steps completed")
 
 
 if __name__ == "__main__":
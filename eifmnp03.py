@@ -21,7 +21,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from pbblnfmt import put as pbbln_put
+import fmt
+from sasio import read_sas as read_sas7bdat
 
 
 DEFAULT_BASE = Path("Data_Warehouse/MIS/XMIS/input/prod")
@@ -45,17 +46,12 @@ NUMERIC_ZERO = [
     "WSUSPEND", "WOISUSP", "WRECOVER", "WRECC", "WOIRECV", "WOIRECC",
     "WIISPW", "WOIW", "MARKETVL", "DAYS",
 ]
+# Low-cardinality status codes returned as categoricals by read_sas.
+CODE_COLUMNS = ("BORSTAT", "USER5")
 
 
-def read_sas(path: Path) -> pd.DataFrame:
-    df = pd.read_sas(path, format="sas7bdat", encoding="latin1")
-    df.columns = [str(c).upper() for c in df.columns]
-    for col in df.select_dtypes(include=["object"]).columns:
-        df[col] = df[col].map(
-            lambda x: x.decode("latin1").rstrip() if isinstance(x, bytes)
-            else (x.rstrip() if isinstance(x, str) else x)
-        )
-    return df
+def read_sas(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    return read_sas7bdat(path, columns=columns, encoding="latin1", categorical=CODE_COLUMNS)
 
 
 def sas_sum(*values: Any) -> float:
@@ -85,12 +81,39 @@ def branch_label(ntbrch: Any, branch_map: dict[int, str]) -> str:
     description = branch_map.get(code)
     if description is None:
         try:
-            description = pbbln_put(code, "BRCHCD.", "")
+            description = fmt.put("PBBLNFMT.BRCHCD", code, "")
         except KeyError:
             description = ""
     return f"{description} {code:03d}".strip()
 
 
+def branch_labels(ntbrch: pd.Series, branch_map: dict[int, str]) -> pd.Series:
+    """branch_label for a whole column, with one BRCHCD. lookup over the distinct codes."""
+    codes, uniques = pd.factorize(ntbrch, use_na_sentinel=True)
+    numbers = []
+    for value in uniques:
+        try:
+            numbers.append(int(value))
+        except (TypeError, ValueError):
+            numbers.append(None)
+    unmapped = sorted({code for code in numbers if code is not None and code not in branch_map})
+    try:
+        described = dict(zip(unmapped, fmt.put_array("PBBLNFMT.BRCHCD", unmapped, "")))
+    except KeyError:
+        described = dict.fromkeys(unmapped, "")
+    labels = np.empty(len(uniques) + 1, dtype=object)
+    for index, code in enumerate(numbers):
+        if code is None:
+            labels[index] = ""
+        else:
+            description = branch_map.get(code)
+            if description is None:
+                description = described[code]
+            labels[index] = f"{description} {code:03d}".strip()
+    labels[-1] = ""
+    return pd.Series(labels[codes], index=ntbrch.index, name=ntbrch.name)
+
+
 def remaining_months(date: pd.Timestamp, issue: pd.Timestamp, term: float) -> float:
     if pd.isna(date) or pd.isna(issue):
         return np.nan
@@ -111,11 +134,27 @@ def initialize_row(row: pd.Series) -> pd.Series:
     return row
 
 
+def rule78_batch(rem1: Any, rem2: Any, charge: Any, term: Any) -> np.ndarray:
+    """Rule-of-78 amount for months rem2..rem1 of every account in one pass.
+
+    sum(2 * (m + 1) * charge / (term * (term + 1))) over m = int(rem2)..int(rem1)
+    is an arithmetic series, so it reduces to
+    charge * ((b + 1) * (b + 2) - a * (a + 1)) / (term * (term + 1)).
+    Inputs broadcast; stacking two rem1 rows returns IIS and SUSPEND together.
+    Missing rem1/rem2, term <= 0 and rem1 < rem2 give 0 as before.
+    """
+    rem1, rem2, charge, term = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (rem1, rem2, charge, term))
+    )
+    valid = ~(np.isnan(rem1) | np.isnan(rem2) | (term <= 0) | (rem1 < rem2))
+    first, last = np.trunc(rem2), np.trunc(rem1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = charge * ((last + 1) * (last + 2) - first * (first + 1)) / (term * (term + 1))
+    return np.where(valid, total, 0.0)
+
+
 def rule78_sum(rem1: float, rem2: float, charge: float, term: float) -> float:
-    if any(pd.isna(x) for x in (rem1, rem2)) or term <= 0 or rem1 < rem2:
-        return 0.0
-    months = np.arange(int(rem1), int(rem2) - 1, -1)
-    return float((2 * (months + 1) * charge / (term * (term + 1))).sum())
+    return float(rule78_batch(rem1, rem2, charge, term))
 
 
 def written_off(row: pd.Series) -> pd.Series:
@@ -229,6 +268,267 @@ def calculate_current(row: pd.Series, report_date: pd.Timestamp) -> pd.Series:
     return rescheduled(written_off(row))
 
 
+# ---------------------------------------------------------------------------
+# Columnar engine.  The functions below evaluate exactly the same rules as
+# initialize_row/written_off/rescheduled/calculate_existing/calculate_current,
+# but over whole columns with NumPy masks instead of one pd.Series per loan.
+# Each "if" of the row path becomes a mask and every assignment is applied in
+# the same order, so the two engines produce identical values.  The row path
+# is kept as the reference engine (--engine row / --reconcile).
+# ---------------------------------------------------------------------------
+
+ENGINES = ("columnar", "row")
+
+IIS_COLUMNS = [
+    "BORSTAT", "UHC", "NETBAL", "IISP", "SUSPEND", "RECOVER", "RECC", "IISPW",
+    "IIS", "OIP", "OISUSP", "OIRECV", "OIRECC", "OIW", "OI", "TOTIIS",
+]
+
+
+def sas_sum_columns(*columns: Any) -> np.ndarray:
+    """Columnar sas_sum: missing values count as zero, summed left to right."""
+    total = None
+    for column in columns:
+        column = np.nan_to_num(np.asarray(column, dtype=float), nan=0.0)
+        total = column if total is None else total + column
+    return total
+
+
+def sas_dates(values: pd.Series | None, index: pd.Index) -> pd.Series:
+    """Columnar sas_date over a whole column (NaT where the column is absent)."""
+    if values is None:
+        return pd.Series(pd.NaT, index=index, dtype="datetime64[ns]")
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pd.to_datetime(values, unit="D", origin="1960-01-01")
+    return pd.to_datetime(values.map(sas_date))
+
+
+def remaining_months_column(date: pd.Timestamp | pd.Series, issue: pd.Series, term: np.ndarray) -> np.ndarray:
+    if isinstance(date, pd.Series):
+        year, month = date.dt.year, date.dt.month
+    else:
+        year, month = date.year, date.month
+    elapsed = (year - issue.dt.year) * 12 + month - issue.dt.month + 1
+    return term - elapsed.to_numpy(dtype=float)
+
+
+def floor_zero(values: np.ndarray) -> np.ndarray:
+    """Vectorized max(0, x); like the builtin, a missing x yields 0."""
+    return np.where(values > 0, values, 0.0)
+
+
+def numeric_column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """Columnar val(row, name) for numeric fields."""
+    if name not in df:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[name], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+
+
+def text_column(df: pd.DataFrame, name: str, default: str) -> pd.Series:
+    """Columnar val(row, name, default) for text fields (categoricals included)."""
+    if name not in df:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[name].astype(object).where(df[name].notna(), default)
+
+
+def loan_type_codes(df: pd.DataFrame) -> np.ndarray:
+    """Columnar int(val(row, "LOANTYPE", 0))."""
+    return numeric_column(df, "LOANTYPE").astype(np.int64)
+
+
+def initialize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for c in NUMERIC_ZERO:
+        df[c] = df[c].fillna(0.0) if c in df else 0.0
+    df["EARNTERM"] = df["EARNTERM"].where(df["EARNTERM"] != 0, df["NOTETERM"])
+    for c, default in [("WRITEOFF", "N"), ("WDOWNIND", "N"), ("RESCHEIND", "N"), ("USER5", ""), ("BORSTAT", "")]:
+        df[c] = text_column(df, c, default)
+    written = (df["WRITEOFF"] == "Y") & (df["WDOWNIND"] != "Y")
+    df.loc[written, "BORSTAT"] = "W"
+    return df
+
+
+def written_off_frame(df: pd.DataFrame) -> pd.DataFrame:
+    written = (df["WRITEOFF"] == "Y").to_numpy()
+    if not written.any():
+        return df
+    full = written & (df["WDOWNIND"] != "Y").to_numpy()
+    down = written & ~full
+    iisp, oip = numeric_column(df, "IISP"), numeric_column(df, "OIP")
+    suspend = np.where(written, numeric_column(df, "WSUSPEND"), numeric_column(df, "SUSPEND"))
+    oisusp = np.where(written, numeric_column(df, "WOISUSP"), numeric_column(df, "OISUSP"))
+    recover, recc = numeric_column(df, "RECOVER"), numeric_column(df, "RECC")
+    oirecv, oirecc = numeric_column(df, "OIRECV"), numeric_column(df, "OIRECC")
+    iis, oi = numeric_column(df, "IIS"), numeric_column(df, "OI")
+    iispw, oiw = numeric_column(df, "IISPW"), numeric_column(df, "OIW")
+
+    recover = np.where(full, numeric_column(df, "WRECOVER"), recover)
+    recc = np.where(full, numeric_column(df, "WRECC"), recc)
+    oirecv = np.where(full, numeric_column(df, "WOIRECV"), oirecv)
+    oirecc = np.where(full, numeric_column(df, "WOIRECC"), oirecc)
+    iis = np.where(full, 0.0, iis)
+    oi = np.where(full, 0.0, oi)
+    iispw = np.where(full, sas_sum_columns(iisp, suspend, -recover, -recc), iispw)
+    oiw = np.where(full, sas_sum_columns(oip, oisusp, -oirecv, -oirecc), oiw)
+
+    iispw = np.where(down, numeric_column(df, "WIISPW"), iispw)
+    oiw = np.where(down, numeric_column(df, "WOIW"), oiw)
+    iis = np.where(down, sas_sum_columns(iisp, suspend, -recover, -recc, -iispw), iis)
+    reverse = down & (iis < 0)
+    recover = np.where(reverse, 0.0, recover)
+    iis = np.where(reverse, sas_sum_columns(iisp, suspend, -recc, -iispw), iis)
+    oi = np.where(down, sas_sum_columns(oip, oisusp, -oirecv, -oirecc, -oiw), oi)
+    reverse = down & (oi < 0)
+    oirecv = np.where(reverse, 0.0, oirecv)
+    oirecc = np.where(reverse, 0.0, oirecc)
+    oi = np.where(reverse, sas_sum_columns(oip, oisusp, -oiw), oi)
+
+    for c, values in [("SUSPEND", suspend), ("OISUSP", oisusp), ("RECOVER", recover), ("RECC", recc),
+                      ("OIRECV", oirecv), ("OIRECC", oirecc), ("IIS", iis), ("OI", oi),
+                      ("IISPW", iispw), ("OIW", oiw)]:
+        df[c] = values
+    return df
+
+
+def rescheduled_frame(df: pd.DataFrame) -> pd.DataFrame:
+    resched = (df["RESCHEIND"] == "Y").to_numpy()
+    if resched.any():
+        for target, source in [("SUSPEND", "WSUSPEND"), ("OISUSP", "WOISUSP"),
+                               ("RECOVER", "WRECOVER"), ("RECC", "WRECC"),
+                               ("OIRECV", "WOIRECV"), ("OIRECC", "WOIRECC")]:
+            df[target] = np.where(resched, numeric_column(df, source), df[target])
+        iis = sas_sum_columns(df["IISP"], df["SUSPEND"], -df["RECOVER"], -df["RECC"], -numeric_column(df, "IISPW"))
+        oi = sas_sum_columns(df["OIP"], df["OISUSP"], -df["OIRECV"], -df["OIRECC"], -numeric_column(df, "OIW"))
+        df["IIS"] = np.where(resched, iis, df["IIS"])
+        df["OI"] = np.where(resched, oi, df["OI"])
+    df["TOTIIS"] = sas_sum_columns(df["IIS"], df["OI"])
+    return df
+
+
+def calculate_existing_frame(loan: pd.DataFrame, report_date: pd.Timestamp) -> pd.DataFrame:
+    """Columnar calculate_existing for every EXIST = 'Y' account at once."""
+    df = initialize_frame(loan)
+    for c in ["IIS", "SUSPEND", "UHC", "OI", "OISUSP", "RECOVER", "OIRECV", "OIRECC", "OIW", "RECC"]:
+        df[c] = 0.0
+    lt = loan_type_codes(df)
+    hp, accrual = np.isin(lt, [128, 130]), np.isin(lt, list(ACCRUAL_TYPES))
+    days, curbal, marketvl = df["DAYS"].to_numpy(dtype=float), df["CURBAL"].to_numpy(dtype=float), df["MARKETVL"].to_numpy(dtype=float)
+    iisp, oip = df["IISP"].to_numpy(dtype=float), df["OIP"].to_numpy(dtype=float)
+    term, charge = df["EARNTERM"].to_numpy(dtype=float), df["TERMCHG"].to_numpy(dtype=float)
+    borstat, user5_n = df["BORSTAT"], (df["USER5"] == "N").to_numpy()
+    written, repossessed = (borstat == "W").to_numpy(), (borstat == "R").to_numpy()
+    nonperforming = (days > 89) | borstat.isin(["F", "R", "I"]).to_numpy() | (user5_n & ~np.isin(lt, [983, 993]))
+    bl, issue = sas_dates(df.get("BLDATE"), df.index), sas_dates(df.get("ISSDTE"), df.index)
+    billed = bl.notna().to_numpy() & (charge > 0) & nonperforming
+    fees_oi = sas_sum_columns(df["FEETOT2"], -df["FEEAMTA"], df["FEEAMT5"])
+    fees_oisusp = sas_sum_columns(df["FEEAMT"], -df["FEEAMTA"], df["FEEAMT5"])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rem1 = remaining_months_column(bl, issue, term) - np.where(hp, 3, 1)
+        rem2 = floor_zero(remaining_months_column(report_date, issue, term))
+        rems = remaining_months_column(pd.Timestamp(report_date.year, 1, 1), issue, term)
+        iis, suspend = np.where(billed, rule78_batch(np.vstack([rem1, rems]), rem2, charge, term), 0.0)
+        oi = np.where(nonperforming, fees_oi, 0.0)
+        oisusp = np.where((billed & ~hp) | (~billed & nonperforming), fees_oisusp, 0.0)
+        uhc = np.where(billed & (rem2 > 0) & (term > 0), rem2 * (rem2 + 1) * charge / (term * (term + 1)), 0.0)
+    netbal = curbal - uhc
+    iis = np.where((netbal <= iisp) & (nonperforming | user5_n), netbal, iis)
+
+    iispw = np.where(written, iisp, df["IISPW"].to_numpy(dtype=float))
+    oiw = np.where(written, oip, 0.0)
+    recover = np.where(written, 0.0, iisp + suspend - iis)
+    recc, oirecv, oirecc = np.zeros(len(df)), np.zeros(len(df)), np.zeros(len(df))
+    negative = ~written & (recover < 0)
+    suspend = np.where(negative, suspend - recover, suspend)
+    recover = np.where(negative, 0.0, recover)
+    excess = ~written & (recover > iisp)
+    recc = np.where(excess, recover - iisp, recc)
+    recover = np.where(excess, iisp, recover)
+    other = ~written & ~hp
+    oirecv = np.where(other, oip - oi, oirecv)
+    negative = other & (oirecv < 0)
+    oisusp = np.where(negative, oisusp - oirecv, oisusp)
+    oirecv = np.where(negative, 0.0, oirecv)
+    oirecv = np.where(other & (oisusp < 0), oirecv - oisusp, oirecv)
+    excess = other & (oirecv > oip)
+    oirecc = np.where(excess, oirecv - oip, oirecc)
+    oirecv = np.where(excess, oip, oirecv)
+
+    netexp = curbal - iisp - np.where(repossessed, marketvl, 0.0)
+    reverse = (charge == 0) & (((netexp > 0) & (days > 89)) | repossessed)
+    iis = np.where(reverse, recover, iis)
+    recover = np.where(reverse, 0.0, recover)
+    oi = np.where(reverse, fees_oi, oi)
+    oirecv = np.where(reverse, 0.0, oirecv)
+    iis = np.where(accrual, df["ACCRUAL"].to_numpy(dtype=float), iis)
+    oisusp = sas_sum_columns(oirecv, oirecc, oiw, -oip, oi)
+    oirecv = np.where(oisusp < 0, oirecv - oisusp, oirecv)
+    excess = oirecv > oip
+    oirecc = np.where(excess, oirecv - oip, oirecc)
+    oirecv = np.where(excess, oip, oirecv)
+    oisusp = sas_sum_columns(oirecv, oirecc, oiw, -oip, oi)
+
+    for c, values in [("IIS", iis), ("SUSPEND", suspend), ("UHC", uhc), ("OI", oi), ("OISUSP", oisusp),
+                      ("RECOVER", recover), ("OIRECV", oirecv), ("OIRECC", oirecc), ("OIW", oiw),
+                      ("RECC", recc), ("NETBAL", netbal), ("IISPW", iispw)]:
+        df[c] = values
+    return rescheduled_frame(written_off_frame(df))
+
+
+def calculate_current_frame(loan: pd.DataFrame, report_date: pd.Timestamp) -> pd.DataFrame:
+    """Columnar calculate_current for every non-existing account at once."""
+    df = initialize_frame(loan)
+    for c in ["IIS", "UHC", "OI", "RECOVER", "RECC", "OIRECV", "OIRECC", "IISPW", "OIW"]:
+        df[c] = 0.0
+    lt = loan_type_codes(df)
+    term, charge = df["EARNTERM"].to_numpy(dtype=float), df["TERMCHG"].to_numpy(dtype=float)
+    issue, bl = sas_dates(df.get("ISSDTE"), df.index), sas_dates(df.get("BLDATE"), df.index)
+    condition = (bl.notna().to_numpy() & (charge > 0)) | ((df["USER5"] == "N").to_numpy() & ~np.isin(lt, [983, 993]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rem2 = floor_zero(remaining_months_column(report_date, issue, term))
+        rem1 = remaining_months_column(bl, issue, term) - np.where(np.isin(lt, [128, 130]), 3, 1)
+        iis = np.where(condition, rule78_batch(rem1, rem2, charge, term), 0.0)
+        uhc = np.where((rem2 > 0) & (term > 0), rem2 * (rem2 + 1) * charge / (term * (term + 1)), 0.0)
+    oi = sas_sum_columns(df["FEETOT2"], -df["FEEAMTA"], df["FEEAMT5"])
+    iis = np.where(np.isin(lt, list(ACCRUAL_TYPES)), df["ACCRUAL"].to_numpy(dtype=float), iis)
+    df["IIS"], df["UHC"], df["OI"] = iis, uhc, oi
+    df["SUSPEND"], df["OISUSP"] = iis, oi
+    df["NETBAL"] = df["CURBAL"] - df["UHC"]
+    return rescheduled_frame(written_off_frame(df))
+
+
+def calculate_iis(loan: pd.DataFrame, report_date: pd.Timestamp, engine: str = "columnar") -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return the (existing, current) IIS frames using the requested engine."""
+    existing = loan[loan.get("EXIST", "") == "Y"]
+    current = loan[loan.get("EXIST", "") != "Y"]
+    if engine == "row":
+        return (existing.apply(calculate_existing, axis=1, report_date=report_date),
+                current.apply(calculate_current, axis=1, report_date=report_date))
+    if engine != "columnar":
+        raise ValueError(f"unknown IIS engine {engine!r}; expected one of {ENGINES}")
+    return calculate_existing_frame(existing, report_date), calculate_current_frame(current, report_date)
+
+
+def reconcile_iis(loan: pd.DataFrame, report_date: pd.Timestamp) -> list[str]:
+    """Run both engines and return 'SUBSET.COLUMN' for every column that differs."""
+    mismatches = []
+    results = zip(("EXISTING", "CURRENT"), calculate_iis(loan, report_date, "row"), calculate_iis(loan, report_date, "columnar"))
+    for subset, row_frame, column_frame in results:
+        if row_frame.empty and column_frame.empty:
+            continue
+        for c in IIS_COLUMNS:
+            expected, actual = row_frame[c], column_frame[c].reindex(row_frame.index)
+            if c == "BORSTAT":
+                same = expected.astype(str).equals(actual.astype(str))
+            else:
+                same = np.array_equal(expected.to_numpy(dtype=float), actual.to_numpy(dtype=float), equal_nan=True)
+            if not same:
+                mismatches.append(f"{subset}.{c}")
+    return mismatches
+
+
 def apply_nplntb(previous: pd.DataFrame) -> pd.DataFrame:
     """Match PGM(NPLNTB), whose supplied transformation rules are commented."""
     return previous
@@ -309,7 +609,7 @@ def write_original_listing(df: pd.DataFrame, report_date: pd.Timestamp, output:
     return report
 
 
-def main() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--input-dir", type=Path, default=DEFAULT_BASE)
     p.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
@@ -319,12 +619,25 @@ def main() -> None:
     p.add_argument("--ploan-pattern", default="ploan{mm}.sas7bdat")
     p.add_argument("--branch-map", type=Path)
     p.add_argument("--no-console-report", action="store_true")
-    args = p.parse_args()
+    p.add_argument("--engine", choices=ENGINES, default="columnar",
+                   help="IIS calculation engine; 'row' is the original per-account reference path")
+    p.add_argument("--reconcile", action="store_true",
+                   help="Also run the row engine and stop if any IIS column differs")
+    return p.parse_args(argv)
+
+
+def run(args: argparse.Namespace, loan: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Run the job and return the combined IIS frame (NPL.IISMM).
+
+    loan, when given, is LOANMM as already read by read_sas(); it is not
+    modified, so a controller can share one copy between steps.
+    """
     args.output_dir.mkdir(parents=True, exist_ok=True)
     # Replacement for NPL.REPTDATE: process as at yesterday's calendar date.
     report_date = pd.Timestamp(date.today() - timedelta(days=1))
     mm, prev = f"{report_date.month:02d}", f"{(report_date.month - 2) % 12 + 1:02d}"
-    loan = read_sas(args.input_dir / args.loan_pattern.format(mm=mm))
+    if loan is None:
+        loan = read_sas(args.input_dir / args.loan_pattern.format(mm=mm))
     wiis = read_sas(args.input_dir / args.wiis_file).drop(columns=["NOTENO", "NTBRCH"], errors="ignore")
     wiis["_WIIS"] = True
     loan = loan.merge(wiis, on="ACCTNO", how="left", suffixes=("", "_WIIS"))
@@ -333,10 +646,14 @@ def main() -> None:
         loan.loc[loan["LOANTYPE"].isin([380, 381]), "FEEAMT"] = loan.loc[loan["LOANTYPE"].isin([380, 381]), "FEETOT2"]
         loan.loc[loan["LOANTYPE"].isin([983, 993]), "WDOWNIND"] = "N"
     bmap = load_branch_map(args.branch_map)
-    existing = loan[loan.get("EXIST", "") == "Y"].apply(calculate_existing, axis=1, report_date=report_date)
-    current = loan[loan.get("EXIST", "") != "Y"].apply(calculate_current, axis=1, report_date=report_date)
+    if args.reconcile:
+        mismatches = reconcile_iis(loan, report_date)
+        if mismatches:
+            raise SystemExit(f"EIFMNP03: row and columnar IIS engines differ on {', '.join(mismatches)}")
+        print("EIFMNP03: row and columnar IIS engines reconcile")
+    existing, current = calculate_iis(loan, report_date, args.engine)
     for df in (existing, current):
-        df["BRANCH"] = df["NTBRCH"].map(lambda x: branch_label(x, bmap))
+        df["BRANCH"] = branch_labels(df["NTBRCH"], bmap)
         df["LOANTYP"] = df["LOANTYPE"].map(LOAN_TYPES).fillna("OTHERS")
     if mm == "01":
         for df in (existing, current): df[["IISPCUM", "OIPCUM", "POI"]] = 0.0
@@ -388,6 +705,11 @@ def main() -> None:
     print(f"Processed {len(combined):,} rows for {report_date.date()} into {args.output_dir}")
     if not args.no_console_report:
         print(report, end="")
+    return combined
+
+
+def main(argv: list[str] | None = None) -> None:
+    run(parse_args(argv))
 
 
 if __name__ == "__main__":
@@ -11,9 +11,15 @@ import numpy as np
 import pandas as pd
 
 try:
-    from eifmnp03 import branch_label, load_branch_map, read_sas, risk, sas_date, sas_sum, val
+    from eifmnp03 import (
+        ENGINES, branch_labels, floor_zero, load_branch_map, loan_type_codes, read_sas,
+        remaining_months_column, risk, sas_date, sas_dates, sas_sum, sas_sum_columns, text_column, val,
+    )
 except ModuleNotFoundError:
-    from EIFMNP03 import branch_label, load_branch_map, read_sas, risk, sas_date, sas_sum, val
+    from EIFMNP03 import (
+        ENGINES, branch_labels, floor_zero, load_branch_map, loan_type_codes, read_sas,
+        remaining_months_column, risk, sas_date, sas_dates, sas_sum, sas_sum_columns, text_column, val,
+    )
 
 
 DEFAULT_BASE = Path("Data_Warehouse/MIS/XMIS/input/prod")
@@ -147,27 +153,163 @@ def provision(row: pd.Series, report_date: pd.Timestamp, existing: bool) -> pd.S
     return row
 
 
-def main() -> None:
+PROVISION_COLUMNS = ["BORSTAT", "UHC", "NETBAL", "OSPRIN", "OTHERFEE", "MARKETVL", "NETEXP", "SP", "SPPL", "RECOVER", "SPPW"]
+
+
+def provision_frame(data: pd.DataFrame, report_date: pd.Timestamp, existing: bool) -> pd.DataFrame:
+    """Columnar provision(): the same UHC/NETEXP/SP tiers and overrides as masks."""
+    df = data.copy()
+    for c in ["CURBAL", "TERMCHG", "EARNTERM", "NOTETERM", "IIS", "FEEAMT", "FEETOT2", "FEEAMT8",
+              "FEEAMTA", "FEEAMT5", "APPVALUE", "MARKETVL", "SPP2", "WREALVL", "WSPPL", "WSP",
+              "WRECOVER", "WSPPW", "DAYS"]:
+        df[c] = df[c].fillna(0.0) if c in df else 0.0
+    df["EARNTERM"] = df["EARNTERM"].where(df["EARNTERM"] != 0, df["NOTETERM"])
+    num = lambda c: df[c].to_numpy(dtype=float)
+    text = lambda c, default: text_column(df, c, default).to_numpy(dtype=object)
+    lt, days = loan_type_codes(df), num("DAYS")
+    borstat, user5, census7 = text("BORSTAT", ""), text("USER5", ""), text("CENSUS7", "")
+    written = text("WRITEOFF", "N") == "Y"
+    wdown = text("WDOWNIND", "N") == "Y"
+    flagged = written & ~wdown
+    borstat = np.where(flagged, "W", borstat)
+    if flagged.any():
+        df["BORSTAT"] = np.where(flagged, "W", df["BORSTAT"].astype(object) if "BORSTAT" in df else np.nan)
+    issue = sas_dates(df.get("ISSDTE"), df.index)
+    curbal, term, charge, appvalue, wrealvl, spp2 = num("CURBAL"), num("EARNTERM"), num("TERMCHG"), num("APPVALUE"), num("WREALVL"), num("SPP2")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rem2 = floor_zero(remaining_months_column(report_date, issue, term))
+        uhc = np.where((rem2 > 0) & (term > 0), rem2 * (rem2 + 1) * charge / (term * (term + 1)), 0.0)
+    df["UHC"] = uhc
+    df["NETBAL"] = curbal - uhc
+    osprin = curbal - uhc - num("IIS")
+    df["OSPRIN"] = osprin
+    other = np.where(np.isin(lt, [380, 381]),
+                     sas_sum_columns(df["FEEAMT"], -df["FEETOT2"]),
+                     sas_sum_columns(df["FEEAMT8"], -df["FEETOT2"], df["FEEAMTA"], -df["FEEAMT5"]))
+    otherfee = np.where(np.isin(lt, [983, 993]), 0.0, floor_zero(other))
+    df["OTHERFEE"] = otherfee
+    secured = ((appvalue > 0) & (np.isin(lt, [705, 128, 700, 130, 380, 381]) | (census7 == "9"))
+               & ((days > 89) | (user5 == "N")) & ~np.isin(borstat, ["F", "R", "I", "Y", "W"]) & ~np.isin(lt, [983, 993]))
+    hardcode = text("HARDCODE", "N") == "Y"
+    age = np.trunc(report_date.year - issue.dt.year.to_numpy(dtype=float) + (report_date.month - issue.dt.month.to_numpy(dtype=float)) / 12)
+    age = np.where(np.isnan(age), 0.0, age)
+
+    market = num("MARKETVL")
+    market = np.where(secured & (census7 != "9"), appvalue * (1 - age * 0.2), market)
+    market = np.where(~secured & (borstat != "R"), 0.0, market)
+    market = np.where(hardcode, wrealvl, market)
+    market = np.where(secured, floor_zero(market), market)
+    netexp = osprin + otherfee - np.where(secured & (days > 273), 0.0, market)
+    sp = np.select(
+        [secured & (days > 364), secured & (days > 273), secured,
+         (days > 364) | np.isin(borstat, ["F", "R", "I", "W"]), days > 273, (days > 89) & (borstat == "Y")],
+        [netexp, netexp / 2, netexp * 0.2, netexp, netexp / 2, netexp / 5],
+        default=0.0,
+    )
+    sp = floor_zero(sp)
+    sppl = floor_zero(sp - spp2) if existing else sp
+    sppl = np.where(hardcode, num("WSPPL"), sppl)
+    sp = np.where(hardcode, num("WSP"), sp)
+    recover = floor_zero(spp2 - sp) if existing else np.zeros(len(df))
+    sppw = np.zeros(len(df))
+    closed = borstat == "W"
+    sppw = np.where(closed, spp2, sppw)
+    sp = np.where(closed, 0.0, sp)
+    market = np.where(closed, 0.0, market)
+
+    sppl = np.where(written, num("WSPPL"), sppl)
+    otherfee = np.where(written, 0.0, otherfee)
+    full = written & ~wdown
+    recover = np.where(full, num("WRECOVER"), recover)
+    sp = np.where(full, 0.0, sp)
+    sppw = np.where(full, sas_sum_columns(spp2, sppl, -recover), sppw)
+    down = written & wdown
+    sppw = np.where(down, num("WSPPW"), sppw)
+    recover = np.where(down & (netexp <= 0), 0.0, recover)
+    sp = np.where(down, sas_sum_columns(spp2, sppl, -recover, -sppw), sp)
+    reverse = down & (netexp <= 0) & (sp > 0)
+    recover = np.where(reverse, sp, recover)
+    sp = np.where(reverse, 0.0, sp)
+
+    resched = text("RESCHEIND", "") == "Y"
+    recover = np.where(resched, num("WRECOVER"), recover)
+    sppw = np.where(resched, num("WSPPW"), sppw)
+    sp = np.where(resched, sas_sum_columns(spp2, sppl, -recover, -sppw), sp)
+
+    df["OTHERFEE"], df["MARKETVL"], df["NETEXP"], df["SP"] = otherfee, market, netexp, sp
+    df["SPPL"], df["RECOVER"], df["SPPW"] = sppl, recover, sppw
+    return df
+
+
+def calculate_provision(data: pd.DataFrame, report_date: pd.Timestamp, engine: str = "columnar") -> pd.DataFrame:
+    """Existing accounts followed by current accounts, as in the SAS SET order."""
+    exist = data.get("EXIST", "") == "Y"
+    if engine == "row":
+        parts = [data[exist].apply(provision, axis=1, report_date=report_date, existing=True),
+                 data[~exist].apply(provision, axis=1, report_date=report_date, existing=False)]
+    elif engine == "columnar":
+        parts = [provision_frame(data[exist], report_date, True), provision_frame(data[~exist], report_date, False)]
+    else:
+        raise ValueError(f"unknown provision engine {engine!r}; expected one of {ENGINES}")
+    return pd.concat(parts, ignore_index=True, sort=False)
+
+
+def reconcile_provision(data: pd.DataFrame, report_date: pd.Timestamp) -> list[str]:
+    """Run provision() as the oracle and return every column the columnar engine gets wrong."""
+    expected = calculate_provision(data, report_date, "row")
+    actual = calculate_provision(data, report_date, "columnar")
+    mismatches = []
+    for c in PROVISION_COLUMNS:
+        if c == "BORSTAT":
+            same = expected[c].astype(str).equals(actual[c].astype(str))
+        else:
+            same = np.array_equal(expected[c].to_numpy(dtype=float), actual[c].to_numpy(dtype=float), equal_nan=True)
+        if not same:
+            mismatches.append(c)
+    return mismatches
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p=argparse.ArgumentParser(); p.add_argument("--input-dir",type=Path,default=DEFAULT_BASE); p.add_argument("--output-dir",type=Path,default=DEFAULT_OUTPUT_DIR)
     p.add_argument("--iis-file",type=Path,help="Optional explicit IIS SAS7BDAT path")
     p.add_argument("--iis-pattern",default="iis{mm}.sas7bdat"); p.add_argument("--loan-pattern",default="loan{mm}.sas7bdat")
     p.add_argument("--wsp2-file",default="wsp2.sas7bdat"); p.add_argument("--previous-pattern",default="sp2{mm}.sas7bdat"); p.add_argument("--branch-map",type=Path); p.add_argument("--no-console-report",action="store_true")
-    a=p.parse_args(); a.output_dir.mkdir(parents=True,exist_ok=True); rd=pd.Timestamp(date.today()-timedelta(days=1)); mm=f"{rd.month:02d}"; prev=f"{(rd.month-2)%12+1:02d}"
-    loan=read_sas(a.input_dir/a.loan_pattern.format(mm=mm)); wsp=read_sas(a.input_dir/a.wsp2_file).drop(columns=["NOTENO","NTBRCH"],errors="ignore"); wsp["_WSP"]=True
+    p.add_argument("--engine",choices=ENGINES,default="columnar",help="Provision engine; 'row' is the original per-account reference path")
+    p.add_argument("--reconcile",action="store_true",help="Also run the row engine and stop if SP/SPPL/RECOVER/SPPW or any derived column differs")
+    return p.parse_args(argv)
+
+
+def run(a: argparse.Namespace, loan: pd.DataFrame | None = None, iis: pd.DataFrame | None = None) -> pd.DataFrame:
+    """Run the job and return SP2MM.
+
+    loan is LOANMM as already read by read_sas() and iis the NPL.IISMM frame
+    returned by EIFMNP03.run(); either is read from disk when not given.
+    Neither is modified.
+    """
+    a.output_dir.mkdir(parents=True,exist_ok=True); rd=pd.Timestamp(date.today()-timedelta(days=1)); mm=f"{rd.month:02d}"; prev=f"{(rd.month-2)%12+1:02d}"
+    loan=read_sas(a.input_dir/a.loan_pattern.format(mm=mm)) if loan is None else loan; wsp=read_sas(a.input_dir/a.wsp2_file).drop(columns=["NOTENO","NTBRCH"],errors="ignore"); wsp["_WSP"]=True
     data=loan.merge(wsp,on="ACCTNO",how="left",suffixes=("","_WSP")); data["WRITEOFF"]=np.where(data["_WSP"].fillna(False),"Y","N")
     iis_path = a.iis_file if a.iis_file else a.input_dir/a.iis_pattern.format(mm=mm)
-    iis=read_table(iis_path)[["ACCTNO","IIS"]].drop_duplicates("ACCTNO"); data=data.merge(iis,on="ACCTNO",how="left",suffixes=("","_IIS")); data["IIS"]=data.get("IIS_IIS",data.get("IIS",0)).fillna(0)
-    existing=data[data.get("EXIST","")=="Y"].apply(provision,axis=1,report_date=rd,existing=True); current=data[data.get("EXIST","")!="Y"].apply(provision,axis=1,report_date=rd,existing=False)
-    out=pd.concat([existing,current],ignore_index=True,sort=False)
+    iis=(read_table(iis_path) if iis is None else iis)[["ACCTNO","IIS"]].drop_duplicates("ACCTNO"); data=data.merge(iis,on="ACCTNO",how="left",suffixes=("","_IIS")); data["IIS"]=data.get("IIS_IIS",data.get("IIS",0)).fillna(0)
+    if a.reconcile:
+        mismatches=reconcile_provision(data,rd)
+        if mismatches: raise SystemExit(f"{PROGRAM_NAME}: row and columnar provision engines differ on {', '.join(mismatches)}")
+        print(f"{PROGRAM_NAME}: row and columnar provision engines reconcile")
+    out=calculate_provision(data,rd,a.engine)
     if PIBB_PROFILE:
         out=out[((out["COSTCTR"]>=3000)&(out["COSTCTR"]<=3999))|out["COSTCTR"].isin([4043,4048])]
     else:
         out=out[((out["COSTCTR"]<3000)|(out["COSTCTR"]>3999))&~out["COSTCTR"].isin([4043,4048])&out["COSTCTR"].notna()]
-    bm=load_branch_map(a.branch_map); out["BRANCH"]=out["NTBRCH"].map(lambda x:branch_label(x,bm)); out["LOANTYP"]=out["LOANTYPE"].map(LNTYP).fillna("OTHERS"); out["RISK"]=out.apply(risk,axis=1); out=out.drop_duplicates(["ACCTNO","NOTENO"])
+    bm=load_branch_map(a.branch_map); out["BRANCH"]=branch_labels(out["NTBRCH"],bm); out["LOANTYP"]=out["LOANTYPE"].map(LNTYP).fillna("OTHERS"); out["RISK"]=out.apply(risk,axis=1); out=out.drop_duplicates(["ACCTNO","NOTENO"])
     out.to_csv(a.output_dir/f"sp2{mm}.csv",index=False); measures=["CURBAL","UHC","NETBAL","IIS","OSPRIN","MARKETVL","NETEXP","SPP2","SPPL","RECOVER","SPPW","SP","OTHERFEE"]
     out.groupby(["LOANTYP","RISK","BRANCH"],dropna=False)[measures].sum().reset_index().to_csv(a.output_dir/f"{PROGRAM_NAME.lower()}_summary.csv",index=False)
     out.to_csv(a.output_dir/f"{PROGRAM_NAME.lower()}_detail.csv",index=False); report=write_original_report(out,rd,a.output_dir); print(f"{PROGRAM_NAME} processed {len(out):,} rows for {rd.date()}")
     if not a.no_console_report: print(report,end="")
+    return out
+
+
+def main(argv: list[str] | None = None) -> None:
+    run(parse_args(argv))
 
 
 if __name__=="__main__": main()
@@ -8,9 +8,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 try:
-    from eifmnp03 import branch_label,load_branch_map,read_sas,risk,sas_date,sas_sum,val
+    from eifmnp03 import ENGINES,branch_labels,floor_zero,load_branch_map,loan_type_codes,read_sas,remaining_months_column,risk,sas_date,sas_dates,sas_sum,sas_sum_columns,text_column,val
 except ModuleNotFoundError:
-    from EIFMNP03 import branch_label,load_branch_map,read_sas,risk,sas_date,sas_sum,val
+    from EIFMNP03 import ENGINES,branch_labels,floor_zero,load_branch_map,loan_type_codes,read_sas,remaining_months_column,risk,sas_date,sas_dates,sas_sum,sas_sum_columns,text_column,val
 
 
 DEFAULT_BASE = Path("Data_Warehouse/MIS/XMIS/input/prod")
@@ -107,15 +107,121 @@ def movement(row:pd.Series,rd:pd.Timestamp,existing:bool)->pd.Series:
     row["CHKNPL"]=sas_sum(row["NETBALP"],row["NEWNPL"],row["ACCRINT"],-row["RECOVER"],-row["PL"],-row["NPLW"]); return row
 
 
-def main():
-    p=argparse.ArgumentParser();p.add_argument("--input-dir",type=Path,default=DEFAULT_BASE);p.add_argument("--output-dir",type=Path,default=DEFAULT_OUTPUT_DIR);p.add_argument("--loan-pattern",default="loan{mm}.sas7bdat");p.add_argument("--waq-file",default="waq.sas7bdat");p.add_argument("--branch-map",type=Path);p.add_argument("--no-console-report",action="store_true",help="Save the PROC PRINT listing without echoing it to stdout");a=p.parse_args()
-    a.output_dir.mkdir(parents=True,exist_ok=True);rd=pd.Timestamp(date.today()-timedelta(days=1));mm=f"{rd.month:02d}";loan=read_sas(a.input_dir/a.loan_pattern.format(mm=mm));waq=read_sas(a.input_dir/a.waq_file).drop(columns=["NOTENO","NTBRCH"],errors="ignore");waq["_WAQ"]=True
-    data=loan.merge(waq,on="ACCTNO",how="left",suffixes=("","_WAQ"));data["WRITEOFF"]=np.where(data["_WAQ"].fillna(False),"Y","N");ex=data[data.get("EXIST","")=="Y"].apply(movement,axis=1,rd=rd,existing=True);cu=data[data.get("EXIST","")!="Y"].apply(movement,axis=1,rd=rd,existing=False);out=pd.concat([ex,cu],ignore_index=True,sort=False)
+MOVEMENT_COLUMNS = ["BORSTAT", "CURBALP", "ADJUST", "NEWNPL", "ACCRINT", "RECOVER", "PL", "NPLW", "NPL", "OI", "CHKNPL"]
+
+
+def movement_frame(data:pd.DataFrame,rd:pd.Timestamp)->pd.DataFrame:
+    """Columnar movement() over existing and current accounts in one pass.
+
+    EXIST = 'Y' selects the existing-account equations per row, so the two
+    subsets no longer need separate apply calls.  Rows come back in the
+    original order: existing accounts first, then current accounts.
+    """
+    df=data.copy()
+    for c in ["CURBALP","CURBAL","NETBALP","FEEAMT","FEETOT2","FEEYTD","FEEPDYTD","TERMCHG","EARNTERM","NOTETERM","UHCP","WACCRINT","WNEWNPL","WRECOVER","WNPLW","DAYS"]:
+        df[c]=df[c].fillna(0.0) if c in df else 0.0
+    df["EARNTERM"]=df["EARNTERM"].where(df["EARNTERM"]!=0,df["NOTETERM"])
+    num=lambda c: df[c].to_numpy(dtype=float)
+    text=lambda c,default: text_column(df,c,default).to_numpy(dtype=object)
+    existing=(df["EXIST"]=="Y").to_numpy() if "EXIST" in df else np.zeros(len(df),dtype=bool)
+    lt=loan_type_codes(df); bor,user5=text("BORSTAT",""),text("USER5","")
+    written=text("WRITEOFF","N")=="Y"; wdown=text("WDOWNIND","N")=="Y"; flagged=written&~wdown
+    bor=np.where(flagged,"W",bor)
+    if flagged.any(): df["BORSTAT"]=np.where(flagged,"W",df["BORSTAT"].astype(object) if "BORSTAT" in df else np.nan)
+    days,curbal,netbalp,feeamt=num("DAYS"),num("CURBAL"),num("NETBALP"),num("FEEAMT")
+    term,charge=num("EARNTERM"),num("TERMCHG")
+    issue=sas_dates(df.get("ISSDTE"),df.index)
+    with np.errstate(divide="ignore",invalid="ignore"):
+        rem2=floor_zero(remaining_months_column(rd,issue,term))
+        uhc=np.where((rem2>0)&(term>0),rem2*(rem2+1)*charge/(term*(term+1)),0.0)
+    zeros=lambda: np.zeros(len(df))
+    adjust=np.where(existing,feeamt-num("FEETOT2"),0.0)
+    newnpl,accrint,recover,pl,nplw,npl=zeros(),zeros(),zeros(),zeros(),zeros(),zeros()
+    oi=num("OI") if "OI" in df else np.full(len(df),np.nan)
+    curbalp=num("CURBALP")
+
+    performing=existing&(((days<90)&np.isin(bor,["","A","C","S","T","Y"])&(curbal>=0)&(user5!="N"))|np.isin(lt,[983,993]))
+    pl=np.where(performing,netbalp,pl)
+    settled=performing&(days==0)&(curbal==0)
+    recover=np.where(settled,netbalp,recover); pl=np.where(settled,0.0,pl)
+
+    npl_exist=existing&~performing; closed=bor=="W"
+    accrint=np.where(npl_exist,num("FEEYTD"),accrint); oi=np.where(npl_exist,feeamt,oi)
+    curbalp=np.where(npl_exist&(bor=="F"),curbalp-num("UHCP"),curbalp)
+    recover=np.where(npl_exist,np.where(closed,0.0,curbalp-curbal+num("FEEPDYTD")),recover)
+    negative=npl_exist&(recover<0)
+    curbalp=np.where(negative,curbalp-recover,curbalp); recover=np.where(negative,0.0,recover)
+    nplw=np.where(npl_exist&closed,netbalp,nplw)
+    npl=np.where(npl_exist&~closed,curbal-uhc+oi,npl)
+
+    current=~existing
+    oi=np.where(current,feeamt,oi)
+    newnpl=np.where(current,curbal-uhc+oi,newnpl); npl=np.where(current,newnpl,npl)
+
+    override=written|np.isin(lt,[983,993])
+    accrint=np.where(override,num("WACCRINT"),accrint); newnpl=np.where(override,num("WNEWNPL"),newnpl); adjust=np.where(override,0.0,adjust)
+    full=override&~wdown
+    recover=np.where(full,num("WRECOVER"),recover); pl=np.where(full,0.0,pl); npl=np.where(full,0.0,npl)
+    nplw=np.where(full,sas_sum_columns(netbalp,newnpl,accrint,-recover),nplw)
+    down=override&wdown
+    nplw=np.where(down,num("WNPLW"),nplw)
+    npl=np.where(down,sas_sum_columns(netbalp,newnpl,accrint,-recover,-nplw,-pl),npl)
+
+    df["CURBALP"]=curbalp
+    for c,values in [("ADJUST",adjust),("NEWNPL",newnpl),("ACCRINT",accrint),("RECOVER",recover),("PL",pl),("NPLW",nplw),("NPL",npl),("OI",oi)]:
+        df[c]=values
+    df["CHKNPL"]=sas_sum_columns(netbalp,newnpl,accrint,-recover,-pl,-nplw)
+    order=np.concatenate([np.flatnonzero(existing),np.flatnonzero(current)])
+    return df.iloc[order].reset_index(drop=True)
+
+
+def calculate_movement(data:pd.DataFrame,rd:pd.Timestamp,engine:str="columnar")->pd.DataFrame:
+    if engine=="columnar": return movement_frame(data,rd)
+    if engine!="row": raise ValueError(f"unknown movement engine {engine!r}; expected one of {ENGINES}")
+    ex=data[data.get("EXIST","")=="Y"].apply(movement,axis=1,rd=rd,existing=True);cu=data[data.get("EXIST","")!="Y"].apply(movement,axis=1,rd=rd,existing=False)
+    return pd.concat([ex,cu],ignore_index=True,sort=False)
+
+
+def reconcile_movement(data:pd.DataFrame,rd:pd.Timestamp)->list[str]:
+    """Run movement() as the oracle and return every column the columnar engine gets wrong."""
+    expected,actual=calculate_movement(data,rd,"row"),calculate_movement(data,rd,"columnar")
+    mismatches=[]
+    for c in MOVEMENT_COLUMNS:
+        if c not in expected and c not in actual: continue
+        if c not in expected or c not in actual: mismatches.append(c); continue
+        if c=="BORSTAT": same=expected[c].astype(str).equals(actual[c].astype(str))
+        else: same=np.array_equal(expected[c].to_numpy(dtype=float),actual[c].to_numpy(dtype=float),equal_nan=True)
+        if not same: mismatches.append(c)
+    return mismatches
+
+
+def parse_args(argv:list[str]|None=None)->argparse.Namespace:
+    p=argparse.ArgumentParser();p.add_argument("--input-dir",type=Path,default=DEFAULT_BASE);p.add_argument("--output-dir",type=Path,default=DEFAULT_OUTPUT_DIR);p.add_argument("--loan-pattern",default="loan{mm}.sas7bdat");p.add_argument("--waq-file",default="waq.sas7bdat");p.add_argument("--branch-map",type=Path);p.add_argument("--no-console-report",action="store_true",help="Save the PROC PRINT listing without echoing it to stdout")
+    p.add_argument("--engine",choices=ENGINES,default="columnar",help="Movement engine; 'row' is the original per-account reference path");p.add_argument("--reconcile",action="store_true",help="Also run the row engine and stop if any movement column differs")
+    return p.parse_args(argv)
+
+
+def run(a:argparse.Namespace,loan:pd.DataFrame|None=None)->pd.DataFrame:
+    """Run the job and return AQ; loan is LOANMM as already read by read_sas() (not modified)."""
+    a.output_dir.mkdir(parents=True,exist_ok=True);rd=pd.Timestamp(date.today()-timedelta(days=1));mm=f"{rd.month:02d}"
+    if loan is None: loan=read_sas(a.input_dir/a.loan_pattern.format(mm=mm))
+    waq=read_sas(a.input_dir/a.waq_file).drop(columns=["NOTENO","NTBRCH"],errors="ignore");waq["_WAQ"]=True
+    data=loan.merge(waq,on="ACCTNO",how="left",suffixes=("","_WAQ"));data["WRITEOFF"]=np.where(data["_WAQ"].fillna(False),"Y","N")
+    if a.reconcile:
+        mismatches=reconcile_movement(data,rd)
+        if mismatches: raise SystemExit(f"{PROGRAM_NAME}: row and columnar movement engines differ on {', '.join(mismatches)}")
+        print(f"{PROGRAM_NAME}: row and columnar movement engines reconcile")
+    out=calculate_movement(data,rd,a.engine)
     if PIBB_PROFILE: out=out[((out["COSTCTR"]>=3000)&(out["COSTCTR"]<=3999))|out["COSTCTR"].isin([4043,4048])]
     else: out=out[((out["COSTCTR"]<3000)|(out["COSTCTR"]>3999))&~out["COSTCTR"].isin([4043,4048])&out["COSTCTR"].notna()]
-    bm=load_branch_map(a.branch_map);out["BRANCH"]=out["NTBRCH"].map(lambda x:branch_label(x,bm));out["LOANTYP"]=out["LOANTYPE"].map(LNTYP).fillna("OTHERS");out["RISK"]=out.apply(risk,axis=1);out.to_csv(a.output_dir/"aq.csv",index=False)
+    bm=load_branch_map(a.branch_map);out["BRANCH"]=branch_labels(out["NTBRCH"],bm);out["LOANTYP"]=out["LOANTYPE"].map(LNTYP).fillna("OTHERS");out["RISK"]=out.apply(risk,axis=1);out.to_csv(a.output_dir/"aq.csv",index=False)
     measures=["CURBALP","CURBAL","NETBALP","NEWNPL","ACCRINT","RECOVER","PL","NPLW","ADJUST","NPL"];out.groupby(["LOANTYP","RISK","BRANCH"],dropna=False)[measures].sum().reset_index().to_csv(a.output_dir/f"{PROGRAM_NAME.lower()}_summary.csv",index=False);out.to_csv(a.output_dir/f"{PROGRAM_NAME.lower()}_detail.csv",index=False);report=write_original_report(out,rd,a.output_dir);print(f"{PROGRAM_NAME} processed {len(out):,} rows for {rd.date()}");
     if not a.no_console_report: print(report,end="")
+    return out
+
+
+def main(argv:list[str]|None=None):
+    run(parse_args(argv))
 
 
 if __name__=="__main__":main()
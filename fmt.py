@@ -0,0 +1,419 @@
+"""One registry for the converted PROC FORMAT libraries.
+
+The format libraries are four modules with four matching engines:
+PBBLNFMT.put (with PBBELF), PBBDPFMT.lookup/lookup_range, pbbdpfmt3's
+apply_format and PBMISFMT.lookup.  This module indexes all of them behind
+one lookup:
+
+    fmt.put("PBBLNFMT.BRCHCD", 3001)           # -> "HOE"
+    fmt.put_array("DDCUSTCD", frame["CUSTCODE"])
+    fmt.hit_counts()                            # values looked up per format
+
+A name is SOURCE.FORMAT, or just FORMAT when only one source defines it
+(or every source that does defines the same format).  Case, a leading $
+and a trailing period are ignored, as in SAS.  Sources are PBBLNFMT,
+PBBDPFMT, PBBDPFMT3 (pbbdpfmt3.py) and PBMISFMT.
+
+PBBLNFMT formats keep PBBLNFMT's SAS value normalization.  Every other
+format runs on pbbdpfmt3's numeric/range/quoted selectors: PBBDPFMT's and
+PBMISFMT's dicts and range tables are turned into the same kind of rules,
+so numbers give exactly what those modules return, and a numeric code
+given as text ('204') matches as it would in SAS instead of missing a
+dict key.  Formats are compiled on first use and cached.  Definitions
+that give the same label for every value (see _Format.fingerprint) count
+as one format: an unqualified name resolves across them, and within one
+engine they share one compiled object.  default is returned when nothing
+matches and the format has no OTHER rule of its own.
+
+EIFMNP03 looks up BRCHCD. here; the other jobs still call their format
+module directly and move over one at a time.  The registry may be used
+from several threads: loading, compiling and the hit counts are guarded
+by one lock, the lookups themselves run outside it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import math
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import cached_property
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+SOURCES = ("PBBLNFMT", "PBBDPFMT", "PBBDPFMT3", "PBMISFMT")
+_NO_OTHER = object()
+# Text no format names, to see what unmatched text gets.
+_UNMATCHED = "\x00"
+
+
+class _Format(ABC):
+    """A compiled format: put() for one value, put_array() for a column.
+
+    fingerprint identifies what the format returns, not where it came
+    from: the labels at every number and text its rules turn on (each
+    boundary, the gaps between boundaries, missing, unmatched text),
+    with runs of equal labels merged.  Two definitions with the same
+    fingerprint give the same label for every number and every text they
+    name, whatever source and layout they come from.
+    """
+
+    definition: Any
+
+    @abstractmethod
+    def put(self, value: Any, default: Any = None) -> Any:
+        """The label for one value."""
+
+    @abstractmethod
+    def put_array(self, values: Iterable[Any], default: Any = None) -> np.ndarray:
+        """The labels for a column, as an object array aligned with values."""
+
+    @abstractmethod
+    def probes(self) -> tuple[list[float], list[str]] | None:
+        """The numbers and texts the rules turn on; None when they cannot be listed."""
+
+    @cached_property
+    def fingerprint(self) -> str:
+        probes = self.probes()
+        if probes is None:
+            return _fingerprint("definition", self.definition)
+        numbers, texts = probes
+        missing = [np.nan, _UNMATCHED] if texts else [np.nan]
+        return _fingerprint(self._partition(numbers), self._labels(texts), self._labels(missing))
+
+    def _labels(self, values: list[Any]) -> tuple[Any, ...]:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return tuple(_label(label) for label in self.put_array(array, _NO_OTHER))
+
+    def _partition(self, numbers: list[float]) -> tuple[Any, ...]:
+        points = sorted({float(number) for number in numbers if math.isfinite(number)})
+        if not points:
+            return self._labels([0.0])
+        probes = [points[0] - 1]
+        for left, right in zip(points, points[1:]):
+            probes += [left, (left + right) / 2]
+        probes += [points[-1], points[-1] + 1]
+        labels = self._labels(probes)
+        gap = labels[0]
+        pieces = [gap]
+        for index, point in enumerate(points):
+            at, after = labels[2 * index + 1], labels[2 * index + 2]
+            if at != gap or after != gap:
+                pieces.append((point, at, after))
+            gap = after
+        return tuple(pieces)
+
+
+class _LoanFormat(_Format):
+    """PBBLNFMT/PBBELF catalog format (PBBLNFMT.CompiledFormat)."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        import PBBLNFMT
+
+        self.definition = spec
+        self.compiled = PBBLNFMT.CompiledFormat(spec)
+
+    def put(self, value: Any, default: Any = None) -> Any:
+        return self.compiled.put(value, default)
+
+    def put_array(self, values: Iterable[Any], default: Any = None) -> np.ndarray:
+        return self.compiled.put_array(values, default)
+
+    def probes(self) -> tuple[list[float], list[str]] | None:
+        if not self.compiled.compiled or (self.compiled.character and self.compiled.points):
+            return None
+        keys = [key for key in self.compiled.exact if key is not None]
+        numbers = [key for key in keys if isinstance(key, (int, float)) and not isinstance(key, bool)]
+        texts = [key for key in keys if isinstance(key, str)]
+        if len(numbers) + len(texts) != len(keys):
+            return None
+        return [*numbers, *self.compiled.points], texts
+
+
+class _DepositFormat(_Format):
+    """pbbdpfmt3 VALUE/INVALUE rules: numeric, range and quoted selectors as in SAS.
+
+    PBBDPFMT's and PBMISFMT's dict and range formats are served by this
+    engine too (see _selector_rules); no match is None here.
+    """
+
+    def __init__(self, definition: dict[str, Any]) -> None:
+        import pbbdpfmt3
+
+        self.definition = tuple(tuple(rule) for rule in definition["rules"])
+        self.compiled = pbbdpfmt3._compile(definition)
+
+    def put(self, value: Any, default: Any = None) -> Any:
+        index = self.compiled.rule_index(value)
+        return default if index == self.compiled.no_rule else self.compiled.results[index]
+
+    def put_array(self, values: Iterable[Any], default: Any = None) -> np.ndarray:
+        results = self.compiled.results.copy()
+        results[-1] = default
+        return results[self.compiled.rule_indexes(values)]
+
+    def probes(self) -> tuple[list[float], list[str]] | None:
+        if not self.compiled.compiled:
+            return None
+        return [*self.compiled.exact, *self.compiled.points.tolist()], list(self.compiled.text)
+
+
+def _label(label: Any) -> Any:
+    if label is _NO_OTHER:
+        return ("no match",)
+    return label.item() if isinstance(label, np.generic) else label
+
+
+def _fingerprint(*parts: Any) -> str:
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_pbmisfmt() -> ModuleType:
+    """PBMISFMT ships as PBMISFMT.PY, which the import system does not pick up."""
+    if "PBMISFMT" in sys.modules:
+        return sys.modules["PBMISFMT"]
+    path = Path(__file__).with_name("PBMISFMT.PY")
+    loader = importlib.machinery.SourceFileLoader("PBMISFMT", str(path))
+    spec = importlib.util.spec_from_loader("PBMISFMT", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["PBMISFMT"] = module
+    loader.exec_module(module)
+    return module
+
+
+def _key(name: str) -> str:
+    return name.upper().strip().rstrip(".").lstrip("$")
+
+
+def _number(value: float) -> str:
+    if value == -math.inf:
+        return "LOW"
+    if value == math.inf:
+        return "HIGH"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _selector_rules(
+    mapping: Mapping[Any, Any] | None = None,
+    ranges: Iterable[Any] = (),
+    other: Any = _NO_OTHER,
+) -> dict[str, Any]:
+    """A PBBDPFMT/PBMISFMT dict or RangeRule list as pbbdpfmt3 rules.
+
+    Numeric keys become numeric selectors and text keys quoted ones, so a
+    number matches as it does in the dict (204 and 204.0 alike); the dicts'
+    fallback becomes OTHER.
+    """
+    rules = [
+        (_number(key) if not isinstance(key, str) else f"'{key}'", label) for key, label in (mapping or {}).items()
+    ]
+    rules += [(f"{_number(rule.start)}-{_number(rule.end)}", rule.value) for rule in ranges]
+    if other is not _NO_OTHER:
+        rules.append(("OTHER", other))
+    return {"kind": "VALUE", "rules": rules}
+
+
+# Each source yields (name, factory); factories run on first use, so
+# catalog-backed specs are only decoded for formats in use.
+def _pbblnfmt_entries() -> Iterable[tuple[str, Callable[[], _Format]]]:
+    import PBBLNFMT
+
+    catalog = PBBLNFMT.load_catalog()
+    for name in catalog:
+        yield name, lambda name=name: _LoanFormat(catalog[name])
+
+
+def _pbbdpfmt3_entries() -> Iterable[tuple[str, Callable[[], _Format]]]:
+    import pbbdpfmt3
+
+    for name in pbbdpfmt3._DEFINITIONS:
+        yield name, lambda name=name: _DepositFormat(pbbdpfmt3._DEFINITIONS[name])
+
+
+def _pbbdpfmt_entries() -> Iterable[tuple[str, Callable[[], _Format]]]:
+    import PBBDPFMT as m
+
+    # Fallbacks as in the module's sadenom(), fdprd(), race(), ...
+    definitions = {
+        "SADENOM": lambda: _selector_rules(m.SADENOM, other="D"),
+        "SAPROD": lambda: _selector_rules(m.SAPROD, other="42120"),
+        "FDPROD": lambda: _selector_rules(m.FDPROD, other="42130"),
+        "FDPRODD": lambda: _selector_rules(m.FDPRODD, other="42130"),
+        "RMFDORGMT": lambda: _selector_rules(m.RMFDORGMT),
+        "RACE": lambda: _selector_rules(m.RACE, other="0"),
+        # fddenom() checks the single codes before the ranges.
+        "FDDENOM": lambda: _selector_rules(dict.fromkeys(sorted(m.FDDENOM_SINGLE), "I"), m.FDDENOM_RULES, "D"),
+        "FDPRD": lambda: _selector_rules(ranges=m.FDPRD_RULES, other=" "),
+        "FDORGMT": lambda: _selector_rules(ranges=m.FDORGMT_RULES),
+        "FDRMMT": lambda: _selector_rules(ranges=m.FDRMMT_RULES),
+    }
+    for name, definition in definitions.items():
+        yield name, lambda definition=definition: _DepositFormat(definition())
+
+
+def _pbmisfmt_entries() -> Iterable[tuple[str, Callable[[], _Format]]]:
+    m = _load_pbmisfmt()
+    for name, mapping, other in (("STATECD", m.STATECD, "B"), ("BRANCHCD", m.BRANCHCD, "OTHER")):
+        yield name, lambda mapping=mapping, other=other: _DepositFormat(_selector_rules(mapping, other=other))
+
+
+_ENTRIES = {
+    "PBBLNFMT": _pbblnfmt_entries,
+    "PBBDPFMT": _pbbdpfmt_entries,
+    "PBBDPFMT3": _pbbdpfmt3_entries,
+    "PBMISFMT": _pbmisfmt_entries,
+}
+
+
+class FormatRegistry:
+    """Qualified-name index over every source plus the shared compiled cache."""
+
+    def __init__(self) -> None:
+        self._factories: dict[str, Callable[[], _Format]] = {}
+        self._built: dict[str, _Format] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._loaded: set[str] = set()
+        self._compiled: dict[str, _Format] = {}
+        self._shared: dict[tuple[type, str], _Format] = {}
+        self._resolved: dict[str, str] = {}
+        self._hits: Counter[str] = Counter()
+        # Reentrant: resolve() and compiled() call _load() and fingerprint().
+        self._lock = threading.RLock()
+
+    def _load(self, source: str) -> None:
+        with self._lock:
+            if source in self._loaded:
+                return
+            for name, factory in _ENTRIES[source]():
+                qualified = f"{source}.{_key(name)}"
+                self._factories[qualified] = factory
+                self._by_name.setdefault(_key(name), []).append(qualified)
+            self._loaded.add(source)
+
+    def _build(self, qualified: str) -> _Format:
+        with self._lock:
+            built = self._compiled.get(qualified) or self._built.get(qualified)
+            if built is None:
+                built = self._built[qualified] = self._factories[qualified]()
+            return built
+
+    def fingerprint(self, qualified: str) -> str:
+        return self._build(qualified).fingerprint
+
+    def names(self) -> list[str]:
+        """Every qualified format name."""
+        with self._lock:
+            for source in SOURCES:
+                self._load(source)
+            return sorted(self._factories)
+
+    def resolve(self, name: str) -> str:
+        key = _key(name)
+        source, dot, bare = key.partition(".")
+        with self._lock:
+            if dot:
+                if source not in _ENTRIES:
+                    raise KeyError(f"Unknown format source {source!r}; use one of {', '.join(SOURCES)}")
+                self._load(source)
+                if key not in self._factories:
+                    raise KeyError(f"Unknown format: {name}")
+                return key
+            for source in SOURCES:
+                self._load(source)
+            candidates = self._by_name.get(key, [])
+            if not candidates:
+                raise KeyError(f"Unknown format: {name}")
+            if len({self.fingerprint(candidate) for candidate in candidates}) > 1:
+                raise KeyError(f"Format {name} is defined differently by {', '.join(candidates)}; qualify it")
+            return candidates[0]
+
+    def _resolve(self, name: str) -> str:
+        """resolve(), remembered per name as written by the caller."""
+        qualified = self._resolved.get(name)
+        if qualified is None:
+            qualified = self._resolved[name] = self.resolve(name)
+        return qualified
+
+    def compiled(self, qualified: str) -> _Format:
+        """The compiled format for a qualified name, shared with identical definitions."""
+        compiled = self._compiled.get(qualified)
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            compiled = self._compiled.get(qualified)
+            if compiled is None:
+                built = self._build(qualified)
+                # Shared only within one engine: engines differ on values
+                # outside the rules (text given to a numeric format, ...).
+                compiled = self._shared.setdefault((type(built), built.fingerprint), built)
+                self._compiled[qualified] = compiled
+                self._built.pop(qualified, None)
+            return compiled
+
+    def _count(self, qualified: str, values: int) -> None:
+        with self._lock:
+            self._hits[qualified] += values
+
+    def put(self, name: str, value: Any, default: Any = None) -> Any:
+        qualified = self._resolve(name)
+        self._count(qualified, 1)
+        return self.compiled(qualified).put(value, default)
+
+    def put_array(self, name: str, values: Iterable[Any], default: Any = None) -> np.ndarray:
+        qualified = self._resolve(name)
+        if not isinstance(values, (pd.Series, np.ndarray)):
+            values = list(values)
+        self._count(qualified, len(values))
+        return self.compiled(qualified).put_array(values, default)
+
+    def hit_counts(self) -> list[tuple[str, int]]:
+        with self._lock:
+            return self._hits.most_common()
+
+    def reset_hit_counts(self) -> None:
+        with self._lock:
+            self._hits.clear()
+
+    def shared(self) -> dict[str, list[str]]:
+        """Compiled formats used by more than one name (fingerprint -> names)."""
+        groups: dict[str, list[str]] = {}
+        with self._lock:
+            for qualified, compiled in self._compiled.items():
+                groups.setdefault(compiled.fingerprint, []).append(qualified)
+        return {fingerprint: sorted(names) for fingerprint, names in groups.items() if len(names) > 1}
+
+
+REGISTRY = FormatRegistry()
+
+
+def put(name: str, value: Any, default: Any = None) -> Any:
+    """SAS PUT(value, name.) through the registry."""
+    return REGISTRY.put(name, value, default)
+
+
+def put_array(name: str, values: Iterable[Any], default: Any = None) -> np.ndarray:
+    """put() over a column; returns an object array aligned with values."""
+    return REGISTRY.put_array(name, values, default)
+
+
+def hit_counts() -> list[tuple[str, int]]:
+    """Values looked up per format since start (or the last reset), busiest first."""
+    return REGISTRY.hit_counts()
+
+
+def reset_hit_counts() -> None:
+    REGISTRY.reset_hit_counts()
+
+
+def available_formats() -> list[str]:
+    return REGISTRY.names()
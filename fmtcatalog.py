@@ -0,0 +1,201 @@
+"""Precompiled format catalog artifacts with lazy, per-format loading.
+
+The PROC FORMAT conversions (PBBLNFMT, PBBELF, PBBDPFMT) are large literal
+dict modules; importing one builds every format even when a job uses two.
+Their literals now live in source-only modules, and a build step writes
+them to a compact artifact:
+
+    magic | source digest | index length | index | one JSON blob per format
+
+The index maps a format name to the offset and length of its blob.  At
+runtime the artifact is memory-mapped and only the blobs of the formats a
+job actually uses are decoded.  The digest is a BLAKE2 hash of the source
+module's file, so an edited source module is never served from a stale
+artifact: the catalog falls back to importing the source.
+
+The artifacts are built ahead of time and committed next to their source
+modules; a running job never writes there.  After editing pbblnfmt_catalog
+or pbbdpfmt_definitions, rebuild and commit them with:
+
+    python fmtcatalog.py PBBLNFMT pbbdpfmt3
+
+When XMIS_FORMAT_CATALOG_DIR is set, artifacts are kept in that directory
+instead, and a job that finds its artifact missing or stale rebuilds it
+there.  Each writer goes through a temporary file of its own and an atomic
+rename, so concurrent jobs (or threads) never see a partial artifact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+
+MAGIC = b"XMISFMT1"
+DIGEST_SIZE = 16
+CATALOG_DIR_VARIABLE = "XMIS_FORMAT_CATALOG_DIR"
+_HEADER = struct.Struct(f"<8s{DIGEST_SIZE}sI")
+
+
+def source_digest(path: Path) -> bytes:
+    return hashlib.blake2b(path.read_bytes(), digest_size=DIGEST_SIZE).digest()
+
+
+def write_artifact(path: Path, specs: Mapping[str, Any], digest: bytes) -> Path:
+    """Serialize specs to path (atomically) and return it."""
+    blobs = {name: json.dumps(spec, separators=(",", ":")).encode("utf-8") for name, spec in specs.items()}
+    index: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for name, blob in blobs.items():
+        index[name] = (offset, len(blob))
+        offset += len(blob)
+    encoded_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, partial = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as target:
+            target.write(_HEADER.pack(MAGIC, digest, len(encoded_index)))
+            target.write(encoded_index)
+            for blob in blobs.values():
+                target.write(blob)
+        os.replace(partial, path)
+    except BaseException:
+        Path(partial).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class CatalogArtifact:
+    """Read side of an artifact: the index up front, blobs on demand."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.digest, index_length = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a format catalog artifact")
+            start = _HEADER.size
+            self._index = json.loads(self._map[start:start + index_length])
+            self._data_start = start + index_length
+        except Exception:
+            self._map.close()
+            raise
+
+    def names(self) -> list[str]:
+        return list(self._index)
+
+    def get(self, name: str) -> Any:
+        offset, length = self._index[name]
+        start = self._data_start + offset
+        return json.loads(self._map[start:start + length])
+
+
+class LazyCatalog(Mapping[str, Any]):
+    """Read-only mapping of format name to spec, served from the artifact.
+
+    source is the source module's file and load_source returns its specs;
+    decode, if given, restores a decoded JSON spec to the source's shape
+    (JSON has no tuples).
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        artifact_name: str,
+        load_source: Callable[[], Mapping[str, Any]],
+        decode: Callable[[Any], Any] | None = None,
+    ) -> None:
+        self.source = source
+        self.artifact_name = artifact_name
+        self._load_source = load_source
+        self._decode = decode
+        self._artifact: CatalogArtifact | None = None
+        self._specs: Mapping[str, Any] | None = None
+        self._names: list[str] | None = None
+        self._decoded: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def artifact_path(self) -> Path:
+        directory = os.environ.get(CATALOG_DIR_VARIABLE)
+        return (Path(directory) if directory else self.source.parent) / self.artifact_name
+
+    def _open(self) -> None:
+        # _names is assigned last, so a set _names means the catalog is ready.
+        if self._names is not None:
+            return
+        with self._lock:
+            if self._names is not None:
+                return
+            digest = source_digest(self.source)
+            try:
+                artifact = CatalogArtifact(self.artifact_path)
+            except (OSError, ValueError, struct.error):
+                artifact = None
+            if artifact is not None and artifact.digest == digest:
+                self._artifact = artifact
+                self._names = artifact.names()
+                return
+            specs = self._load_source()
+            if os.environ.get(CATALOG_DIR_VARIABLE):
+                try:
+                    write_artifact(self.artifact_path, specs, digest)
+                except OSError:
+                    pass
+            self._specs = specs
+            self._names = list(specs)
+
+    def build(self) -> Path:
+        """Write the artifact from the source module, whatever is on disk."""
+        return write_artifact(self.artifact_path, self._load_source(), source_digest(self.source))
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._decoded:
+            return self._decoded[name]
+        self._open()
+        if self._specs is not None:
+            return self._specs[name]
+        spec = self._artifact.get(name)
+        if self._decode is not None:
+            spec = self._decode(spec)
+        self._decoded[name] = spec
+        return spec
+
+    def __iter__(self) -> Iterator[str]:
+        self._open()
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        self._open()
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        self._open()
+        return name in self._names
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Build the artifacts of the named catalog modules (each has build_catalog())."""
+    modules = sys.argv[1:] if argv is None else argv
+    if not modules:
+        print("usage: python fmtcatalog.py MODULE [MODULE ...]", file=sys.stderr)
+        return 2
+    for name in modules:
+        path = importlib.import_module(name).build_catalog()
+        print(f"{name}: {path} ({path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,25 @@
 """Auto-generated Python conversion of the full PBBDPFMT SAS member.
 
-This standalone module contains every %LET list, VALUE format, and INVALUE
-informat from the supplied PBBDPFMT source. It does not read SAS source at
-runtime.
+This module contains every %LET list, VALUE format, and INVALUE informat
+from the supplied PBBDPFMT source. It does not read SAS source at runtime.
+The VALUE/INVALUE literals live in pbbdpfmt_definitions.py and are loaded
+one format at a time from its fmtcatalog artifact on first use.
 """
 
 from __future__ import annotations
 
 import math
 import re
-from typing import Any
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from fmtcatalog import LazyCatalog
 
 
 MACROS = {
@@ -36,2442 +46,38 @@ MACROS = {
     ],
 }
 
-FORMAT_DEFINITIONS = {
-    "SADENOM": {
-        "kind": "VALUE",
-        "rules": [
-            ("204", "I"),
-            ("207", "I"),
-            ("214", "I"),
-            ("215", "I"),
-            ("218", "I"),
-            ("220", "I"),
-            ("221", "I"),
-            ("222", "I"),
-            ("223", "I"),
-            ("OTHER", "D"),
-        ],
-    },
-    "SAPROD": {
-        "kind": "VALUE",
-        "rules": [
-            ("100", "N"),
-            ("126", "N"),
-            ("127", "N"),
-            ("128", "N"),
-            ("129", "N"),
-            ("140", "N"),
-            ("141", "N"),
-            ("142", "N"),
-            ("200", "42120"),
-            ("201", "42120"),
-            ("202", "42120"),
-            ("203", "42120"),
-            ("204", "42320"),
-            ("205", "42120"),
-            ("206", "42120"),
-            ("207", "42120"),
-            ("208", "42120"),
-            ("210", "42120"),
-            ("211", "N"),
-            ("212", "42120"),
-            ("213", "42120"),
-            ("214", "42320"),
-            ("215", "42320"),
-            ("216", "42120"),
-            ("218", "42120"),
-            ("220", "42120"),
-            ("221", "42120"),
-            ("222", "42120"),
-            ("223", "42120"),
-            ("227", "42120"),
-            ("228", "42120"),
-            ("297", "N"),
-            ("298", "N"),
-            ("480", "N"),
-            ("481", "N"),
-            ("482", "N"),
-            ("483", "N"),
-            ("484", "N"),
-            ("OTHER", "42120"),
-        ],
-    },
-    "FDDENOM": {
-        "kind": "VALUE",
-        "rules": [
-            ("229-232", "I"),
-            ("272-283", "I"),
-            ("334-336", "I"),
-            ("338-339", "I"),
-            ("340-359", "I"),
-            ("379-382", "I"),
-            ("386-394", "I"),
-            ("422", "I"),
-            ("424", "I"),
-            ("426", "I"),
-            ("428", "I"),
-            ("453-459", "I"),
-            ("461-469", "I"),
-            ("475", "I"),
-            ("481", "I"),
-            ("487", "I"),
-            ("489", "I"),
-            ("491", "I"),
-            ("493", "I"),
-            ("495", "I"),
-            ("497", "I"),
-            ("499", "I"),
-            ("542-544", "I"),
-            ("555", "I"),
-            ("557", "I"),
-            ("575", "I"),
-            ("580-593", "I"),
-            ("595-599", "I"),
-            ("603-607", "I"),
-            ("609-611", "I"),
-            ("620-627", "I"),
-            ("640-659", "I"),
-            ("660-719", "I"),
-            ("726-731", "I"),
-            ("736-740", "I"),
-            ("777", "I"),
-            ("780-839", "I"),
-            ("851-853", "I"),
-            ("856-863", "I"),
-            ("893-894", "I"),
-            ("896-897", "I"),
-            ("902-903", "I"),
-            ("914-940", "I"),
-            ("941-967", "I"),
-            ("987-988", "I"),
-            ("991-993", "I"),
-            ("OTHER", "D"),
-        ],
-    },
-    "FDPROD": {
-        "kind": "VALUE",
-        "rules": [
-            ("229", "42133"),
-            ("230", "42133"),
-            ("231", "42133"),
-            ("232", "42133"),
-            ("233", "42130"),
-            ("234", "42130"),
-            ("235", "42130"),
-            ("236", "42130"),
-            ("237", "42130"),
-            ("238", "42130"),
-            ("239", "42130"),
-            ("240", "42130"),
-            ("241", "42130"),
-            ("242", "42130"),
-            ("243", "42130"),
-            ("244", "42130"),
-            ("245", "42130"),
-            ("246", "42130"),
-            ("247", "42130"),
-            ("248", "42130"),
-            ("249", "42130"),
-            ("250", "42130"),
-            ("251", "42130"),
-            ("252", "42130"),
-            ("253", "42130"),
-            ("254", "42130"),
-            ("255", "42130"),
-            ("256", "42130"),
-            ("257", "42130"),
-            ("258", "42130"),
-            ("259", "42130"),
-            ("260", "42130"),
-            ("261", "42130"),
-            ("262", "42130"),
-            ("263", "42130"),
-            ("264", "42130"),
-            ("265", "42130"),
-            ("266", "42130"),
-            ("267", "42130"),
-            ("268", "42130"),
-            ("269", "42130"),
-            ("270", "42130"),
-            ("271", "42130"),
-            ("272", "42133"),
-            ("273", "42133"),
-            ("274", "42133"),
-            ("275", "42133"),
-            ("276", "42133"),
-            ("277", "42133"),
-            ("278", "42133"),
-            ("279", "42133"),
-            ("280", "42133"),
-            ("281", "42133"),
-            ("282", "42133"),
-            ("283", "42133"),
-            ("284", "42130"),
-            ("285", "42130"),
-            ("286", "42130"),
-            ("287", "42130"),
-            ("288", "42130"),
-            ("289", "42130"),
-            ("290", "42130"),
-            ("291", "42130"),
-            ("292", "42130"),
-            ("293", "42130"),
-            ("294", "42130"),
-            ("295", "42130"),
-            ("300", "42130"),
-            ("301", "42130"),
-            ("302", "42130"),
-            ("303", "42130"),
-            ("304", "42130"),
-            ("305", "42130"),
-            ("306", "42130"),
-            ("307", "42130"),
-            ("308", "42130"),
-            ("309", "42130"),
-            ("310", "42130"),
-            ("311", "42130"),
-            ("312", "42130"),
-            ("313", "42130"),
-            ("314", "42130"),
-            ("315", "42130"),
-            ("316", "42130"),
-            ("317", "42130"),
-            ("318", "42130"),
-            ("319", "42130"),
-            ("320", "42130"),
-            ("321", "42130"),
-            ("322", "42130"),
-            ("323", "42130"),
-            ("324", "42130"),
-            ("325", "42130"),
-            ("326", "42130"),
-            ("327", "42130"),
-            ("328", "42130"),
-            ("329", "42130"),
-            ("330", "42130"),
-            ("331", "42130"),
-            ("332", "42130"),
-            ("333", "42130"),
-            ("334", "42133"),
-            ("335", "42133"),
-            ("336", "42133"),
-            ("337", "42130"),
-            ("338", "42133"),
-            ("339", "42133"),
-            ("340", "42132"),
-            ("341", "42132"),
-            ("342", "49999"),
-            ("343", "42132"),
-            ("344", "42132"),
-            ("345", "49999"),
-            ("346", "42132"),
-            ("347", "42132"),
-            ("348", "49999"),
-            ("349", "42132"),
-            ("350", "42132"),
-            ("351", "42132"),
-            ("352", "42132"),
-            ("353", "42132"),
-            ("354", "42132"),
-            ("355", "42132"),
-            ("356", "42132"),
-            ("357", "42132"),
-            ("358", "42132"),
-            ("359", "42132"),
-            ("360", "42130"),
-            ("361", "42130"),
-            ("362", "42130"),
-            ("363", "42130"),
-            ("364", "42130"),
-            ("365", "42130"),
-            ("366", "42130"),
-            ("368", "42130"),
-            ("369", "42130"),
-            ("370", "42130"),
-            ("371", "42130"),
-            ("372", "42130"),
-            ("373", "42130"),
-            ("374", "42130"),
-            ("375", "42130"),
-            ("376", "42130"),
-            ("377", "42130"),
-            ("378", "42130"),
-            ("379", "42133"),
-            ("380", "42133"),
-            ("381", "42133"),
-            ("382", "42133"),
-            ("383", "42130"),
-            ("384", "42130"),
-            ("385", "42130"),
-            ("386", "42133"),
-            ("387", "42133"),
-            ("388", "42133"),
-            ("389", "42133"),
-            ("390", "42133"),
-            ("391", "42133"),
-            ("392", "42133"),
-            ("393", "42133"),
-            ("394", "42133"),
-            ("395", "42130"),
-            ("396", "42130"),
-            ("397", "42130"),
-            ("398", "42130"),
-            ("399", "42130"),
-            ("400", "42130"),
-            ("401", "42130"),
-            ("402", "42130"),
-            ("403", "42130"),
-            ("404", "42130"),
-            ("405", "42130"),
-            ("406", "42130"),
-            ("407", "42130"),
-            ("408", "42130"),
-            ("409", "42130"),
-            ("410", "42130"),
-            ("411", "42130"),
-            ("412", "42130"),
-            ("413", "42130"),
-            ("414", "42130"),
-            ("415", "42130"),
-            ("416", "42130"),
-            ("417", "42130"),
-            ("418", "42130"),
-            ("419", "42130"),
-            ("420", "42130"),
-            ("421", "42630"),
-            ("422", "42133"),
-            ("423", "42630"),
-            ("424", "42133"),
-            ("425", "42630"),
-            ("426", "42133"),
-            ("427", "42630"),
-            ("428", "42133"),
-            ("429", "42630"),
-            ("430", "42630"),
-            ("431", "42630"),
-            ("432", "42630"),
-            ("433", "42630"),
-            ("434", "42630"),
-            ("435", "42630"),
-            ("436", "42630"),
-            ("437", "42630"),
-            ("438", "42130"),
-            ("439", "42630"),
-            ("440", "42630"),
-            ("441", "42630"),
-            ("442", "42630"),
-            ("443", "42630"),
-            ("444", "42630"),
-            ("445", "42130"),
-            ("446", "42630"),
-            ("447", "42130"),
-            ("448", "42130"),
-            ("449", "42130"),
-            ("450", "42130"),
-            ("451", "42130"),
-            ("452", "42130"),
-            ("453", "42132"),
-            ("454", "42132"),
-            ("455", "42132"),
-            ("456", "42132"),
-            ("457", "42132"),
-            ("458", "42132"),
-            ("459", "42132"),
-            ("460", "42130"),
-            ("461", "42132"),
-            ("462", "42132"),
-            ("463", "42132"),
-            ("464", "42132"),
-            ("465", "42132"),
-            ("466", "42132"),
-            ("467", "42132"),
-            ("468", "42132"),
-            ("469", "42132"),
-            ("470", "42630"),
-            ("471", "42630"),
-            ("472", "42630"),
-            ("473", "42630"),
-            ("474", "42630"),
-            ("475", "42133"),
-            ("476", "42630"),
-            ("477", "42630"),
-            ("478", "42630"),
-            ("479", "42630"),
-            ("480", "42630"),
-            ("481", "42133"),
-            ("482", "42630"),
-            ("483", "42630"),
-            ("484", "42630"),
-            ("485", "42630"),
-            ("486", "42630"),
-            ("487", "42133"),
-            ("488", "42630"),
-            ("489", "42133"),
-            ("490", "42630"),
-            ("491", "42133"),
-            ("492", "42630"),
-            ("493", "42133"),
-            ("494", "42630"),
-            ("495", "42133"),
-            ("496", "42630"),
-            ("497", "42133"),
-            ("498", "42630"),
-            ("499", "42133"),
-            ("500", "42130"),
-            ("501", "42130"),
-            ("502", "42130"),
-            ("503", "42130"),
-            ("504", "42130"),
-            ("505", "42130"),
-            ("506", "42130"),
-            ("507", "42130"),
-            ("508", "42130"),
-            ("509", "42130"),
-            ("510", "42130"),
-            ("511", "42130"),
-            ("512", "42130"),
-            ("513", "42130"),
-            ("514", "42130"),
-            ("515", "42130"),
-            ("516", "42130"),
-            ("517", "42130"),
-            ("518", "42130"),
-            ("519", "42130"),
-            ("520", "42130"),
-            ("521", "42130"),
-            ("522", "42130"),
-            ("523", "42130"),
-            ("524", "42130"),
-            ("525", "42130"),
-            ("526", "42130"),
-            ("527", "42130"),
-            ("528", "42130"),
-            ("529", "42130"),
-            ("530", "42130"),
-            ("531", "42130"),
-            ("532", "42130"),
-            ("533", "42130"),
-            ("534", "42130"),
-            ("535", "42130"),
-            ("536", "42130"),
-            ("537", "42130"),
-            ("538", "42130"),
-            ("539", "42130"),
-            ("540", "42130"),
-            ("541", "42130"),
-            ("542", "42133"),
-            ("543", "42133"),
-            ("544", "42133"),
-            ("545", "42130"),
-            ("546", "42130"),
-            ("547", "42130"),
-            ("548", "42630"),
-            ("550", "42630"),
-            ("551", "42130"),
-            ("552", "42630"),
-            ("553", "42130"),
-            ("554", "42630"),
-            ("555", "42133"),
-            ("556", "42630"),
-            ("557", "42133"),
-            ("558", "42630"),
-            ("559", "42130"),
-            ("560", "42630"),
-            ("561", "42630"),
-            ("562", "42630"),
-            ("563", "42630"),
-            ("564", "42630"),
-            ("565", "42630"),
-            ("566", "42630"),
-            ("567", "42630"),
-            ("568", "42130"),
-            ("569", "42630"),
-            ("570", "42130"),
-            ("571", "42630"),
-            ("572", "42130"),
-            ("573", "42630"),
-            ("574", "42630"),
-            ("575", "42133"),
-            ("576", "42630"),
-            ("577", "42130"),
-            ("578", "42630"),
-            ("579", "42630"),
-            ("580", "42132"),
-            ("581", "42132"),
-            ("582", "42132"),
-            ("583", "42132"),
-            ("584", "42132"),
-            ("585", "42132"),
-            ("586", "42132"),
-            ("587", "42132"),
-            ("588", "42132"),
-            ("589", "42132"),
-            ("590", "42132"),
-            ("591", "42132"),
-            ("592", "42132"),
-            ("593", "42132"),
-            ("594", "42130"),
-            ("595", "42132"),
-            ("596", "42132"),
-            ("597", "42133"),
-            ("598", "42133"),
-            ("599", "42133"),
-            ("600", "42130"),
-            ("601", "42130"),
-            ("602", "42130"),
-            ("603", "42133"),
-            ("604", "42133"),
-            ("605", "42133"),
-            ("606", "42133"),
-            ("607", "42133"),
-            ("608", "42130"),
-            ("609", "42133"),
-            ("610", "42133"),
-            ("611", "42133"),
-            ("612", "42130"),
-            ("613", "42130"),
-            ("614", "42130"),
-            ("615", "42130"),
-            ("616", "42130"),
-            ("617", "42130"),
-            ("618", "42130"),
-            ("619", "42130"),
-            ("620", "42133"),
-            ("621", "42133"),
-            ("622", "42133"),
-            ("623", "42133"),
-            ("624", "42133"),
-            ("625", "42133"),
-            ("626", "42133"),
-            ("627", "42133"),
-            ("628", "42130"),
-            ("629", "42130"),
-            ("630", "42130"),
-            ("631", "42130"),
-            ("632", "42130"),
-            ("633", "42130"),
-            ("634", "42130"),
-            ("635", "42130"),
-            ("636", "42130"),
-            ("637", "42130"),
-            ("638", "42130"),
-            ("639", "42130"),
-            ("640", "42133"),
-            ("641", "42133"),
-            ("642", "42133"),
-            ("643", "42133"),
-            ("644", "42133"),
-            ("645", "42133"),
-            ("646", "42133"),
-            ("647", "42133"),
-            ("648", "42133"),
-            ("649", "42133"),
-            ("650", "42133"),
-            ("651", "42133"),
-            ("652", "42133"),
-            ("653", "42133"),
-            ("654", "42133"),
-            ("655", "42133"),
-            ("656", "42133"),
-            ("657", "42133"),
-            ("658", "42133"),
-            ("659", "42133"),
-            ("660", "42132"),
-            ("661", "42132"),
-            ("662", "42132"),
-            ("663", "42132"),
-            ("664", "42132"),
-            ("665", "42132"),
-            ("666", "42132"),
-            ("667", "42132"),
-            ("668", "42132"),
-            ("669", "42132"),
-            ("670", "42132"),
-            ("671", "42132"),
-            ("672", "42132"),
-            ("673", "42132"),
-            ("674", "42132"),
-            ("675", "42132"),
-            ("676", "42132"),
-            ("677", "42132"),
-            ("678", "42132"),
-            ("679", "42132"),
-            ("680", "42132"),
-            ("681", "42132"),
-            ("682", "42132"),
-            ("683", "42132"),
-            ("684", "42132"),
-            ("685", "42132"),
-            ("686", "42132"),
-            ("687", "42132"),
-            ("688", "42132"),
-            ("689", "42132"),
-            ("690", "42132"),
-            ("691", "42132"),
-            ("692", "42132"),
-            ("693", "42132"),
-            ("694", "42132"),
-            ("695", "42132"),
-            ("696", "42132"),
-            ("697", "42132"),
-            ("698", "42132"),
-            ("699", "42132"),
-            ("700", "42132"),
-            ("701", "42132"),
-            ("702", "42132"),
-            ("703", "42132"),
-            ("704", "42132"),
-            ("705", "42132"),
-            ("706", "42132"),
-            ("707", "42132"),
-            ("708", "42132"),
-            ("709", "42132"),
-            ("710", "42132"),
-            ("711", "42132"),
-            ("712", "42132"),
-            ("713", "42132"),
-            ("714", "42132"),
-            ("715", "42132"),
-            ("716", "42132"),
-            ("717", "42132"),
-            ("718", "42132"),
-            ("719", "42132"),
-            ("720", "42130"),
-            ("721", "42130"),
-            ("722", "42130"),
-            ("723", "42130"),
-            ("724", "42130"),
-            ("725", "42130"),
-            ("726", "42133"),
-            ("727", "42133"),
-            ("728", "42133"),
-            ("729", "42133"),
-            ("730", "42133"),
-            ("731", "42133"),
-            ("732", "42130"),
-            ("733", "42130"),
-            ("734", "42130"),
-            ("735", "42130"),
-            ("736", "42133"),
-            ("737", "42133"),
-            ("738", "42133"),
-            ("739", "42133"),
-            ("740", "42133"),
-            ("741", "42130"),
-            ("742", "42130"),
-            ("743", "42130"),
-            ("744", "42130"),
-            ("745", "42130"),
-            ("746", "42130"),
-            ("747", "42130"),
-            ("748", "42130"),
-            ("749", "42130"),
-            ("750", "42130"),
-            ("751", "42630"),
-            ("752", "42630"),
-            ("753", "42630"),
-            ("754", "42630"),
-            ("755", "42630"),
-            ("756", "42630"),
-            ("757", "42630"),
-            ("758", "42630"),
-            ("759", "42630"),
-            ("760", "42630"),
-            ("761", "42630"),
-            ("762", "42630"),
-            ("763", "42630"),
-            ("764", "42630"),
-            ("765", "42630"),
-            ("766", "42630"),
-            ("767", "42630"),
-            ("768", "42630"),
-            ("769", "42630"),
-            ("770", "42630"),
-            ("771", "42630"),
-            ("772", "42630"),
-            ("773", "42630"),
-            ("774", "42630"),
-            ("775", "42130"),
-            ("776", "42130"),
-            ("777", "42133"),
-            ("778", "42130"),
-            ("779", "42130"),
-            ("780", "42133"),
-            ("781", "42133"),
-            ("782", "42133"),
-            ("783", "42133"),
-            ("784", "42133"),
-            ("785", "42133"),
-            ("786", "42133"),
-            ("787", "42133"),
-            ("788", "42133"),
-            ("789", "42133"),
-            ("790", "42133"),
-            ("791", "42133"),
-            ("792", "42133"),
-            ("793", "42133"),
-            ("794", "42133"),
-            ("795", "42133"),
-            ("796", "42133"),
-            ("797", "42133"),
-            ("798", "42133"),
-            ("799", "42133"),
-            ("800", "42133"),
-            ("801", "42133"),
-            ("802", "42133"),
-            ("803", "42133"),
-            ("804", "42133"),
-            ("805", "42133"),
-            ("806", "42133"),
-            ("807", "42133"),
-            ("808", "42133"),
-            ("809", "42133"),
-            ("810", "42133"),
-            ("811", "42133"),
-            ("812", "42133"),
-            ("813", "42133"),
-            ("814", "42133"),
-            ("815", "42133"),
-            ("816", "42133"),
-            ("817", "42133"),
-            ("818", "42133"),
-            ("819", "42133"),
-            ("820", "42133"),
-            ("821", "42133"),
-            ("822", "42133"),
-            ("823", "42133"),
-            ("824", "42133"),
-            ("825", "42133"),
-            ("826", "42133"),
-            ("827", "42133"),
-            ("828", "42133"),
-            ("829", "42133"),
-            ("830", "42133"),
-            ("831", "42133"),
-            ("832", "42133"),
-            ("833", "42133"),
-            ("834", "42133"),
-            ("835", "42133"),
-            ("836", "42133"),
-            ("837", "42133"),
-            ("838", "42133"),
-            ("839", "42133"),
-            ("850", "42130"),
-            ("851", "49999"),
-            ("852", "49999"),
-            ("853", "49999"),
-            ("854", "42130"),
-            ("855", "42130"),
-            ("856", "42133"),
-            ("857", "42133"),
-            ("858", "42133"),
-            ("859", "42133"),
-            ("860", "42133"),
-            ("861", "42133"),
-            ("862", "42133"),
-            ("863", "42133"),
-            ("864", "42130"),
-            ("865", "42130"),
-            ("866", "42130"),
-            ("867", "42130"),
-            ("868", "42130"),
-            ("869", "42130"),
-            ("870", "42130"),
-            ("871", "42130"),
-            ("872", "42130"),
-            ("873", "42130"),
-            ("874", "42130"),
-            ("875", "42130"),
-            ("876", "42130"),
-            ("877", "42130"),
-            ("878", "42130"),
-            ("879", "42130"),
-            ("880", "42130"),
-            ("881", "42130"),
-            ("882", "42130"),
-            ("883", "42130"),
-            ("884", "42130"),
-            ("885", "42130"),
-            ("886", "42130"),
-            ("887", "42130"),
-            ("888", "42130"),
-            ("889", "42130"),
-            ("890", "42130"),
-            ("891", "42130"),
-            ("892", "42130"),
-            ("893", "42133"),
-            ("894", "42133"),
-            ("895", "42130"),
-            ("896", "42133"),
-            ("897", "42133"),
-            ("898", "42130"),
-            ("899", "42130"),
-            ("900", "42130"),
-            ("901", "42130"),
-            ("902", "42133"),
-            ("903", "42133"),
-            ("904", "42130"),
-            ("905", "42130"),
-            ("914", "42133"),
-            ("915", "42133"),
-            ("916", "42133"),
-            ("917", "42133"),
-            ("918", "42133"),
-            ("919", "42133"),
-            ("920", "42133"),
-            ("921", "42133"),
-            ("922", "42133"),
-            ("923", "42133"),
-            ("924", "42133"),
-            ("925", "42133"),
-            ("926", "42133"),
-            ("927", "42133"),
-            ("928", "42133"),
-            ("929", "42133"),
-            ("930", "42133"),
-            ("931", "42133"),
-            ("932", "42133"),
-            ("933", "42133"),
-            ("934", "42133"),
-            ("935", "42133"),
-            ("936", "42133"),
-            ("937", "42133"),
-            ("938", "42133"),
-            ("939", "42133"),
-            ("940", "42133"),
-            ("941", "42133"),
-            ("942", "42133"),
-            ("943", "42133"),
-            ("944", "42133"),
-            ("945", "42133"),
-            ("946", "42133"),
-            ("947", "42133"),
-            ("948", "42133"),
-            ("949", "42133"),
-            ("950", "42133"),
-            ("951", "42133"),
-            ("952", "42133"),
-            ("953", "42133"),
-            ("954", "42133"),
-            ("955", "42133"),
-            ("956", "42133"),
-            ("957", "42133"),
-            ("958", "42133"),
-            ("959", "42133"),
-            ("960", "42133"),
-            ("961", "42133"),
-            ("962", "42133"),
-            ("963", "42133"),
-            ("964", "42133"),
-            ("965", "42133"),
-            ("966", "42133"),
-            ("967", "42133"),
-            ("968", "42130"),
-            ("969", "42130"),
-            ("970", "42130"),
-            ("971", "42130"),
-            ("972", "42130"),
-            ("973", "42130"),
-            ("974", "42130"),
-            ("975", "42130"),
-            ("976", "42130"),
-            ("977", "42130"),
-            ("978", "42130"),
-            ("979", "42130"),
-            ("980", "42130"),
-            ("981", "42130"),
-            ("982", "42130"),
-            ("983", "42130"),
-            ("984", "42130"),
-            ("985", "42130"),
-            ("986", "42130"),
-            ("987", "42133"),
-            ("988", "42133"),
-            ("989", "42130"),
-            ("990", "42130"),
-            ("991", "42133"),
-            ("992", "42133"),
-            ("993", "42133"),
-            ("994", "42130"),
-            ("995", "42130"),
-            ("996", "42130"),
-            ("997", "42130"),
-            ("OTHER", "42130"),
-        ],
-    },
-    "FDPRODD": {
-        "kind": "VALUE",
-        "rules": [
-            ("300", "42130"),
-            ("301", "42130"),
-            ("302", "42132"),
-            ("303", "42130"),
-            ("311", "42130"),
-            ("312", "42130"),
-            ("313", "42133"),
-            ("314", "42133"),
-            ("315", "42132"),
-            ("316", "42133"),
-            ("393", "42133"),
-            ("394", "42132"),
-            ("OTHER", "42130"),
-        ],
-    },
-    "FDPRD": {
-        "kind": "VALUE",
-        "rules": [
-            ("300-319,400-419,368-394,500-539,600-639, 741-744,445", "N"),
-            ("320-339,420-428,540-547", "L"),
-            ("340-359,453-459,461-469,580-599", "M"),
-            ("660-740", "M"),
-            ("OTHER", " "),
-        ],
-    },
-    "FCYTERM": {
-        "kind": "INVALUE",
-        "rules": [
-            ("470,471,476,477,482,483,488,494,548,554, 429,433,437,421,567,574,439,751,755,756,759, 762,767,771", 1),
-            ("472,473,478,479,484,485,490,496,550,551,556, 569,576,440,441,423,752,757,760,763,768,772, 430,434", 3),
-            ("474,480,486,492,498,552,553,558, 571,578,579,442,443,425,753,761,764,765,769,773, 431,435,758", 6),
-            ("444,446,545-547,560-566,573,427,754,766,770, 774,432,436", 12),
-        ],
-    },
-    "CADENOM": {
-        "kind": "VALUE",
-        "rules": [
-            ("20,21,32,33,60,61,62,63,64,66,67,70,71,73,75,76,92,93,96,97,80, 23,24,25,321,13,14,15-19,7,8,81, 160-169,182-188,74,46,47,48,49,45", "I"),
-            ("OTHER", "D"),
-        ],
-    },
-    "CAPROD": {
-        "kind": "VALUE",
-        "rules": [
-            ("3", "42110"),
-            ("4", "42110"),
-            ("5", "42110"),
-            ("6", "42110"),
-            ("7", "42110"),
-            ("8", "42110"),
-            ("9", "42110"),
-            ("10", "42110"),
-            ("11", "42110"),
-            ("12", "42110"),
-            ("13", "42110"),
-            ("14", "42110"),
-            ("15", "42110"),
-            ("16", "42110"),
-            ("17", "42110"),
-            ("18", "42110"),
-            ("19", "42110"),
-            ("20", "42110"),
-            ("21", "42110"),
-            ("22", "42110"),
-            ("23", "42110"),
-            ("24", "42110"),
-            ("25", "42110"),
-            ("26", "42110"),
-            ("27", "42110"),
-            ("30", "34180"),
-            ("31", "34180"),
-            ("32", "34180"),
-            ("33", "34180"),
-            ("34", "34240"),
-            ("35", "42110"),
-            ("36", "42110"),
-            ("37", "42110"),
-            ("38", "42110"),
-            ("39", "42110"),
-            ("40", "42110"),
-            ("41", "42110"),
-            ("42", "42110"),
-            ("43", "42110"),
-            ("45", "42110"),
-            ("46", "42110"),
-            ("47", "42110"),
-            ("48", "42110"),
-            ("49", "42110"),
-            ("50", "42110"),
-            ("51", "42110"),
-            ("52", "42110"),
-            ("53", "42180"),
-            ("54", "42110"),
-            ("55", "42110"),
-            ("56", "42110"),
-            ("57", "42110"),
-            ("58", "42110"),
-            ("59", "42110"),
-            ("60", "42310"),
-            ("61", "42310"),
-            ("62", "42310"),
-            ("63", "42180"),
-            ("64", "42310"),
-            ("65", "42110"),
-            ("66", "42110"),
-            ("67", "42110"),
-            ("68", "42110"),
-            ("69", "42110"),
-            ("70", "42110"),
-            ("71", "42110"),
-            ("72", "42199"),
-            ("73", "42110"),
-            ("74", "42310"),
-            ("75", "42110"),
-            ("76", "42110"),
-            ("77", "42110"),
-            ("78", "42110"),
-            ("79", "42199"),
-            ("80", "42199"),
-            ("81", "42110"),
-            ("82", "42110"),
-            ("83", "42110"),
-            ("84", "42110"),
-            ("85", "42110"),
-            ("86", "42110"),
-            ("87", "42110"),
-            ("88", "42110"),
-            ("89", "42110"),
-            ("90", "42110"),
-            ("91", "42110"),
-            ("92", "42110"),
-            ("93", "42110"),
-            ("94", "42110"),
-            ("95", "42110"),
-            ("96", "42110"),
-            ("97", "42110"),
-            ("98", "N"),
-            ("100", "42110"),
-            ("101", "42110"),
-            ("102", "42110"),
-            ("103", "42180"),
-            ("104", "43110"),
-            ("105", "43110"),
-            ("106", "42110"),
-            ("107", "N"),
-            ("108", "42110"),
-            ("109", "42110"),
-            ("110", "42110"),
-            ("111", "42110"),
-            ("112", "42110"),
-            ("113", "42110"),
-            ("114", "42110"),
-            ("115", "42110"),
-            ("116", "42110"),
-            ("117", "42110"),
-            ("118", "42110"),
-            ("119", "42110"),
-            ("120", "42110"),
-            ("121", "42110"),
-            ("122", "42110"),
-            ("123", "42110"),
-            ("124", "42110"),
-            ("125", "42110"),
-            ("126", "N"),
-            ("127", "N"),
-            ("128", "N"),
-            ("129", "N"),
-            ("130", "N"),
-            ("131", "42110"),
-            ("132", "42110"),
-            ("133", "42110"),
-            ("134", "42110"),
-            ("135", "42110"),
-            ("136", "N"),
-            ("137", "42110"),
-            ("138", "42110"),
-            ("139", "N"),
-            ("140", "N"),
-            ("141", "N"),
-            ("142", "N"),
-            ("143", "N"),
-            ("144", "N"),
-            ("145", "N"),
-            ("146", "N"),
-            ("147", "N"),
-            ("148", "N"),
-            ("149", "N"),
-            ("150", "42110"),
-            ("151", "42110"),
-            ("152", "42110"),
-            ("153", "42110"),
-            ("154", "42110"),
-            ("155", "42110"),
-            ("156", "42110"),
-            ("157", "42110"),
-            ("158", "42110"),
-            ("159", "42110"),
-            ("160", "42310"),
-            ("161", "42310"),
-            ("162", "42310"),
-            ("163", "42180"),
-            ("164", "42310"),
-            ("165", "42310"),
-            ("166", "42110"),
-            ("167", "42110"),
-            ("168", "42110"),
-            ("169", "42110"),
-            ("170", "42110"),
-            ("171", "N"),
-            ("172", "N"),
-            ("173", "N"),
-            ("174", "42110"),
-            ("175", "42110"),
-            ("176", "42110"),
-            ("177", "42110"),
-            ("178", "42110"),
-            ("180", "42110"),
-            ("181", "42110"),
-            ("182", "42310"),
-            ("183", "42110"),
-            ("184", "42110"),
-            ("185", "42110"),
-            ("186", "42110"),
-            ("187", "42110"),
-            ("188", "42110"),
-            ("190", "42110"),
-            ("191", "42110"),
-            ("192", "42110"),
-            ("193", "42110"),
-            ("194", "42110"),
-            ("195", "42110"),
-            ("196", "42110"),
-            ("197", "42110"),
-            ("198", "42110"),
-            ("320", "N"),
-            ("321", "N"),
-            ("400", "42610"),
-            ("401", "42610"),
-            ("402", "42610"),
-            ("403", "42610"),
-            ("404", "42610"),
-            ("405", "42610"),
-            ("406", "42610"),
-            ("407", "42610"),
-            ("408", "42610"),
-            ("409", "42610"),
-            ("410", "42610"),
-            ("411", "42610"),
-            ("413", "42699"),
-            ("420", "42610"),
-            ("421", "42610"),
-            ("422", "42610"),
-            ("423", "42610"),
-            ("424", "42610"),
-            ("425", "42610"),
-            ("426", "42610"),
-            ("427", "42610"),
-            ("428", "42610"),
-            ("429", "42610"),
-            ("430", "42610"),
-            ("431", "42610"),
-            ("432", "42610"),
-            ("433", "42610"),
-            ("434", "42610"),
-            ("440", "42610"),
-            ("441", "42610"),
-            ("442", "42610"),
-            ("443", "42610"),
-            ("444", "42610"),
-            ("450", "42610"),
-            ("451", "42610"),
-            ("452", "42610"),
-            ("453", "42610"),
-            ("454", "42610"),
-            ("473", "N"),
-            ("474", "N"),
-            ("475", "N"),
-            ("476", "N"),
-            ("477", "N"),
-            ("478", "N"),
-            ("479", "N"),
-            ("549", "N"),
-            ("550", "N"),
-            ("OTHER", "42110"),
-        ],
-    },
-    "DPCUSTCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "01"),
-            ("2", "02"),
-            ("3", "03"),
-            ("4", "04"),
-            ("5", "05"),
-            ("6", "06"),
-            ("10", "10"),
-            ("11", "11"),
-            ("12", "12"),
-            ("13", "13"),
-            ("15", "15"),
-            ("17", "17"),
-            ("20", "20"),
-            ("30", "30"),
-            ("31", "31"),
-            ("32", "32"),
-            ("33", "33"),
-            ("34", "34"),
-            ("35", "35"),
-            ("36", "36"),
-            ("37", "37"),
-            ("38", "38"),
-            ("39", "39"),
-            ("40", "40"),
-            ("41", "41"),
-            ("42", "42"),
-            ("43", "43"),
-            ("44", "44"),
-            ("45", "45"),
-            ("46", "46"),
-            ("47", "47"),
-            ("48", "48"),
-            ("49", "49"),
-            ("51", "51"),
-            ("52", "52"),
-            ("53", "53"),
-            ("54", "54"),
-            ("50", "50"),
-            ("57", "57"),
-            ("59", "59"),
-            ("60", "60"),
-            ("61", "61"),
-            ("62", "62"),
-            ("63", "63"),
-            ("64", "64"),
-            ("65", "65"),
-            ("66", "66"),
-            ("67", "67"),
-            ("68", "68"),
-            ("69", "69"),
-            ("70", "70"),
-            ("71", "71"),
-            ("72", "72"),
-            ("73", "73"),
-            ("74", "74"),
-            ("75", "75"),
-            ("76", "76"),
-            ("77", "77"),
-            ("78", "78"),
-            ("79", "79"),
-            ("80", "80"),
-            ("81", "81"),
-            ("82", "82"),
-            ("83", "83"),
-            ("84", "84"),
-            ("85", "85"),
-            ("86", "86"),
-            ("87", "87"),
-            ("88", "88"),
-            ("89", "89"),
-            ("90", "90"),
-            ("91", "91"),
-            ("92", "92"),
-            ("95", "95"),
-            ("96", "96"),
-            ("98", "98"),
-            ("99", "99"),
-            ("OTHER", "78"),
-        ],
-    },
-    "SACUSTCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "30"),
-            ("2", "30"),
-            ("3", "30"),
-            ("4", "04"),
-            ("5", "05"),
-            ("6", "06"),
-            ("10", "30"),
-            ("11", "30"),
-            ("12", "30"),
-            ("13", "30"),
-            ("15", "78"),
-            ("17", "30"),
-            ("20", "30"),
-            ("30", "30"),
-            ("31", "31"),
-            ("32", "32"),
-            ("33", "33"),
-            ("34", "34"),
-            ("35", "35"),
-            ("36", "06"),
-            ("37", "37"),
-            ("38", "38"),
-            ("39", "39"),
-            ("40", "40"),
-            ("41", "41"),
-            ("42", "42"),
-            ("43", "43"),
-            ("44", "44"),
-            ("45", "45"),
-            ("46", "46"),
-            ("47", "47"),
-            ("48", "48"),
-            ("49", "49"),
-            ("50", "78"),
-            ("51", "51"),
-            ("52", "52"),
-            ("53", "53"),
-            ("54", "54"),
-            ("57", "78"),
-            ("59", "78"),
-            ("60", "78"),
-            ("61", "78"),
-            ("62", "78"),
-            ("63", "78"),
-            ("64", "78"),
-            ("65", "78"),
-            ("66", "78"),
-            ("67", "78"),
-            ("68", "78"),
-            ("69", "78"),
-            ("70", "78"),
-            ("71", "78"),
-            ("72", "78"),
-            ("73", "78"),
-            ("74", "78"),
-            ("75", "78"),
-            ("76", "78"),
-            ("77", "77"),
-            ("78", "78"),
-            ("79", "79"),
-            ("80", "86"),
-            ("81", "86"),
-            ("82", "86"),
-            ("83", "86"),
-            ("84", "86"),
-            ("85", "86"),
-            ("86", "86"),
-            ("87", "87"),
-            ("88", "88"),
-            ("89", "89"),
-            ("90", "90"),
-            ("91", "91"),
-            ("92", "92"),
-            ("95", "95"),
-            ("96", "96"),
-            ("98", "98"),
-            ("99", "99"),
-            ("OTHER", "78"),
-        ],
-    },
-    "FDCUSTCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "01"),
-            ("2", "02"),
-            ("3", "03"),
-            ("4", "04"),
-            ("5", "05"),
-            ("6", "06"),
-            ("10", "02"),
-            ("11", "11"),
-            ("12", "12"),
-            ("13", "13"),
-            ("15", "62"),
-            ("17", "17"),
-            ("20", "30"),
-            ("30", "30"),
-            ("31", "31"),
-            ("32", "32"),
-            ("33", "33"),
-            ("34", "34"),
-            ("35", "35"),
-            ("36", "06"),
-            ("37", "37"),
-            ("38", "38"),
-            ("39", "39"),
-            ("40", "40"),
-            ("41", "41"),
-            ("42", "42"),
-            ("43", "43"),
-            ("44", "44"),
-            ("45", "45"),
-            ("46", "46"),
-            ("47", "47"),
-            ("48", "48"),
-            ("49", "49"),
-            ("50", "78"),
-            ("51", "51"),
-            ("52", "52"),
-            ("53", "53"),
-            ("54", "54"),
-            ("57", "57"),
-            ("59", "59"),
-            ("60", "62"),
-            ("61", "61"),
-            ("62", "62"),
-            ("63", "63"),
-            ("64", "64"),
-            ("65", "67"),
-            ("66", "66"),
-            ("67", "67"),
-            ("68", "68"),
-            ("69", "69"),
-            ("70", "71"),
-            ("71", "71"),
-            ("72", "72"),
-            ("73", "73"),
-            ("74", "74"),
-            ("75", "75"),
-            ("76", "78"),
-            ("77", "77"),
-            ("78", "78"),
-            ("79", "79"),
-            ("80", "86"),
-            ("81", "84"),
-            ("82", "82"),
-            ("83", "83"),
-            ("84", "84"),
-            ("85", "86"),
-            ("86", "86"),
-            ("87", "87"),
-            ("88", "88"),
-            ("89", "89"),
-            ("90", "90"),
-            ("91", "91"),
-            ("92", "92"),
-            ("95", "95"),
-            ("96", "96"),
-            ("98", "98"),
-            ("99", "99"),
-            ("OTHER", "78"),
-        ],
-    },
-    "IFDCUSCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "01"),
-            ("2", "02"),
-            ("3", "03"),
-            ("4", "04"),
-            ("5", "05"),
-            ("6", "06"),
-            ("10", "02"),
-            ("11", "11"),
-            ("12", "12"),
-            ("13", "13"),
-            ("15", "62"),
-            ("17", "17"),
-            ("20", "30"),
-            ("30", "30"),
-            ("31", "31"),
-            ("32", "32"),
-            ("33", "33"),
-            ("34", "34"),
-            ("35", "35"),
-            ("36", "06"),
-            ("37", "37"),
-            ("38", "38"),
-            ("39", "39"),
-            ("40", "40"),
-            ("41", "41"),
-            ("42", "42"),
-            ("43", "43"),
-            ("44", "44"),
-            ("45", "45"),
-            ("46", "46"),
-            ("47", "47"),
-            ("48", "48"),
-            ("49", "49"),
-            ("50", "78"),
-            ("51", "51"),
-            ("52", "52"),
-            ("53", "53"),
-            ("54", "54"),
-            ("57", "57"),
-            ("59", "59"),
-            ("60", "62"),
-            ("61", "61"),
-            ("62", "62"),
-            ("63", "63"),
-            ("64", "64"),
-            ("65", "67"),
-            ("66", "66"),
-            ("67", "67"),
-            ("68", "68"),
-            ("69", "69"),
-            ("70", "71"),
-            ("71", "71"),
-            ("72", "72"),
-            ("73", "73"),
-            ("74", "74"),
-            ("75", "75"),
-            ("76", "78"),
-            ("77", "77"),
-            ("78", "78"),
-            ("79", "79"),
-            ("80", "86"),
-            ("81", "84"),
-            ("82", "82"),
-            ("83", "83"),
-            ("84", "84"),
-            ("85", "86"),
-            ("86", "86"),
-            ("87", "87"),
-            ("88", "88"),
-            ("89", "89"),
-            ("90", "90"),
-            ("91", "91"),
-            ("92", "92"),
-            ("95", "95"),
-            ("96", "96"),
-            ("98", "98"),
-            ("99", "99"),
-            ("OTHER", "78"),
-        ],
-    },
-    "DDCUSTCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "01"),
-            ("2", "30"),
-            ("3", "30"),
-            ("4", "04"),
-            ("5", "05"),
-            ("6", "06"),
-            ("10", "30"),
-            ("11", "30"),
-            ("12", "12"),
-            ("13", "13"),
-            ("15", "62"),
-            ("17", "17"),
-            ("20", "30"),
-            ("30", "30"),
-            ("31", "31"),
-            ("32", "32"),
-            ("33", "33"),
-            ("34", "34"),
-            ("35", "35"),
-            ("36", "06"),
-            ("37", "37"),
-            ("38", "38"),
-            ("39", "39"),
-            ("40", "40"),
-            ("41", "41"),
-            ("42", "42"),
-            ("43", "43"),
-            ("44", "44"),
-            ("45", "45"),
-            ("46", "46"),
-            ("47", "47"),
-            ("48", "48"),
-            ("49", "49"),
-            ("50", "78"),
-            ("51", "51"),
-            ("52", "52"),
-            ("53", "53"),
-            ("54", "54"),
-            ("57", "57"),
-            ("59", "59"),
-            ("60", "62"),
-            ("61", "61"),
-            ("62", "62"),
-            ("63", "63"),
-            ("64", "64"),
-            ("65", "44"),
-            ("66", "41"),
-            ("67", "44"),
-            ("68", "48"),
-            ("69", "52"),
-            ("70", "71"),
-            ("71", "71"),
-            ("72", "72"),
-            ("73", "73"),
-            ("74", "74"),
-            ("75", "75"),
-            ("76", "78"),
-            ("77", "77"),
-            ("78", "78"),
-            ("79", "79"),
-            ("80", "86"),
-            ("81", "86"),
-            ("82", "86"),
-            ("83", "86"),
-            ("84", "86"),
-            ("85", "86"),
-            ("86", "86"),
-            ("87", "87"),
-            ("88", "88"),
-            ("89", "89"),
-            ("90", "90"),
-            ("91", "91"),
-            ("92", "92"),
-            ("95", "95"),
-            ("96", "96"),
-            ("98", "98"),
-            ("99", "99"),
-            ("OTHER", "79"),
-        ],
-    },
-    "STATECD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "W"),
-            ("2", "W"),
-            ("3", "W"),
-            ("4", "M"),
-            ("5", "A"),
-            ("6", "P"),
-            ("7", "J"),
-            ("8", "C"),
-            ("9", "A"),
-            ("10", "K"),
-            ("11", "K"),
-            ("12", "D"),
-            ("13", "D"),
-            ("14", "D"),
-            ("15", "W"),
-            ("16", "N"),
-            ("17", "N"),
-            ("18", "B"),
-            ("19", "B"),
-            ("20", "B"),
-            ("21", "J"),
-            ("22", "B"),
-            ("23", "A"),
-            ("24", "N"),
-            ("25", "B"),
-            ("26", "W"),
-            ("27", "P"),
-            ("28", "J"),
-            ("29", "W"),
-            ("30", "T"),
-            ("31", "B"),
-            ("32", "Q"),
-            ("33", "S"),
-            ("34", "R"),
-            ("35", "B"),
-            ("36", "B"),
-            ("37", "J"),
-            ("38", "W"),
-            ("39", "N"),
-            ("40", "W"),
-            ("41", "W"),
-            ("42", "P"),
-            ("43", "B"),
-            ("44", "S"),
-            ("45", "N"),
-            ("46", "B"),
-            ("47", "J"),
-            ("48", "C"),
-            ("49", "A"),
-            ("50", "Q"),
-            ("51", "A"),
-            ("52", "J"),
-            ("53", "W"),
-            ("54", "P"),
-            ("55", "L"),
-            ("56", "B"),
-            ("57", "K"),
-            ("58", "Q"),
-            ("59", "J"),
-            ("60", "P"),
-            ("61", "J"),
-            ("62", "S"),
-            ("63", "N"),
-            ("64", "N"),
-            ("65", "N"),
-            ("66", "W"),
-            ("67", "A"),
-            ("68", "P"),
-            ("69", "B"),
-            ("70", "K"),
-            ("71", "C"),
-            ("72", "S"),
-            ("73", "B"),
-            ("74", "K"),
-            ("75", "J"),
-            ("76", "A"),
-            ("77", "K"),
-            ("78", "B"),
-            ("79", "J"),
-            ("80", "A"),
-            ("81", "B"),
-            ("82", "D"),
-            ("83", "W"),
-            ("84", "D"),
-            ("85", "A"),
-            ("86", "K"),
-            ("87", "J"),
-            ("88", "K"),
-            ("89", "J"),
-            ("90", "Q"),
-            ("91", "J"),
-            ("92", "B"),
-            ("93", "J"),
-            ("94", "W"),
-            ("95", "A"),
-            ("96", "B"),
-            ("97", "W"),
-            ("98", "J"),
-            ("102", "J"),
-            ("103", "W"),
-            ("104", "K"),
-            ("105", "J"),
-            ("106", "T"),
-            ("107", "P"),
-            ("108", "A"),
-            ("109", "B"),
-            ("110", "J"),
-            ("111", "M"),
-            ("112", "S"),
-            ("113", "C"),
-            ("114", "P"),
-            ("115", "S"),
-            ("116", "C"),
-            ("117", "D"),
-            ("118", "B"),
-            ("119", "A"),
-            ("120", "B"),
-            ("121", "P"),
-            ("122", "B"),
-            ("123", "A"),
-            ("124", "B"),
-            ("125", "B"),
-            ("126", "P"),
-            ("127", "B"),
-            ("128", "W"),
-            ("129", "W"),
-            ("130", "Q"),
-            ("131", "B"),
-            ("133", "B"),
-            ("134", "D"),
-            ("135", "B"),
-            ("136", "W"),
-            ("137", "A"),
-            ("138", "W"),
-            ("139", "C"),
-            ("140", "S"),
-            ("141", "W"),
-            ("142", "S"),
-            ("143", "S"),
-            ("144", "J"),
-            ("145", "B"),
-            ("146", "A"),
-            ("147", "J"),
-            ("148", "B"),
-            ("149", "S"),
-            ("150", "P"),
-            ("151", "W"),
-            ("152", "A"),
-            ("153", "B"),
-            ("154", "P"),
-            ("155", "B"),
-            ("156", "M"),
-            ("157", "B"),
-            ("158", "A"),
-            ("159", "P"),
-            ("160", "M"),
-            ("161", "S"),
-            ("162", "B"),
-            ("163", "W"),
-            ("164", "P"),
-            ("165", "M"),
-            ("166", "J"),
-            ("167", "B"),
-            ("168", "W"),
-            ("169", "W"),
-            ("170", "B"),
-            ("171", "P"),
-            ("172", "M"),
-            ("173", "B"),
-            ("174", "J"),
-            ("175", "Q"),
-            ("176", "J"),
-            ("177", "P"),
-            ("178", "W"),
-            ("179", "W"),
-            ("180", "B"),
-            ("183", "Q"),
-            ("184", "Q"),
-            ("185", "Q"),
-            ("186", "Q"),
-            ("188", "Q"),
-            ("189", "Q"),
-            ("190", "Q"),
-            ("191", "Q"),
-            ("192", "Q"),
-            ("193", "Q"),
-            ("194", "Q"),
-            ("195", "W"),
-            ("196", "W"),
-            ("197", "W"),
-            ("198", "W"),
-            ("199", "B"),
-            ("201", "B"),
-            ("202", "B"),
-            ("203", "B"),
-            ("204", "P"),
-            ("205", "P"),
-            ("206", "P"),
-            ("207", "A"),
-            ("208", "A"),
-            ("209", "A"),
-            ("210", "A"),
-            ("211", "A"),
-            ("214", "J"),
-            ("215", "J"),
-            ("216", "J"),
-            ("217", "J"),
-            ("220", "C"),
-            ("221", "B"),
-            ("222", "J"),
-            ("224", "J"),
-            ("225", "B"),
-            ("226", "W"),
-            ("227", "B"),
-            ("228", "S"),
-            ("230", "W"),
-            ("231", "M"),
-            ("232", "W"),
-            ("233", "C"),
-            ("234", "J"),
-            ("235", "B"),
-            ("237", "C"),
-            ("238", "K"),
-            ("239", "C"),
-            ("240", "B"),
-            ("241", "B"),
-            ("242", "J"),
-            ("243", "A"),
-            ("244", "A"),
-            ("245", "A"),
-            ("246", "A"),
-            ("247", "J"),
-            ("248", "W"),
-            ("249", "A"),
-            ("250", "B"),
-            ("251", "A"),
-            ("252", "B"),
-            ("253", "P"),
-            ("254", "N"),
-            ("256", "A"),
-            ("257", "C"),
-            ("258", "K"),
-            ("259", "Q"),
-            ("260", "T"),
-            ("261", "D"),
-            ("262", "W"),
-            ("263", "C"),
-            ("264", "C"),
-            ("265", "P"),
-            ("266", "P"),
-            ("267", "W"),
-            ("268", "B"),
-            ("269", "W"),
-            ("270", "B"),
-            ("273", "Q"),
-            ("277", "D"),
-            ("278", "S"),
-            ("274", "Q"),
-            ("275", "Q"),
-            ("276", "S"),
-            ("279", "W"),
-            ("280", "B"),
-            ("281", "Q"),
-            ("282", "S"),
-            ("283", "S"),
-            ("284", "W"),
-            ("285", "B"),
-            ("286", "J"),
-            ("287", "J"),
-            ("288", "W"),
-            ("289", "B"),
-            ("290", "J"),
-            ("291", "B"),
-            ("292", "W"),
-            ("293", "B"),
-            ("294", "B"),
-            ("295", "B"),
-            ("296", "W"),
-            ("701", "W"),
-            ("702", "W"),
-            ("703", "D"),
-            ("704", "K"),
-            ("800", "N"),
-            ("801", "P"),
-            ("802", "W"),
-            ("803", "S"),
-            ("804", "J"),
-            ("805", "J"),
-            ("806", "K"),
-            ("807", "M"),
-            ("808", "P"),
-            ("809", "A"),
-            ("811", "W"),
-            ("812", "W"),
-            ("813", "Q"),
-            ("814", "B"),
-            ("815", "B"),
-            ("816", "B"),
-            ("817", "P"),
-            ("818", "W"),
-            ("819", "C"),
-            ("820", "B"),
-            ("821", "W"),
-            ("822", "W"),
-            ("823", "A"),
-            ("824", "K"),
-            ("825", "B"),
-            ("826", "P"),
-            ("827", "D"),
-            ("OTHER", "B"),
-        ],
-    },
-    "FDORGMT": {
-        "kind": "VALUE",
-        "rules": [
-            ("LOW - 1", "12"),
-            ("1 - 2", "13"),
-            ("2 - 3", "14"),
-            ("3 - 6", "15"),
-            ("6 - 9", "16"),
-            ("9 - 12", "17"),
-            ("12 - 15", "21"),
-            ("15 - 18", "22"),
-            ("18 - 24", "23"),
-            ("24 - 36", "24"),
-            ("36 - 48", "25"),
-            ("48 - 60", "26"),
-            ("60 - HIGH", "30"),
-        ],
-    },
-    "FDRMMT": {
-        "kind": "VALUE",
-        "rules": [
-            ("LOW - 0", "51"),
-            ("0 - 1", "52"),
-            ("1 - 2", "53"),
-            ("2 - 3", "54"),
-            ("3 - 6", "55"),
-            ("6 - 9", "56"),
-            ("9 - 12", "57"),
-            ("12 - 24", "61"),
-            ("24 - 36", "62"),
-            ("36 - 48", "63"),
-            ("48 - 60", "64"),
-            ("60 - HIGH", "70"),
-        ],
-    },
-    "RMFDORGMT": {
-        "kind": "VALUE",
-        "rules": [
-            ("272,284", "12"),
-            ("273,285", "13"),
-            ("274,286", "14"),
-            ("275,276,277,287,288,289", "15"),
-            ("278,279,280,290,291,292", "16"),
-            ("281,282,283,293,294,295", "17"),
-        ],
-    },
-    "SDRANGE": {
-        "kind": "INVALUE",
-        "rules": [
-            ("LOW - 5", 5),
-            ("5 - 10", 10),
-            ("10 - 50", 50),
-            ("50 - 100", 100),
-            ("100 - 500", 500),
-            ("500 - 1000", 1000),
-            ("1000 - 1500", 1500),
-            ("1500 - 2000", 2000),
-            ("2000 - 2500", 2500),
-            ("2500 - 3000", 3000),
-            ("3000 - 3500", 3500),
-            ("3500 - 4000", 4000),
-            ("4000 - 4500", 4500),
-            ("4500 - 5000", 5000),
-            ("5000 - 6000", 6000),
-            ("6000 - 7000", 7000),
-            ("7000 - 8000", 8000),
-            ("8000 - 9000", 9000),
-            ("9000 - 10000", 10000),
-            ("10000 - 15000", 15000),
-            ("15000 - 20000", 20000),
-            ("20000 - 25000", 25000),
-            ("25000 - 30000", 30000),
-            ("30000 - 35000", 35000),
-            ("35000 - 40000", 40000),
-            ("40000 - 45000", 45000),
-            ("45000 - 50000", 50000),
-            ("50000 - 55000", 55000),
-            ("55000 - 60000", 60000),
-            ("60000 - 65000", 65000),
-            ("65000 - 70000", 70000),
-            ("70000 - 75000", 75000),
-            ("75000 - 80000", 80000),
-            ("80000 - 85000", 85000),
-            ("85000 - 90000", 90000),
-            ("90000 - 95000", 95000),
-            ("95000 - 100000", 100000),
-            ("100000 - 150000", 150000),
-            ("150000 - 200000", 200000),
-            ("200000 - 300000", 300000),
-            ("300000 - 500000", 500000),
-            ("500000 - 1000000", 1000000),
-            ("1000000 - 2000000", 2000000),
-            ("2000000 - 3000000", 3000000),
-            ("3000000 - 4000000", 4000000),
-            ("4000000 - 5000000", 5000000),
-            ("5000000 -10000000", 10000000),
-            ("10000000 - HIGH", 10000001),
-        ],
-    },
-    "S1RANGE": {
-        "kind": "INVALUE",
-        "rules": [
-            ("LOW - 5", 5),
-            ("5 - 10", 10),
-            ("10 - 50", 50),
-            ("50 - 100", 100),
-            ("100 - 500", 500),
-            ("500 - 1000", 1000),
-            ("1000 - 1500", 1500),
-            ("1500 - 2000", 2000),
-            ("2000 - 2500", 2500),
-            ("2500 - 3000", 3000),
-            ("3000 - 3500", 3500),
-            ("3500 - 4000", 4000),
-            ("4000 - 4500", 4500),
-            ("4500 - 5000", 5000),
-            ("5000 - 6000", 6000),
-            ("6000 - 7000", 7000),
-            ("7000 - 8000", 8000),
-            ("8000 - 9000", 9000),
-            ("9000 - 10000", 10000),
-            ("10000 - 15000", 15000),
-            ("15000 - 20000", 20000),
-            ("20000 - 25000", 25000),
-            ("25000 - 30000", 30000),
-            ("30000 - 35000", 35000),
-            ("35000 - 40000", 40000),
-            ("40000 - 45000", 45000),
-            ("45000 - 50000", 50000),
-            ("50000 - 55000", 55000),
-            ("55000 - 60000", 60000),
-            ("60000 - 65000", 65000),
-            ("65000 - 70000", 70000),
-            ("70000 - 75000", 75000),
-            ("75000 - 80000", 80000),
-            ("80000 - 85000", 85000),
-            ("85000 - 90000", 90000),
-            ("90000 - 95000", 95000),
-            ("95000 - 100000", 100000),
-            ("100000 - 150000", 150000),
-            ("150000 - 200000", 200000),
-            ("200000 - 300000", 300000),
-            ("300000 - 350000", 350000),
-            ("350000 - 360000", 360000),
-            ("360000 - 500000", 500000),
-            ("500000 - 510000", 510000),
-            ("510000 - 550000", 550000),
-            ("550000 - 850000", 850000),
-            ("850000 - 860000", 860000),
-            ("860000 - 1000000", 1000000),
-            ("1000000 - 2000000", 2000000),
-            ("2000000 - 3000000", 3000000),
-            ("3000000 - 4000000", 4000000),
-            ("4000000 - 5000000", 5000000),
-            ("5000000 -10000000", 10000000),
-            ("10000000 - HIGH", 10000001),
-        ],
-    },
-    "S2RANGE": {
-        "kind": "INVALUE",
-        "rules": [
-            ("LOW - 0", 0),
-            ("0 - 5", 5),
-            ("5 - 10", 10),
-            ("10 - 50", 50),
-            ("50 - 100", 100),
-            ("100 - 500", 500),
-            ("500 - 1000", 1000),
-            ("1000 - 1500", 1500),
-            ("1500 - 2000", 2000),
-            ("2000 - 2500", 2500),
-            ("2500 - 3000", 3000),
-            ("3000 - 3500", 3500),
-            ("3500 - 4000", 4000),
-            ("4000 - 4500", 4500),
-            ("4500 - 5000", 5000),
-            ("5000 - 6000", 6000),
-            ("6000 - 7000", 7000),
-            ("7000 - 8000", 8000),
-            ("8000 - 9000", 9000),
-            ("9000 - 10000", 10000),
-            ("10000 - 15000", 15000),
-            ("15000 - 20000", 20000),
-            ("20000 - 25000", 25000),
-            ("25000 - 30000", 30000),
-            ("30000 - 35000", 35000),
-            ("35000 - 40000", 40000),
-            ("40000 - 45000", 45000),
-            ("45000 - 50000", 50000),
-            ("50000 - 55000", 55000),
-            ("55000 - 60000", 60000),
-            ("60000 - 65000", 65000),
-            ("65000 - 70000", 70000),
-            ("70000 - 75000", 75000),
-            ("75000 - 80000", 80000),
-            ("80000 - 85000", 85000),
-            ("85000 - 90000", 90000),
-            ("90000 - 95000", 95000),
-            ("95000 - 100000", 100000),
-            ("100000 - 150000", 150000),
-            ("150000 - 200000", 200000),
-            ("200000 - 300000", 300000),
-            ("300000 - 350000", 350000),
-            ("350000 - 360000", 360000),
-            ("360000 - 500000", 500000),
-            ("500000 - 510000", 510000),
-            ("510000 - 550000", 550000),
-            ("550000 - 600000", 600000),
-            ("600000 - 700000", 700000),
-            ("700000 - 800000", 800000),
-            ("800000 - 850000", 850000),
-            ("850000 - 860000", 860000),
-            ("860000 - 900000", 900000),
-            ("900000 - 1000000", 1000000),
-            ("1000000 - 1100000", 1100000),
-            ("1100000 - 1200000", 1200000),
-            ("1200000 - 1300000", 1300000),
-            ("1300000 - 1400000", 1400000),
-            ("1400000 - 1500000", 1500000),
-            ("1500000 - 1600000", 1600000),
-            ("1600000 - 1700000", 1700000),
-            ("1700000 - 1800000", 1800000),
-            ("1800000 - 1900000", 1900000),
-            ("1900000 - 2000000", 2000000),
-            ("2000000 - 3000000", 3000000),
-            ("3000000 - 4000000", 4000000),
-            ("4000000 - 5000000", 5000000),
-            ("5000000 -10000000", 10000000),
-            ("10000000 - HIGH", 10000001),
-        ],
-    },
-    "DDRANGE": {
-        "kind": "INVALUE",
-        "rules": [
-            ("LOW - 1000", 1000),
-            ("1000 - 2000", 2000),
-            ("2000 - 2500", 2500),
-            ("2500 - 3000", 3000),
-            ("3000 - 5000", 5000),
-            ("5000 - 10000", 10000),
-            ("10000 - 20000", 20000),
-            ("20000 - 30000", 30000),
-            ("30000 - 40000", 40000),
-            ("40000 - 50000", 50000),
-            ("50000 - 75000", 75000),
-            ("75000 - 100000", 100000),
-            ("100000 - 150000", 150000),
-            ("150000 - 200000", 200000),
-            ("200000 - 250000", 250000),
-            ("250000 - 500000", 500000),
-            ("500000 - 1000000", 1000000),
-            ("1000000 - 2000000", 2000000),
-            ("2000000 - 3000000", 3000000),
-            ("3000000 - 4000000", 4000000),
-            ("4000000 - 5000000", 5000000),
-            ("5000000 - HIGH", 5000001),
-        ],
-    },
-    "$RACE": {
-        "kind": "VALUE",
-        "rules": [
-            ("'0'", "0"),
-            ("'1'", "1"),
-            ("'2'", "2"),
-            ("'3'", "3"),
-            ("OTHER", "0"),
-        ],
-    },
-    "BRANCHCD": {
-        "kind": "VALUE",
-        "rules": [
-            ("1", "HEAD OFFICE"),
-            ("2", "JLN SULTAN SULAIMAN"),
-            ("3", "JLN RAJA CHULAN"),
-            ("4", "MELAKA"),
-            ("5", "IPOH MAIN OFFICE"),
-            ("6", "PENANG"),
-            ("7", "JOHOR BAHRU"),
-            ("8", "KUANTAN"),
-            ("9", "JLN YANG KALSOM"),
-            ("10", "ALOR SETAR"),
-            ("11", "GURUN"),
-            ("12", "PASIR PUTEH"),
-            ("13", "KOTA BHARU"),
-            ("14", "TANAH MERAH"),
-            ("15", "KEPUNG"),
-            ("16", "NILAI"),
-            ("17", "TAMPIN"),
-            ("18", "PJ NEW TOWN"),
-            ("19", "DAMANSARA UTAMA"),
-            ("20", "TMN CHI LIUNG"),
-            ("21", "BATU PAHAT"),
-            ("22", "SEMENYIH"),
-            ("23", "KAMUNTING"),
-            ("24", "RASAH"),
-            ("25", "SHAH ALAM"),
-            ("26", "SERI PETALING"),
-            ("27", "NIBONG TEBAL"),
-            ("28", "MUAR"),
-            ("29", "JLN RAJA LAUT"),
-            ("30", "KUALA TRENGGANU"),
-            ("31", "SEKINCHAN"),
-            ("32", "WISMA SABERKAS (WSS)"),
-            ("33", "KOTA KINABALU"),
-            ("34", "KANGAR"),
-            ("35", "SERI SETIA"),
-            ("36", "S S 2"),
-            ("37", "TMN SENTOSA"),
-            ("38", "JLN KELANG LAMA"),
-            ("39", "KUALA KELAWANG"),
-            ("40", "JLN SUNGEI BESI"),
-            ("41", "JLN IPOH"),
-            ("42", "BKT MERTAJAM"),
-            ("43", "BANTING"),
-            ("44", "TAWAU"),
-            ("45", "SEREMBAN"),
-            ("46", "AMPANG"),
-            ("47", "SEGAMAT"),
-            ("48", "MENTAKAB"),
-            ("49", "JELAPANG"),
-            ("50", "MIRI"),
-            ("51", "SERI MANJUNG"),
-            ("52", "ULU TIRAM"),
-            ("53", "TMN MALURI"),
-            ("54", "BDR BAYAN BARU"),
-            ("55", "LABUAN"),
-            ("56", "KAJANG"),
-            ("57", "SG PETANI"),
-            ("58", "SIBU"),
-            ("59", "PONTIAN KECIL"),
-            ("60", "BAGAN AJAM"),
-            ("61", "KULAI"),
-            ("62", "SANDAKAN"),
-            ("63", "GEMAS"),
-            ("64", "PORT DICKSON"),
-            ("65", "BAHAU"),
-            ("66", "BKT DAMANSARA"),
-            ("67", "CHEMOR"),
-            ("68", "SIMPANG AMPAT"),
-            ("69", "BATANG KALI"),
-            ("70", "POKOK SENA"),
-            ("71", "BRINCHANG"),
-            ("72", "PAPAR"),
-            ("73", "SG PELEK"),
-            ("74", "SIK"),
-            ("75", "CHAAH"),
-            ("76", "PANTAI REMIS"),
-            ("77", "PULAU LANGKAWI"),
-            ("78", "SUBANG JAYA"),
-            ("79", "MASAI"),
-            ("80", "MENGLEMBU"),
-            ("81", "SG BULOH"),
-            ("82", "MACHANG"),
-            ("83", "JLN BUKIT BINTANG"),
-            ("84", "PASIR MAS"),
-            ("85", "SG SIPUT"),
-            ("86", "CHANGLUN"),
-            ("87", "MERSING"),
-            ("88", "KULIM"),
-            ("89", "TAMPOI"),
-            ("90", "BINTULU"),
-            ("91", "KLUANG"),
-            ("92", "KLANG"),
-            ("93", "ENDAU"),
-            ("94", "SETAPAK"),
-            ("95", "TELUK INTAN"),
-            ("96", "SERI GOMBAK"),
-            ("97", "JLN TUN H S LEE"),
-            ("98", "TMN CENTURY"),
-            ("101", "KAMPONG BAHRU"),
-            ("102", "PARIT RAJA"),
-            ("103", "JINJANG"),
-            ("104", "KUALA KETIL"),
-            ("105", "KOTA TINGGI"),
-            ("106", "CHUKAI"),
-            ("107", "JELUTONG"),
-            ("108", "BAGAN SERAI"),
-            ("109", "KUALA SELANGOR"),
-            ("110", "TMN JOHOR JAYA"),
-            ("111", "AIR KEROH"),
-            ("112", "LIDO"),
-            ("113", "TEMERLOH"),
-            ("114", "BANDAR BARU AIR ITAM"),
-            ("115", "KENINGAU"),
-            ("116", "TRIANG"),
-            ("117", "KUALA KRAI"),
-            ("118", "TMN MELAWATI"),
-            ("120", "PANDAN INDAH"),
-            ("121", "PRAI"),
-            ("122", "SERI KEMBANGAN"),
-            ("123", "IPOH GARDEN"),
-            ("124", "SECTION 14"),
-            ("125", "KELANA JAYA"),
-            ("126", "PULAU TIKUS"),
-            ("127", "TMN SERI MUDA"),
-            ("128", "SEGAMBUT"),
-            ("129", "BANGSAR"),
-            ("130", "PADUNGAN"),
-            ("131", "TMN MAYANG"),
-            ("133", "PORT KLANG"),
-            ("134", "RANTAU PANJANG"),
-            ("135", "BDR SUNWAY"),
-            ("136", "TMN CHERAS"),
-            ("137", "JLN PASIR PUTEH"),
-            ("138", "WANGSA MAJU"),
-            ("139", "JERANTUT"),
-            ("140", "CITY PARADE"),
-            ("141", "SENTUL"),
-            ("142", "KOTA BELUD"),
-            ("143", "LAHAD DATU"),
-            ("144", "KAHANG"),
-            ("145", "BDR SRI DAMANSARA"),
-            ("146", "PUSING"),
-            ("147", "PEKAN NENAS"),
-            ("148", "PJ OLD TOWN"),
-            ("149", "BEAUFORT"),
-            ("150", "LEBOH MACALLUM"),
-            ("151", "SELAYANG"),
-            ("152", "AIR TAWAR"),
-            ("153", "USJ"),
-            ("154", "BDR SEBERANG JAYA"),
-            ("155", "TMN TAMING JAYA"),
-            ("156", "TMN MELAKA RAYA"),
-            ("157", "BDR PUCHONG JAYA"),
-            ("158", "SIMPANG PULAI"),
-            ("159", "RELAU"),
-            ("160", "MASJID TANAH"),
-            ("161", "DONGGONGON"),
-            ("162", "SEA PARK"),
-            ("163", "JLN KUCHAI LAMA"),
-            ("164", "KEPALA BATAS"),
-            ("165", "TENGKERA"),
-            ("166", "PASIR GUDANG"),
-            ("167", "BKT BERUNTUNG"),
-            ("168", "KLCITY MAIN"),
-            ("169", "CKT THAMBI DOLLAH"),
-            ("170", "PANDAN JAYA"),
-            ("171", "JLN MACALLISTER"),
-            ("172", "TMN MALIM JAYA"),
-            ("173", "SG CHUA"),
-            ("174", "BDR BARU PERMAS JAYA"),
-            ("175", "LIMBANG"),
-            ("176", "TMN PERLING"),
-            ("177", "JLN RAJA UDA"),
-            ("178", "MEDAN IDAMAN"),
-            ("179", "OVERSEAS UNION GDN"),
-            ("180", "KG BARU SUBANG"),
-            ("183", "JLN CENTRAL, SIBU"),
-            ("184", "JLN PENRISSEN, KUCHING"),
-            ("185", "KUCHING CITY (KCY)       "),
-            ("186", "JLN TUN ZAIDI, KUCHING"),
-            ("188", "PELITA, MIRI"),
-            ("189", "BATU NIAH"),
-            ("190", "BINTANGOR"),
-            ("191", "KAPIT"),
-            ("192", "MARUDI"),
-            ("193", "MUKAH"),
-            ("194", "SARIKEI"),
-            ("195", "BINTANG WALK, KL"),
-            ("196", "JLN HANG LEKIU"),
-            ("197", "TIONG NAM, KL"),
-            ("198", "TMN DESA,JLN KELANG LAMA"),
-            ("199", "JLN TAPAH,KLANG"),
-            ("201", "PANDAMARAN, KLANG"),
-            ("202", "RAWANG"),
-            ("203", "SG JAROM"),
-            ("204", "BUTTERWORTH"),
-            ("205", "SG NIBONG"),
-            ("206", "TAMAN BUKIT MAS"),
-            ("207", "BERCHAM (BCM)    "),
-            ("208", "JLN SULTAN IDRIS SHAH, IPOH"),
-            ("209", "SITIAWAN"),
-            ("210", "TANJUNG MALIM"),
-            ("211", "TANJUNG PIANDANG"),
-            ("214", "JLN GEREJA, JOHOR BARU"),
-            ("215", "JLN KUKUP, PONTIAN KECHIL"),
-            ("216", "SKUDAI"),
-            ("217", "TMN MUNSHI IBRAHIM, TAMPOI"),
-            ("220", "GENTING HIGHLANDS, PAHANG"),
-            ("221", "TMN SENTOSA, KLANG       "),
-            ("222", "TMN DESA CEMERLANG,JOHOR "),
-            ("224", "JLN ABDULLAH, MUAR       "),
-            ("225", "TMN INDAH, SELANGOR      "),
-            ("226", "JLN PASAR, KUALA LUMPUR  "),
-            ("228", "INANAM, KOTA KINABALU    "),
-            ("230", "SALAK SOUTH, KUALA LUMPUR"),
-            ("231", "BATU BERENDAM, MELAKA    "),
-            ("232", "TMN MIDAH, KUALA LUMPUR  "),
-            ("233", "BENTONG                  "),
-            ("234", "SIMPANG RENGAM           "),
-            ("235", "SABAK BERNAM, SELANGOR   "),
-            ("237", "KUALA LIPIS, PAHANG      "),
-            ("238", "JALAN KOTA, KEDAH        "),
-            ("239", "KEMAYAN, PAHANG          "),
-            ("240", "KAPAR, SELANGOR          "),
-            ("241", "DAMANSARA JAYA, SELANGOR "),
-            ("242", "TANGKAK JOHOR            "),
-            ("243", "KUALA KANGSAR PERAK      "),
-            ("244", "GUNUNG RAPAT IPOH PERAK  "),
-            ("245", "BIDOR PERAK              "),
-            ("247", "BUKIT PASIR MUAR JOHOR   "),
-            ("248", "JLN TUN SAMBANTHAN KL    "),
-            ("249", "TAIPING PERAK            "),
-            ("250", "TAMAN ENG ANN SELANGOR   "),
-            ("251", "KAMPAR PERAK             "),
-            ("252", "TAMAN MUDA SELANGOR      "),
-            ("253", "JLN TANJONG TOKONG P.PINANG"),
-            ("254", "KUALA PILAH N. SEMBILAN  "),
-            ("256", "PARIT BUNTAR PERAK       "),
-            ("257", "RAUB PAHANG              "),
-            ("258", "JITRA KEDAH              "),
-            ("259", "SRI AMAN SARAWAK         "),
-            ("260", "KUALA DUNGUN TERENGGANU  "),
-            ("261", "GUA MUSANG KELANTAN      "),
-            ("262", "TAMAN CONNAUGHT CHERAS   "),
-            ("263", "BENTA PAHANG             "),
-            ("264", "JALAN BESERAH PAHANG     "),
-            ("265", "JALAN AIR ITAM PENANG    "),
-            ("266", "JALAN DATUK KERAMAT PENANG"),
-            ("267", "TMN TUN DR ISMAIL WILAYAH "),
-            ("268", "BANDAR BUKIT TINGGI       "),
-            ("269", "MONT KIARA                "),
-            ("270", "BANDAR PUTERI PUCHONG     "),
-            ("273", "LI HUA SARAWAK            "),
-            ("277", "WAKAF SIKU KELANTAN       "),
-            ("278", "JALAN PANTAI SABAH        "),
-            ("274", "STUTONG SARAWAK           "),
-            ("275", "MEDAN SENTRAL SARAWAK     "),
-            ("276", "JALAN APAS SABAH          "),
-            ("279", "PUTRAJAYA                 "),
-            ("280", "KOTA DAMANSARA            "),
-            ("281", "PELITA                    "),
-            ("282", "PUTATAN                   "),
-            ("283", "PRIMA SQUARE              "),
-            ("284", "BANDAR SRI PERMAISURI     "),
-            ("285", "BANDAR MAHKOTA CHERAS     "),
-            ("286", "BUKIT INDAH BRANCH        "),
-            ("287", "SUTERA UTAMA              "),
-            ("288", "STARPARC POINT            "),
-            ("289", "TAMAN EQUINE              "),
-            ("290", "TAMAN DAYA                "),
-            ("291", "BANDAR SUNGAI LONG        "),
-            ("292", "BANDAR MENJALARA          "),
-            ("293", "BANDAR SETIA ALAM         "),
-            ("294", "KOTA KEMUNING             "),
-            ("295", "BANDAR KINRARA            "),
-            ("296", "BUKIT JALIL               "),
-            ("702", "PUTRAJAYA                 "),
-            ("703", "ISLAMIC WAKAF SIKU        "),
-            ("704", "ISLAMIC JALAN KOTA        "),
-            ("OTHER", "OTHER"),
-        ],
-    },
-}
+
+_SOURCE = Path(__file__).with_name("pbbdpfmt_definitions.py")
+
+
+def _source_definitions() -> dict[str, Any]:
+    from pbbdpfmt_definitions import FORMAT_DEFINITIONS
+
+    return FORMAT_DEFINITIONS
+
+
+def _decode_definition(definition: dict[str, Any]) -> dict[str, Any]:
+    return {**definition, "rules": [tuple(rule) for rule in definition["rules"]]}
+
+
+_DEFINITIONS = LazyCatalog(_SOURCE, "pbbdpfmt_definitions.fmtcat", _source_definitions, _decode_definition)
+
+
+def build_catalog() -> Path:
+    return _DEFINITIONS.build()
+
+
+def __getattr__(name: str) -> Any:
+    # FORMAT_DEFINITIONS moved to pbbdpfmt_definitions; import it only on request.
+    if name == "FORMAT_DEFINITIONS":
+        return _source_definitions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_RANGE = re.compile(
+    r"(LOW|HIGH|[-+]?\d+(?:\.\d+)?)\s*-\s*(LOW|HIGH|[-+]?\d+(?:\.\d+)?)",
+    flags=re.IGNORECASE,
+)
 
 
 def macro(name: str) -> list[int]:
@@ -2479,11 +85,13 @@ def macro(name: str) -> list[int]:
 
 
 def apply_format(name: str, value: Any) -> Any:
-    definition = FORMAT_DEFINITIONS[name.upper()]
-    for raw_keys, result in definition["rules"]:
-        if _matches(raw_keys, value):
-            return result
-    return None
+    return _compiled(name.upper()).apply(value)
+
+
+def apply_format_array(name: str, values: Iterable[Any]) -> np.ndarray:
+    """apply_format over a whole column; same results as calling it per value."""
+    compiled = _compiled(name.upper())
+    return compiled.results[compiled.rule_indexes(values)]
 
 
 def ddcustcd(value: Any) -> str:
@@ -2562,6 +170,25 @@ def race(value: Any) -> Any:
     return apply_format("$RACE", value)
 
 
+def ddcustcd_array(values: Iterable[Any]) -> np.ndarray:
+    return _array_with_default("DDCUSTCD", values, "79")
+
+
+def statecd_array(values: Iterable[Any]) -> np.ndarray:
+    return _array_with_default("STATECD", values, "B")
+
+
+def branchcd_array(values: Iterable[Any]) -> np.ndarray:
+    return _array_with_default("BRANCHCD", values, "OTHER")
+
+
+def _array_with_default(name: str, values: Iterable[Any], default: str) -> np.ndarray:
+    compiled = _compiled(name)
+    table = np.empty(len(compiled.results), dtype=object)
+    table[:] = [str(result or default) for result in compiled.results]
+    return table[compiled.rule_indexes(values)]
+
+
 def _matches(raw_keys: str, value: Any) -> bool:
     if raw_keys.upper() == "OTHER":
         return True
@@ -2593,11 +220,7 @@ def _selector_matches(selector: str, value: Any) -> bool:
     if not selector:
         return False
 
-    range_match = re.fullmatch(
-        r"(LOW|HIGH|[-+]?\d+(?:\.\d+)?)\s*-\s*(LOW|HIGH|[-+]?\d+(?:\.\d+)?)",
-        selector,
-        flags=re.IGNORECASE,
-    )
+    range_match = _RANGE.fullmatch(selector)
     if range_match:
         number = _to_number(value)
         if number is None:
@@ -2632,3 +255,172 @@ def _to_number(value: Any) -> float | None:
         return float(str(value).strip())
     except (TypeError, ValueError):
         return None
+
+
+@dataclass(frozen=True)
+class _CompiledFormat:
+    """One FORMAT_DEFINITIONS entry parsed into lookup tables.
+
+    Every selector of rule i is filed under its kind: numbers go into an
+    exact-value table, LOW/HIGH ranges into a sorted partition of boundary
+    points (each point and each gap between points carries the earliest
+    rule covering it), literal text into a dict.  The first matching rule
+    is then the smallest rule index any table returns, which is what the
+    declaration-order scan in _matches() gives.  results[len(rules)] is
+    None, the no-match answer.
+
+    A format with a selector the tables cannot express exactly (a NaN or
+    infinite numeric literal) keeps scanning with _matches().
+    """
+
+    rules: tuple[tuple[str, Any], ...]
+    results: np.ndarray
+    exact: dict[float, int]
+    exact_keys: np.ndarray
+    exact_rules: np.ndarray
+    points: np.ndarray
+    point_rules: np.ndarray
+    gap_rules: np.ndarray
+    text: dict[str, int]
+    other: int
+    compiled: bool
+
+    @property
+    def no_rule(self) -> int:
+        return len(self.rules)
+
+    def rule_index(self, value: Any) -> int:
+        if not self.compiled:
+            return next(
+                (index for index, (raw_keys, _) in enumerate(self.rules) if _matches(raw_keys, value)),
+                self.no_rule,
+            )
+        best = self.other
+        number = _to_number(value)
+        if number is not None:
+            best = min(best, self.exact.get(number, best))
+            position = bisect_left(self.points, number)
+            if position < len(self.points) and self.points[position] == number:
+                best = min(best, int(self.point_rules[position]))
+            else:
+                best = min(best, int(self.gap_rules[position]))
+        if self.text:
+            best = min(best, self.text.get(str(value).strip(), best))
+        return best
+
+    def apply(self, value: Any) -> Any:
+        return self.results[self.rule_index(value)]
+
+    def rule_indexes(self, values: Iterable[Any]) -> np.ndarray:
+        if isinstance(values, pd.Series):
+            numeric = pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype)
+            if self.compiled and not self.text and numeric:
+                return self._number_indexes(values.to_numpy(dtype="float64", na_value=np.nan))
+            array = values.array
+        elif isinstance(values, np.ndarray):
+            array = values
+        else:
+            array = np.empty(len(values := list(values)), dtype=object)
+            array[:] = values
+        if self.compiled and not self.text and array.dtype.kind in "iuf":
+            return self._number_indexes(array.astype("float64"))
+
+        # Look up each distinct (type, value) once; the type is part of the
+        # key because 1, 1.0 and True hash alike but need not classify alike.
+        distinct: dict[tuple[type, Any], int] = {}
+        codes = np.fromiter(
+            (distinct.setdefault((type(value), value), len(distinct)) for value in array),
+            dtype=np.intp,
+            count=len(array),
+        )
+        uniques = [value for _, value in distinct]
+        if not self.compiled:
+            indexes = np.array([self.rule_index(value) for value in uniques], dtype=np.intp)
+            return indexes[codes]
+        numbers = np.array(
+            [np.nan if (number := _to_number(value)) is None else number for value in uniques],
+            dtype="float64",
+        )
+        indexes = self._number_indexes(numbers)
+        if self.text:
+            texts = np.array([self.text.get(str(value).strip(), self.no_rule) for value in uniques], dtype=np.intp)
+            indexes = np.minimum(indexes, texts)
+        return indexes[codes]
+
+    def _number_indexes(self, numbers: np.ndarray) -> np.ndarray:
+        """Earliest rule per number; NaN (no number) only reaches OTHER."""
+        indexes = np.full(len(numbers), self.other, dtype=np.intp)
+        for keys, on_key, between in (
+            (self.exact_keys, self.exact_rules, None),
+            (self.points, self.point_rules, self.gap_rules),
+        ):
+            if not len(keys):
+                continue
+            position = np.searchsorted(keys, numbers, side="left")
+            clipped = np.minimum(position, len(keys) - 1)
+            hit = keys[clipped] == numbers
+            found = np.where(hit, on_key[clipped], self.no_rule)
+            if between is not None:
+                found = np.where(hit, found, between[position])
+            np.minimum(indexes, found, out=indexes)
+        return indexes
+
+
+def _compile(definition: dict[str, Any]) -> _CompiledFormat:
+    rules = tuple(definition["rules"])
+    no_rule = len(rules)
+    exact: dict[float, int] = {}
+    text: dict[str, int] = {}
+    ranges: list[tuple[float, float, int]] = []
+    other = no_rule
+    compiled = True
+    for index, (raw_keys, _) in enumerate(rules):
+        if raw_keys.upper() == "OTHER":
+            other = min(other, index)
+            continue
+        for selector in _split_selectors(raw_keys):
+            selector = selector.strip()
+            if not selector:
+                continue
+            range_match = _RANGE.fullmatch(selector)
+            if range_match:
+                ranges.append((_boundary(range_match.group(1)), _boundary(range_match.group(2)), index))
+            elif selector[0:1] in {"'", '"'} and selector[-1:] == selector[0]:
+                text.setdefault(selector[1:-1], index)
+            elif (expected := _to_number(selector)) is not None:
+                compiled = compiled and math.isfinite(expected)
+                exact.setdefault(expected, index)
+            else:
+                text.setdefault(selector, index)
+
+    points = sorted({bound for low, high, _ in ranges for bound in (low, high)})
+    point_rules = [
+        min((index for low, high, index in ranges if low <= point <= high), default=no_rule)
+        for point in points
+    ]
+    gap_rules = [no_rule] + [
+        min((index for low, high, index in ranges if low <= left and right <= high), default=no_rule)
+        for left, right in zip(points, points[1:])
+    ] + [no_rule] * bool(points)
+    exact_keys = sorted(exact)
+
+    results = np.empty(no_rule + 1, dtype=object)
+    results[:] = [result for _, result in rules] + [None]
+    return _CompiledFormat(
+        rules=rules,
+        results=results,
+        exact=exact,
+        exact_keys=np.array(exact_keys, dtype="float64"),
+        exact_rules=np.array([exact[key] for key in exact_keys], dtype=np.intp),
+        points=np.array(points, dtype="float64"),
+        point_rules=np.array(point_rules, dtype=np.intp),
+        gap_rules=np.array(gap_rules, dtype=np.intp),
+        text=text,
+        other=other,
+        compiled=compiled,
+    )
+
+
+@lru_cache(maxsize=None)
+def _compiled(name: str) -> _CompiledFormat:
+    return _compile(_DEFINITIONS[name])
@@ -1,41 +1,10 @@
-"""Auto-generated Python conversion of the full PBBDPFMT SAS member.
+"""PBBDPFMT VALUE/INVALUE definitions (source for the format catalog).
 
-This standalone module contains every %LET list, VALUE format, and INVALUE
-informat from the supplied PBBDPFMT source. It does not read SAS source at
-runtime.
+This module only holds the converted PROC FORMAT literals; pbbdpfmt3.py
+serves them through fmtcatalog, so jobs do not import this module unless
+the catalog artifact is missing or out of date.
 """
 
-from __future__ import annotations
-
-import math
-import re
-from typing import Any
-
-
-MACROS = {
-    "ACE": [
-        40, 42, 43, 150, 151, 152, 181,
-    ],
-    "FCY": [
-        350, 351, 352, 353, 354, 355, 356, 357, 358, 360, 361, 362,
-    ],
-    "CURX": [
-        50, 51, 55, 56, 57, 58, 60, 64, 65, 68, 69, 167,
-        169, 168, 85, 86, 87, 88, 89, 66, 67, 70, 71, 73,
-        96, 97, 61, 90, 91, 92, 93, 94, 95, 100, 101, 102,
-        106, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118,
-        119, 120, 121, 122, 123, 124, 125, 133, 134, 135, 137, 138,
-        170, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160,
-        161, 162, 163, 164, 165, 166, 174, 175, 176, 177, 178, 179,
-        180, 181, 182, 183, 189, 190, 191, 192, 193, 194, 195, 196,
-        197, 198, 81, 82, 83, 84, 184, 185, 186, 131, 132, 187,
-        188, 20, 21, 77, 40, 41, 42, 43, 78, 74, 35, 36,
-        37, 38, 39, 46, 47, 48, 49, 75, 76, 23, 24, 25,
-        45, 26, 27, 13, 14, 15, 16, 17, 18, 19, 3, 4,
-        5, 6, 7, 8, 9, 10, 11, 12, 22, 81,
-    ],
-}
-
 FORMAT_DEFINITIONS = {
     "SADENOM": {
         "kind": "VALUE",
@@ -2472,163 +2441,3 @@ FORMAT_DEFINITIONS = {
         ],
     },
 }
-
-
-def macro(name: str) -> list[int]:
-    return list(MACROS[name.upper()])
-
-
-def apply_format(name: str, value: Any) -> Any:
-    definition = FORMAT_DEFINITIONS[name.upper()]
-    for raw_keys, result in definition["rules"]:
-        if _matches(raw_keys, value):
-            return result
-    return None
-
-
-def ddcustcd(value: Any) -> str:
-    return str(apply_format("DDCUSTCD", value) or "79")
-
-
-def statecd(value: Any) -> str:
-    return str(apply_format("STATECD", value) or "B")
-
-
-def branchcd(value: Any) -> str:
-    return str(apply_format("BRANCHCD", value) or "OTHER")
-
-
-def sadenom(value: Any) -> Any:
-    return apply_format("SADENOM", value)
-
-def saprod(value: Any) -> Any:
-    return apply_format("SAPROD", value)
-
-def fddenom(value: Any) -> Any:
-    return apply_format("FDDENOM", value)
-
-def fdprod(value: Any) -> Any:
-    return apply_format("FDPROD", value)
-
-def fdprodd(value: Any) -> Any:
-    return apply_format("FDPRODD", value)
-
-def fdprd(value: Any) -> Any:
-    return apply_format("FDPRD", value)
-
-def fcyterm(value: Any) -> Any:
-    return apply_format("FCYTERM", value)
-
-def cadenom(value: Any) -> Any:
-    return apply_format("CADENOM", value)
-
-def caprod(value: Any) -> Any:
-    return apply_format("CAPROD", value)
-
-def dpcustcd(value: Any) -> Any:
-    return apply_format("DPCUSTCD", value)
-
-def sacustcd(value: Any) -> Any:
-    return apply_format("SACUSTCD", value)
-
-def fdcustcd(value: Any) -> Any:
-    return apply_format("FDCUSTCD", value)
-
-def ifdcuscd(value: Any) -> Any:
-    return apply_format("IFDCUSCD", value)
-
-def fdorgmt(value: Any) -> Any:
-    return apply_format("FDORGMT", value)
-
-def fdrmmt(value: Any) -> Any:
-    return apply_format("FDRMMT", value)
-
-def rmfdorgmt(value: Any) -> Any:
-    return apply_format("RMFDORGMT", value)
-
-def sdrange(value: Any) -> Any:
-    return apply_format("SDRANGE", value)
-
-def s1range(value: Any) -> Any:
-    return apply_format("S1RANGE", value)
-
-def s2range(value: Any) -> Any:
-    return apply_format("S2RANGE", value)
-
-def ddrange(value: Any) -> Any:
-    return apply_format("DDRANGE", value)
-
-def race(value: Any) -> Any:
-    return apply_format("$RACE", value)
-
-
-def _matches(raw_keys: str, value: Any) -> bool:
-    if raw_keys.upper() == "OTHER":
-        return True
-    return any(_selector_matches(selector, value) for selector in _split_selectors(raw_keys))
-
-
-def _split_selectors(raw_keys: str) -> list[str]:
-    selectors = []
-    current = []
-    quote = None
-    for character in raw_keys:
-        if character in {"'", '"'}:
-            if quote == character:
-                quote = None
-            elif quote is None:
-                quote = character
-        if character == "," and quote is None:
-            selectors.append("".join(current).strip())
-            current = []
-        else:
-            current.append(character)
-    if current:
-        selectors.append("".join(current).strip())
-    return selectors
-
-
-def _selector_matches(selector: str, value: Any) -> bool:
-    selector = selector.strip()
-    if not selector:
-        return False
-
-    range_match = re.fullmatch(
-        r"(LOW|HIGH|[-+]?\d+(?:\.\d+)?)\s*-\s*(LOW|HIGH|[-+]?\d+(?:\.\d+)?)",
-        selector,
-        flags=re.IGNORECASE,
-    )
-    if range_match:
-        number = _to_number(value)
-        if number is None:
-            return False
-        return _boundary(range_match.group(1)) <= number <= _boundary(range_match.group(2))
-
-    if selector[0:1] in {"'", '"'} and selector[-1:] == selector[0]:
-        return str(value).strip() == selector[1:-1]
-
-    number = _to_number(value)
-    expected = _to_number(selector)
-    if number is not None and expected is not None:
-        return number == expected
-    return str(value).strip() == selector
-
-
-def _boundary(token: str) -> float:
-    token = token.upper()
-    if token == "LOW":
-        return -math.inf
-    if token == "HIGH":
-        return math.inf
-    return float(token)
-
-
-def _to_number(value: Any) -> float | None:
-    if value is None:
-        return None
-    if isinstance(value, float) and math.isnan(value):
-        return None
-    try:
-        return float(str(value).strip())
-    except (TypeError, ValueError):
-        return None
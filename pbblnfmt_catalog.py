@@ -0,0 +1,817 @@
+"""PBBLNFMT and PBBELF format definitions (source for the format catalog).
+
+This module only holds the converted PROC FORMAT literals; PBBLNFMT.py
+serves them through fmtcatalog, so jobs do not import this module unless
+the catalog artifact is missing or out of date.
+"""
+
+PBBLNFMT_CATALOG = {'ODDENOM': {'kind': 'value', 'character': False, 'rules': [{'values': [32, 33, 60, 61, 62, 63, 64, 92, 93, 96, 81, 70, 71, 73, 74, 7, 8, 46, 47, 48, 49, 45, 13, 14, 20, 21], 'ranges': [[160, 169], [182, 188], [15, 19], [23, 25]], 'other': False, 'result': 'I'}, {'values': [], 'ranges': [], 'other': True, 'result': 'D'}]},
+ 'ODPROD': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': [3], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [4], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [5], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [6], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [7], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [8], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [9], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [10], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [11], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [12], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [13], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [14], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [15], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [16], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [17], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [18], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [19], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [20], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [21], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [22], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [23], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [24], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [25], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [26], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [27], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [30], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [31], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [32], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [33], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [35], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [36], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [37], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [38], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [39], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [41], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [42], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [43], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [45], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [46], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [47], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [48], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [49], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [50], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [51], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [52], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [53], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [54], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [55], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [56], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [57], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [58], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [59], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [60], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [61], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [62], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [63], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [64], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [65], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [68], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [69], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [70], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [71], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [73], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [74], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [75], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [76], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [77], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [78], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [81], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [82], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [83], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [84], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [85], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [86], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [87], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [88], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [89], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [90], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [91], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [92], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [93], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [94], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [95], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [96], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [97], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [98], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [100], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [101], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [102], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [103], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [104], 'ranges': [], 'other': False, 'result': '33110'}, {'values': [105], 'ranges': [], 'other': False, 'result': '33110'}, {'values': [106], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [107], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [108], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [109], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [110], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [111], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [112], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [113], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [114], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [115], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [116], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [117], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [118], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [119], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [120], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [121], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [122], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [123], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [124], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [125], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [126], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [127], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [128], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [129], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [130], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [131], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [132], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [133], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [134], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [135], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [136], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [137], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [138], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [139], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [140], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [141], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [142], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [143], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [144], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [145], 'ranges': [], 'other': False, 'result': 'N'},
+                      {'values': [146], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [147], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [148], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [149], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [150], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [151], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [152], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [153], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [154], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [155], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [156], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [157], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [158], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [159], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [160], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [161], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [162], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [163], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [164], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [165], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [166], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [167], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [168], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [169], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [170], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [171], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [172], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [173], 'ranges': [], 'other': False, 'result': 'N'},
+                      {'values': [174], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [175], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [176], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [177], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [178], 'ranges': [], 'other': False, 'result': '34240'}, {'values': [180], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [181], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [182], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [183], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [184], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [185], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [186], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [187], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [188], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [190], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [191], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [192], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [193], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [194], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [195], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [196], 'ranges': [], 'other': False, 'result': '34180'},
+                      {'values': [197], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [198], 'ranges': [], 'other': False, 'result': '34180'}, {'values': [473], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [474], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [475], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [476], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [477], 'ranges': [], 'other': False, 'result': 'N'},
+                      {'values': [478], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [479], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [549], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [550], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [], 'ranges': [], 'other': True, 'result': '34180'}]},
+ 'LNDENOM': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [100, 119, 120, 122, 126, 127, 128, 129, 130, 131, 132, 185, 169, 134, 135, 136, 138, 139, 140, 141, 142, 143, 170, 180, 181, 182, 183, 101, 147, 148, 173, 174, 159, 160, 161, 162, 164, 165, 179, 146, 184, 191, 197, 199, 124, 145, 144, 163, 186, 187, 102, 103, 104, 105, 106, 107, 108, 188, 189, 190, 137, 400, 401, 402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 419, 418, 427, 428, 429, 445, 446, 448, 973],
+                        'ranges': [[110, 118], [851, 899], [152, 158], [192, 196], [420, 422], [461, 470], [430, 439], [440, 444], [650, 699], [471, 498]],
+                        'other': False,
+                        'result': 'I'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': 'D'}]},
+ 'LNPROD': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': [], 'ranges': [[4, 7]], 'other': False, 'result': '34230'}, {'values': [15], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [20], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [25], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [26], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [27], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [28], 'ranges': [], 'other': False, 'result': '34230'},
+                      {'values': [29, 30], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [31, 32], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [33], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [60], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [61], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [62], 'ranges': [], 'other': False, 'result': '34230'},
+                      {'values': [63], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [70], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [71], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [72], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [73], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [74], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [75], 'ranges': [], 'other': False, 'result': '34230'},
+                      {'values': [76], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [77], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [78], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [79], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [100], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [101], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [102], 'ranges': [], 'other': False, 'result': '34230'},
+                      {'values': [103], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [104], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [105], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [106], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [107], 'ranges': [], 'other': False, 'result': '34230'}, {'values': [108], 'ranges': [], 'other': False, 'result': '34230'},
+                      {'values': [], 'ranges': [[110, 111]], 'other': False, 'result': '34120'}, {'values': [112], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [113], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [114], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [115], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [116], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [117], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [118], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [119], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [120], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [122], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [124], 'ranges': [], 'other': False, 'result': '54120'}, {'values': [126], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [127], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [128], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [129], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [130], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [131], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [132], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [133], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [134], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [135], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [136], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [137], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [138], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [139], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [140], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [141], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [142], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [143], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [144], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [145], 'ranges': [], 'other': False, 'result': '54120'}, {'values': [146], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [147], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [148], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [149], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [150], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [151], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [152], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [153], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [154], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [155], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [156], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [157], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [158], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [159], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [160], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [161], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [162], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [163], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [164], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [165], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [169], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [170], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [172], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [173], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [174], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [175], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [176], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [177], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [178], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [179], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [180], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [181], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [182], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [183], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [184], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [185], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [186], 'ranges': [], 'other': False, 'result': '34115'},
+                      {'values': [187], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [188], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [189], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [190], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [191], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [192], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [193], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [194], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [195], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [196], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [197], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [199], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [200, 201], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [204, 205], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [209, 210], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [211, 212], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [213], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [214, 215], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [216], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [217], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [218], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [219, 220], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [225, 226], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [], 'ranges': [[227, 228]], 'other': False, 'result': '34120'}, {'values': [], 'ranges': [[230, 233]], 'other': False, 'result': '34120'},
+                      {'values': [234], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [235], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [236], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [237], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [238], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [239], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [240], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [241], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [242], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [243], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [244], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [245], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [246], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [247], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [248], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [249], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [250], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [253], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [254], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [255], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [256], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [257], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [258], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [259], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [260], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [300, 301], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [302], 'ranges': [], 'other': False, 'result': '34190'},
+                      {'values': [303], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [304, 305], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [306], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [307], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [308], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [309, 310], 'ranges': [], 'other': False, 'result': '34114'},
+                      {'values': [311], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [313], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [315], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [316], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [320], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [322], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [325], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [330], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [335], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [340], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [345], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [348], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [349], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [350], 'ranges': [], 'other': False, 'result': '34190'},
+                      {'values': [351], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [354], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [355], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [356], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [357], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [358], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [359], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [360], 'ranges': [], 'other': False, 'result': '34113'}, {'values': [361], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [362], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [363], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [364], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [365], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [367], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [368], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [369], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [380], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [381], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [390], 'ranges': [], 'other': False, 'result': '34112'}, {'values': [391], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [392], 'ranges': [], 'other': False, 'result': '34170'},
+                      {'values': [400], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [401], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [402], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [403], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [404], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [405], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [406], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [407], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [408], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [409], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [410], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [411], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [412], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [413], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [414], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [415], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [416], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [417], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [418], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [419], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [420], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [421], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [422], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [423], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [424], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [425], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [426], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [427], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [428], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [429], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [430], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [431], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [432], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [433], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [434], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [435], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [436], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [437], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [438], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [439], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [440], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [441], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [442], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [443], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [445], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [446], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [447], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [448], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [461], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [462], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [463], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [464], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [465], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [466], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [467], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [468], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [469], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [470], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [471], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [472], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [473], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [474], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [475], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [476], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [477], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [478], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [479], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [480], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [481], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [482], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [483], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [484], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [485], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [486], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [487], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [488], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [489], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [490], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [491], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [492], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [493], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [494], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [495], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [496], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [497], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [498], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [500], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [504, 505], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [506], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [509, 510], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [512], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [515], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [516], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [517], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [518], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [519], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [520], 'ranges': [], 'other': False, 'result': 'N'},
+                      {'values': [], 'ranges': [[521, 523]], 'other': False, 'result': '34149'}, {'values': [524], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [525], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [526], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [527], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [528], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [529], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [530], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [531], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [532], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [533], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [555, 556], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [559, 560], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [561], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [564, 565], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [566], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [567], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [568], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [569], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [570], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [573], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [574], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [575], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [576], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [577], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [578], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [600], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [601], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [602], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [603], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [604], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [605], 'ranges': [], 'other': False, 'result': '34190'},
+                      {'values': [606], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [607], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [608], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [609], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [610], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [611], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [612], 'ranges': [], 'other': False, 'result': '34170'},
+                      {'values': [631], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [632], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [633], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [634], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [635], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [636], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [637], 'ranges': [], 'other': False, 'result': '34114'},
+                      {'values': [638], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [639], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [640], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [641], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [650, 651], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [652, 653], 'ranges': [], 'other': False, 'result': '34117'},
+                      {'values': [654, 655], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [656, 657], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [658, 659], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [660], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [661, 662], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [663], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [664], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [665], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [666], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [667], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [668], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [669], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [670], 'ranges': [], 'other': False, 'result': '34114'},
+                      {'values': [671], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [672], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [673], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [674], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [675], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [676], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [677], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [678], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [679], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [680], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [681, 682], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [683], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [684], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [685], 'ranges': [], 'other': False, 'result': '34190'},
+                      {'values': [686], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [687], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [688], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [689], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [690], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [691], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [692], 'ranges': [], 'other': False, 'result': '34120'},
+                      {'values': [693], 'ranges': [], 'other': False, 'result': '34117'}, {'values': [694], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [695], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [696], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [698], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [699], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [700, 705], 'ranges': [], 'other': False, 'result': '34111'},
+                      {'values': [750], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [709, 710], 'ranges': [], 'other': False, 'result': '54124'}, {'values': [720, 725], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [752, 760], 'ranges': [], 'other': False, 'result': '34111'}, {'values': [770, 775], 'ranges': [], 'other': False, 'result': '34113'}, {'values': [799], 'ranges': [], 'other': False, 'result': '34112'},
+                      {'values': [800], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [801], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [802], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [803], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [804], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [805], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [806], 'ranges': [], 'other': False, 'result': '34690'},
+                      {'values': [807], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [808], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [809], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [810], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [811], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [812], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [813], 'ranges': [], 'other': False, 'result': '34600'},
+                      {'values': [814], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [815], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [816], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [817], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [818], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [851], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [852], 'ranges': [], 'other': False, 'result': '34600'},
+                      {'values': [853], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [854], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [855], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [856], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [857], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [858], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [859], 'ranges': [], 'other': False, 'result': '34690'},
+                      {'values': [860], 'ranges': [], 'other': False, 'result': '34690'}, {'values': [900, 901], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [902], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [903], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [904, 905], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [906], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [907], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [908], 'ranges': [], 'other': False, 'result': '34113'}, {'values': [909], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [910], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [911], 'ranges': [], 'other': False, 'result': '34120'}, {'values': [912], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [913], 'ranges': [], 'other': False, 'result': '34149'},
+                      {'values': [914, 915], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [916], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [917], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [918], 'ranges': [], 'other': False, 'result': '34149'}, {'values': [919, 920], 'ranges': [], 'other': False, 'result': '34114'}, {'values': [925], 'ranges': [], 'other': False, 'result': '34190'},
+                      {'values': [950], 'ranges': [], 'other': False, 'result': '34115'}, {'values': [951], 'ranges': [], 'other': False, 'result': '34190'}, {'values': [981], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [982], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [983], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [984], 'ranges': [], 'other': False, 'result': 'M'}, {'values': [985], 'ranges': [], 'other': False, 'result': 'M'},
+                      {'values': [991], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [992], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [993], 'ranges': [], 'other': False, 'result': 'N'}, {'values': [994], 'ranges': [], 'other': False, 'result': 'M'}, {'values': [995], 'ranges': [], 'other': False, 'result': 'M'}, {'values': [996], 'ranges': [], 'other': False, 'result': 'M'}, {'values': [], 'ranges': [], 'other': True, 'result': '34149'}]},
+ 'LIQPFMT': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [117, 113, 118, 115, 116, 110, 111, 139, 140, 141, 142, 227, 228, 230, 231, 234, 201, 204, 205, 226, 225, 235, 236, 237, 238, 239, 240, 241, 242, 248, 100, 101, 112, 114, 170, 200, 209, 210, 211, 212, 214, 215, 213, 216, 217, 218, 219, 220, 229, 232, 233, 244, 245, 246, 247, 243, 150, 151, 175, 152, 156, 445, 446, 400, 409, 410, 412, 413, 414, 415, 423, 440, 466, 253, 254, 431, 432, 433, 255, 256, 257, 258, 259, 260, 638, 650, 651, 664, 600, 249, 911, 250],
+                        'ranges': [],
+                        'other': False,
+                        'result': 'HL'},
+                       {'values': [302, 365, 506, 902, 903, 951, 350, 910, 925, 364, 146, 184, 192, 195, 802, 803, 856, 857, 858, 859, 351, 860, 660, 685, 604, 605, 634, 806, 808, 810, 812, 814, 190, 689, 641, 917, 817], 'ranges': [], 'other': False, 'result': 'RC'}, {'values': [392, 612], 'ranges': [], 'other': False, 'result': 'FS'}, {'values': [], 'ranges': [], 'other': True, 'result': 'FL'}]},
+ 'SLTYPE': {'kind': 'value', 'character': False, 'rules': [{'values': [70, 106], 'ranges': [[4, 7], [100, 102]], 'other': False, 'result': 'HL'}, {'values': [15, 20, 71, 72, 103, 104, 107], 'ranges': [], 'other': False, 'result': 'HP'}, {'values': [105, 108], 'ranges': [[25, 34], [60, 62], [73, 79]], 'other': False, 'result': 'FL'}, {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'LN03FMT': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [4, 5, 6, 7, 15, 20, 100, 101, 102, 103, 104, 105, 106, 107, 108], 'ranges': [[25, 34], [60, 63], [70, 78]], 'other': False, 'result': 'SL'}, {'values': [225], 'ranges': [], 'other': False, 'result': 'OT'}, {'values': [110, 112, 114, 200, 201, 141, 150, 210, 212, 227, 230, 232, 409, 237, 239, 244, 243, 246, 410, 255, 433, 445, 258, 259], 'ranges': [], 'other': False, 'result': 'P1'},
+                       {'values': [170, 524, 525, 526, 527, 531, 555, 556, 559, 560, 561, 564, 565, 566, 567, 568, 569, 570, 573, 909, 162, 575, 576, 144, 172, 418, 427, 428, 473, 489, 434, 421, 435, 437, 438, 439, 448, 577, 578, 436], 'ranges': [], 'other': False, 'result': 'P2'},
+                       {'values': [111, 113, 115, 116, 117, 118, 209, 139, 140, 204, 205, 214, 142, 211, 215, 219, 220, 228, 231, 233, 151, 152, 156, 175, 256, 257, 234, 235, 236, 238, 240, 241, 213, 216, 242, 245, 247, 248, 217, 218, 260, 400, 412, 413, 414, 415, 423, 466, 249, 250, 440, 253, 254, 431, 432, 446, 472, 474, 479, 484, 486, 494], 'ranges': [], 'other': False, 'result': 'P3'}, {'values': [392, 612], 'ranges': [], 'other': False, 'result': 'P5'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': 'P4'}]},
+ 'ODRATE': {'kind': 'value', 'character': False, 'rules': [{'values': [50, 51, 52, 53, 54, 55, 56, 57, 65, 106, 159, 170, 174, 175, 176, 177, 178, 179, 180, 135], 'ranges': [[100, 103], [108, 125], [137, 138], [150, 158], [191, 198]], 'other': False, 'result': '30595'}, {'values': [60, 61, 62, 63, 166, 96, 93, 97], 'ranges': [[160, 164]], 'other': False, 'result': '30593'}, {'values': [], 'ranges': [], 'other': True, 'result': '30595'}]},
+ 'LNRATE': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': [124, 139, 140, 141, 142, 145, 200, 201, 204, 205, 209, 210, 211, 212, 214, 215, 219, 220, 225, 226, 227, 228, 230], 'ranges': [[110, 119], [230, 248]], 'other': False, 'result': '30591'}, {'values': [128, 130, 380, 381, 700, 705], 'ranges': [], 'other': False, 'result': '30592'}, {'values': [131, 132, 348, 720, 725, 392, 612], 'ranges': [], 'other': False, 'result': '30595'},
+                      {'values': [15, 20, 96, 97, 100, 533], 'ranges': [[4, 7], [25, 34], [60, 63], [70, 79]], 'other': False, 'result': '30593'}, {'values': [120, 122, 126, 127, 129, 135, 136, 138, 143, 146, 304, 305, 315, 320, 325, 330, 335, 340, 345, 350, 390, 391, 910, 914, 915, 919, 920, 925, 950, 951], 'ranges': [[180, 184], [193, 196], [300, 302], [309, 310], [355, 365], [900, 909]], 'other': False, 'result': '30596'},
+                      {'values': [144, 170, 509, 510, 512, 555, 556, 559, 560, 561, 573, 574, 575, 576], 'ranges': [[504, 506], [515, 532], [564, 570]], 'other': False, 'result': '30597'}, {'values': [], 'ranges': [], 'other': True, 'result': '30595'}]},
+ 'ODCUSTCD': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': [1], 'ranges': [], 'other': False, 'result': '01'}, {'values': [2], 'ranges': [], 'other': False, 'result': '02'}, {'values': [3], 'ranges': [], 'other': False, 'result': '03'}, {'values': [4], 'ranges': [], 'other': False, 'result': '04'}, {'values': [5], 'ranges': [], 'other': False, 'result': '05'}, {'values': [6], 'ranges': [], 'other': False, 'result': '06'}, {'values': [10], 'ranges': [], 'other': False, 'result': '11'},
+                        {'values': [11], 'ranges': [], 'other': False, 'result': '11'}, {'values': [12], 'ranges': [], 'other': False, 'result': '12'}, {'values': [13], 'ranges': [], 'other': False, 'result': '13'}, {'values': [15], 'ranges': [], 'other': False, 'result': '79'}, {'values': [17], 'ranges': [], 'other': False, 'result': '17'}, {'values': [20], 'ranges': [], 'other': False, 'result': '30'}, {'values': [30], 'ranges': [], 'other': False, 'result': '30'},
+                        {'values': [32], 'ranges': [], 'other': False, 'result': '32'}, {'values': [33], 'ranges': [], 'other': False, 'result': '33'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34'}, {'values': [35], 'ranges': [], 'other': False, 'result': '35'}, {'values': [36], 'ranges': [], 'other': False, 'result': '04'}, {'values': [37], 'ranges': [], 'other': False, 'result': '37'}, {'values': [38], 'ranges': [], 'other': False, 'result': '38'},
+                        {'values': [39], 'ranges': [], 'other': False, 'result': '39'}, {'values': [40], 'ranges': [], 'other': False, 'result': '40'}, {'values': [41], 'ranges': [], 'other': False, 'result': '41'}, {'values': [42], 'ranges': [], 'other': False, 'result': '42'}, {'values': [43], 'ranges': [], 'other': False, 'result': '43'}, {'values': [44], 'ranges': [], 'other': False, 'result': '44'}, {'values': [46], 'ranges': [], 'other': False, 'result': '46'},
+                        {'values': [47], 'ranges': [], 'other': False, 'result': '47'}, {'values': [48], 'ranges': [], 'other': False, 'result': '48'}, {'values': [49], 'ranges': [], 'other': False, 'result': '49'}, {'values': [51], 'ranges': [], 'other': False, 'result': '51'}, {'values': [52], 'ranges': [], 'other': False, 'result': '52'}, {'values': [53], 'ranges': [], 'other': False, 'result': '53'}, {'values': [54], 'ranges': [], 'other': False, 'result': '54'},
+                        {'values': [50], 'ranges': [], 'other': False, 'result': '79'}, {'values': [57], 'ranges': [], 'other': False, 'result': '57'}, {'values': [59], 'ranges': [], 'other': False, 'result': '59'}, {'values': [60], 'ranges': [], 'other': False, 'result': '62'}, {'values': [61], 'ranges': [], 'other': False, 'result': '61'}, {'values': [62], 'ranges': [], 'other': False, 'result': '62'}, {'values': [63], 'ranges': [], 'other': False, 'result': '63'},
+                        {'values': [64], 'ranges': [], 'other': False, 'result': '64'}, {'values': [65], 'ranges': [], 'other': False, 'result': '44'}, {'values': [66], 'ranges': [], 'other': False, 'result': '41'}, {'values': [67], 'ranges': [], 'other': False, 'result': '44'}, {'values': [68], 'ranges': [], 'other': False, 'result': '48'}, {'values': [69], 'ranges': [], 'other': False, 'result': '52'}, {'values': [70], 'ranges': [], 'other': False, 'result': '71'},
+                        {'values': [71], 'ranges': [], 'other': False, 'result': '71'}, {'values': [72], 'ranges': [], 'other': False, 'result': '72'}, {'values': [73], 'ranges': [], 'other': False, 'result': '73'}, {'values': [74], 'ranges': [], 'other': False, 'result': '74'}, {'values': [75], 'ranges': [], 'other': False, 'result': '75'}, {'values': [76], 'ranges': [], 'other': False, 'result': '78'}, {'values': [77], 'ranges': [], 'other': False, 'result': '77'},
+                        {'values': [78], 'ranges': [], 'other': False, 'result': '78'}, {'values': [79], 'ranges': [], 'other': False, 'result': '79'}, {'values': [80], 'ranges': [], 'other': False, 'result': '86'}, {'values': [81], 'ranges': [], 'other': False, 'result': '86'}, {'values': [85], 'ranges': [], 'other': False, 'result': '86'}, {'values': [86], 'ranges': [], 'other': False, 'result': '86'}, {'values': [87], 'ranges': [], 'other': False, 'result': '87'},
+                        {'values': [88], 'ranges': [], 'other': False, 'result': '88'}, {'values': [89], 'ranges': [], 'other': False, 'result': '89'}, {'values': [90], 'ranges': [], 'other': False, 'result': '90'}, {'values': [91], 'ranges': [], 'other': False, 'result': '91'}, {'values': [92], 'ranges': [], 'other': False, 'result': '92'}, {'values': [95], 'ranges': [], 'other': False, 'result': '95'}, {'values': [96], 'ranges': [], 'other': False, 'result': '96'},
+                        {'values': [98], 'ranges': [], 'other': False, 'result': '98'}, {'values': [99], 'ranges': [], 'other': False, 'result': '99'}, {'values': [], 'ranges': [], 'other': True, 'result': '79'}]},
+ 'LOCUSTCD': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': [1], 'ranges': [], 'other': False, 'result': '11'}, {'values': [2], 'ranges': [], 'other': False, 'result': '02'}, {'values': [3], 'ranges': [], 'other': False, 'result': '03'}, {'values': [4], 'ranges': [], 'other': False, 'result': '04'}, {'values': [5], 'ranges': [], 'other': False, 'result': '05'}, {'values': [6], 'ranges': [], 'other': False, 'result': '06'}, {'values': [10], 'ranges': [], 'other': False, 'result': '11'},
+                        {'values': [11], 'ranges': [], 'other': False, 'result': '11'}, {'values': [12], 'ranges': [], 'other': False, 'result': '12'}, {'values': [13], 'ranges': [], 'other': False, 'result': '13'}, {'values': [15], 'ranges': [], 'other': False, 'result': '79'}, {'values': [17], 'ranges': [], 'other': False, 'result': '17'}, {'values': [20], 'ranges': [], 'other': False, 'result': '30'}, {'values': [30], 'ranges': [], 'other': False, 'result': '30'},
+                        {'values': [31], 'ranges': [], 'other': False, 'result': '31'}, {'values': [32], 'ranges': [], 'other': False, 'result': '32'}, {'values': [33], 'ranges': [], 'other': False, 'result': '33'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34'}, {'values': [35], 'ranges': [], 'other': False, 'result': '35'}, {'values': [36], 'ranges': [], 'other': False, 'result': '06'}, {'values': [37], 'ranges': [], 'other': False, 'result': '37'},
+                        {'values': [38], 'ranges': [], 'other': False, 'result': '38'}, {'values': [39], 'ranges': [], 'other': False, 'result': '39'}, {'values': [40], 'ranges': [], 'other': False, 'result': '40'}, {'values': [41], 'ranges': [], 'other': False, 'result': '41'}, {'values': [42], 'ranges': [], 'other': False, 'result': '42'}, {'values': [43], 'ranges': [], 'other': False, 'result': '43'}, {'values': [44], 'ranges': [], 'other': False, 'result': '44'},
+                        {'values': [46], 'ranges': [], 'other': False, 'result': '46'}, {'values': [47], 'ranges': [], 'other': False, 'result': '47'}, {'values': [48], 'ranges': [], 'other': False, 'result': '48'}, {'values': [49], 'ranges': [], 'other': False, 'result': '49'}, {'values': [51], 'ranges': [], 'other': False, 'result': '51'}, {'values': [52], 'ranges': [], 'other': False, 'result': '52'}, {'values': [53], 'ranges': [], 'other': False, 'result': '53'},
+                        {'values': [54], 'ranges': [], 'other': False, 'result': '54'}, {'values': [50], 'ranges': [], 'other': False, 'result': '79'}, {'values': [57], 'ranges': [], 'other': False, 'result': '57'}, {'values': [59], 'ranges': [], 'other': False, 'result': '59'}, {'values': [60], 'ranges': [], 'other': False, 'result': '62'}, {'values': [61], 'ranges': [], 'other': False, 'result': '61'}, {'values': [62], 'ranges': [], 'other': False, 'result': '62'},
+                        {'values': [63], 'ranges': [], 'other': False, 'result': '63'}, {'values': [64], 'ranges': [], 'other': False, 'result': '64'}, {'values': [65], 'ranges': [], 'other': False, 'result': '44'}, {'values': [66], 'ranges': [], 'other': False, 'result': '41'}, {'values': [67], 'ranges': [], 'other': False, 'result': '44'}, {'values': [68], 'ranges': [], 'other': False, 'result': '48'}, {'values': [69], 'ranges': [], 'other': False, 'result': '52'},
+                        {'values': [70], 'ranges': [], 'other': False, 'result': '71'}, {'values': [71], 'ranges': [], 'other': False, 'result': '71'}, {'values': [72], 'ranges': [], 'other': False, 'result': '72'}, {'values': [73], 'ranges': [], 'other': False, 'result': '73'}, {'values': [74], 'ranges': [], 'other': False, 'result': '74'}, {'values': [75], 'ranges': [], 'other': False, 'result': '75'}, {'values': [76], 'ranges': [], 'other': False, 'result': '78'},
+                        {'values': [77], 'ranges': [], 'other': False, 'result': '77'}, {'values': [78], 'ranges': [], 'other': False, 'result': '78'}, {'values': [79], 'ranges': [], 'other': False, 'result': '79'}, {'values': [80], 'ranges': [], 'other': False, 'result': '86'}, {'values': [81], 'ranges': [], 'other': False, 'result': '81'}, {'values': [82], 'ranges': [], 'other': False, 'result': '82'}, {'values': [83], 'ranges': [], 'other': False, 'result': '83'},
+                        {'values': [84], 'ranges': [], 'other': False, 'result': '84'}, {'values': [85], 'ranges': [], 'other': False, 'result': '86'}, {'values': [86], 'ranges': [], 'other': False, 'result': '86'}, {'values': [87], 'ranges': [], 'other': False, 'result': '87'}, {'values': [88], 'ranges': [], 'other': False, 'result': '88'}, {'values': [89], 'ranges': [], 'other': False, 'result': '89'}, {'values': [90], 'ranges': [], 'other': False, 'result': '90'},
+                        {'values': [91], 'ranges': [], 'other': False, 'result': '91'}, {'values': [92], 'ranges': [], 'other': False, 'result': '92'}, {'values': [95], 'ranges': [], 'other': False, 'result': '95'}, {'values': [96], 'ranges': [], 'other': False, 'result': '96'}, {'values': [98], 'ranges': [], 'other': False, 'result': '98'}, {'values': [99], 'ranges': [], 'other': False, 'result': '99'}, {'values': [], 'ranges': [], 'other': True, 'result': '79'}]},
+ 'LNCUSTCD': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': [1], 'ranges': [], 'other': False, 'result': '01'}, {'values': [2], 'ranges': [], 'other': False, 'result': '02'}, {'values': [3], 'ranges': [], 'other': False, 'result': '03'}, {'values': [4], 'ranges': [], 'other': False, 'result': '04'}, {'values': [5], 'ranges': [], 'other': False, 'result': '05'}, {'values': [6], 'ranges': [], 'other': False, 'result': '06'}, {'values': [10], 'ranges': [], 'other': False, 'result': '10'},
+                        {'values': [11], 'ranges': [], 'other': False, 'result': '11'}, {'values': [12], 'ranges': [], 'other': False, 'result': '12'}, {'values': [13], 'ranges': [], 'other': False, 'result': '13'}, {'values': [15], 'ranges': [], 'other': False, 'result': '15'}, {'values': [17], 'ranges': [], 'other': False, 'result': '17'}, {'values': [20], 'ranges': [], 'other': False, 'result': '20'}, {'values': [30], 'ranges': [], 'other': False, 'result': '30'},
+                        {'values': [32], 'ranges': [], 'other': False, 'result': '32'}, {'values': [33], 'ranges': [], 'other': False, 'result': '33'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34'}, {'values': [35], 'ranges': [], 'other': False, 'result': '35'}, {'values': [36], 'ranges': [], 'other': False, 'result': '36'}, {'values': [37], 'ranges': [], 'other': False, 'result': '37'}, {'values': [38], 'ranges': [], 'other': False, 'result': '38'},
+                        {'values': [39], 'ranges': [], 'other': False, 'result': '39'}, {'values': [40], 'ranges': [], 'other': False, 'result': '40'}, {'values': [41], 'ranges': [], 'other': False, 'result': '41'}, {'values': [42], 'ranges': [], 'other': False, 'result': '42'}, {'values': [43], 'ranges': [], 'other': False, 'result': '43'}, {'values': [44], 'ranges': [], 'other': False, 'result': '44'}, {'values': [46], 'ranges': [], 'other': False, 'result': '46'},
+                        {'values': [47], 'ranges': [], 'other': False, 'result': '47'}, {'values': [48], 'ranges': [], 'other': False, 'result': '48'}, {'values': [49], 'ranges': [], 'other': False, 'result': '49'}, {'values': [51], 'ranges': [], 'other': False, 'result': '51'}, {'values': [52], 'ranges': [], 'other': False, 'result': '52'}, {'values': [53], 'ranges': [], 'other': False, 'result': '53'}, {'values': [54], 'ranges': [], 'other': False, 'result': '54'},
+                        {'values': [50], 'ranges': [], 'other': False, 'result': '50'}, {'values': [57], 'ranges': [], 'other': False, 'result': '57'}, {'values': [59], 'ranges': [], 'other': False, 'result': '59'}, {'values': [60], 'ranges': [], 'other': False, 'result': '60'}, {'values': [61], 'ranges': [], 'other': False, 'result': '61'}, {'values': [62], 'ranges': [], 'other': False, 'result': '62'}, {'values': [63], 'ranges': [], 'other': False, 'result': '63'},
+                        {'values': [64], 'ranges': [], 'other': False, 'result': '64'}, {'values': [65], 'ranges': [], 'other': False, 'result': '65'}, {'values': [66], 'ranges': [], 'other': False, 'result': '41'}, {'values': [67], 'ranges': [], 'other': False, 'result': '44'}, {'values': [68], 'ranges': [], 'other': False, 'result': '48'}, {'values': [69], 'ranges': [], 'other': False, 'result': '52'}, {'values': [70], 'ranges': [], 'other': False, 'result': '70'},
+                        {'values': [71], 'ranges': [], 'other': False, 'result': '71'}, {'values': [72], 'ranges': [], 'other': False, 'result': '72'}, {'values': [73], 'ranges': [], 'other': False, 'result': '73'}, {'values': [74], 'ranges': [], 'other': False, 'result': '74'}, {'values': [75], 'ranges': [], 'other': False, 'result': '75'}, {'values': [76], 'ranges': [], 'other': False, 'result': '76'}, {'values': [77], 'ranges': [], 'other': False, 'result': '77'},
+                        {'values': [78], 'ranges': [], 'other': False, 'result': '78'}, {'values': [79], 'ranges': [], 'other': False, 'result': '79'}, {'values': [80], 'ranges': [], 'other': False, 'result': '80'}, {'values': [81], 'ranges': [], 'other': False, 'result': '81'}, {'values': [85], 'ranges': [], 'other': False, 'result': '85'}, {'values': [86], 'ranges': [], 'other': False, 'result': '86'}, {'values': [87], 'ranges': [], 'other': False, 'result': '87'},
+                        {'values': [88], 'ranges': [], 'other': False, 'result': '88'}, {'values': [89], 'ranges': [], 'other': False, 'result': '89'}, {'values': [90], 'ranges': [], 'other': False, 'result': '90'}, {'values': [91], 'ranges': [], 'other': False, 'result': '91'}, {'values': [92], 'ranges': [], 'other': False, 'result': '92'}, {'values': [95], 'ranges': [], 'other': False, 'result': '95'}, {'values': [96], 'ranges': [], 'other': False, 'result': '96'},
+                        {'values': [98], 'ranges': [], 'other': False, 'result': '98'}, {'values': [99], 'ranges': [], 'other': False, 'result': '99'}, {'values': [], 'ranges': [], 'other': True, 'result': '79'}]},
+ 'BUSIND': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['01', "-'06'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['11', "-'13'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['17'], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['30', "-'35'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['37', "-'40'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['45'], 'ranges': [], 'other': False, 'result': 'BUS'},
+                      {'values': ['57'], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['59'], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['61', "-'64'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['66', "-'69'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['71', "-'75'"], 'ranges': [], 'other': False, 'result': 'BUS'}, {'values': ['77', "-'79'"], 'ranges': [], 'other': False, 'result': 'IND'},
+                      {'values': ['95', "-'96'"], 'ranges': [], 'other': False, 'result': 'IND'}, {'values': [], 'ranges': [], 'other': True, 'result': 'IND'}]},
+ 'RISKCD': {'kind': 'value', 'character': True, 'rules': [{'values': ['2', '02', '002', '0002'], 'ranges': [], 'other': False, 'result': '34902'}, {'values': ['3', '03', '003', '0003'], 'ranges': [], 'other': False, 'result': '34903'}, {'values': ['4', '04', '004', '0004'], 'ranges': [], 'other': False, 'result': '34904'}, {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'MTHPASS': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [0, '-', 30], 'ranges': [], 'other': False, 'result': '0'}, {'values': [31, '-', 59], 'ranges': [], 'other': False, 'result': '1'}, {'values': [60, '-', 89], 'ranges': [], 'other': False, 'result': '2'}, {'values': [90, '-', 121], 'ranges': [], 'other': False, 'result': '3'}, {'values': [122, '-', 151], 'ranges': [], 'other': False, 'result': '4'}, {'values': [152, '-', 182], 'ranges': [], 'other': False, 'result': '5'},
+                       {'values': [183, '-', 213], 'ranges': [], 'other': False, 'result': '6'}, {'values': [214, '-', 243], 'ranges': [], 'other': False, 'result': '7'}, {'values': [244, '-', 273], 'ranges': [], 'other': False, 'result': '8'}, {'values': [274, '-', 303], 'ranges': [], 'other': False, 'result': '9'}, {'values': [304, '-', 333], 'ranges': [], 'other': False, 'result': '10'}, {'values': [334, '-', 364], 'ranges': [], 'other': False, 'result': '11'},
+                       {'values': [365, '-', 394], 'ranges': [], 'other': False, 'result': '12'}, {'values': [395, '-', 424], 'ranges': [], 'other': False, 'result': '13'}, {'values': [425, '-', 456], 'ranges': [], 'other': False, 'result': '14'}, {'values': [457, '-', 486], 'ranges': [], 'other': False, 'result': '15'}, {'values': [487, '-', 516], 'ranges': [], 'other': False, 'result': '16'}, {'values': [517, '-', 547], 'ranges': [], 'other': False, 'result': '17'},
+                       {'values': [548, '-', 577], 'ranges': [], 'other': False, 'result': '18'}, {'values': [578, '-', 608], 'ranges': [], 'other': False, 'result': '19'}, {'values': [609, '-', 638], 'ranges': [], 'other': False, 'result': '20'}, {'values': [639, '-', 668], 'ranges': [], 'other': False, 'result': '21'}, {'values': [669, '-', 698], 'ranges': [], 'other': False, 'result': '22'}, {'values': [699, '-', 729], 'ranges': [], 'other': False, 'result': '23'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': '24'}]},
+ 'NDAYS': {'kind': 'invalue',
+           'character': False,
+           'rules': [{'values': ['LOW', '-', 30], 'ranges': [], 'other': False, 'result': 0}, {'values': [31, '-', 59], 'ranges': [], 'other': False, 'result': 1}, {'values': [60, '-', 89], 'ranges': [], 'other': False, 'result': 2}, {'values': [90, '-', 121], 'ranges': [], 'other': False, 'result': 3}, {'values': [122, '-', 151], 'ranges': [], 'other': False, 'result': 4}, {'values': [152, '-', 182], 'ranges': [], 'other': False, 'result': 5},
+                     {'values': [183, '-', 213], 'ranges': [], 'other': False, 'result': 6}, {'values': [214, '-', 243], 'ranges': [], 'other': False, 'result': 7}, {'values': [244, '-', 273], 'ranges': [], 'other': False, 'result': 8}, {'values': [274, '-', 303], 'ranges': [], 'other': False, 'result': 9}, {'values': [304, '-', 333], 'ranges': [], 'other': False, 'result': 10}, {'values': [334, '-', 364], 'ranges': [], 'other': False, 'result': 11},
+                     {'values': [365, '-', 394], 'ranges': [], 'other': False, 'result': 12}, {'values': [395, '-', 424], 'ranges': [], 'other': False, 'result': 13}, {'values': [425, '-', 456], 'ranges': [], 'other': False, 'result': 14}, {'values': [457, '-', 486], 'ranges': [], 'other': False, 'result': 15}, {'values': [487, '-', 516], 'ranges': [], 'other': False, 'result': 16}, {'values': [517, '-', 547], 'ranges': [], 'other': False, 'result': 17},
+                     {'values': [548, '-', 577], 'ranges': [], 'other': False, 'result': 18}, {'values': [578, '-', 608], 'ranges': [], 'other': False, 'result': 19}, {'values': [609, '-', 638], 'ranges': [], 'other': False, 'result': 20}, {'values': [639, '-', 668], 'ranges': [], 'other': False, 'result': 21}, {'values': [669, '-', 698], 'ranges': [], 'other': False, 'result': 22}, {'values': [699, '-', 729], 'ranges': [], 'other': False, 'result': 23},
+                     {'values': [730, '-', 'HIGH'], 'ranges': [], 'other': False, 'result': 24}]},
+ 'LNORMT': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': ['LOW', '-', 1], 'ranges': [], 'other': False, 'result': '12'}, {'values': [1, '-', 2], 'ranges': [], 'other': False, 'result': '13'}, {'values': [2, '-', 3], 'ranges': [], 'other': False, 'result': '14'}, {'values': [3, '-', 6], 'ranges': [], 'other': False, 'result': '15'}, {'values': [6, '-', 9], 'ranges': [], 'other': False, 'result': '16'}, {'values': [9, '-', 12], 'ranges': [], 'other': False, 'result': '17'},
+                      {'values': [12, '-', 15], 'ranges': [], 'other': False, 'result': '21'}, {'values': [15, '-', 18], 'ranges': [], 'other': False, 'result': '22'}, {'values': [18, '-', 24], 'ranges': [], 'other': False, 'result': '23'}, {'values': [24, '-', 36], 'ranges': [], 'other': False, 'result': '24'}, {'values': [36, '-', 48], 'ranges': [], 'other': False, 'result': '25'}, {'values': [48, '-', 60], 'ranges': [], 'other': False, 'result': '26'},
+                      {'values': [60, '-', 120], 'ranges': [], 'other': False, 'result': '31'}, {'values': [120, '-', 180], 'ranges': [], 'other': False, 'result': '32'}, {'values': [180, '-', 'HIGH'], 'ranges': [], 'other': False, 'result': '33'}]},
+ 'LNRMMT': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': ['LOW', '-', 0], 'ranges': [], 'other': False, 'result': '51'}, {'values': [0, '-', 1], 'ranges': [], 'other': False, 'result': '52'}, {'values': [1, '-', 2], 'ranges': [], 'other': False, 'result': '53'}, {'values': [2, '-', 3], 'ranges': [], 'other': False, 'result': '54'}, {'values': [3, '-', 6], 'ranges': [], 'other': False, 'result': '55'}, {'values': [6, '-', 9], 'ranges': [], 'other': False, 'result': '56'},
+                      {'values': [9, '-', 12], 'ranges': [], 'other': False, 'result': '57'}, {'values': [12, '-', 24], 'ranges': [], 'other': False, 'result': '61'}, {'values': [24, '-', 36], 'ranges': [], 'other': False, 'result': '62'}, {'values': [36, '-', 48], 'ranges': [], 'other': False, 'result': '63'}, {'values': [48, '-', 60], 'ranges': [], 'other': False, 'result': '64'}, {'values': [60, '-', 120], 'ranges': [], 'other': False, 'result': '71'},
+                      {'values': [120, '-', 180], 'ranges': [], 'other': False, 'result': '72'}, {'values': [180, '-', 'HIGH'], 'ranges': [], 'other': False, 'result': '73'}]},
+ 'STATECD': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['1', '01', '001', '0001', '00001', '000001'], 'ranges': [], 'other': False, 'result': 'J'}, {'values': ['2', '02', '002', '0002', '00002', '000002'], 'ranges': [], 'other': False, 'result': 'K'}, {'values': ['3', '03', '003', '0003', '00003', '000003'], 'ranges': [], 'other': False, 'result': 'D'}, {'values': ['4', '04', '004', '0004', '00004', '000004'], 'ranges': [], 'other': False, 'result': 'M'},
+                       {'values': ['5', '05', '005', '0005', '00005', '000005'], 'ranges': [], 'other': False, 'result': 'N'}, {'values': ['6', '06', '006', '0006', '00006', '000006'], 'ranges': [], 'other': False, 'result': 'C'}, {'values': ['7', '07', '007', '0007', '00007', '000007'], 'ranges': [], 'other': False, 'result': 'P'}, {'values': ['8', '08', '008', '0008', '00008', '000008'], 'ranges': [], 'other': False, 'result': 'A'},
+                       {'values': ['9', '09', '009', '0009', '00009', '000009'], 'ranges': [], 'other': False, 'result': 'R'}, {'values': ['10', '010', '0010', '00010', '000010'], 'ranges': [], 'other': False, 'result': 'S'}, {'values': ['11', '011', '0011', '00011', '000011'], 'ranges': [], 'other': False, 'result': 'Q'}, {'values': ['12', '012', '0012', '00012', '000012'], 'ranges': [], 'other': False, 'result': 'B'},
+                       {'values': ['13', '013', '0013', '00013', '000013'], 'ranges': [], 'other': False, 'result': 'T'}, {'values': ['14', '014', '0014', '00014', '000014', '16', '016', '0016', '00016', '000016'], 'ranges': [], 'other': False, 'result': 'W'}, {'values': ['15', '015', '0015', '00015', '000015'], 'ranges': [], 'other': False, 'result': 'L'}, {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'APPRLIMT': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': ['LOW', '-<', 100000], 'ranges': [], 'other': False, 'result': '30511'}, {'values': [100000, '-<', 500000], 'ranges': [], 'other': False, 'result': '30512'}, {'values': [500000, '-<', 1000000], 'ranges': [], 'other': False, 'result': '30513'}, {'values': [1000000, '-<', 5000000], 'ranges': [], 'other': False, 'result': '30514'}, {'values': [5000000, '-<', 20000000], 'ranges': [], 'other': False, 'result': '30515'},
+                        {'values': [20000000, '-<', 50000000], 'ranges': [], 'other': False, 'result': '30516'}, {'values': [50000000, '-', 'HIGH'], 'ranges': [], 'other': False, 'result': '30519'}]},
+ 'LOANSIZE': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': ['LOW', '-<', 100000], 'ranges': [], 'other': False, 'result': '80511'}, {'values': [100000, '-<', 500000], 'ranges': [], 'other': False, 'result': '80512'}, {'values': [500000, '-<', 1000000], 'ranges': [], 'other': False, 'result': '80513'}, {'values': [1000000, '-<', 5000000], 'ranges': [], 'other': False, 'result': '80514'}, {'values': [5000000, '-<', 20000000], 'ranges': [], 'other': False, 'result': '80515'},
+                        {'values': [20000000, '-<', 50000000], 'ranges': [], 'other': False, 'result': '80516'}, {'values': [50000000, '-', 'HIGH'], 'ranges': [], 'other': False, 'result': '80519'}]},
+ 'FISSTYPE': {'kind': 'value',
+              'character': True,
+              'rules': [{'values': ['1100', '1111', '1112', '1113', '1114', '1115', '1116', '1117', '1119', '1120', '1130', '1140', '1150'], 'ranges': [], 'other': False, 'result': '1100'}, {'values': ['2200', '2210', '2220'], 'ranges': [], 'other': False, 'result': '2200'}, {'values': ['2300', '2301', '2302', '2303'], 'ranges': [], 'other': False, 'result': '2300'}, {'values': ['3100', '3110', '3115', '3111', '3112', '3113', '3114'], 'ranges': [], 'other': False, 'result': '3100'},
+                        {'values': ['3210', '3211', '3212', '3219'], 'ranges': [], 'other': False, 'result': '3210'}, {'values': ['3220', '3221', '3222'], 'ranges': [], 'other': False, 'result': '3220'}, {'values': ['3230', '3231', '3232'], 'ranges': [], 'other': False, 'result': '3230'}, {'values': ['3240', '3241', '3242'], 'ranges': [], 'other': False, 'result': '3240'}, {'values': ['3260', '3270', '3271', '3272', '3273', '3280', '3290'], 'ranges': [], 'other': False, 'result': '3260'},
+                        {'values': ['3310', '3311', '3312', '3313'], 'ranges': [], 'other': False, 'result': '3310'}, {'values': ['3430', '3431', '3432', '3433'], 'ranges': [], 'other': False, 'result': '3430'}, {'values': ['3550', '3551', '3552'], 'ranges': [], 'other': False, 'result': '3550'}, {'values': ['3610', '3611', '3619'], 'ranges': [], 'other': False, 'result': '3610'},
+                        {'values': ['3700', '3710', '3720', '3721', '3730', '3731', '3732'], 'ranges': [], 'other': False, 'result': '3700'}, {'values': ['3800', '3811', '3812', '3813', '3814', '3819'], 'ranges': [], 'other': False, 'result': '3800'}, {'values': ['3831', '3832', '3833', '3834', '3835'], 'ranges': [], 'other': False, 'result': '3831'}, {'values': ['3841', '3842', '3843', '3844'], 'ranges': [], 'other': False, 'result': '3841'},
+                        {'values': ['3850', '3851', '3852', '3853'], 'ranges': [], 'other': False, 'result': '3850'}, {'values': ['3860', '3861', '3862', '3863', '3864', '3865', '3866'], 'ranges': [], 'other': False, 'result': '3860'}, {'values': ['3870', '3871', '3872', '3873'], 'ranges': [], 'other': False, 'result': '3870'}, {'values': ['3890', '3891', '3892', '3893', '3894'], 'ranges': [], 'other': False, 'result': '3890'},
+                        {'values': ['3910', '3911', '3919'], 'ranges': [], 'other': False, 'result': '3910'}, {'values': ['3905', '3951', '3952', '3953', '3954', '3955', '3956', '3957'], 'ranges': [], 'other': False, 'result': '3950'}, {'values': ['7110', '7111', '7112', '7113', '7114', '7115', '7116', '7117'], 'ranges': [], 'other': False, 'result': '7110'}, {'values': ['7120', '7121', '7122', '7123', '7124'], 'ranges': [], 'other': False, 'result': '7120'},
+                        {'values': ['7130', '7131', '7132', '7133', '7134'], 'ranges': [], 'other': False, 'result': '7130'}, {'values': ['7190', '7191', '7192', '7193', '7199'], 'ranges': [], 'other': False, 'result': '7190'}, {'values': ['7200', '7210', '7220'], 'ranges': [], 'other': False, 'result': '7200'}, {'values': ['8100', '8110', '8120', '8130'], 'ranges': [], 'other': False, 'result': '8100'},
+                        {'values': ['8300', '8310', '8330', '8320', '8321', '8331', '8332', '8333', '8340'], 'ranges': [], 'other': False, 'result': '8300'}, {'values': ['8400', '8410', '8411', '8412', '8413', '8414', '8415', '8416', '8420'], 'ranges': [], 'other': False, 'result': '8400'}, {'values': ['8900', '8910', '8911', '8912', '8913', '8914', '8920', '8921', '8922', '8930', '8931', '8932', '8990', '8991', '8999'], 'ranges': [], 'other': False, 'result': '8900'},
+                        {'values': ['9100', '9101', '9102', '9103'], 'ranges': [], 'other': False, 'result': '9100'}, {'values': ['9200', '9201', '9202', '9203'], 'ranges': [], 'other': False, 'result': '9200'}, {'values': ['9300', '9311', '9312', '9313', '9314'], 'ranges': [], 'other': False, 'result': '9300'}, {'values': ['9400', '9410', '9420', '9430', '9431', '9432', '9433', '9434', '9435', '9440', '9450', '9499'], 'ranges': [], 'other': False, 'result': '9400'}]},
+ 'FISSGROUP': {'kind': 'value',
+               'character': True,
+               'rules': [{'values': ['1100', '1111', '1112', '1113', '1114', '1115', '1116', '1117', '1119', '1120', '1130', '1140', '1150', '1200', '1300', '1400'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['2100', '2200', '2210', '2220', '2300', '2301', '2302', '2303', '2400', '2900'], 'ranges': [], 'other': False, 'result': '2000'},
+                         {'values': ['3100', '3110', '3115', '3111', '3112', '3113', '3114', '3120', '3210', '3211', '3212', '3219', '3220', '3221', '3222', '3230', '3231', '3232', '3240', '3241', '3242', '3250', '3260', '3270', '3271', '3272', '3273', '3280', '3290', '3310', '3311', '3312', '3313', '3430', '3431', '3432', '3433', '3550', '3551', '3552', '3610', '3611', '3619', '3700', '3710', '3720', '3721', '3730', '3731', '3732', '3800', '3811', '3812', '3813', '3814', '3819', '3825', '3831',
+                                     '3832', '3833', '3834', '3835', '3841', '3842', '3843', '3844', '3850', '3851', '3852', '3853', '3860', '3861', '3862', '3863', '3864', '3865', '3866', '3870', '3871', '3872', '3873', '3890', '3891', '3892', '3893', '3894', '3910', '3911', '3919', '3905', '3951', '3952', '3953', '3954', '3955', '3956', '3957', '3960'],
+                          'ranges': [],
+                          'other': False,
+                          'result': '3000'},
+                         {'values': ['4010', '4020', '4030'], 'ranges': [], 'other': False, 'result': '4000'}, {'values': ['5010', '5001', '5002', '5003', '5004', '5005', '5006', '5008', '5020', '5030', '5040', '5050', '5999'], 'ranges': [], 'other': False, 'result': '5000'}, {'values': ['6100', '6110', '6120', '6130', '6300', '6310', '6320'], 'ranges': [], 'other': False, 'result': '6000'},
+                         {'values': ['7110', '7111', '7112', '7113', '7114', '7115', '7116', '7117', '7120', '7121', '7122', '7123', '7124', '7130', '7131', '7132', '7133', '7134', '7190', '7191', '7192', '7193', '7199', '7200', '7210', '7220'], 'ranges': [], 'other': False, 'result': '7000'},
+                         {'values': ['8100', '8110', '8120', '8130', '8300', '8310', '8330', '8320', '8321', '8331', '8332', '8333', '8340', '8400', '8410', '8411', '8412', '8413', '8414', '8415', '8416', '8420', '8900', '8910', '8911', '8912', '8913', '8914', '8920', '8921', '8922', '8930', '8931', '8932', '8990', '8991', '8999'], 'ranges': [], 'other': False, 'result': '8000'},
+                         {'values': ['9100', '9101', '9102', '9103', '9200', '9201', '9202', '9203', '9300', '9311', '9312', '9313', '9314', '9400', '9410', '9420', '9430', '9431', '9432', '9433', '9434', '9435', '9440', '9450', '9499', '9500', '9600'], 'ranges': [], 'other': False, 'result': '9000'}]},
+ 'SECTCD': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['1112'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1114'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1116'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1130'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1140'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1150'], 'ranges': [], 'other': False, 'result': '1120'},
+                      {'values': ['3111'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3112'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['8410'], 'ranges': [], 'other': False, 'result': '8416'}, {'values': ['8910'], 'ranges': [], 'other': False, 'result': '8914'}, {'values': ['8920'], 'ranges': [], 'other': False, 'result': '8922'}, {'values': ['9440'], 'ranges': [], 'other': False, 'result': '9430'},
+                      {'values': ['9450'], 'ranges': [], 'other': False, 'result': '9430'}]},
+ 'INDSECT': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['01291', '01292'], 'ranges': [], 'other': False, 'result': '1111'}, {'values': ['01120'], 'ranges': [], 'other': False, 'result': '1112'}, {'values': ['01261', '01262'], 'ranges': [], 'other': False, 'result': '1113'}, {'values': ['01263'], 'ranges': [], 'other': False, 'result': '1114'}, {'values': ['01273'], 'ranges': [], 'other': False, 'result': '1115'}, {'values': ['01140'], 'ranges': [], 'other': False, 'result': '1116'},
+                       {'values': ['01131', '01132', '01133', '01134', '01135', '01136', '01191', '01192', '01210', '01221', '01222', '01223', '01224', '01225', '01226', '01227', '01228', '01229', '01231', '01232', '01233', '01239', '01241', '01249', '01251', '01252', '01253', '01259', '01269', '01271', '01272', '01279', '01281', '01282', '01283', '01284', '01285', '01293', '01294', '01295', '01296', '01301', '01302', '01303', '01304'], 'ranges': [], 'other': False, 'result': '1117'},
+                       {'values': ['01111', '01112', '01113', '01119', '01137', '01138', '01150', '01160', '01193', '01199', '01289', '01299'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['01411', '01412', '01413', '01420', '01430', '01441', '01442', '01443', '01450', '01461', '01462', '01463', '01464', '01465', '01466', '01467', '01468', '01469', '01491', '01492', '01493', '01494', '01495', '01496', '01497', '01499', '03225'], 'ranges': [], 'other': False, 'result': '1120'},
+                       {'values': ['01610', '01620', '01631', '01632', '01633', '01634', '01640'], 'ranges': [], 'other': False, 'result': '1130'}, {'values': ['01701', '01702'], 'ranges': [], 'other': False, 'result': '1150'}, {'values': ['02101', '02102', '02103', '02104', '02105', '02201', '02202', '02203', '02204', '02301', '02302', '02303', '02309', '02401', '02402'], 'ranges': [], 'other': False, 'result': '1200'},
+                       {'values': ['03111', '03112', '03113', '03114', '03115', '03119', '03121', '03122', '03123', '03124', '03129', '03211', '03212', '03213', '03214', '03215', '03216', '03217', '03218', '03219', '03221', '03222', '03223', '03224', '03229'], 'ranges': [], 'other': False, 'result': '1300'}, {'values': ['01500'], 'ranges': [], 'other': False, 'result': '1400'}, {'values': ['05100', '05200', '08921', '08922', '08923'], 'ranges': [], 'other': False, 'result': '2100'},
+                       {'values': ['06101', '06102', '06103', '06104', '06201', '06202', '06203', '06204', '06205'], 'ranges': [], 'other': False, 'result': '2210'}, {'values': ['09101', '09102'], 'ranges': [], 'other': False, 'result': '2220'}, {'values': ['07101', '07102'], 'ranges': [], 'other': False, 'result': '2301'}, {'values': ['07292', '07293', '07294', '07295', '07296', '07297', '07298', '07299'], 'ranges': [], 'other': False, 'result': '2302'},
+                       {'values': ['07291'], 'ranges': [], 'other': False, 'result': '2303'}, {'values': ['07210'], 'ranges': [], 'other': False, 'result': '2400'}, {'values': ['08101', '08102', '08103', '08104', '08105', '08106', '08107', '08108', '08109', '08911', '08912', '08913', '08914', '08915', '08916', '08917', '08918', '08931', '08932', '08933', '08991', '08992', '08993', '08994', '08995', '08996', '08999', '09900'], 'ranges': [], 'other': False, 'result': '2900'},
+                       {'values': ['10101', '10102', '10103', '10104', '10109', '10201', '10202', '10203', '10204', '10301', '10302', '10303', '10304', '10306', '10404', '10405', '10406', '10407'], 'ranges': [], 'other': False, 'result': '3110'}, {'values': ['10501', '10502', '10509'], 'ranges': [], 'other': False, 'result': '3111'}, {'values': ['10611', '10612', '10613', '10619', '10621', '10622', '10623', '10800'], 'ranges': [], 'other': False, 'result': '3112'},
+                       {'values': ['11010', '11020', '11030', '11041', '11042'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['10305', '10711', '10712', '10713', '10714', '10721', '10722', '10731', '10732', '10733', '10741', '10742', '10750', '10791', '10792', '10793', '10794', '10795', '10799', '35303', '10205'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['10401', '10402', '10403'], 'ranges': [], 'other': False, 'result': '3115'},
+                       {'values': ['12000'], 'ranges': [], 'other': False, 'result': '3120'}, {'values': ['13110', '13120', '13131', '13132', '13139', '13910'], 'ranges': [], 'other': False, 'result': '3211'}, {'values': ['14300'], 'ranges': [], 'other': False, 'result': '3212'}, {'values': ['13921', '13922', '13930', '13940', '13990'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['14101', '14102', '14103', '14109'], 'ranges': [], 'other': False, 'result': '3221'},
+                       {'values': ['14200'], 'ranges': [], 'other': False, 'result': '3222'}, {'values': ['15110', '15120'], 'ranges': [], 'other': False, 'result': '3231'}, {'values': ['15201', '15202', '15203', '15209'], 'ranges': [], 'other': False, 'result': '3232'}, {'values': ['16100'], 'ranges': [], 'other': False, 'result': '3241'}, {'values': ['16211', '16212', '16221', '16222', '16230', '16291', '16292'], 'ranges': [], 'other': False, 'result': '3242'},
+                       {'values': ['17010', '17020', '17091', '17092', '17093', '17094', '17099'], 'ranges': [], 'other': False, 'result': '3250'}, {'values': ['58110'], 'ranges': [], 'other': False, 'result': '3271'}, {'values': ['58130'], 'ranges': [], 'other': False, 'result': '3272'}, {'values': ['58120', '58190'], 'ranges': [], 'other': False, 'result': '3273'}, {'values': ['18110', '18120'], 'ranges': [], 'other': False, 'result': '3280'},
+                       {'values': ['18200'], 'ranges': [], 'other': False, 'result': '3290'}, {'values': ['20111', '20112', '20113', '20119', '20121', '20129', '20131', '20132', '20133'], 'ranges': [], 'other': False, 'result': '3311'}, {'values': ['20300'], 'ranges': [], 'other': False, 'result': '3312'},
+                       {'values': ['20210', '20221', '20222', '20231', '20232', '20291', '20292', '20299', '21001', '21002', '21003', '21004', '21005', '21006', '21007', '21009'], 'ranges': [], 'other': False, 'result': '3313'}, {'values': ['19100'], 'ranges': [], 'other': False, 'result': '3431'}, {'values': ['19201', '19202'], 'ranges': [], 'other': False, 'result': '3432'}, {'values': ['22111', '22112', '22191', '22192', '22193', '22199'], 'ranges': [], 'other': False, 'result': '3551'},
+                       {'values': ['22201', '22202', '22203', '22204', '22205', '22209'], 'ranges': [], 'other': False, 'result': '3552'}, {'values': ['23101', '23109'], 'ranges': [], 'other': False, 'result': '3611'}, {'values': ['23911', '23912', '23921', '23929', '23930', '23941', '23942', '23951', '23952', '23953', '23959', '23960', '23990'], 'ranges': [], 'other': False, 'result': '3619'},
+                       {'values': ['24101', '24102', '24103', '24104', '24109'], 'ranges': [], 'other': False, 'result': '3710'}, {'values': ['24202', '24209'], 'ranges': [], 'other': False, 'result': '3720'}, {'values': ['24201'], 'ranges': [], 'other': False, 'result': '3721'}, {'values': ['24311', '24312'], 'ranges': [], 'other': False, 'result': '3731'}, {'values': ['24320'], 'ranges': [], 'other': False, 'result': '3732'},
+                       {'values': ['25111', '25112', '25113', '25119', '25120', '25130', '33110'], 'ranges': [], 'other': False, 'result': '3811'}, {'values': ['25910'], 'ranges': [], 'other': False, 'result': '3813'}, {'values': ['25920'], 'ranges': [], 'other': False, 'result': '3814'}, {'values': ['25930', '25991', '25992', '25993', '25994', '25999'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['26201', '26202', '28170'], 'ranges': [], 'other': False, 'result': '3825'},
+                       {'values': ['25200', '28210', '28230', '28240', '28250', '28260', '28290', '30400'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['28220'], 'ranges': [], 'other': False, 'result': '3833'}, {'values': ['28110', '28120', '28130', '28140', '28150', '28160', '28180', '28191', '28192', '28199', '33120', '33200'], 'ranges': [], 'other': False, 'result': '3834'}, {'values': ['27500'], 'ranges': [], 'other': False, 'result': '3835'},
+                       {'values': ['26101', '26102', '26103', '26104', '26105', '26109'], 'ranges': [], 'other': False, 'result': '3842'}, {'values': ['26300'], 'ranges': [], 'other': False, 'result': '3843'}, {'values': ['26400'], 'ranges': [], 'other': False, 'result': '3844'}, {'values': ['23102', '26511', '26512', '26600', '32500', '33131', '33132'], 'ranges': [], 'other': False, 'result': '3851'},
+                       {'values': ['26701', '26702', '26800', '27310', '33133'], 'ranges': [], 'other': False, 'result': '3852'}, {'values': ['26520'], 'ranges': [], 'other': False, 'result': '3853'}, {'values': ['27101'], 'ranges': [], 'other': False, 'result': '3861'}, {'values': ['27102'], 'ranges': [], 'other': False, 'result': '3862'}, {'values': ['27320', '27330'], 'ranges': [], 'other': False, 'result': '3863'}, {'values': ['27200'], 'ranges': [], 'other': False, 'result': '3864'},
+                       {'values': ['27400'], 'ranges': [], 'other': False, 'result': '3865'}, {'values': ['27900', '33140'], 'ranges': [], 'other': False, 'result': '3866'}, {'values': ['29101', '29102'], 'ranges': [], 'other': False, 'result': '3871'}, {'values': ['29200'], 'ranges': [], 'other': False, 'result': '3872'}, {'values': ['29300'], 'ranges': [], 'other': False, 'result': '3873'}, {'values': ['30110', '30120'], 'ranges': [], 'other': False, 'result': '3891'},
+                       {'values': ['30200'], 'ranges': [], 'other': False, 'result': '3892'}, {'values': ['30300'], 'ranges': [], 'other': False, 'result': '3893'}, {'values': ['30910', '30920', '30990', '33150'], 'ranges': [], 'other': False, 'result': '3894'}, {'values': ['31001', '31002', '31003', '31009'], 'ranges': [], 'other': False, 'result': '3911'}, {'values': ['32110', '32120', '32200', '32300', '32400', '32901', '32909', '33190'], 'ranges': [], 'other': False, 'result': '3919'},
+                       {'values': ['38301'], 'ranges': [], 'other': False, 'result': '3952'}, {'values': ['38302'], 'ranges': [], 'other': False, 'result': '3953'}, {'values': ['38303', '38304'], 'ranges': [], 'other': False, 'result': '3956'}, {'values': ['38309'], 'ranges': [], 'other': False, 'result': '3957'}, {'values': ['38114'], 'ranges': [], 'other': False, 'result': '3960'}, {'values': ['35101', '35102', '36001', '36002'], 'ranges': [], 'other': False, 'result': '4010'},
+                       {'values': ['35201', '35202', '35203'], 'ranges': [], 'other': False, 'result': '4020'}, {'values': ['35301', '35302'], 'ranges': [], 'other': False, 'result': '4030'}, {'values': ['41009'], 'ranges': [], 'other': False, 'result': '5001'}, {'values': ['41003'], 'ranges': [], 'other': False, 'result': '5002'}, {'values': ['41002'], 'ranges': [], 'other': False, 'result': '5003'},
+                       {'values': ['42101', '42102', '42103', '42104', '42105', '42106', '42109'], 'ranges': [], 'other': False, 'result': '5004'}, {'values': ['41001'], 'ranges': [], 'other': False, 'result': '5006'}, {'values': ['42201', '42202', '42203', '42204', '42205', '42206', '42207', '42209', '42901', '42902', '42903', '42904', '42905', '42906', '42909', '43901', '43902', '43903', '43904', '43905'], 'ranges': [], 'other': False, 'result': '5008'},
+                       {'values': ['43110', '43121', '43122', '43123', '43124', '43125', '43126', '43129'], 'ranges': [], 'other': False, 'result': '5020'}, {'values': ['43211', '43212', '43213', '43214', '43215', '43216', '43219', '43221', '43222', '43223', '43224', '43225', '43226', '43227', '43228', '43229', '43291', '43293', '43294', '43295', '43299'], 'ranges': [], 'other': False, 'result': '5030'},
+                       {'values': ['43292', '43301', '43302', '43303', '43304', '43305', '43306', '43307', '43309', '43906'], 'ranges': [], 'other': False, 'result': '5040'}, {'values': ['43907'], 'ranges': [], 'other': False, 'result': '5050'}, {'values': ['43909'], 'ranges': [], 'other': False, 'result': '5999'},
+                       {'values': ['45101', '45102', '45103', '45104', '45105', '45106', '45109', '45201', '45202', '45203', '45204', '45205', '45300', '45401', '45402', '45403'], 'ranges': [], 'other': False, 'result': '6110'},
+                       {'values': ['46100', '46201', '46202', '46203', '46204', '46205', '46209', '46311', '46312', '46313', '46314', '46319', '46321', '46322', '46323', '46324', '46325', '46326', '46327', '46329', '46411', '46412', '46413', '46414', '46415', '46416', '46417', '46419', '46421', '46422', '46431', '46432', '46433', '46434', '46441', '46442', '46443', '46444', '46491', '46492', '46493', '46494', '46495', '46496', '46497', '46499', '46510', '46521', '46522', '46531', '46532',
+                                   '46591', '46592', '46593', '46594', '46595', '46596', '46599', '46611', '46612', '46619', '46621', '46622', '46631', '46632', '46633', '46634', '46635', '46636', '46637', '46639', '46691', '46692', '46693', '46694', '46695', '46696', '46697', '46698', '46699', '46901', '46902', '46909'],
+                        'ranges': [],
+                        'other': False,
+                        'result': '6120'},
+                       {'values': ['47111', '47112', '47113', '47114', '47191', '47192', '47193', '47194', '47199', '47211', '47212', '47213', '47214', '47215', '47216', '47217', '47219', '47221', '47222', '47230', '47300', '47411', '47412', '47413', '47420', '47510', '47520', '47531', '47532', '47533', '47591', '47592', '47593', '47594', '47595', '47596', '47597', '47598', '47611', '47612', '47620', '47631', '47632', '47633', '47634', '47635', '47640', '47711', '47712', '47713', '47721',
+                                   '47722', '47731', '47732', '47733', '47734', '47735', '47736', '47737', '47738', '47739', '47741', '47742', '47743', '47744', '47749', '47810', '47820', '47891', '47892', '47893', '47894', '47895', '47911', '47912', '47913', '47914', '47991', '47992', '47999', '95111', '95121', '95122', '95123', '95124', '95125', '95126', '95127', '95211', '95212', '95213', '95214', '95221', '95222', '95230', '95240', '95291', '95292', '95293', '95294', '95295', '95296',
+                                   '95299'],
+                        'ranges': [],
+                        'other': False,
+                        'result': '6130'},
+                       {'values': ['56101', '56102', '56103', '56104', '56105', '56106', '56107', '56210', '56290', '56301', '56302', '56303', '56304', '56309'], 'ranges': [], 'other': False, 'result': '6310'}, {'values': ['55101', '55102', '55103', '55104', '55105', '55106', '55107', '55108', '55109', '55200', '55900'], 'ranges': [], 'other': False, 'result': '6320'}, {'values': ['49110', '49120'], 'ranges': [], 'other': False, 'result': '7111'},
+                       {'values': ['49223', '49229'], 'ranges': [], 'other': False, 'result': '7112'}, {'values': ['49211', '49212', '49221'], 'ranges': [], 'other': False, 'result': '7113'}, {'values': ['49222'], 'ranges': [], 'other': False, 'result': '7114'}, {'values': ['49224', '49225'], 'ranges': [], 'other': False, 'result': '7115'}, {'values': ['49230'], 'ranges': [], 'other': False, 'result': '7116'}, {'values': ['49300'], 'ranges': [], 'other': False, 'result': '7117'},
+                       {'values': ['50111', '50112', '50113'], 'ranges': [], 'other': False, 'result': '7121'}, {'values': ['50121', '50122'], 'ranges': [], 'other': False, 'result': '7122'}, {'values': ['50211', '50212'], 'ranges': [], 'other': False, 'result': '7123'}, {'values': ['50220'], 'ranges': [], 'other': False, 'result': '7124'}, {'values': ['51101'], 'ranges': [], 'other': False, 'result': '7131'}, {'values': ['51201'], 'ranges': [], 'other': False, 'result': '7132'},
+                       {'values': ['51102', '51103', '51203'], 'ranges': [], 'other': False, 'result': '7133'}, {'values': ['51202'], 'ranges': [], 'other': False, 'result': '7134'}, {'values': ['52291'], 'ranges': [], 'other': False, 'result': '7191'}, {'values': ['52100'], 'ranges': [], 'other': False, 'result': '7192'}, {'values': ['52241', '52249'], 'ranges': [], 'other': False, 'result': '7193'},
+                       {'values': ['52211', '52212', '52213', '52214', '52219', '52221', '52222', '52229', '52231', '52232', '52233', '52234', '52239', '52292', '52299', '79110', '79120', '79900'], 'ranges': [], 'other': False, 'result': '7199'}, {'values': ['53100', '53200', '82195'], 'ranges': [], 'other': False, 'result': '7210'}, {'values': ['61101', '61102', '61201', '61202', '61300', '61901', '61902', '61903', '61904', '61905', '61909'], 'ranges': [], 'other': False, 'result': '7220'},
+                       {'values': ['64110', '64191', '64192', '64193', '64194', '64195', '64199', '64200', '64301', '64302', '64303', '64304', '64309', '64910', '64921', '64922', '64923', '64924', '64925', '64929', '64991', '64992', '64993', '64999'], 'ranges': [], 'other': False, 'result': '8110'},
+                       {'values': ['66111', '66112', '66113', '66114', '66119', '66121', '66122', '66123', '66124', '66125', '66129', '66191', '66192', '66199', '66301', '66302', '66303'], 'ranges': [], 'other': False, 'result': '8120'},
+                       {'values': ['65111', '65112', '65121', '65122', '65123', '65124', '65125', '65201', '65202', '65203', '65204', '65205', '65206', '65207', '65301', '65302', '66211', '66212', '66221', '66222', '66223', '66224', '66290'], 'ranges': [], 'other': False, 'result': '8130'}, {'values': ['68101', '68102', '68103', '68104', '68109', '68201', '68202', '68203', '68209'], 'ranges': [], 'other': False, 'result': '8310'},
+                       {'values': ['77211', '77212', '77213', '77219', '77220', '77291', '77293', '77294', '77295', '77296', '77297', '77299'], 'ranges': [], 'other': False, 'result': '8320'}, {'values': ['77292'], 'ranges': [], 'other': False, 'result': '8321'}, {'values': ['77101', '77102', '77302', '77303', '77304'], 'ranges': [], 'other': False, 'result': '8331'}, {'values': ['77301', '77305', '77306', '77309'], 'ranges': [], 'other': False, 'result': '8332'},
+                       {'values': ['77307'], 'ranges': [], 'other': False, 'result': '8333'}, {'values': ['58201', '58202', '58203', '62010', '62021', '62022', '62091', '62099', '63111', '63112', '63120', '95112', '95113'], 'ranges': [], 'other': False, 'result': '8340'}, {'values': ['72101'], 'ranges': [], 'other': False, 'result': '8411'}, {'values': ['72104'], 'ranges': [], 'other': False, 'result': '8412'}, {'values': ['72102', '72106'], 'ranges': [], 'other': False, 'result': '8413'},
+                       {'values': ['72105'], 'ranges': [], 'other': False, 'result': '8414'}, {'values': ['72103'], 'ranges': [], 'other': False, 'result': '8415'}, {'values': ['72109'], 'ranges': [], 'other': False, 'result': '8416'}, {'values': ['72201', '72202', '72209'], 'ranges': [], 'other': False, 'result': '8420'}, {'values': ['69100', '69200'], 'ranges': [], 'other': False, 'result': '8910'}, {'values': ['73200'], 'ranges': [], 'other': False, 'result': '8911'},
+                       {'values': ['70100', '70201'], 'ranges': [], 'other': False, 'result': '8912'}, {'values': ['70203'], 'ranges': [], 'other': False, 'result': '8913'}, {'values': ['70202', '70209'], 'ranges': [], 'other': False, 'result': '8914'}, {'values': ['71200'], 'ranges': [], 'other': False, 'result': '8921'}, {'values': ['71101', '71102', '71103', '71109'], 'ranges': [], 'other': False, 'result': '8922'}, {'values': ['73100'], 'ranges': [], 'other': False, 'result': '8932'},
+                       {'values': ['82920'], 'ranges': [], 'other': False, 'result': '8991'},
+                       {'values': ['74101', '74102', '74103', '74109', '74200', '74901', '74902', '74903', '74904', '74905', '74909', '78100', '78200', '78300', '80100', '80200', '80300', '81100', '81210', '81291', '81292', '81293', '81294', '81295', '81296', '81297', '81299', '81300', '82110', '82191', '82192', '82193', '82194', '82196', '82199', '82200', '82301', '82302', '82910', '82990', '77400'], 'ranges': [], 'other': False, 'result': '8999'},
+                       {'values': ['84111', '84112', '84121', '84122', '84123', '84124', '84125', '84126', '84129', '84131', '84132', '84133', '84134', '84135', '84136', '84137', '84138', '84139'], 'ranges': [], 'other': False, 'result': '9101'}, {'values': ['84210', '84220', '84231', '84232', '84233', '84234', '84235', '84236', '84239'], 'ranges': [], 'other': False, 'result': '9102'}, {'values': ['84300'], 'ranges': [], 'other': False, 'result': '9103'},
+                       {'values': ['86101', '86102', '86201', '86202', '86203', '86901', '86902', '86903', '86904', '86905', '86906', '86909', '87101', '87102', '87103'], 'ranges': [], 'other': False, 'result': '9201'}, {'values': ['75000'], 'ranges': [], 'other': False, 'result': '9202'}, {'values': ['87201', '87209', '87300', '87901', '87902', '87909', '88101', '88109', '88901', '88902', '88909'], 'ranges': [], 'other': False, 'result': '9203'},
+                       {'values': ['85101', '85102', '85103', '85104'], 'ranges': [], 'other': False, 'result': '9311'}, {'values': ['85211', '85212', '85221', '85222'], 'ranges': [], 'other': False, 'result': '9312'}, {'values': ['85301', '85302'], 'ranges': [], 'other': False, 'result': '9313'}, {'values': ['85411', '85412', '85419', '85421', '85429', '85491', '85492', '85493', '85494', '85499', '85500'], 'ranges': [], 'other': False, 'result': '9314'},
+                       {'values': ['37000', '38111', '38112', '38113', '38115', '38121', '38122', '38210', '38220', '39000'], 'ranges': [], 'other': False, 'result': '9410'}, {'values': ['94110', '94120', '94200', '94910', '94920', '94990'], 'ranges': [], 'other': False, 'result': '9420'}, {'values': ['59110', '59120', '59130', '59140', '59200', '60100', '60200', '90001', '90002', '90003', '90004', '90005', '90006', '90007', '90009', '93295'], 'ranges': [], 'other': False, 'result': '9431'},
+                       {'values': ['63910'], 'ranges': [], 'other': False, 'result': '9432'}, {'values': ['63990'], 'ranges': [], 'other': False, 'result': '9435'}, {'values': ['91011', '91012', '91021', '91022', '91031', '91032'], 'ranges': [], 'other': False, 'result': '9440'},
+                       {'values': ['92000', '93111', '93112', '93113', '93114', '93115', '93116', '93117', '93118', '93119', '93120', '93191', '93192', '93193', '93199', '93210', '93291', '93292', '93293', '93294', '93296', '93297', '93299'], 'ranges': [], 'other': False, 'result': '9450'},
+                       {'values': ['96011', '96012', '96013', '96014', '96020', '96031', '96032', '96033', '96034', '96035', '96091', '96092', '96093', '96094', '96095', '96096', '96097', '96099'], 'ranges': [], 'other': False, 'result': '9499'}, {'values': ['97000', '98100', '98200'], 'ranges': [], 'other': False, 'result': '9500'}, {'values': ['99000'], 'ranges': [], 'other': False, 'result': '9600'}, {'values': [], 'ranges': [], 'other': True, 'result': '9999'}]},
+ 'COLLCD': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['1', '01'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['2', '02'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['3', '03'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['5', '05'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['6', '06'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['7', '07'], 'ranges': [], 'other': False, 'result': '30570'},
+                      {'values': ['8', '08'], 'ranges': [], 'other': False, 'result': '30520'}, {'values': ['9', '09'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['10'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['11'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['12'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['13'], 'ranges': [], 'other': False, 'result': '30530'},
+                      {'values': ['14'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['15'], 'ranges': [], 'other': False, 'result': '30540'}, {'values': ['20'], 'ranges': [], 'other': False, 'result': '30580'}, {'values': ['21'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['22'], 'ranges': [], 'other': False, 'result': '30580'}, {'values': ['23'], 'ranges': [], 'other': False, 'result': '30580'},
+                      {'values': ['41'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['42'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['43'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['50'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['51'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['52'], 'ranges': [], 'other': False, 'result': '30570'},
+                      {'values': ['53'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['54'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['55'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['56'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['57'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': ['60'], 'ranges': [], 'other': False, 'result': '30570'},
+                      {'values': ['61'], 'ranges': [], 'other': False, 'result': '30570'}, {'values': [], 'ranges': [], 'other': True, 'result': '30570'}]},
+ 'SECTA': {'kind': 'value',
+           'character': True,
+           'rules': [{'values': ['0110', "-'0139'"], 'ranges': [], 'other': False, 'result': '0100'}, {'values': ['0210', "-'0230'"], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['0311'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['0312'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['0313'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['0314'], 'ranges': [], 'other': False, 'result': '0314'},
+                     {'values': ['0315'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['0316'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['0321'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['0322'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['0323'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['0324'], 'ranges': [], 'other': False, 'result': '0324'},
+                     {'values': ['0329'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['0410'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['0420'], 'ranges': [], 'other': False, 'result': '0420'}, {'values': ['0430'], 'ranges': [], 'other': False, 'result': '0430'}, {'values': ['1100', "-'1400'"], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['2100', "-'2909'"], 'ranges': [], 'other': False, 'result': '2000'},
+                     {'values': ['3100', "-'3909'"], 'ranges': [], 'other': False, 'result': '3000'}, {'values': ['4100', "-'4200'"], 'ranges': [], 'other': False, 'result': '4000'}, {'values': ['5001'], 'ranges': [], 'other': False, 'result': '5001'}, {'values': ['5002'], 'ranges': [], 'other': False, 'result': '5002'}, {'values': ['5003'], 'ranges': [], 'other': False, 'result': '5003'}, {'values': ['5004'], 'ranges': [], 'other': False, 'result': '5004'},
+                     {'values': ['5005'], 'ranges': [], 'other': False, 'result': '5005'}, {'values': ['5006'], 'ranges': [], 'other': False, 'result': '5006'}, {'values': ['5009'], 'ranges': [], 'other': False, 'result': '5009'}, {'values': ['7100', "-'7220'"], 'ranges': [], 'other': False, 'result': '7000'}, {'values': ['9100', "-'9600'"], 'ranges': [], 'other': False, 'result': '9000'}, {'values': ['9999'], 'ranges': [], 'other': False, 'result': '9999'},
+                     {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'SECTB': {'kind': 'value',
+           'character': True,
+           'rules': [{'values': ['0210', "-'0212'"], 'ranges': [], 'other': False, 'result': '0210'}, {'values': ['6110', "-'6150'"], 'ranges': [], 'other': False, 'result': '6100'}, {'values': ['6210', "-'6250'"], 'ranges': [], 'other': False, 'result': '6200'}, {'values': ['6310', "-'6320'"], 'ranges': [], 'other': False, 'result': '6300'}, {'values': ['8100'], 'ranges': [], 'other': False, 'result': '8100'}, {'values': ['8200'], 'ranges': [], 'other': False, 'result': '8200'},
+                     {'values': ['8310'], 'ranges': [], 'other': False, 'result': '8310'}, {'values': ['8321', "-'8329'"], 'ranges': [], 'other': False, 'result': '8320'}, {'values': ['8330'], 'ranges': [], 'other': False, 'result': '8330'}, {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'DELQDES': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['  '], 'ranges': [], 'other': False, 'result': 'NO LEGAL ACTION TAKEN'}, {'values': ['09'], 'ranges': [], 'other': False, 'result': 'LNOD/RECALL ISSUED'}, {'values': ['10'], 'ranges': [], 'other': False, 'result': 'SUMMON/WRIT FILED'}, {'values': ['11'], 'ranges': [], 'other': False, 'result': 'JUDGEMENT ORDER'}, {'values': ['12'], 'ranges': [], 'other': False, 'result': 'BANKRUPTCY'},
+                       {'values': ['13'], 'ranges': [], 'other': False, 'result': 'CHARGING ORDER'}, {'values': ['14'], 'ranges': [], 'other': False, 'result': 'GARNISHEE ORDER'}, {'values': ['15'], 'ranges': [], 'other': False, 'result': 'WRIT OF SEIZURE AND SALE'}, {'values': ['16'], 'ranges': [], 'other': False, 'result': 'PROHIBITORY ORDER'}, {'values': ['17'], 'ranges': [], 'other': False, 'result': 'WINDING-UP'}, {'values': ['18'], 'ranges': [], 'other': False, 'result': 'AUCTION'},
+                       {'values': ['19'], 'ranges': [], 'other': False, 'result': 'JUDGEMENT DEBTOR SUMMONS'}, {'values': ['20'], 'ranges': [], 'other': False, 'result': 'RECEIVER/SECTION 176'}, {'values': ['21'], 'ranges': [], 'other': False, 'result': 'SETTLED/DISCHARGED'}, {'values': [], 'ranges': [], 'other': True, 'result': ''}]},
+ 'SECDES': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['0100'], 'ranges': [], 'other': False, 'result': 'SECURITIES                 '}, {'values': ['0200'], 'ranges': [], 'other': False, 'result': 'TRANSPORT VEHICLES         '}, {'values': ['0310'], 'ranges': [], 'other': False, 'result': 'RESIDENTIAL PROPERTY       '}, {'values': ['0311'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST <=25K     '}, {'values': ['0312'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST >25K-60K  '},
+                      {'values': ['0313'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST >60K-100K '}, {'values': ['0314'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST >100K-150K'}, {'values': ['0315'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST >150K-250K'}, {'values': ['0316'], 'ranges': [], 'other': False, 'result': 'RESIDE PROP COST >250K     '}, {'values': ['0320'], 'ranges': [], 'other': False, 'result': 'NON RESI. PROPERTY         '},
+                      {'values': ['0321'], 'ranges': [], 'other': False, 'result': 'PURCH IND BUILD & FACTORIES'}, {'values': ['0322'], 'ranges': [], 'other': False, 'result': 'PURCH OF LAND ONLY         '}, {'values': ['0323'], 'ranges': [], 'other': False, 'result': 'PURCH OF COMMERCIAL COMPLEX'}, {'values': ['0324'], 'ranges': [], 'other': False, 'result': 'PURCH OF SHOPHOUSES        '}, {'values': ['0329'], 'ranges': [], 'other': False, 'result': 'PURCH OTH NRESIDE PROP     '},
+                      {'values': ['0410'], 'ranges': [], 'other': False, 'result': 'PERSONAL USES              '}, {'values': ['0420'], 'ranges': [], 'other': False, 'result': 'CREDIT CARD                '}, {'values': ['0430'], 'ranges': [], 'other': False, 'result': 'CONSUMER DURABLES          '}, {'values': ['1000'], 'ranges': [], 'other': False, 'result': 'AGRICULTURE, HUNTING,\n               FORESTRY & FISHING         '},
+                      {'values': ['2000'], 'ranges': [], 'other': False, 'result': 'MINING & QUARRYING         '}, {'values': ['3000'], 'ranges': [], 'other': False, 'result': 'MANUFACTURING              '}, {'values': ['4000'], 'ranges': [], 'other': False, 'result': 'ELEC, GAS & WATER SUPPLY   '}, {'values': ['5000'], 'ranges': [], 'other': False, 'result': 'CONSTRUCTION'}, {'values': ['5001'], 'ranges': [], 'other': False, 'result': 'GEN INCL CIVIL ENGINE CONT '},
+                      {'values': ['5002'], 'ranges': [], 'other': False, 'result': 'SPECIAL TRADE CONTRACTORS  '}, {'values': ['5003'], 'ranges': [], 'other': False, 'result': 'INDUST BUILD & FACTORIES   '}, {'values': ['5004'], 'ranges': [], 'other': False, 'result': 'CONSTRUCT INFRASTRUCTURE   '}, {'values': ['5005'], 'ranges': [], 'other': False, 'result': 'CONSTRUCT COMMERCIAL COMPL '}, {'values': ['5006'], 'ranges': [], 'other': False, 'result': 'CONSTRUCT RESIDENTIAL      '},
+                      {'values': ['5009'], 'ranges': [], 'other': False, 'result': 'CONSTRUCTION NEC           '}, {'values': ['6100'], 'ranges': [], 'other': False, 'result': 'WHOLESALE'}, {'values': ['6200'], 'ranges': [], 'other': False, 'result': 'RETAIL TRADE'}, {'values': ['6300'], 'ranges': [], 'other': False, 'result': 'RESTAURANTS & HOTELS'}, {'values': ['7000'], 'ranges': [], 'other': False, 'result': 'TRANSPORT, STORAGE & COMM  '},
+                      {'values': ['8100'], 'ranges': [], 'other': False, 'result': 'FINANCIAL SERVICES'}, {'values': ['8200'], 'ranges': [], 'other': False, 'result': 'INSURANCE'}, {'values': ['8310'], 'ranges': [], 'other': False, 'result': 'REAL ESTATE'}, {'values': ['8320'], 'ranges': [], 'other': False, 'result': 'BUSINESS SERVICES'}, {'values': ['8330'], 'ranges': [], 'other': False, 'result': 'EQUIPMENT RENTAL'},
+                      {'values': ['9000'], 'ranges': [], 'other': False, 'result': 'COMMUNITY, SOCIAL &\n               PERSONAL SERVICES          '}, {'values': ['9999'], 'ranges': [], 'other': False, 'result': 'SECTORS NEC                '}, {'values': [], 'ranges': [], 'other': True, 'result': ' '}]},
+ 'ARRCLASS': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': [1], 'ranges': [], 'other': False, 'result': '0 - < 1 MTH   '}, {'values': [2], 'ranges': [], 'other': False, 'result': '1 - < 2 MTH   '}, {'values': [3], 'ranges': [], 'other': False, 'result': '2 - < 3 MTH   '}, {'values': [4], 'ranges': [], 'other': False, 'result': '3 - < 4 MTH   '}, {'values': [5], 'ranges': [], 'other': False, 'result': '4 - < 5 MTH   '}, {'values': [6], 'ranges': [], 'other': False, 'result': '5 - < 6 MTH   '},
+                        {'values': [7], 'ranges': [], 'other': False, 'result': '6 - < 7 MTH   '}, {'values': [8], 'ranges': [], 'other': False, 'result': '7 - < 8 MTH   '}, {'values': [9], 'ranges': [], 'other': False, 'result': '8 - < 9 MTH   '}, {'values': [10], 'ranges': [], 'other': False, 'result': '9 - < 12 MTH  '}, {'values': [11], 'ranges': [], 'other': False, 'result': '12 - < 18 MTH '}, {'values': [12], 'ranges': [], 'other': False, 'result': '18 - < 24 MTH '},
+                        {'values': [13], 'ranges': [], 'other': False, 'result': '24 - < 36 MTH '}, {'values': [14], 'ranges': [], 'other': False, 'result': '36 MTH & ABOVE'}, {'values': [15], 'ranges': [], 'other': False, 'result': 'DEFICIT       '}]},
+ 'BTPROD': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['BAP', 'BAI', 'BAS', 'BAE', 'BPI', 'BII', 'BSI', 'BEI'], 'ranges': [], 'other': False, 'result': '34152'}, {'values': ['FAS', 'FAU', 'FDS', 'FDU', 'FCL', 'FTB', 'DAS', 'DAU', 'DDS', 'DDU', 'DDT', 'ITB', 'VAL', 'DIL', 'FIL', 'POS', 'PCR', 'PBA', 'PRO', 'PRE', 'PBU', 'PBR', 'PUM', 'PAU', 'PDU', 'PDT', 'PTB', 'PFU', 'PFD'], 'ranges': [], 'other': False, 'result': '34159'},
+                      {'values': ['TFL', 'TML', 'TFC', 'TMC', 'TFO', 'TMO', 'TLL', 'TNL', 'TLC', 'TNC', 'TLO', 'TNO', 'TLQ', 'TLZ', 'TFI', 'TBI', 'TLI', 'TXI', 'PFT'], 'ranges': [], 'other': False, 'result': '34160'}, {'values': ['FTL', 'FTI', 'FFS', 'FFU', 'FCS', 'FCU', 'FFL'], 'ranges': [], 'other': False, 'result': '34600'}, {'values': [], 'ranges': [], 'other': True, 'result': '34159'}]},
+ 'BTPRODI': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['BGF'], 'ranges': [], 'other': False, 'result': '51100'}, {'values': ['APG'], 'ranges': [], 'other': False, 'result': '51999'}, {'values': ['BGP', 'BGT'], 'ranges': [], 'other': False, 'result': '52100'},
+                       {'values': ['ALC', 'BFC', 'BLC', 'DLC', 'IFS', 'IFD', 'IFU', 'IFO', 'ILB', 'ILS', 'ILL', 'ILU', 'PLC', 'RFC', 'RLC', 'SFC', 'SLC', 'TFR', 'TLR', 'CEX', 'UMB', 'FSI', 'FUI', 'LSI', 'LUI', 'FSO', 'FUO', 'LSO', 'LUO'], 'ranges': [], 'other': False, 'result': '53100'}, {'values': ['SGC', 'SGL', 'SLI', 'SCI'], 'ranges': [], 'other': False, 'result': '53200'},
+                       {'values': ['BRA', 'BUF', 'BUL', 'GTI', 'GPI', 'GFI', 'UFI', 'UDI'], 'ranges': [], 'other': False, 'result': '53999'}]},
+ 'BTPRODA': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['BGF'], 'ranges': [], 'other': False, 'result': '51100'}, {'values': ['APG'], 'ranges': [], 'other': False, 'result': '51999'}, {'values': ['BGP', 'BGT'], 'ranges': [], 'other': False, 'result': '52100'}, {'values': ['ALC', 'BFC', 'BLC', 'DLC', 'IFS', 'IFD', 'IFU', 'IFO', 'ILB', 'ILS', 'ILL', 'ILU', 'PLC', 'RFC', 'RLC', 'SFC', 'SLC', 'TFR', 'TLR', 'CEX', 'UMB'], 'ranges': [], 'other': False, 'result': '53100'},
+                       {'values': ['SGC', 'SGL'], 'ranges': [], 'other': False, 'result': '53200'}, {'values': ['BRA', 'BUF', 'BUL'], 'ranges': [], 'other': False, 'result': '53999'}]},
+ 'BTRATE': {'kind': 'value', 'character': True, 'rules': [{'values': ['IEF', 'MDL', 'MLL', 'MOL', 'MOF', 'MCL', 'MCF', 'PEF', 'PCE', 'PCP', 'MFL', 'BPI', 'BII', 'BSI', 'BEI'], 'ranges': [], 'other': False, 'result': '30596'}, {'values': ['BAP', 'BAI', 'BAS', 'BAE'], 'ranges': [], 'other': False, 'result': '30593'}, {'values': [], 'ranges': [], 'other': True, 'result': '30597'}]},
+ 'CRISCD': {'kind': 'value',
+            'character': True,
+            'rules': [{'values': ['0440'], 'ranges': [], 'other': False, 'result': '0440'}, {'values': ['0441'], 'ranges': [], 'other': False, 'result': '0440'}, {'values': ['0460'], 'ranges': [], 'other': False, 'result': '0460'}, {'values': ['1110'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['1111'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['1120'], 'ranges': [], 'other': False, 'result': '0120'},
+                      {'values': ['1121'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['1131'], 'ranges': [], 'other': False, 'result': '0131'}, {'values': ['1139'], 'ranges': [], 'other': False, 'result': '0132'}, {'values': ['1140'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['1210'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['1211'], 'ranges': [], 'other': False, 'result': '0110'},
+                      {'values': ['1220'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['1221'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['1230'], 'ranges': [], 'other': False, 'result': '0132'}, {'values': ['1290'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['2111'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['2112'], 'ranges': [], 'other': False, 'result': '0312'},
+                      {'values': ['2113'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2114'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2115'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2116'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['2121'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['2122'], 'ranges': [], 'other': False, 'result': '0322'},
+                      {'values': ['2123'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['2124'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2125'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2126'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['2129'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['2208'], 'ranges': [], 'other': False, 'result': '0311'},
+                      {'values': ['2209'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['2210'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2211'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2212'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2213'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['2221'], 'ranges': [], 'other': False, 'result': '0321'},
+                      {'values': ['2222'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['2223'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['2224'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2225'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2226'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['2229'], 'ranges': [], 'other': False, 'result': '0329'},
+                      {'values': ['2308'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['2309'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['2310'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2311'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2312'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2313'], 'ranges': [], 'other': False, 'result': '0316'},
+                      {'values': ['2321'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['2322'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['2323'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['2324'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2325'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2326'], 'ranges': [], 'other': False, 'result': '0329'},
+                      {'values': ['2329'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['3100'], 'ranges': [], 'other': False, 'result': '3100'}, {'values': ['3101'], 'ranges': [], 'other': False, 'result': '3100'}, {'values': ['3110'], 'ranges': [], 'other': False, 'result': '3100'}, {'values': ['3120'], 'ranges': [], 'other': False, 'result': '3100'}, {'values': ['3200'], 'ranges': [], 'other': False, 'result': '0200'},
+                      {'values': ['3201'], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['3300'], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['3900'], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['3901'], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['4100'], 'ranges': [], 'other': False, 'result': '0430'}, {'values': ['4300'], 'ranges': [], 'other': False, 'result': '0410'},
+                      {'values': ['4200'], 'ranges': [], 'other': False, 'result': '0420'}, {'values': ['4411'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4412'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4421'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4422'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4431'], 'ranges': [], 'other': False, 'result': '0139'},
+                      {'values': ['4432'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4441'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['4442'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['5100'], 'ranges': [], 'other': False, 'result': '0390'}, {'values': ['5200'], 'ranges': [], 'other': False, 'result': '0390'}, {'values': ['5300'], 'ranges': [], 'other': False, 'result': '0470'},
+                      {'values': ['5400'], 'ranges': [], 'other': False, 'result': '0990'}, {'values': ['5401'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['5402'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['5403'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['5404'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['5405'], 'ranges': [], 'other': False, 'result': '0315'},
+                      {'values': ['5406'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['5407'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['5408'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['5409'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['5410'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['5411'], 'ranges': [], 'other': False, 'result': '0329'},
+                      {'values': ['5412'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['5413'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['5414'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['5415'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['5416'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['5417'], 'ranges': [], 'other': False, 'result': '0316'},
+                      {'values': ['5418'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['5419'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['5420'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['5421'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['5422'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5423'], 'ranges': [], 'other': False, 'result': '0324'},
+                      {'values': ['5424'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5425'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['5426'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5431'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['5432'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['5433'], 'ranges': [], 'other': False, 'result': '0313'},
+                      {'values': ['5434'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['5435'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['5436'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['5437'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['5438'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['5439'], 'ranges': [], 'other': False, 'result': '0323'},
+                      {'values': ['5440'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['5441'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5442'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['5443'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5500'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['5501'], 'ranges': [], 'other': False, 'result': '0470'},
+                      {'values': ['5600'], 'ranges': [], 'other': False, 'result': '0440'}, {'values': ['5700'], 'ranges': [], 'other': False, 'result': '0990'}, {'values': ['5800'], 'ranges': [], 'other': False, 'result': '0990'}, {'values': ['6300'], 'ranges': [], 'other': False, 'result': '0390'}, {'values': ['9000'], 'ranges': [], 'other': False, 'result': '0990'}, {'values': ['9001'], 'ranges': [], 'other': False, 'result': '0990'},
+                      {'values': [], 'ranges': [], 'other': True, 'result': '0990'}]},
+ 'RVRSECT': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['1111'], 'ranges': [], 'other': False, 'result': '1111'}, {'values': ['1112'], 'ranges': [], 'other': False, 'result': '1112'}, {'values': ['1113'], 'ranges': [], 'other': False, 'result': '1113'}, {'values': ['1114'], 'ranges': [], 'other': False, 'result': '1114'}, {'values': ['1115'], 'ranges': [], 'other': False, 'result': '1115'}, {'values': ['1116'], 'ranges': [], 'other': False, 'result': '1116'},
+                       {'values': ['1117'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1119'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1120'], 'ranges': [], 'other': False, 'result': '1118'}, {'values': ['1130'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1140'], 'ranges': [], 'other': False, 'result': '1400'}, {'values': ['1150'], 'ranges': [], 'other': False, 'result': '1130'},
+                       {'values': ['1200'], 'ranges': [], 'other': False, 'result': '1210'}, {'values': ['1300'], 'ranges': [], 'other': False, 'result': '1309'}, {'values': ['1400'], 'ranges': [], 'other': False, 'result': '1400'}, {'values': ['2100'], 'ranges': [], 'other': False, 'result': '2100'}, {'values': ['2210'], 'ranges': [], 'other': False, 'result': '2200'}, {'values': ['2220'], 'ranges': [], 'other': False, 'result': '2200'},
+                       {'values': ['2301'], 'ranges': [], 'other': False, 'result': '2301'}, {'values': ['2302'], 'ranges': [], 'other': False, 'result': '2302'}, {'values': ['2303'], 'ranges': [], 'other': False, 'result': '2303'}, {'values': ['2400'], 'ranges': [], 'other': False, 'result': '2909'}, {'values': ['2900'], 'ranges': [], 'other': False, 'result': '2909'}, {'values': ['3110'], 'ranges': [], 'other': False, 'result': '3111'},
+                       {'values': ['3111'], 'ranges': [], 'other': False, 'result': '3112'}, {'values': ['3112'], 'ranges': [], 'other': False, 'result': '3116'}, {'values': ['3113'], 'ranges': [], 'other': False, 'result': '3134'}, {'values': ['3114'], 'ranges': [], 'other': False, 'result': '3121'}, {'values': ['3115'], 'ranges': [], 'other': False, 'result': '3152'}, {'values': ['3120'], 'ranges': [], 'other': False, 'result': '3140'},
+                       {'values': ['3211'], 'ranges': [], 'other': False, 'result': '3211'}, {'values': ['3212'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['3219'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['3221'], 'ranges': [], 'other': False, 'result': '3220'}, {'values': ['3222'], 'ranges': [], 'other': False, 'result': '3232'}, {'values': ['3231'], 'ranges': [], 'other': False, 'result': '3231'},
+                       {'values': ['3232'], 'ranges': [], 'other': False, 'result': '3240'}, {'values': ['3241'], 'ranges': [], 'other': False, 'result': '3311'}, {'values': ['3242'], 'ranges': [], 'other': False, 'result': '3319'}, {'values': ['3250'], 'ranges': [], 'other': False, 'result': '3411'}, {'values': ['3271'], 'ranges': [], 'other': False, 'result': '3420'}, {'values': ['3272'], 'ranges': [], 'other': False, 'result': '3420'},
+                       {'values': ['3273'], 'ranges': [], 'other': False, 'result': '3420'}, {'values': ['3280'], 'ranges': [], 'other': False, 'result': '3420'}, {'values': ['3290'], 'ranges': [], 'other': False, 'result': '3420'}, {'values': ['3311'], 'ranges': [], 'other': False, 'result': '3511'}, {'values': ['3312'], 'ranges': [], 'other': False, 'result': '3513'}, {'values': ['3313'], 'ranges': [], 'other': False, 'result': '3521'},
+                       {'values': ['3431'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3432'], 'ranges': [], 'other': False, 'result': '3531'}, {'values': ['3433'], 'ranges': [], 'other': False, 'result': '3540'}, {'values': ['3551'], 'ranges': [], 'other': False, 'result': '3551'}, {'values': ['3552'], 'ranges': [], 'other': False, 'result': '3560'}, {'values': ['3611'], 'ranges': [], 'other': False, 'result': '3620'},
+                       {'values': ['3619'], 'ranges': [], 'other': False, 'result': '3610'}, {'values': ['3710'], 'ranges': [], 'other': False, 'result': '3710'}, {'values': ['3720'], 'ranges': [], 'other': False, 'result': '3720'}, {'values': ['3721'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3731'], 'ranges': [], 'other': False, 'result': '3710'}, {'values': ['3732'], 'ranges': [], 'other': False, 'result': '3720'},
+                       {'values': ['3811'], 'ranges': [], 'other': False, 'result': '3813'}, {'values': ['3813'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3814'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3819'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3825'], 'ranges': [], 'other': False, 'result': '3825'}, {'values': ['3832'], 'ranges': [], 'other': False, 'result': '3822'},
+                       {'values': ['3833'], 'ranges': [], 'other': False, 'result': '3829'}, {'values': ['3834'], 'ranges': [], 'other': False, 'result': '3829'}, {'values': ['3835'], 'ranges': [], 'other': False, 'result': '3829'}, {'values': ['3842'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3843'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['3844'], 'ranges': [], 'other': False, 'result': '3832'},
+                       {'values': ['3851'], 'ranges': [], 'other': False, 'result': '3851'}, {'values': ['3852'], 'ranges': [], 'other': False, 'result': '3852'}, {'values': ['3853'], 'ranges': [], 'other': False, 'result': '3853'}, {'values': ['3861'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3862'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3863'], 'ranges': [], 'other': False, 'result': '3839'},
+                       {'values': ['3864'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3865'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3866'], 'ranges': [], 'other': False, 'result': '3839'}, {'values': ['3871'], 'ranges': [], 'other': False, 'result': '3843'}, {'values': ['3872'], 'ranges': [], 'other': False, 'result': '3849'}, {'values': ['3873'], 'ranges': [], 'other': False, 'result': '3849'},
+                       {'values': ['3891'], 'ranges': [], 'other': False, 'result': '3841'}, {'values': ['3892'], 'ranges': [], 'other': False, 'result': '3842'}, {'values': ['r', '3893'], 'ranges': [], 'other': False, 'result': '3845'}, {'values': ['3894'], 'ranges': [], 'other': False, 'result': '3849'}, {'values': ['3911'], 'ranges': [], 'other': False, 'result': '3320'}, {'values': ['3919'], 'ranges': [], 'other': False, 'result': '3909'},
+                       {'values': ['3952'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3953'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3955'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3956'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3957'], 'ranges': [], 'other': False, 'result': '3909'}, {'values': ['3960'], 'ranges': [], 'other': False, 'result': '3909'},
+                       {'values': ['4010'], 'ranges': [], 'other': False, 'result': '4101'}, {'values': ['4020'], 'ranges': [], 'other': False, 'result': '4102'}, {'values': ['4030'], 'ranges': [], 'other': False, 'result': '4103'}, {'values': ['5001'], 'ranges': [], 'other': False, 'result': '5001'}, {'values': ['5002'], 'ranges': [], 'other': False, 'result': '5002'}, {'values': ['5003'], 'ranges': [], 'other': False, 'result': '5003'},
+                       {'values': ['5004'], 'ranges': [], 'other': False, 'result': '5004'}, {'values': ['5005'], 'ranges': [], 'other': False, 'result': '5005'}, {'values': ['5006'], 'ranges': [], 'other': False, 'result': '5006'}, {'values': ['5008'], 'ranges': [], 'other': False, 'result': '5001'}, {'values': ['5020'], 'ranges': [], 'other': False, 'result': '5009'}, {'values': ['5030'], 'ranges': [], 'other': False, 'result': '5009'},
+                       {'values': ['5040'], 'ranges': [], 'other': False, 'result': '5009'}, {'values': ['5050'], 'ranges': [], 'other': False, 'result': '5009'}, {'values': ['5999'], 'ranges': [], 'other': False, 'result': '5009'}, {'values': ['6110'], 'ranges': [], 'other': False, 'result': '6131'}, {'values': ['6120'], 'ranges': [], 'other': False, 'result': '6150'}, {'values': ['6130'], 'ranges': [], 'other': False, 'result': '6250'},
+                       {'values': ['6310'], 'ranges': [], 'other': False, 'result': '6310'}, {'values': ['6320'], 'ranges': [], 'other': False, 'result': '6320'}, {'values': ['7111'], 'ranges': [], 'other': False, 'result': '7111'}, {'values': ['7112'], 'ranges': [], 'other': False, 'result': '7116'}, {'values': ['7113'], 'ranges': [], 'other': False, 'result': '7113'}, {'values': ['7114'], 'ranges': [], 'other': False, 'result': '7116'},
+                       {'values': ['7115'], 'ranges': [], 'other': False, 'result': '7116'}, {'values': ['7116'], 'ranges': [], 'other': False, 'result': '7116'}, {'values': ['7117'], 'ranges': [], 'other': False, 'result': '7115'}, {'values': ['7121'], 'ranges': [], 'other': False, 'result': '7121'}, {'values': ['7122'], 'ranges': [], 'other': False, 'result': '7123'}, {'values': ['7123'], 'ranges': [], 'other': False, 'result': '7122'},
+                       {'values': ['7124'], 'ranges': [], 'other': False, 'result': '7122'}, {'values': ['7131'], 'ranges': [], 'other': False, 'result': '7131'}, {'values': ['7132'], 'ranges': [], 'other': False, 'result': '7132'}, {'values': ['7133'], 'ranges': [], 'other': False, 'result': '7132'}, {'values': ['7134'], 'ranges': [], 'other': False, 'result': '7132'}, {'values': ['7191'], 'ranges': [], 'other': False, 'result': '7191'},
+                       {'values': ['7192'], 'ranges': [], 'other': False, 'result': '7192'}, {'values': ['7193'], 'ranges': [], 'other': False, 'result': '7199'}, {'values': ['7199'], 'ranges': [], 'other': False, 'result': '7199'}, {'values': ['7210'], 'ranges': [], 'other': False, 'result': '7210'}, {'values': ['7220'], 'ranges': [], 'other': False, 'result': '7220'}, {'values': ['8110'], 'ranges': [], 'other': False, 'result': '8100'},
+                       {'values': ['8120'], 'ranges': [], 'other': False, 'result': '8100'}, {'values': ['8130'], 'ranges': [], 'other': False, 'result': '8200'}, {'values': ['8310'], 'ranges': [], 'other': False, 'result': '8310'}, {'values': ['8320'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8321'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8331'], 'ranges': [], 'other': False, 'result': '8329'},
+                       {'values': ['8332'], 'ranges': [], 'other': False, 'result': '8330'}, {'values': ['8333'], 'ranges': [], 'other': False, 'result': '8330'}, {'values': ['8340'], 'ranges': [], 'other': False, 'result': '8323'}, {'values': ['8411'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8412'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8413'], 'ranges': [], 'other': False, 'result': '9320'},
+                       {'values': ['8414'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8415'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8416'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8420'], 'ranges': [], 'other': False, 'result': '9320'}, {'values': ['8910'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8911'], 'ranges': [], 'other': False, 'result': '8329'},
+                       {'values': ['8912'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8913'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8914'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8920'], 'ranges': [], 'other': False, 'result': '8324'}, {'values': ['8921'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8922'], 'ranges': [], 'other': False, 'result': '8324'},
+                       {'values': ['8931'], 'ranges': [], 'other': False, 'result': '8325'}, {'values': ['8932'], 'ranges': [], 'other': False, 'result': '8325'}, {'values': ['8991'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['8999'], 'ranges': [], 'other': False, 'result': '8329'}, {'values': ['9101'], 'ranges': [], 'other': False, 'result': '9100'}, {'values': ['9102'], 'ranges': [], 'other': False, 'result': '9100'},
+                       {'values': ['9103'], 'ranges': [], 'other': False, 'result': '9100'}, {'values': ['9201'], 'ranges': [], 'other': False, 'result': '9331'}, {'values': ['9202'], 'ranges': [], 'other': False, 'result': '9332'}, {'values': ['9203'], 'ranges': [], 'other': False, 'result': '9340'}, {'values': ['9311'], 'ranges': [], 'other': False, 'result': '9310'}, {'values': ['9312'], 'ranges': [], 'other': False, 'result': '9310'},
+                       {'values': ['9313'], 'ranges': [], 'other': False, 'result': '9310'}, {'values': ['9314'], 'ranges': [], 'other': False, 'result': '9310'}, {'values': ['9410'], 'ranges': [], 'other': False, 'result': '9200'}, {'values': ['9420'], 'ranges': [], 'other': False, 'result': '9350'}, {'values': ['9431'], 'ranges': [], 'other': False, 'result': '9411'}, {'values': ['9432'], 'ranges': [], 'other': False, 'result': '9999'},
+                       {'values': ['9433'], 'ranges': [], 'other': False, 'result': '9999'}, {'values': ['9434'], 'ranges': [], 'other': False, 'result': '9999'}, {'values': ['9435'], 'ranges': [], 'other': False, 'result': '9999'}, {'values': ['9440'], 'ranges': [], 'other': False, 'result': '9420'}, {'values': ['9450'], 'ranges': [], 'other': False, 'result': '9490'}, {'values': ['9499'], 'ranges': [], 'other': False, 'result': '9520'},
+                       {'values': ['9500'], 'ranges': [], 'other': False, 'result': '9530'}, {'values': ['9600'], 'ranges': [], 'other': False, 'result': '9600'}, {'values': ['9999'], 'ranges': [], 'other': False, 'result': '9999'}, {'values': [], 'ranges': [], 'other': True, 'result': '    '}]},
+ 'RVRCRIS': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['0440'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['0441'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['0460'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['1110'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['1120'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['1131'], 'ranges': [], 'other': False, 'result': '0131'},
+                       {'values': ['1139'], 'ranges': [], 'other': False, 'result': '0132'}, {'values': ['1140'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['1210'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['1220'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['1230'], 'ranges': [], 'other': False, 'result': '0132'}, {'values': ['1290'], 'ranges': [], 'other': False, 'result': '0139'},
+                       {'values': ['2111'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['2112'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['2113'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2114'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2115'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2116'], 'ranges': [], 'other': False, 'result': '0316'},
+                       {'values': ['2121'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['2122'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['2123'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['2124'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2129'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['2208'], 'ranges': [], 'other': False, 'result': '0311'},
+                       {'values': ['2209'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['2210'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2211'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2212'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2213'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['2221'], 'ranges': [], 'other': False, 'result': '0321'},
+                       {'values': ['2222'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['2223'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['2224'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['2229'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['2308'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['2309'], 'ranges': [], 'other': False, 'result': '0312'},
+                       {'values': ['2310'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['2311'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['2312'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['2313'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['2321'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['2322'], 'ranges': [], 'other': False, 'result': '1000'},
+                       {'values': ['2323'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['2324'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['2329'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['3100'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['3101'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['3200'], 'ranges': [], 'other': False, 'result': '1000'},
+                       {'values': ['3201'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['3900'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['3901'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['4100'], 'ranges': [], 'other': False, 'result': '0430'}, {'values': ['4300'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['5100'], 'ranges': [], 'other': False, 'result': '1000'},
+                       {'values': ['5200'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5300'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5401'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['5402'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['5403'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['5404'], 'ranges': [], 'other': False, 'result': '0314'},
+                       {'values': ['5405'], 'ranges': [], 'other': False, 'result': '0315'}, {'values': ['5406'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['5407'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['5408'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['5409'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['5410'], 'ranges': [], 'other': False, 'result': '0324'},
+                       {'values': ['5411'], 'ranges': [], 'other': False, 'result': '0329'}, {'values': ['5412'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['5413'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['5414'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['5415'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['5416'], 'ranges': [], 'other': False, 'result': '0315'},
+                       {'values': ['5417'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['5418'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5419'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5420'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5421'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5422'], 'ranges': [], 'other': False, 'result': '1000'},
+                       {'values': ['5423'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5424'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['5500'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['5501'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5600'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['5700'], 'ranges': [], 'other': False, 'result': '1000'},
+                       {'values': ['5800'], 'ranges': [], 'other': False, 'result': '1000'}, {'values': ['9000'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['9001'], 'ranges': [], 'other': False, 'result': '1000'}]},
+ 'BTCUSTCD': {'kind': 'value',
+              'character': False,
+              'rules': [{'values': [1], 'ranges': [], 'other': False, 'result': '11'}, {'values': [2], 'ranges': [], 'other': False, 'result': '02'}, {'values': [3], 'ranges': [], 'other': False, 'result': '03'}, {'values': [4], 'ranges': [], 'other': False, 'result': '04'}, {'values': [5], 'ranges': [], 'other': False, 'result': '05'}, {'values': [6], 'ranges': [], 'other': False, 'result': '06'}, {'values': [10], 'ranges': [], 'other': False, 'result': '11'},
+                        {'values': [11], 'ranges': [], 'other': False, 'result': '11'}, {'values': [12], 'ranges': [], 'other': False, 'result': '12'}, {'values': [13], 'ranges': [], 'other': False, 'result': '13'}, {'values': [15], 'ranges': [], 'other': False, 'result': '79'}, {'values': [17], 'ranges': [], 'other': False, 'result': '17'}, {'values': [20], 'ranges': [], 'other': False, 'result': '30'}, {'values': [30], 'ranges': [], 'other': False, 'result': '30'},
+                        {'values': [31], 'ranges': [], 'other': False, 'result': '31'}, {'values': [32], 'ranges': [], 'other': False, 'result': '32'}, {'values': [33], 'ranges': [], 'other': False, 'result': '33'}, {'values': [34], 'ranges': [], 'other': False, 'result': '34'}, {'values': [35], 'ranges': [], 'other': False, 'result': '35'}, {'values': [36], 'ranges': [], 'other': False, 'result': '06'}, {'values': [37], 'ranges': [], 'other': False, 'result': '37'},
+                        {'values': [38], 'ranges': [], 'other': False, 'result': '38'}, {'values': [39], 'ranges': [], 'other': False, 'result': '39'}, {'values': [40], 'ranges': [], 'other': False, 'result': '40'}, {'values': [41], 'ranges': [], 'other': False, 'result': '41'}, {'values': [42], 'ranges': [], 'other': False, 'result': '42'}, {'values': [43], 'ranges': [], 'other': False, 'result': '43'}, {'values': [44], 'ranges': [], 'other': False, 'result': '44'},
+                        {'values': [46], 'ranges': [], 'other': False, 'result': '46'}, {'values': [47], 'ranges': [], 'other': False, 'result': '47'}, {'values': [48], 'ranges': [], 'other': False, 'result': '48'}, {'values': [49], 'ranges': [], 'other': False, 'result': '49'}, {'values': [51], 'ranges': [], 'other': False, 'result': '51'}, {'values': [52], 'ranges': [], 'other': False, 'result': '52'}, {'values': [53], 'ranges': [], 'other': False, 'result': '53'},
+                        {'values': [54], 'ranges': [], 'other': False, 'result': '54'}, {'values': [50], 'ranges': [], 'other': False, 'result': '79'}, {'values': [57], 'ranges': [], 'other': False, 'result': '57'}, {'values': [59], 'ranges': [], 'other': False, 'result': '59'}, {'values': [60], 'ranges': [], 'other': False, 'result': '62'}, {'values': [61], 'ranges': [], 'other': False, 'result': '61'}, {'values': [62], 'ranges': [], 'other': False, 'result': '62'},
+                        {'values': [63], 'ranges': [], 'other': False, 'result': '63'}, {'values': [64], 'ranges': [], 'other': False, 'result': '64'}, {'values': [65], 'ranges': [], 'other': False, 'result': '44'}, {'values': [66], 'ranges': [], 'other': False, 'result': '66'}, {'values': [67], 'ranges': [], 'other': False, 'result': '67'}, {'values': [68], 'ranges': [], 'other': False, 'result': '68'}, {'values': [69], 'ranges': [], 'other': False, 'result': '69'},
+                        {'values': [70], 'ranges': [], 'other': False, 'result': '71'}, {'values': [71], 'ranges': [], 'other': False, 'result': '71'}, {'values': [72], 'ranges': [], 'other': False, 'result': '72'}, {'values': [73], 'ranges': [], 'other': False, 'result': '73'}, {'values': [74], 'ranges': [], 'other': False, 'result': '74'}, {'values': [75], 'ranges': [], 'other': False, 'result': '75'}, {'values': [76], 'ranges': [], 'other': False, 'result': '78'},
+                        {'values': [77], 'ranges': [], 'other': False, 'result': '77'}, {'values': [78], 'ranges': [], 'other': False, 'result': '78'}, {'values': [79], 'ranges': [], 'other': False, 'result': '79'}, {'values': [80], 'ranges': [], 'other': False, 'result': '86'}, {'values': [81], 'ranges': [], 'other': False, 'result': '81'}, {'values': [82], 'ranges': [], 'other': False, 'result': '82'}, {'values': [83], 'ranges': [], 'other': False, 'result': '83'},
+                        {'values': [84], 'ranges': [], 'other': False, 'result': '84'}, {'values': [85], 'ranges': [], 'other': False, 'result': '86'}, {'values': [86], 'ranges': [], 'other': False, 'result': '86'}, {'values': [87], 'ranges': [], 'other': False, 'result': '87'}, {'values': [88], 'ranges': [], 'other': False, 'result': '88'}, {'values': [89], 'ranges': [], 'other': False, 'result': '89'}, {'values': [90], 'ranges': [], 'other': False, 'result': '90'},
+                        {'values': [91], 'ranges': [], 'other': False, 'result': '91'}, {'values': [92], 'ranges': [], 'other': False, 'result': '92'}, {'values': [95], 'ranges': [], 'other': False, 'result': '95'}, {'values': [96], 'ranges': [], 'other': False, 'result': '96'}, {'values': [98], 'ranges': [], 'other': False, 'result': '98'}, {'values': [99], 'ranges': [], 'other': False, 'result': '99'}, {'values': [], 'ranges': [], 'other': True, 'result': '79'}]},
+ 'RVRSE': {'kind': 'value',
+           'character': True,
+           'rules': [{'values': ['1111'], 'ranges': [], 'other': False, 'result': '1111'}, {'values': ['1112'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1113'], 'ranges': [], 'other': False, 'result': '1113'}, {'values': ['1114'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1115'], 'ranges': [], 'other': False, 'result': '1115'}, {'values': ['1116'], 'ranges': [], 'other': False, 'result': '1119'},
+                     {'values': ['1117'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1118'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1119'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1120'], 'ranges': [], 'other': False, 'result': '1130'}, {'values': ['1130'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1140'], 'ranges': [], 'other': False, 'result': '1120'},
+                     {'values': ['1150'], 'ranges': [], 'other': False, 'result': '1120'}, {'values': ['1210'], 'ranges': [], 'other': False, 'result': '1200'}, {'values': ['1220'], 'ranges': [], 'other': False, 'result': '1200'}, {'values': ['1301'], 'ranges': [], 'other': False, 'result': '1300'}, {'values': ['1302'], 'ranges': [], 'other': False, 'result': '1300'}, {'values': ['1309'], 'ranges': [], 'other': False, 'result': '1300'},
+                     {'values': ['1400'], 'ranges': [], 'other': False, 'result': '1400'}, {'values': ['2100'], 'ranges': [], 'other': False, 'result': '2100'}, {'values': ['2200'], 'ranges': [], 'other': False, 'result': '2210'}, {'values': ['2301'], 'ranges': [], 'other': False, 'result': '2301'}, {'values': ['2302'], 'ranges': [], 'other': False, 'result': '2302'}, {'values': ['2303'], 'ranges': [], 'other': False, 'result': '2303'},
+                     {'values': ['2901'], 'ranges': [], 'other': False, 'result': '2900'}, {'values': ['2902'], 'ranges': [], 'other': False, 'result': '2900'}, {'values': ['2903'], 'ranges': [], 'other': False, 'result': '2900'}, {'values': ['2909'], 'ranges': [], 'other': False, 'result': '2900'}, {'values': ['3111'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3112'], 'ranges': [], 'other': False, 'result': '3114'},
+                     {'values': ['3113'], 'ranges': [], 'other': False, 'result': '3110'}, {'values': ['3114'], 'ranges': [], 'other': False, 'result': '3110'}, {'values': ['3115'], 'ranges': [], 'other': False, 'result': '3110'}, {'values': ['3116'], 'ranges': [], 'other': False, 'result': '3112'}, {'values': ['3117'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3118'], 'ranges': [], 'other': False, 'result': '3114'},
+                     {'values': ['3119'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3121'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3122'], 'ranges': [], 'other': False, 'result': '3112'}, {'values': ['3123'], 'ranges': [], 'other': False, 'result': '3110'}, {'values': ['3124'], 'ranges': [], 'other': False, 'result': '3112'}, {'values': ['3125'], 'ranges': [], 'other': False, 'result': '3112'},
+                     {'values': ['3129'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3131'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['3132'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['3133'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['3134'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['3140'], 'ranges': [], 'other': False, 'result': '3120'},
+                     {'values': ['3151'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3152'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3153'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3159'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3211'], 'ranges': [], 'other': False, 'result': '3211'}, {'values': ['3212'], 'ranges': [], 'other': False, 'result': '3212'},
+                     {'values': ['3213'], 'ranges': [], 'other': False, 'result': '3212'}, {'values': ['3214'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['3215'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['3219'], 'ranges': [], 'other': False, 'result': '3219'}, {'values': ['3220'], 'ranges': [], 'other': False, 'result': '3221'}, {'values': ['3231'], 'ranges': [], 'other': False, 'result': '3231'},
+                     {'values': ['3232'], 'ranges': [], 'other': False, 'result': '3222'}, {'values': ['3233'], 'ranges': [], 'other': False, 'result': '3231'}, {'values': ['3240'], 'ranges': [], 'other': False, 'result': '3232'}, {'values': ['3311'], 'ranges': [], 'other': False, 'result': '3241'}, {'values': ['3312'], 'ranges': [], 'other': False, 'result': '3242'}, {'values': ['3319'], 'ranges': [], 'other': False, 'result': '3242'},
+                     {'values': ['3320'], 'ranges': [], 'other': False, 'result': '3911'}, {'values': ['3411'], 'ranges': [], 'other': False, 'result': '3250'}, {'values': ['3412'], 'ranges': [], 'other': False, 'result': '3250'}, {'values': ['3419'], 'ranges': [], 'other': False, 'result': '3250'}, {'values': ['3420'], 'ranges': [], 'other': False, 'result': '3280'}, {'values': ['3511'], 'ranges': [], 'other': False, 'result': '3311'},
+                     {'values': ['3512'], 'ranges': [], 'other': False, 'result': '3311'}, {'values': ['3513'], 'ranges': [], 'other': False, 'result': '3312'}, {'values': ['3521'], 'ranges': [], 'other': False, 'result': '3313'}, {'values': ['3522'], 'ranges': [], 'other': False, 'result': '3313'}, {'values': ['3523'], 'ranges': [], 'other': False, 'result': '3313'}, {'values': ['3529'], 'ranges': [], 'other': False, 'result': '3313'},
+                     {'values': ['3531'], 'ranges': [], 'other': False, 'result': '3432'}, {'values': ['3540'], 'ranges': [], 'other': False, 'result': '3432'}, {'values': ['3551'], 'ranges': [], 'other': False, 'result': '3551'}, {'values': ['3559'], 'ranges': [], 'other': False, 'result': '3551'}, {'values': ['3560'], 'ranges': [], 'other': False, 'result': '3552'}, {'values': ['3610'], 'ranges': [], 'other': False, 'result': '3619'},
+                     {'values': ['3620'], 'ranges': [], 'other': False, 'result': '3611'}, {'values': ['3691'], 'ranges': [], 'other': False, 'result': '3619'}, {'values': ['3692'], 'ranges': [], 'other': False, 'result': '3619'}, {'values': ['3693'], 'ranges': [], 'other': False, 'result': '3619'}, {'values': ['3699'], 'ranges': [], 'other': False, 'result': '3619'}, {'values': ['3710'], 'ranges': [], 'other': False, 'result': '3710'},
+                     {'values': ['3720'], 'ranges': [], 'other': False, 'result': '3720'}, {'values': ['3811'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3812'], 'ranges': [], 'other': False, 'result': '3911'}, {'values': ['3813'], 'ranges': [], 'other': False, 'result': '3811'}, {'values': ['3819'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3821'], 'ranges': [], 'other': False, 'result': '3834'},
+                     {'values': ['3822'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['3823'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['3824'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['3825'], 'ranges': [], 'other': False, 'result': '3825'}, {'values': ['3829'], 'ranges': [], 'other': False, 'result': '3832'}, {'values': ['3831'], 'ranges': [], 'other': False, 'result': '3866'},
+                     {'values': ['3832'], 'ranges': [], 'other': False, 'result': '3844'}, {'values': ['3833'], 'ranges': [], 'other': False, 'result': '3866'}, {'values': ['3839'], 'ranges': [], 'other': False, 'result': '3866'}, {'values': ['3841'], 'ranges': [], 'other': False, 'result': '3891'}, {'values': ['3842'], 'ranges': [], 'other': False, 'result': '3892'}, {'values': ['3843'], 'ranges': [], 'other': False, 'result': '3871'},
+                     {'values': ['3844'], 'ranges': [], 'other': False, 'result': '3894'}, {'values': ['3845'], 'ranges': [], 'other': False, 'result': '3893'}, {'values': ['3849'], 'ranges': [], 'other': False, 'result': '3894'}, {'values': ['3851'], 'ranges': [], 'other': False, 'result': '3851'}, {'values': ['3852'], 'ranges': [], 'other': False, 'result': '3852'}, {'values': ['3853'], 'ranges': [], 'other': False, 'result': '3853'},
+                     {'values': ['3901'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3902'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3903'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3909'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['4101'], 'ranges': [], 'other': False, 'result': '4010'}, {'values': ['4102'], 'ranges': [], 'other': False, 'result': '4020'},
+                     {'values': ['4103'], 'ranges': [], 'other': False, 'result': '4030'}, {'values': ['4200'], 'ranges': [], 'other': False, 'result': '4030'}, {'values': ['5001'], 'ranges': [], 'other': False, 'result': '5001'}, {'values': ['5002'], 'ranges': [], 'other': False, 'result': '5002'}, {'values': ['5003'], 'ranges': [], 'other': False, 'result': '5003'}, {'values': ['5004'], 'ranges': [], 'other': False, 'result': '5004'},
+                     {'values': ['5005'], 'ranges': [], 'other': False, 'result': '5005'}, {'values': ['5006'], 'ranges': [], 'other': False, 'result': '5006'}, {'values': ['5009'], 'ranges': [], 'other': False, 'result': '5999'}, {'values': ['6111'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6112'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6113'], 'ranges': [], 'other': False, 'result': '6120'},
+                     {'values': ['6114'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6115'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6116'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6117'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6118'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6119'], 'ranges': [], 'other': False, 'result': '6120'},
+                     {'values': ['6121'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6131'], 'ranges': [], 'other': False, 'result': '6110'}, {'values': ['6132'], 'ranges': [], 'other': False, 'result': '6110'}, {'values': ['6133'], 'ranges': [], 'other': False, 'result': '6110'}, {'values': ['6134'], 'ranges': [], 'other': False, 'result': '6110'}, {'values': ['6139'], 'ranges': [], 'other': False, 'result': '6110'},
+                     {'values': ['6141'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6142'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6143'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6144'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6145'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6146'], 'ranges': [], 'other': False, 'result': '6120'},
+                     {'values': ['6147'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6148'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6149'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6150'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6211'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6212'], 'ranges': [], 'other': False, 'result': '6130'},
+                     {'values': ['6213'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6214'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6215'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6216'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6217'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6218'], 'ranges': [], 'other': False, 'result': '6130'},
+                     {'values': ['6219'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6221'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6222'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6231'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6241'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6242'], 'ranges': [], 'other': False, 'result': '6130'},
+                     {'values': ['6243'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6249'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6250'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6310'], 'ranges': [], 'other': False, 'result': '6310'}, {'values': ['6320'], 'ranges': [], 'other': False, 'result': '6320'}, {'values': ['7111'], 'ranges': [], 'other': False, 'result': '7111'},
+                     {'values': ['7112'], 'ranges': [], 'other': False, 'result': '7113'}, {'values': ['7113'], 'ranges': [], 'other': False, 'result': '7113'}, {'values': ['7114'], 'ranges': [], 'other': False, 'result': '7116'}, {'values': ['7115'], 'ranges': [], 'other': False, 'result': '7117'}, {'values': ['7116'], 'ranges': [], 'other': False, 'result': '7112'}, {'values': ['7121'], 'ranges': [], 'other': False, 'result': '7121'},
+                     {'values': ['7122'], 'ranges': [], 'other': False, 'result': '7123'}, {'values': ['7123'], 'ranges': [], 'other': False, 'result': '7121'}, {'values': ['7131'], 'ranges': [], 'other': False, 'result': '7131'}, {'values': ['7132'], 'ranges': [], 'other': False, 'result': '7132'}, {'values': ['7191'], 'ranges': [], 'other': False, 'result': '7191'}, {'values': ['7192'], 'ranges': [], 'other': False, 'result': '7192'},
+                     {'values': ['7199'], 'ranges': [], 'other': False, 'result': '7199'}, {'values': ['7210'], 'ranges': [], 'other': False, 'result': '7210'}, {'values': ['7220'], 'ranges': [], 'other': False, 'result': '7220'}, {'values': ['8100'], 'ranges': [], 'other': False, 'result': '8110'}, {'values': ['8200'], 'ranges': [], 'other': False, 'result': '8130'}, {'values': ['8310'], 'ranges': [], 'other': False, 'result': '8310'},
+                     {'values': ['8321'], 'ranges': [], 'other': False, 'result': '8914'}, {'values': ['8322'], 'ranges': [], 'other': False, 'result': '8914'}, {'values': ['8323'], 'ranges': [], 'other': False, 'result': '8340'}, {'values': ['8324'], 'ranges': [], 'other': False, 'result': '8922'}, {'values': ['8325'], 'ranges': [], 'other': False, 'result': '8931'}, {'values': ['8329'], 'ranges': [], 'other': False, 'result': '8999'},
+                     {'values': ['8330'], 'ranges': [], 'other': False, 'result': '8332'}, {'values': ['8410'], 'ranges': [], 'other': False, 'result': '8416'}, {'values': ['8910'], 'ranges': [], 'other': False, 'result': '8914'}, {'values': ['8920'], 'ranges': [], 'other': False, 'result': '8922'}, {'values': ['9100'], 'ranges': [], 'other': False, 'result': '9101'}, {'values': ['9200'], 'ranges': [], 'other': False, 'result': '9410'},
+                     {'values': ['9310'], 'ranges': [], 'other': False, 'result': '9314'}, {'values': ['9320'], 'ranges': [], 'other': False, 'result': '8416'}, {'values': ['9331'], 'ranges': [], 'other': False, 'result': '9201'}, {'values': ['9332'], 'ranges': [], 'other': False, 'result': '9202'}, {'values': ['9340'], 'ranges': [], 'other': False, 'result': '9203'}, {'values': ['9350'], 'ranges': [], 'other': False, 'result': '9420'},
+                     {'values': ['9391'], 'ranges': [], 'other': False, 'result': '9420'}, {'values': ['9399'], 'ranges': [], 'other': False, 'result': '9203'}, {'values': ['9411'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9412'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9413'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9414'], 'ranges': [], 'other': False, 'result': '9431'},
+                     {'values': ['9415'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9420'], 'ranges': [], 'other': False, 'result': '9440'}, {'values': ['9440'], 'ranges': [], 'other': False, 'result': '9430'}, {'values': ['9450'], 'ranges': [], 'other': False, 'result': '9430'}, {'values': ['9490'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9511'], 'ranges': [], 'other': False, 'result': '6130'},
+                     {'values': ['9512'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['9513'], 'ranges': [], 'other': False, 'result': '6110'}, {'values': ['9514'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['9515'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['9520'], 'ranges': [], 'other': False, 'result': '9499'}, {'values': ['9530'], 'ranges': [], 'other': False, 'result': '9500'},
+                     {'values': ['9591'], 'ranges': [], 'other': False, 'result': '9499'}, {'values': ['9592'], 'ranges': [], 'other': False, 'result': '9499'}, {'values': ['9599'], 'ranges': [], 'other': False, 'result': '9499'}, {'values': ['9600'], 'ranges': [], 'other': False, 'result': '9600'}, {'values': ['9700'], 'ranges': [], 'other': False, 'result': '9700'}, {'values': ['9999'], 'ranges': [], 'other': False, 'result': '9999'},
+                     {'values': [], 'ranges': [], 'other': True, 'result': '    '}]},
+ 'FISSPUR': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['0111'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['0112'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['0119'], 'ranges': [], 'other': False, 'result': '0110'}, {'values': ['0121'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['0122'], 'ranges': [], 'other': False, 'result': '0120'}, {'values': ['0129'], 'ranges': [], 'other': False, 'result': '0120'},
+                       {'values': ['0131'], 'ranges': [], 'other': False, 'result': '0131'}, {'values': ['0132'], 'ranges': [], 'other': False, 'result': '0132'}, {'values': ['0139'], 'ranges': [], 'other': False, 'result': '0139'}, {'values': ['0211'], 'ranges': [], 'other': False, 'result': '0211'}, {'values': ['0212'], 'ranges': [], 'other': False, 'result': '0212'}, {'values': ['0220'], 'ranges': [], 'other': False, 'result': '0200'},
+                       {'values': ['0230'], 'ranges': [], 'other': False, 'result': '0200'}, {'values': ['0311'], 'ranges': [], 'other': False, 'result': '0311'}, {'values': ['0312'], 'ranges': [], 'other': False, 'result': '0312'}, {'values': ['0313'], 'ranges': [], 'other': False, 'result': '0313'}, {'values': ['0314'], 'ranges': [], 'other': False, 'result': '0314'}, {'values': ['0315'], 'ranges': [], 'other': False, 'result': '0315'},
+                       {'values': ['0316'], 'ranges': [], 'other': False, 'result': '0316'}, {'values': ['0321'], 'ranges': [], 'other': False, 'result': '0321'}, {'values': ['0322'], 'ranges': [], 'other': False, 'result': '0322'}, {'values': ['0323'], 'ranges': [], 'other': False, 'result': '0323'}, {'values': ['0324'], 'ranges': [], 'other': False, 'result': '0324'}, {'values': ['0329'], 'ranges': [], 'other': False, 'result': '0329'},
+                       {'values': ['0410'], 'ranges': [], 'other': False, 'result': '0410'}, {'values': ['0420'], 'ranges': [], 'other': False, 'result': '0420'}, {'values': ['0430'], 'ranges': [], 'other': False, 'result': '0430'}]},
+ 'NEWSECT': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['1111'], 'ranges': [], 'other': False, 'result': '1111'}, {'values': ['1113'], 'ranges': [], 'other': False, 'result': '1113'}, {'values': ['1115'], 'ranges': [], 'other': False, 'result': '1115'}, {'values': ['1117'], 'ranges': [], 'other': False, 'result': '1117'}, {'values': ['1119'], 'ranges': [], 'other': False, 'result': '1119'}, {'values': ['1200'], 'ranges': [], 'other': False, 'result': '1200'},
+                       {'values': ['1300'], 'ranges': [], 'other': False, 'result': '1300'}, {'values': ['1400'], 'ranges': [], 'other': False, 'result': '1400'}, {'values': ['2100'], 'ranges': [], 'other': False, 'result': '2100'}, {'values': ['2210', '2220'], 'ranges': [], 'other': False, 'result': '2200'}, {'values': ['2301'], 'ranges': [], 'other': False, 'result': '2301'}, {'values': ['2303'], 'ranges': [], 'other': False, 'result': '2303'},
+                       {'values': ['2400'], 'ranges': [], 'other': False, 'result': '2400'}, {'values': ['2900'], 'ranges': [], 'other': False, 'result': '2900'}, {'values': ['3115'], 'ranges': [], 'other': False, 'result': '3115'}, {'values': ['3113'], 'ranges': [], 'other': False, 'result': '3113'}, {'values': ['3114'], 'ranges': [], 'other': False, 'result': '3114'}, {'values': ['3120'], 'ranges': [], 'other': False, 'result': '3120'},
+                       {'values': ['3211', '3212', '3219'], 'ranges': [], 'other': False, 'result': '3210'}, {'values': ['3221', '3222'], 'ranges': [], 'other': False, 'result': '3220'}, {'values': ['3231', '3232'], 'ranges': [], 'other': False, 'result': '3230'}, {'values': ['3241', '3242'], 'ranges': [], 'other': False, 'result': '3240'}, {'values': ['3250'], 'ranges': [], 'other': False, 'result': '3250'}, {'values': ['3271'], 'ranges': [], 'other': False, 'result': '3271'},
+                       {'values': ['3272'], 'ranges': [], 'other': False, 'result': '3272'}, {'values': ['3273'], 'ranges': [], 'other': False, 'result': '3273'}, {'values': ['3280'], 'ranges': [], 'other': False, 'result': '3280'}, {'values': ['3290'], 'ranges': [], 'other': False, 'result': '3290'}, {'values': ['3311', '3312', '3313'], 'ranges': [], 'other': False, 'result': '3310'}, {'values': ['3431', '3432', '3433'], 'ranges': [], 'other': False, 'result': '3430'},
+                       {'values': ['3551', '3552'], 'ranges': [], 'other': False, 'result': '3550'}, {'values': ['3611', '3619'], 'ranges': [], 'other': False, 'result': '3610'}, {'values': ['3710'], 'ranges': [], 'other': False, 'result': '3710'}, {'values': ['3721'], 'ranges': [], 'other': False, 'result': '3721'}, {'values': ['3731'], 'ranges': [], 'other': False, 'result': '3731'}, {'values': ['3732'], 'ranges': [], 'other': False, 'result': '3732'},
+                       {'values': ['3811'], 'ranges': [], 'other': False, 'result': '3811'}, {'values': ['3813'], 'ranges': [], 'other': False, 'result': '3813'}, {'values': ['3814'], 'ranges': [], 'other': False, 'result': '3814'}, {'values': ['3819'], 'ranges': [], 'other': False, 'result': '3819'}, {'values': ['3825'], 'ranges': [], 'other': False, 'result': '3825'}, {'values': ['3833'], 'ranges': [], 'other': False, 'result': '3833'},
+                       {'values': ['3834'], 'ranges': [], 'other': False, 'result': '3834'}, {'values': ['3835'], 'ranges': [], 'other': False, 'result': '3835'}, {'values': ['3842', '3843', '3844'], 'ranges': [], 'other': False, 'result': '3841'}, {'values': ['3851', '3852', '3853'], 'ranges': [], 'other': False, 'result': '3850'}, {'values': ['3861', '3862', '3863', '3864', '3865', '3866'], 'ranges': [], 'other': False, 'result': '3860'},
+                       {'values': ['3871', '3872', '3873'], 'ranges': [], 'other': False, 'result': '3870'}, {'values': ['3891', '3892', '3893', '3894'], 'ranges': [], 'other': False, 'result': '3890'}, {'values': ['3911'], 'ranges': [], 'other': False, 'result': '3911'}, {'values': ['3919'], 'ranges': [], 'other': False, 'result': '3919'}, {'values': ['3952'], 'ranges': [], 'other': False, 'result': '3952'}, {'values': ['3953'], 'ranges': [], 'other': False, 'result': '3953'},
+                       {'values': ['3955'], 'ranges': [], 'other': False, 'result': '3955'}, {'values': ['3956'], 'ranges': [], 'other': False, 'result': '3956'}, {'values': ['3957'], 'ranges': [], 'other': False, 'result': '3957'}, {'values': ['3960'], 'ranges': [], 'other': False, 'result': '3960'}, {'values': ['4010', '4020', '4030'], 'ranges': [], 'other': False, 'result': '4000'}, {'values': ['5001'], 'ranges': [], 'other': False, 'result': '5001'},
+                       {'values': ['5002'], 'ranges': [], 'other': False, 'result': '5002'}, {'values': ['5003'], 'ranges': [], 'other': False, 'result': '5003'}, {'values': ['5004'], 'ranges': [], 'other': False, 'result': '5004'}, {'values': ['5005'], 'ranges': [], 'other': False, 'result': '5005'}, {'values': ['5006'], 'ranges': [], 'other': False, 'result': '5006'}, {'values': ['5008'], 'ranges': [], 'other': False, 'result': '5008'},
+                       {'values': ['5020'], 'ranges': [], 'other': False, 'result': '5020'}, {'values': ['5030'], 'ranges': [], 'other': False, 'result': '5030'}, {'values': ['5040'], 'ranges': [], 'other': False, 'result': '5040'}, {'values': ['5050'], 'ranges': [], 'other': False, 'result': '5050'}, {'values': ['5999'], 'ranges': [], 'other': False, 'result': '5999'}, {'values': ['6110'], 'ranges': [], 'other': False, 'result': '6110'},
+                       {'values': ['6120'], 'ranges': [], 'other': False, 'result': '6120'}, {'values': ['6130'], 'ranges': [], 'other': False, 'result': '6130'}, {'values': ['6310', '6320'], 'ranges': [], 'other': False, 'result': '6300'}, {'values': ['7111'], 'ranges': [], 'other': False, 'result': '7111'}, {'values': ['7114'], 'ranges': [], 'other': False, 'result': '7114'}, {'values': ['7116'], 'ranges': [], 'other': False, 'result': '7116'},
+                       {'values': ['7117'], 'ranges': [], 'other': False, 'result': '7117'}, {'values': ['7122'], 'ranges': [], 'other': False, 'result': '7122'}, {'values': ['7124'], 'ranges': [], 'other': False, 'result': '7124'}, {'values': ['7131'], 'ranges': [], 'other': False, 'result': '7131'}, {'values': ['7132'], 'ranges': [], 'other': False, 'result': '7132'}, {'values': ['7133'], 'ranges': [], 'other': False, 'result': '7133'},
+                       {'values': ['7134'], 'ranges': [], 'other': False, 'result': '7134'}, {'values': ['7191'], 'ranges': [], 'other': False, 'result': '7191'}, {'values': ['7192'], 'ranges': [], 'other': False, 'result': '7192'}, {'values': ['7193'], 'ranges': [], 'other': False, 'result': '7193'}, {'values': ['7199'], 'ranges': [], 'other': False, 'result': '7199'}, {'values': ['7210'], 'ranges': [], 'other': False, 'result': '7210'},
+                       {'values': ['7220'], 'ranges': [], 'other': False, 'result': '7220'}, {'values': ['8110', '8120', '8130'], 'ranges': [], 'other': False, 'result': '8100'}, {'values': ['8310'], 'ranges': [], 'other': False, 'result': '8310'}, {'values': ['8321'], 'ranges': [], 'other': False, 'result': '8321'}, {'values': ['8331'], 'ranges': [], 'other': False, 'result': '8331'}, {'values': ['8333'], 'ranges': [], 'other': False, 'result': '8333'},
+                       {'values': ['8340'], 'ranges': [], 'other': False, 'result': '8340'}, {'values': ['8411'], 'ranges': [], 'other': False, 'result': '8411'}, {'values': ['8412'], 'ranges': [], 'other': False, 'result': '8412'}, {'values': ['8413'], 'ranges': [], 'other': False, 'result': '8413'}, {'values': ['8414'], 'ranges': [], 'other': False, 'result': '8414'}, {'values': ['8415'], 'ranges': [], 'other': False, 'result': '8415'},
+                       {'values': ['8416'], 'ranges': [], 'other': False, 'result': '8416'}, {'values': ['8420'], 'ranges': [], 'other': False, 'result': '8420'}, {'values': ['8911'], 'ranges': [], 'other': False, 'result': '8911'}, {'values': ['8912'], 'ranges': [], 'other': False, 'result': '8912'}, {'values': ['8913'], 'ranges': [], 'other': False, 'result': '8913'}, {'values': ['8921'], 'ranges': [], 'other': False, 'result': '8921'},
+                       {'values': ['8931'], 'ranges': [], 'other': False, 'result': '8931'}, {'values': ['8932'], 'ranges': [], 'other': False, 'result': '8932'}, {'values': ['8991'], 'ranges': [], 'other': False, 'result': '8991'}, {'values': ['8999'], 'ranges': [], 'other': False, 'result': '8999'}, {'values': ['9101', '9102', '9103'], 'ranges': [], 'other': False, 'result': '9100'}, {'values': ['9201', '9202', '9203'], 'ranges': [], 'other': False, 'result': '9200'},
+                       {'values': ['9311', '9312', '9313', '9314'], 'ranges': [], 'other': False, 'result': '9300'}, {'values': ['9431'], 'ranges': [], 'other': False, 'result': '9431'}, {'values': ['9433'], 'ranges': [], 'other': False, 'result': '9433'}, {'values': ['9434'], 'ranges': [], 'other': False, 'result': '9434'}, {'values': ['9500'], 'ranges': [], 'other': False, 'result': '9500'}, {'values': ['9600'], 'ranges': [], 'other': False, 'result': '9600'},
+                       {'values': ['9999'], 'ranges': [], 'other': False, 'result': '9999'}]},
+ 'VALIDSE': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['1111', '1112', '1113', '1114', '1115', '1116', '1117', '1119', '1120', '1130', '1150', '1200', '1300', '1400', '2100', '1140', '2210', '2220', '2301', '2302', '2303', '2400', '2900', '3110', '3111', '3112', '3113', '3114', '3115', '3120', '3211', '3212', '3219', '3221', '3222', '3231', '3232', '3241', '3242', '3250', '3271', '3272', '3273', '3280', '3290', '3311', '3312', '3313', '3431', '3432', '3433', '3551', '3552', '3611', '3619', '3710', '3720', '3721',
+                                   '3731', '3732', '3811', '3813', '3814', '3819', '3825', '3832', '3833', '3834', '3835', '3842', '3843', '3844', '3851', '3852', '3853', '3861', '3862', '3863', '3864', '3865', '3866', '3871', '3872', '3873', '3891', '3892', '3893', '3894', '3911', '3919', '3956', '3960', '3953', '3957', '3952', '3955', '4010', '4020', '4030', '5001', '5002', '5003', '5004', '5005', '5006', '5008', '5020', '5030', '5040', '5050', '5999', '6110', '6120', '6130', '6310', '6320',
+                                   '7111', '7112', '7113', '7114', '7115', '7116', '7117', '7121', '7122', '7123', '7124', '7131', '7132', '7133', '7134', '7191', '7192', '7193', '7199', '7210', '7220', '8110', '8120', '8130', '8310', '8320', '8321', '8331', '8332', '8333', '8340', '8411', '8412', '8413', '8414', '8415', '8416', '8420', '8910', '8911', '8912', '8913', '8914', '8920', '8921', '8922', '8931', '8932', '8991', '8999', '9101', '9102', '9103', '9201', '9202', '9203', '9311', '9312',
+                                   '9313', '9314', '9410', '9420', '9430', '9431', '9432', '9433', '9434', '9435', '9440', '9450', '9499', '9500', '9600', '9700', '9999'],
+                        'ranges': [],
+                        'other': False,
+                        'result': 'VALID'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': 'INVALID'}]},
+ 'LNFMT': {'kind': 'value',
+           'character': False,
+           'rules': [{'values': [15, 20, 100], 'ranges': [[4, 7], [25, 34], [60, 63], [70, 78]], 'other': False, 'result': 'LSTAFF'}, {'values': [124, 145, 147, 173, 200, 201, 204, 205], 'ranges': [[110, 119], [139, 142], [209, 220], [225, 228], [230, 248]], 'other': False, 'result': 'LHOUSE'}, {'values': [135, 136, 138], 'ranges': [], 'other': False, 'result': 'LBAEPL'}, {'values': [126, 127, 129, 359, 361, 363, 906, 907], 'ranges': [], 'other': False, 'result': 'LSWFSX'},
+                     {'values': [128, 130, 380, 381, 700, 705, 720, 725, 983, 993], 'ranges': [], 'other': False, 'result': 'LHPPRD'},
+                     {'values': [193, 914, 915, 919, 920, 925, 950, 951, 137, 143, 146, 170, 199, 120, 315, 320, 325, 330, 335, 340, 345, 348, 350, 360, 362, 364, 365, 390, 391, 500, 509, 510], 'ranges': [[180, 184], [900, 905], [908, 910], [159, 162], [194, 196], [300, 302], [304, 305], [309, 310], [355, 358], [504, 506], [515, 533], [555, 556], [559, 574]], 'other': False, 'result': 'LOT_OT'}, {'values': [], 'ranges': [], 'other': True, 'result': 'LOT_OT'}]},
+ 'LNLOB': {'kind': 'value',
+           'character': False,
+           'rules': [{'values': [193, 914, 915, 919, 920, 925, 950, 951, 906, 907], 'ranges': [[180, 184], [900, 905], [908, 910]], 'other': False, 'result': 'CORP'}, {'values': [128, 130, 380, 381, 700, 705, 720, 725, 983, 993], 'ranges': [], 'other': False, 'result': 'HPOP'},
+                     {'values': [15, 20, 100, 124, 145, 147, 173, 200, 201, 204, 205, 135, 136, 138, 126, 127, 129, 359, 361, 363, 120, 137, 143, 146, 170, 199, 315, 320, 325, 330, 335, 340, 345, 348, 350, 360, 362, 364, 365, 390, 391, 500, 509, 510],
+                      'ranges': [[4, 7], [25, 34], [60, 63], [70, 78], [110, 119], [139, 142], [209, 220], [225, 228], [230, 248], [159, 162], [194, 196], [300, 302], [304, 305], [309, 310], [355, 358], [504, 506], [515, 533], [555, 556], [559, 574]],
+                      'other': False,
+                      'result': 'RETL'},
+                     {'values': [], 'ranges': [], 'other': True, 'result': 'RETL'}]},
+ 'ODFMT': {'kind': 'value',
+           'character': False,
+           'rules': [{'values': [171, 172, 173], 'ranges': [], 'other': False, 'result': 'OFOREX'}, {'values': [147], 'ranges': [[126, 129], [144, 145]], 'other': False, 'result': 'OOTHER'}, {'values': [113], 'ranges': [[177, 178]], 'other': False, 'result': 'LSHMRG'}, {'values': [106, 135, 148, 189], 'ranges': [[50, 65], [66, 69], [87, 91], [93, 95], [100, 103], [108, 112], [114, 125], [137, 138], [150, 167], [169, 170], [174, 176], [179, 182], [191, 198]], 'other': False, 'result': 'LOT_OT'},
+                     {'values': [], 'ranges': [], 'other': True, 'result': 'LOT_OT'}]},
+ 'ODLOB': {'kind': 'value',
+           'character': False,
+           'rules': [{'values': [171, 172, 173], 'ranges': [], 'other': False, 'result': 'TREA'}, {'values': [147], 'ranges': [], 'other': False, 'result': 'HDOF'}, {'values': [], 'ranges': [[50, 65]], 'other': False, 'result': 'CORP'}, {'values': [113, 106, 135, 148, 189], 'ranges': [[126, 129], [144, 145], [177, 178], [66, 69], [87, 91], [93, 95], [100, 103], [108, 112], [114, 125], [137, 138], [150, 167], [169, 170], [174, 176], [179, 182], [191, 198]], 'other': False, 'result': 'RETL'},
+                     {'values': [], 'ranges': [], 'other': True, 'result': 'RETL'}]},
+ 'HPCC': {'kind': 'value',
+          'character': False,
+          'rules': [{'values': [800], 'ranges': [], 'other': False, 'result': 'H024'}, {'values': [801], 'ranges': [], 'other': False, 'result': 'H204'}, {'values': [802], 'ranges': [], 'other': False, 'result': 'H053'}, {'values': [803], 'ranges': [], 'other': False, 'result': 'H228'}, {'values': [804], 'ranges': [], 'other': False, 'result': 'H007'}, {'values': [805], 'ranges': [], 'other': False, 'result': 'H110'}, {'values': [806], 'ranges': [], 'other': False, 'result': 'H238'},
+                    {'values': [807], 'ranges': [], 'other': False, 'result': 'H231'}, {'values': [808], 'ranges': [], 'other': False, 'result': 'H266'}, {'values': [809], 'ranges': [], 'other': False, 'result': 'H005'}, {'values': [811], 'ranges': [], 'other': False, 'result': 'H168'}, {'values': [812], 'ranges': [], 'other': False, 'result': 'H002'}, {'values': [813], 'ranges': [], 'other': False, 'result': 'H185'}, {'values': [814], 'ranges': [], 'other': False, 'result': 'H268'},
+                    {'values': [815], 'ranges': [], 'other': False, 'result': 'H125'}, {'values': [816], 'ranges': [], 'other': False, 'result': 'H124'}, {'values': [817], 'ranges': [], 'other': False, 'result': 'H006'}, {'values': [818], 'ranges': [], 'other': False, 'result': 'H040'}, {'values': [819], 'ranges': [], 'other': False, 'result': 'H264'}, {'values': [820], 'ranges': [], 'other': False, 'result': 'H135'}, {'values': [821], 'ranges': [], 'other': False, 'result': 'H094'},
+                    {'values': [822], 'ranges': [], 'other': False, 'result': 'H151'}, {'values': [823], 'ranges': [], 'other': False, 'result': 'H123'}, {'values': [824], 'ranges': [], 'other': False, 'result': 'H057'}, {'values': [825], 'ranges': [], 'other': False, 'result': 'H270'}, {'values': [826], 'ranges': [], 'other': False, 'result': 'H042'}, {'values': [827], 'ranges': [], 'other': False, 'result': 'H277'}, {'values': [828], 'ranges': [], 'other': False, 'result': 'H225'},
+                    {'values': [844], 'ranges': [], 'other': False, 'result': 'H034'}, {'values': [845], 'ranges': [], 'other': False, 'result': 'H055'}, {'values': [846], 'ranges': [], 'other': False, 'result': 'H044'}, {'values': [847], 'ranges': [], 'other': False, 'result': 'H283'}, {'values': [848], 'ranges': [], 'other': False, 'result': 'H090'}, {'values': [849], 'ranges': [], 'other': False, 'result': 'H050'}, {'values': [850], 'ranges': [], 'other': False, 'result': 'H273'},
+                    {'values': [851], 'ranges': [], 'other': False, 'result': 'H043'}, {'values': [852], 'ranges': [], 'other': False, 'result': 'H091'}, {'values': [853], 'ranges': [], 'other': False, 'result': 'H021'}, {'values': [854], 'ranges': [], 'other': False, 'result': 'H224'}, {'values': [855], 'ranges': [], 'other': False, 'result': 'H061'}, {'values': [856], 'ranges': [], 'other': False, 'result': 'H202'}, {'values': [857], 'ranges': [], 'other': False, 'result': 'H209'},
+                    {'values': [858], 'ranges': [], 'other': False, 'result': 'H113'}, {'values': [859], 'ranges': [], 'other': False, 'result': 'H249'}, {'values': [860], 'ranges': [], 'other': False, 'result': 'H095'}, {'values': [861], 'ranges': [], 'other': False, 'result': 'H047'}, {'values': [862], 'ranges': [], 'other': False, 'result': 'H030'}, {'values': [863], 'ranges': [], 'other': False, 'result': 'H233'}]},
+ 'STATEPOST': {'kind': 'value',
+               'character': True,
+               'rules': [{'values': ['79000', '79050', '79100', '79150', '79200', '79250', '79502', '79503', '79504', '79505', '79511', '79513', '79514', '79517', '79518', '79520', '79521', '79523', '79532', '79538', '79540', '79546', '79548', '79550', '79552', '79555', '79570', '79575', '79576', '79592', '79601', '79603', '79605', '79606', '79612', '79626', '79630', '79632', '79646', '79658', '79660', '79680', '79681', '79683', '80000', '80050', '80100', '80150', '80200', '80250', '80300',
+                                     '80350', '80400', '80500', '80506', '80508', '80516', '80519', '80534', '80536', '80542', '80546', '80558', '80560', '80564', '80568', '80578', '80584', '80586', '80590', '80592', '80594', '80596', '80600', '80604', '80608', '80620', '80622', '80628', '80644', '80648', '80662', '80664', '80668', '80670', '80672', '80673', '80676', '80700', '80710', '80720', '80730', '80900', '80902', '80904', '80906', '80908', '80988', '80990', '81000', '81100', '81200',
+                                     '81300', '81310', '81400', '81440', '81450', '81500', '81550', '81600', '81700', '81750', '81800', '81850', '81900', '81920', '81930', '82000', '82100', '82200', '82300', '83000', '83100', '83200', '83300', '83400', '83500', '83600', '83700', '84000', '84150', '84200', '84300', '84400', '84500', '84600', '84700', '84800', '84900', '85000', '85100', '85200', '85300', '85400', '86000', '86100', '86200', '86300', '86400', '86500', '86600', '86700', '86800',
+                                     '86810', '86888', '86900'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'J'},
+                         {'values': ['05000', '05050', '05100', '05150', '05200', '05250', '05300', '05350', '05400', '05460', '05500', '05502', '05503', '05504', '05505', '05506', '05508', '05512', '05514', '05516', '05517', '05518', '05520', '05532', '05534', '05536', '05538', '05550', '05551', '05552', '05556', '05558', '05560', '05564', '05576', '05578', '05580', '05582', '05586', '05590', '05592', '05594', '05600', '05604', '05610', '05612', '05614', '05620', '05621', '05622', '05626',
+                                     '05628', '05630', '05632', '05644', '05660', '05661', '05664', '05670', '05672', '05673', '05674', '05675', '05676', '05680', '05690', '05696', '05700', '05710', '05720', '05990', '06000', '06007', '06009', '06010', '06050', '06100', '06150', '06200', '06207', '06209', '06250', '06300', '06350', '06400', '06500', '06507', '06509', '06550', '06570', '06600', '06650', '06660', '06700', '06707', '06709', '06710', '06720', '06750', '06760', '06800', '06900',
+                                     '06910', '07000', '07007', '07009', '08000', '08007', '08009', '08010', '08100', '08110', '08200', '08210', '08300', '08320', '08330', '08340', '08400', '08407', '08409', '08500', '08507', '08509', '08600', '08700', '08800', '09000', '09007', '09009', '09010', '09020', '09100', '09110', '09120', '09130', '09200', '09300', '09310', '09400', '09410', '09600', '09700', '09800', '09810', '14290', '14390', '34950'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'K'},
+                         {'values': ['15000', '15050', '15100', '15150', '15159', '15200', '15300', '15350', '15400', '15500', '15502', '15503', '15504', '15505', '15506', '15508', '15512', '15514', '15516', '15517', '15518', '15519', '15520', '15524', '15529', '15532', '15534', '15536', '15538', '15540', '15546', '15548', '15550', '15551', '15556', '15558', '15560', '15564', '15570', '15572', '15576', '15578', '15582', '15586', '15590', '15592', '15594', '15596', '15600', '15604', '15608',
+                                     '15609', '15612', '15614', '15616', '15622', '15623', '15626', '15628', '15630', '15632', '15634', '15644', '15646', '15648', '15658', '15660', '15661', '15664', '15670', '15672', '15673', '15674', '15676', '15680', '15690', '15710', '15720', '15730', '15740', '15988', '15990', '16010', '16020', '16030', '16040', '16050', '16060', '16070', '16080', '16090', '16100', '16109', '16150', '16200', '16210', '16250', '16300', '16310', '16320', '16400', '16450',
+                                     '16500', '16600', '16700', '16800', '16810', '17000', '17007', '17009', '17010', '17020', '17030', '17040', '17050', '17060', '17070', '17200', '17500', '17507', '17509', '17510', '17600', '17610', '17700', '18000', '18050', '18200', '18300', '18400', '18500'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'D'},
+                         {'values': ['75000', '75050', '75100', '75150', '75200', '75250', '75260', '75300', '75350', '75400', '75450', '75460', '75500', '75502', '75503', '75504', '75505', '75506', '75508', '75510', '75512', '75514', '75516', '75517', '75518', '75519', '75532', '75536', '75538', '75540', '75542', '75546', '75550', '75551', '75552', '75560', '75564', '75566', '75570', '75572', '75576', '75578', '75582', '75584', '75586', '75590', '75592', '75594', '75596', '75600', '75604',
+                                     '75606', '75608', '75609', '75610', '75612', '75618', '75620', '75622', '75626', '75628', '75630', '75632', '75646', '75648', '75662', '75670', '75672', '75673', '75674', '75676', '75690', '75700', '75710', '75720', '75730', '75740', '75750', '75760', '75900', '75902', '75904', '75906', '75908', '75910', '75912', '75914', '75916', '75918', '75990', '76100', '76109', '76200', '76300', '76400', '76409', '76450', '77000', '77007', '77008', '77009', '77100',
+                                     '77109', '77200', '77300', '77309', '77400', '77409', '77500', '78000', '78009', '78100', '78200', '78300', '78307', '78309'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'M'},
+                         {'values': ['70000', '70100', '70200', '70300', '70400', '70450', '70500', '70502', '70503', '70504', '70505', '70506', '70508', '70512', '70516', '70517', '70518', '70532', '70534', '70536', '70540', '70546', '70548', '70550', '70551', '70558', '70560', '70564', '70570', '70572', '70576', '70578', '70582', '70586', '70590', '70592', '70594', '70596', '70600', '70604', '70606', '70608', '70609', '70610', '70620', '70626', '70628', '70632', '70634', '70644', '70646',
+                                     '70648', '70658', '70664', '70670', '70672', '70673', '70674', '70676', '70690', '70700', '70710', '70720', '70730', '70740', '70750', '70990', '71000', '71007', '71009', '71010', '71050', '71059', '71100', '71109', '71150', '71159', '71200', '71209', '71250', '71259', '71300', '71309', '71350', '71359', '71400', '71409', '71450', '71459', '71500', '71509', '71550', '71559', '71600', '71609', '71650', '71659', '71700', '71707', '71709', '71750', '71759',
+                                     '71760', '71770', '71800', '71807', '71809', '71900', '71907', '71909', '71950', '71960', '72000', '72007', '72009', '72100', '72107', '72109', '72120', '72127', '72129', '72200', '72207', '72209', '72300', '72307', '72309', '72400', '72409', '72500', '72507', '72509', '73000', '73007', '73009', '73100', '73109', '73200', '73207', '73209', '73300', '73309', '73400', '73409', '73420', '73430', '73440', '73450', '73460', '73470', '73480', '73500', '73507',
+                                     '73509'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'N'},
+                         {'values': ['25000', '25050', '25100', '25150', '25200', '25250', '25300', '25350', '25500', '25502', '25503', '25504', '25505', '25506', '25508', '25509', '25512', '25514', '25516', '25517', '25518', '25520', '25524', '25529', '25532', '25534', '25536', '25538', '25540', '25546', '25548', '25550', '25551', '25552', '25556', '25558', '25560', '25564', '25570', '25576', '25578', '25582', '25584', '25586', '25590', '25592', '25594', '25596', '25598', '25600', '25604',
+                                     '25606', '25608', '25609', '25610', '25612', '25614', '25620', '25622', '25626', '25628', '25630', '25632', '25644', '25646', '25648', '25656', '25660', '25661', '25662', '25670', '25672', '25673', '25674', '25676', '25690', '25700', '25710', '25720', '25730', '25740', '25750', '25990', '26010', '26040', '26050', '26060', '26070', '26080', '26090', '26100', '26140', '26150', '26180', '26190', '26200', '26250', '26300', '26310', '26320', '26330', '26340',
+                                     '26350', '26360', '26370', '26400', '26410', '26420', '26430', '26440', '26450', '26460', '26485', '26490', '26500', '26600', '26607', '26609', '26610', '26620', '26630', '26640', '26650', '26660', '26680', '26690', '26700', '26800', '26810', '26820', '26900', '27000', '27010', '27020', '27030', '27040', '27050', '27060', '27070', '27090', '27100', '27150', '27200', '27207', '27209', '27210', '27300', '27310', '27400', '27600', '27607', '27609', '27610',
+                                     '27620', '27630', '27650', '27660', '27670', '28000', '28007', '28009', '28010', '28020', '28030', '28040', '28050', '28100', '28200', '28300', '28310', '28320', '28330', '28340', '28380', '28400', '28407', '28409', '28500', '28600', '28610', '28620', '28700', '28707', '28709', '28730', '28740', '28750', '28800', '39000', '39007', '39009', '39010', '39100', '39200', '49000', '69000'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'C'},
+                         {'values': ['30000', '30010', '30020', '30100', '30200', '30250', '30300', '30350', '30450', '30500', '30502', '30503', '30504', '30505', '30506', '30508', '30510', '30512', '30516', '30517', '30518', '30519', '30520', '30524', '30532', '30534', '30536', '30540', '30542', '30546', '30548', '30550', '30551', '30552', '30554', '30556', '30560', '30564', '30570', '30576', '30580', '30582', '30586', '30590', '30592', '30594', '30596', '30600', '30604', '30606', '30609',
+                                     '30610', '30612', '30614', '30620', '30621', '30622', '30626', '30628', '30630', '30632', '30634', '30644', '30646', '30648', '30656', '30658', '30660', '30661', '30662', '30664', '30668', '30670', '30673', '30674', '30676', '30682', '30690', '30700', '30710', '30720', '30730', '30740', '30750', '30760', '30770', '30780', '30790', '30800', '30810', '30820', '30830', '30840', '30900', '30902', '30904', '30906', '30908', '30910', '30912', '30988', '30990',
+                                     '31000', '31007', '31009', '31050', '31100', '31150', '31200', '31250', '31300', '31350', '31400', '31407', '31409', '31450', '31500', '31550', '31560', '31600', '31610', '31650', '31700', '31750', '31800', '31850', '31900', '31907', '31909', '31910', '31920', '31950', '32000', '32040', '32100', '32200', '32300', '32400', '32500', '32600', '32610', '32700', '32800', '32900', '33000', '33007', '33009', '33010', '33020', '33030', '33040', '33100', '33200',
+                                     '33300', '33310', '33320', '33400', '33410', '33420', '33500', '33600', '33700', '33800', '34000', '34007', '34008', '34009', '34010', '34020', '34030', '34100', '34120', '34130', '34140', '34200', '34250', '34300', '34310', '34350', '34400', '34500', '34510', '34520', '34600', '34650', '34700', '34750', '34800', '34850', '34900', '35000', '35007', '35009', '35300', '35350', '35400', '35500', '35600', '35700', '35800', '35820', '35900', '35907', '35909',
+                                     '35910', '35950', '36000', '36007', '36008', '36009', '36010', '36020', '36030', '36100', '36110', '36200', '36207', '36209', '36300', '36307', '36309', '36400', '36500', '36600', '36700', '36750', '36800', '36810'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'A'},
+                         {'values': ['01000', '01007', '01009', '01500', '01502', '01503', '01504', '01505', '01506', '01508', '01512', '01514', '01516', '01517', '01518', '01524', '01529', '01532', '01538', '01540', '01546', '01550', '01551', '01556', '01560', '01564', '01570', '01572', '01576', '01578', '01582', '01586', '01590', '01592', '01594', '01596', '01598', '01600', '01604', '01606', '01608', '01609', '01610', '01612', '01614', '01620', '01622', '01626', '01628', '01630', '01632',
+                                     '01634', '01644', '01646', '01648', '01660', '01664', '01670', '01672', '01673', '01674', '01676', '01680', '01694', '02000', '02100', '02200', '02400', '02450', '02500', '02600', '02607', '02609', '02700', '02707', '02709', '02800'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'R'},
+                         {'values': ['10000', '10050', '10100', '10150', '10200', '10250', '10300', '10350', '10400', '10450', '10460', '10470', '10500', '10502', '10503', '10504', '10505', '10506', '10508', '10512', '10514', '10516', '10518', '10524', '10534', '10538', '10540', '10542', '10546', '10550', '10551', '10552', '10558', '10560', '10564', '10566', '10570', '10576', '10578', '10582', '10590', '10592', '10593', '10594', '10596', '10600', '10604', '10609', '10610', '10612', '10620',
+                                     '10622', '10626', '10628', '10634', '10646', '10648', '10660', '10661', '10662', '10670', '10672', '10673', '10674', '10676', '10690', '10710', '10720', '10730', '10740', '10750', '10760', '10770', '10780', '10790', '10800', '10810', '10820', '10830', '10840', '10850', '10910', '10920', '10990', '11000', '11010', '11020', '11050', '11060', '11100', '11200', '11300', '11400', '11409', '11500', '11600', '11609', '11700', '11800', '11900', '11910', '11920',
+                                     '11950', '11960', '12000', '12100', '12200', '12300', '12700', '12710', '12720', '12990', '13000', '13009', '13020', '13050', '13100', '13110', '13200', '13210', '13220', '13300', '13310', '13400', '13409', '13500', '13600', '13700', '13800', '14000', '14007', '14009', '14020', '14100', '14101', '14110', '14120', '14200', '14300', '14310', '14320', '14400'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'P'},
+                         {'values': ['88000', '88100', '88200', '88300', '88400', '88450', '88460', '88500', '88502', '88504', '88505', '88506', '88508', '88510', '88512', '88514', '88516', '88518', '88520', '88526', '88527', '88532', '88534', '88538', '88540', '88546', '88550', '88551', '88552', '88554', '88556', '88558', '88560', '88562', '88564', '88566', '88568', '88570', '88572', '88576', '88580', '88582', '88586', '88590', '88592', '88594', '88596', '88598', '88600', '88602', '88604',
+                                     '88606', '88608', '88609', '88610', '88612', '88614', '88617', '88618', '88620', '88621', '88622', '88624', '88626', '88628', '88630', '88632', '88634', '88644', '88646', '88648', '88656', '88658', '88660', '88661', '88662', '88670', '88672', '88673', '88675', '88676', '88680', '88690', '88700', '88721', '88722', '88723', '88724', '88725', '88757', '88758', '88759', '88760', '88761', '88762', '88763', '88764', '88765', '88766', '88767', '88768', '88769',
+                                     '88770', '88771', '88772', '88773', '88774', '88775', '88776', '88777', '88778', '88779', '88780', '88781', '88782', '88783', '88784', '88785', '88786', '88787', '88788', '88789', '88790', '88800', '88801', '88802', '88803', '88804', '88805', '88806', '88807', '88808', '88809', '88810', '88811', '88812', '88813', '88814', '88815', '88816', '88817', '88818', '88819', '88820', '88821', '88822', '88823', '88824', '88825', '88826', '88827', '88828', '88829',
+                                     '88830', '88831', '88832', '88833', '88834', '88835', '88836', '88837', '88838', '88839', '88840', '88841', '88842', '88843', '88844', '88845', '88846', '88847', '88848', '88849', '88850', '88851', '88852', '88853', '88854', '88855', '88856', '88857', '88858', '88860', '88861', '88862', '88863', '88865', '88866', '88867', '88868', '88869', '88870', '88871', '88872', '88873', '88874', '88875', '88900', '88901', '88902', '88903', '88904', '88905', '88906',
+                                     '88988', '88990', '88991', '88992', '88993', '88994', '88995', '88996', '88997', '88998', '88999', '89000', '89007', '89008', '89009', '89050', '89057', '89058', '89059', '89100', '89107', '89108', '89109', '89130', '89137', '89138', '89139', '89150', '89157', '89158', '89159', '89200', '89207', '89208', '89209', '89250', '89257', '89258', '89259', '89260', '89300', '89307', '89308', '89309', '89320', '89327', '89328', '89329', '89330', '89337', '89338',
+                                     '89339', '89500', '89507', '89508', '89509', '89600', '89607', '89608', '89609', '89650', '89657', '89658', '89659', '89700', '89707', '89708', '89709', '89720', '89727', '89728', '89729', '89740', '89747', '89748', '89749', '89760', '89767', '89768', '89769', '89800', '89807', '89808', '89809', '89850', '89857', '89858', '89859', '89900', '89907', '89908', '89909', '89950', '89957', '89958', '89959', '90000', '90009', '90100', '90107', '90109', '90200',
+                                     '90300', '90307', '90400', '90700', '90701', '90702', '90703', '90704', '90705', '90706', '90707', '90708', '90709', '90711', '90712', '90713', '90714', '90715', '90716', '90717', '90718', '90719', '90720', '90721', '90722', '90723', '90724', '90725', '90726', '90727', '90728', '90729', '90730', '90731', '90732', '90733', '90734', '90735', '90736', '90737', '90738', '90739', '90740', '90741', '91000', '91007', '91008', '91009', '91010', '91011', '91012',
+                                     '91013', '91014', '91015', '91016', '91017', '91018', '91019', '91020', '91021', '91022', '91023', '91024', '91025', '91026', '91027', '91028', '91029', '91030', '91031', '91032', '91033', '91034', '91035', '91100', '91109', '91110', '91111', '91112', '91113', '91114', '91115', '91116', '91117', '91118', '91119', '91120', '91121', '91122', '91123', '91124', '91125', '91126', '91127', '91128', '91150', '91200', '91207', '91209', '91300', '91307', '91308',
+                                     '91309'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'S'},
+                         {'values': ['93000', '93010', '93050', '93100', '93150', '93200', '93250', '93300', '93350', '93400', '93450', '93500', '93502', '93503', '93504', '93505', '93506', '93507', '93508', '93514', '93516', '93517', '93518', '93519', '93520', '93527', '93529', '93532', '93540', '93550', '93551', '93552', '93554', '93556', '93558', '93560', '93564', '93566', '93570', '93572', '93576', '93578', '93582', '93586', '93590', '93592', '93594', '93596', '93600', '93604', '93606',
+                                     '93608', '93609', '93610', '93612', '93614', '93618', '93619', '93620', '93626', '93628', '93632', '93634', '93648', '93658', '93660', '93661', '93662', '93670', '93672', '93677', '93690', '93694', '93700', '93702', '93704', '93706', '93708', '93710', '93712', '93714', '93716', '93718', '93720', '93722', '93724', '93726', '93728', '93730', '93732', '93734', '93736', '93738', '93740', '93742', '93744', '93746', '93748', '93750', '93752', '93754', '93756',
+                                     '93758', '93760', '93762', '93764', '93900', '93902', '93904', '93906', '93908', '93910', '93912', '93914', '93916', '93990', '94000', '94007', '94009', '94200', '94300', '94500', '94507', '94509', '94600', '94650', '94700', '94707', '94709', '94750', '94760', '94800', '94807', '94809', '94850', '94900', '94950', '95000', '95007', '95008', '95009', '95300', '95400', '95407', '95409', '95500', '95600', '95700', '95707', '95709', '95800', '95900', '96000',
+                                     '96007', '96008', '96009', '96100', '96107', '96108', '96109', '96150', '96200', '96250', '96300', '96307', '96309', '96350', '96400', '96410', '96500', '96507', '96508', '96509', '96600', '96700', '96707', '96709', '96800', '96807', '96809', '96850', '96900', '96950', '97000', '97007', '97008', '97009', '97010', '97011', '97012', '97013', '97014', '97015', '97100', '97200', '97300', '98000', '98007', '98008', '98009', '98050', '98057', '98058', '98059',
+                                     '98100', '98107', '98109', '98150', '98157', '98159', '98200', '98300', '98700', '98707', '98708', '98709', '98750', '98800', '98850', '98857', '98859'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'Q'},
+                         {'values': ['40000', '40100', '40150', '40160', '40170', '40200', '40300', '40400', '40450', '40460', '40470', '40500', '40502', '40503', '40505', '40512', '40517', '40520', '40529', '40542', '40548', '40550', '40551', '40560', '40564', '40570', '40572', '40576', '40578', '40582', '40590', '40592', '40594', '40596', '40598', '40604', '40607', '40608', '40610', '40612', '40620', '40622', '40626', '40632', '40646', '40648', '40660', '40664', '40670', '40672', '40673',
+                                     '40674', '40675', '40676', '40680', '40690', '40700', '40702', '40704', '40706', '40708', '40710', '40712', '40714', '40716', '40718', '40720', '40722', '40724', '40726', '40728', '40730', '40732', '40800', '40802', '40804', '40806', '40808', '40810', '40990', '41000', '41050', '41100', '41150', '41200', '41250', '41300', '41400', '41506', '41560', '41586', '41672', '41700', '41710', '41720', '41900', '41902', '41904', '41906', '41908', '41910', '41912',
+                                     '41914', '41916', '41918', '41990', '42000', '42009', '42100', '42200', '42300', '42425', '42500', '42507', '42509', '42600', '42610', '42700', '42800', '42920', '42940', '42960', '43000', '43007', '43009', '43100', '43200', '43207', '43300', '43400', '43500', '43558', '43600', '43650', '43700', '43800', '43807', '43900', '43950', '44000', '44010', '44020', '44100', '44110', '44200', '44300', '45000', '45100', '45200', '45207', '45209', '45300', '45400',
+                                     '45500', '45600', '45607', '45609', '45620', '45700', '45800', '46000', '46050', '46100', '46150', '46200', '46300', '46350', '46400', '46506', '46547', '46549', '46551', '46564', '46582', '46598', '46662', '46667', '46668', '46672', '46675', '46700', '46710', '46720', '46730', '46740', '46750', '46760', '46770', '46780', '46781', '46782', '46783', '46784', '46785', '46786', '46787', '46788', '46789', '46790', '46791', '46792', '46793', '46794', '46795',
+                                     '46796', '46797', '46798', '46799', '46800', '46801', '46802', '46803', '46804', '46805', '46806', '46860', '46870', '46960', '46962', '46964', '46966', '46968', '46970', '46972', '46974', '46976', '46978', '47000', '47100', '47110', '47120', '47130', '47140', '47150', '47160', '47170', '47180', '47190', '47200', '47300', '47301', '47307', '47308', '47400', '47410', '47500', '47507', '47600', '47610', '47620', '47630', '47640', '47650', '47800', '47810',
+                                     '47820', '47830', '48000', '48010', '48020', '48050', '48100', '48200', '48300', '63000', '63100', '63200', '63300', '64000', '68000', '68100'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'B'},
+                         {'values': ['20000', '20050', '20100', '20200', '20300', '20400', '20500', '20502', '20503', '20504', '20505', '20506', '20508', '20512', '20514', '20516', '20517', '20518', '20519', '20520', '20532', '20534', '20536', '20538', '20540', '20542', '20546', '20548', '20550', '20551', '20552', '20554', '20556', '20560', '20564', '20566', '20568', '20570', '20572', '20576', '20578', '20582', '20586', '20590', '20592', '20596', '20600', '20604', '20606', '20608', '20609',
+                                     '20610', '20612', '20614', '20618', '20620', '20622', '20626', '20628', '20630', '20632', '20646', '20648', '20656', '20658', '20660', '20661', '20662', '20664', '20668', '20670', '20672', '20673', '20674', '20676', '20680', '20690', '20698', '20700', '20710', '20720', '20900', '20902', '20904', '20906', '20908', '20910', '20912', '20914', '20916', '20918', '20920', '20922', '20924', '20926', '20928', '20930', '20990', '21000', '21009', '21010', '21020',
+                                     '21030', '21040', '21060', '21070', '21080', '21090', '21100', '21109', '21200', '21209', '21210', '21220', '21300', '21309', '21400', '21450', '21500', '21600', '21610', '21700', '21800', '21810', '21820', '22000', '22010', '22020', '22100', '22107', '22109', '22110', '22120', '22200', '22300', '22307', '22309', '23000', '23007', '23009', '23050', '23100', '23200', '23300', '23400', '24000', '24007', '24009', '24050', '24060', '24100', '24107', '24109',
+                                     '24200', '24207', '24209', '24300'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'T'},
+                         {'values': ['50000', '50050', '50088', '50100', '50150', '50200', '50250', '50300', '50350', '50400', '50450', '50460', '50470', '50480', '50490', '50500', '50502', '50504', '50505', '50506', '50507', '50508', '50512', '50514', '50515', '50519', '50528', '50529', '50530', '50532', '50534', '50536', '50540', '50544', '50546', '50548', '50550', '50551', '50552', '50554', '50556', '50560', '50562', '50564', '50566', '50568', '50572', '50576', '50578', '50580', '50582',
+                                     '50586', '50588', '50590', '50592', '50594', '50596', '50598', '50599', '50600', '50603', '50604', '50605', '50608', '50609', '50610', '50612', '50614', '50620', '50621', '50622', '50623', '50626', '50632', '50634', '50636', '50638', '50640', '50642', '50644', '50646', '50648', '50650', '50652', '50653', '50656', '50658', '50660', '50661', '50662', '50664', '50666', '50668', '50670', '50672', '50673', '50676', '50677', '50678', '50680', '50682', '50684',
+                                     '50688', '50694', '50700', '50702', '50704', '50706', '50708', '50710', '50712', '50714', '50716', '50718', '50720', '50722', '50724', '50726', '50728', '50730', '50732', '50734', '50736', '50738', '50740', '50742', '50744', '50746', '50748', '50750', '50752', '50754', '50758', '50760', '50762', '50764', '50766', '50768', '50770', '50772', '50774', '50776', '50778', '50780', '50782', '50784', '50786', '50788', '50790', '50792', '50794', '50796', '50798',
+                                     '50800', '50802', '50804', '50806', '50808', '50810', '50812', '50814', '50816', '50818', '50901', '50902', '50903', '50904', '50906', '50907', '50908', '50909', '50910', '50911', '50912', '50913', '50914', '50915', '50916', '50917', '50918', '50919', '50920', '50921', '50922', '50923', '50924', '50925', '50926', '50927', '50928', '50929', '50930', '50931', '50932', '50933', '50934', '50935', '50936', '50937', '50938', '50939', '50940', '50941', '50942',
+                                     '50943', '50944', '50945', '50946', '50947', '50948', '50949', '50950', '50988', '50989', '50990', '51000', '51100', '51200', '51700', '51990', '52000', '52100', '52200', '53000', '53100', '53200', '53300', '53700', '53800', '53990', '54000', '54100', '54200', '55000', '55100', '55200', '55300', '55700', '55710', '55720', '55900', '55902', '55904', '55906', '55908', '55910', '55912', '55914', '55916', '55918', '55920', '55922', '55924', '55926', '55928',
+                                     '55930', '55932', '55934', '55990', '56000', '56100', '57000', '57100', '57700', '57990', '58000', '58100', '58200', '58700', '58990', '59000', '59100', '59200', '59700', '59800', '59990', '60000', '62000', '62007', '62050', '62100', '62150', '62200', '62250', '62300', '62502', '62504', '62505', '62506', '62510', '62512', '62514', '62516', '62517', '62518', '62519', '62520', '62522', '62524', '62526', '62527', '62530', '62532', '62536', '62540', '62542',
+                                     '62546', '62550', '62551', '62570', '62574', '62576', '62582', '62584', '62590', '62592', '62596', '62602', '62604', '62605', '62606', '62616', '62618', '62620', '62623', '62624', '62628', '62630', '62632', '62648', '62652', '62654', '62662', '62668', '62670', '62674', '62675', '62676', '62677', '62686', '62692', '62988'],
+                          'ranges': [],
+                          'other': False,
+                          'result': 'W'},
+                         {'values': ['87000', '87010', '87011', '87012', '87013', '87014', '87015', '87016', '87017', '87018', '87019', '87020', '87021', '87022', '87023', '87024', '87025', '87026', '87027', '87028', '87029', '87030', '87031', '87032', '87033'], 'ranges': [], 'other': False, 'result': 'L'}]}}
+
+PBBELF_FORMATS = {'BRCHCD': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': [1], 'ranges': [[7000, 9000], [9994, 9996], [9998, 9999]], 'other': False, 'result': 'HOE'}, {'values': [3999], 'ranges': [[3000, 3001]], 'other': False, 'result': 'IBU'}, {'values': [], 'ranges': [[4000, 4999]], 'other': False, 'result': 'IBU'}, {'values': [800, 3800], 'ranges': [], 'other': False, 'result': 'H01'}, {'values': [801, 3801], 'ranges': [], 'other': False, 'result': 'H02'}, {'values': [802, 3802], 'ranges': [], 'other': False, 'result': 'H03'},
+                      {'values': [803, 3803], 'ranges': [], 'other': False, 'result': 'H04'}, {'values': [804, 3804], 'ranges': [], 'other': False, 'result': 'H05'}, {'values': [805, 3805], 'ranges': [], 'other': False, 'result': 'H06'}, {'values': [806, 3806], 'ranges': [], 'other': False, 'result': 'H07'}, {'values': [807, 3807], 'ranges': [], 'other': False, 'result': 'H08'}, {'values': [808, 3808], 'ranges': [], 'other': False, 'result': 'H09'},
+                      {'values': [809, 3809], 'ranges': [], 'other': False, 'result': 'H10'}, {'values': [811, 3811], 'ranges': [], 'other': False, 'result': 'H11'}, {'values': [812, 3812], 'ranges': [], 'other': False, 'result': 'H12'}, {'values': [813, 3813], 'ranges': [], 'other': False, 'result': 'H13'}, {'values': [814, 3814], 'ranges': [], 'other': False, 'result': 'H14'}, {'values': [815, 3815], 'ranges': [], 'other': False, 'result': 'H15'},
+                      {'values': [816, 3816], 'ranges': [], 'other': False, 'result': 'H16'}, {'values': [817, 3817], 'ranges': [], 'other': False, 'result': 'H17'}, {'values': [818, 3818], 'ranges': [], 'other': False, 'result': 'H18'}, {'values': [819, 3819], 'ranges': [], 'other': False, 'result': 'H19'}, {'values': [820, 3820], 'ranges': [], 'other': False, 'result': 'H20'}, {'values': [821, 3821], 'ranges': [], 'other': False, 'result': 'H21'},
+                      {'values': [822, 3822], 'ranges': [], 'other': False, 'result': 'H22'}, {'values': [823, 3823], 'ranges': [], 'other': False, 'result': 'H23'}, {'values': [824, 3824], 'ranges': [], 'other': False, 'result': 'H24'}, {'values': [825, 3825], 'ranges': [], 'other': False, 'result': 'H25'}, {'values': [826, 3826], 'ranges': [], 'other': False, 'result': 'H26'}, {'values': [827, 3827], 'ranges': [], 'other': False, 'result': 'H27'},
+                      {'values': [828, 3828], 'ranges': [], 'other': False, 'result': 'H28'}, {'values': [844, 3844], 'ranges': [], 'other': False, 'result': 'H44'}, {'values': [845, 3845], 'ranges': [], 'other': False, 'result': 'H45'}, {'values': [846, 3846], 'ranges': [], 'other': False, 'result': 'H46'}, {'values': [847, 3847], 'ranges': [], 'other': False, 'result': 'H47'}, {'values': [848, 3848], 'ranges': [], 'other': False, 'result': 'H48'},
+                      {'values': [849, 3849], 'ranges': [], 'other': False, 'result': 'H49'}, {'values': [850, 3850], 'ranges': [], 'other': False, 'result': 'H50'}, {'values': [851, 3851], 'ranges': [], 'other': False, 'result': 'H51'}, {'values': [852, 3852], 'ranges': [], 'other': False, 'result': 'H52'}, {'values': [853, 3853], 'ranges': [], 'other': False, 'result': 'H53'}, {'values': [854, 3854], 'ranges': [], 'other': False, 'result': 'H54'},
+                      {'values': [855, 3855], 'ranges': [], 'other': False, 'result': 'H55'}, {'values': [856, 3856], 'ranges': [], 'other': False, 'result': 'H56'}, {'values': [857, 3857], 'ranges': [], 'other': False, 'result': 'H57'}, {'values': [858, 3858], 'ranges': [], 'other': False, 'result': 'H58'}, {'values': [859, 3859], 'ranges': [], 'other': False, 'result': 'H59'}, {'values': [860, 3860], 'ranges': [], 'other': False, 'result': 'H60'},
+                      {'values': [861, 3861], 'ranges': [], 'other': False, 'result': 'H61'}, {'values': [862, 3862], 'ranges': [], 'other': False, 'result': 'H62'}, {'values': [863, 3863], 'ranges': [], 'other': False, 'result': 'H63'}, {'values': [2, 3002], 'ranges': [], 'other': False, 'result': 'JSS'}, {'values': [3, 3003], 'ranges': [], 'other': False, 'result': 'JRC'}, {'values': [4, 3004], 'ranges': [], 'other': False, 'result': 'MLK'},
+                      {'values': [5, 3005], 'ranges': [], 'other': False, 'result': 'IMO'}, {'values': [6, 3006], 'ranges': [], 'other': False, 'result': 'PPG'}, {'values': [7, 3007], 'ranges': [], 'other': False, 'result': 'JBU'}, {'values': [8, 3008], 'ranges': [], 'other': False, 'result': 'KTN'}, {'values': [9, 3009], 'ranges': [], 'other': False, 'result': 'JYK'}, {'values': [10, 3010], 'ranges': [], 'other': False, 'result': 'ASR'},
+                      {'values': [11, 3011], 'ranges': [], 'other': False, 'result': 'GRN'}, {'values': [12, 3012], 'ranges': [], 'other': False, 'result': 'PPH'}, {'values': [13, 3013], 'ranges': [], 'other': False, 'result': 'KBU'}, {'values': [14, 3014], 'ranges': [], 'other': False, 'result': 'TMH'}, {'values': [15, 3015], 'ranges': [], 'other': False, 'result': 'KPG'}, {'values': [16, 3016], 'ranges': [], 'other': False, 'result': 'NLI'},
+                      {'values': [17, 3017], 'ranges': [], 'other': False, 'result': 'TPN'}, {'values': [18, 3018], 'ranges': [], 'other': False, 'result': 'PJN'}, {'values': [19, 3019], 'ranges': [], 'other': False, 'result': 'DUA'}, {'values': [20, 3020], 'ranges': [], 'other': False, 'result': 'TCL'}, {'values': [21, 3021], 'ranges': [], 'other': False, 'result': 'BPT'}, {'values': [22, 3022], 'ranges': [], 'other': False, 'result': 'SMY'},
+                      {'values': [23, 3023], 'ranges': [], 'other': False, 'result': 'KMT'}, {'values': [24, 3024], 'ranges': [], 'other': False, 'result': 'RSH'}, {'values': [25, 3025], 'ranges': [], 'other': False, 'result': 'SAM'}, {'values': [26, 3026], 'ranges': [], 'other': False, 'result': 'SPG'}, {'values': [27, 3027], 'ranges': [], 'other': False, 'result': 'NTL'}, {'values': [28, 3028], 'ranges': [], 'other': False, 'result': 'MUA'},
+                      {'values': [29, 3029], 'ranges': [], 'other': False, 'result': 'JRL'}, {'values': [30, 3030], 'ranges': [], 'other': False, 'result': 'KTU'}, {'values': [31, 3031], 'ranges': [], 'other': False, 'result': 'SKC'}, {'values': [32, 3032], 'ranges': [], 'other': False, 'result': 'WSS'}, {'values': [33, 3033], 'ranges': [], 'other': False, 'result': 'KKU'}, {'values': [34, 3034], 'ranges': [], 'other': False, 'result': 'KGR'},
+                      {'values': [35, 3035], 'ranges': [], 'other': False, 'result': 'SSA'}, {'values': [36, 3036], 'ranges': [], 'other': False, 'result': 'SS2'}, {'values': [37, 3037], 'ranges': [], 'other': False, 'result': 'TSA'}, {'values': [38, 3038], 'ranges': [], 'other': False, 'result': 'JKL'}, {'values': [39, 3039], 'ranges': [], 'other': False, 'result': 'KKG'}, {'values': [40, 3040], 'ranges': [], 'other': False, 'result': 'JSB'},
+                      {'values': [41, 3041], 'ranges': [], 'other': False, 'result': 'JIH'}, {'values': [42, 3042], 'ranges': [], 'other': False, 'result': 'BMM'}, {'values': [43, 3043], 'ranges': [], 'other': False, 'result': 'BTG'}, {'values': [44, 3044], 'ranges': [], 'other': False, 'result': 'TWU'}, {'values': [45, 3045], 'ranges': [], 'other': False, 'result': 'SRB'}, {'values': [46, 3046], 'ranges': [], 'other': False, 'result': 'APG'},
+                      {'values': [47, 3047], 'ranges': [], 'other': False, 'result': 'SGM'}, {'values': [48, 3048], 'ranges': [], 'other': False, 'result': 'MTK'}, {'values': [49, 3049], 'ranges': [], 'other': False, 'result': 'JLP'}, {'values': [50, 3050], 'ranges': [], 'other': False, 'result': 'MRI'}, {'values': [51, 3051], 'ranges': [], 'other': False, 'result': 'SMG'}, {'values': [52, 3052], 'ranges': [], 'other': False, 'result': 'UTM'},
+                      {'values': [53, 3053], 'ranges': [], 'other': False, 'result': 'TMI'}, {'values': [54, 3054], 'ranges': [], 'other': False, 'result': 'BBB'}, {'values': [55, 3055], 'ranges': [], 'other': False, 'result': 'LBN'}, {'values': [56, 3056], 'ranges': [], 'other': False, 'result': 'KJG'}, {'values': [57, 3057], 'ranges': [], 'other': False, 'result': 'SPI'}, {'values': [58, 3058], 'ranges': [], 'other': False, 'result': 'SBU'},
+                      {'values': [59, 3059], 'ranges': [], 'other': False, 'result': 'PKL'}, {'values': [60, 3060], 'ranges': [], 'other': False, 'result': 'BAM'}, {'values': [61, 3061], 'ranges': [], 'other': False, 'result': 'KLI'}, {'values': [62, 3062], 'ranges': [], 'other': False, 'result': 'SDK'}, {'values': [63, 3063], 'ranges': [], 'other': False, 'result': 'GMS'}, {'values': [64, 3064], 'ranges': [], 'other': False, 'result': 'PDN'},
+                      {'values': [65, 3065], 'ranges': [], 'other': False, 'result': 'BHU'}, {'values': [66, 3066], 'ranges': [], 'other': False, 'result': 'BDA'}, {'values': [67, 3067], 'ranges': [], 'other': False, 'result': 'CMR'}, {'values': [68, 3068], 'ranges': [], 'other': False, 'result': 'SAT'}, {'values': [69, 3069], 'ranges': [], 'other': False, 'result': 'BKI'}, {'values': [70, 3070], 'ranges': [], 'other': False, 'result': 'PSA'},
+                      {'values': [71, 3071], 'ranges': [], 'other': False, 'result': 'BCG'}, {'values': [72, 3072], 'ranges': [], 'other': False, 'result': 'PPR'}, {'values': [73, 3073], 'ranges': [], 'other': False, 'result': 'SPK'}, {'values': [74, 3074], 'ranges': [], 'other': False, 'result': 'SIK'}, {'values': [75, 3075], 'ranges': [], 'other': False, 'result': 'CAH'}, {'values': [76, 3076], 'ranges': [], 'other': False, 'result': 'PRS'},
+                      {'values': [77, 3077], 'ranges': [], 'other': False, 'result': 'PLI'}, {'values': [78, 3078], 'ranges': [], 'other': False, 'result': 'SJA'}, {'values': [79, 3079], 'ranges': [], 'other': False, 'result': 'MSI'}, {'values': [80, 3080], 'ranges': [], 'other': False, 'result': 'MLB'}, {'values': [81, 3081], 'ranges': [], 'other': False, 'result': 'SBH'}, {'values': [82, 3082], 'ranges': [], 'other': False, 'result': 'MCG'},
+                      {'values': [83, 3083], 'ranges': [], 'other': False, 'result': 'JBB'}, {'values': [84, 3084], 'ranges': [], 'other': False, 'result': 'PMS'}, {'values': [85, 3085], 'ranges': [], 'other': False, 'result': 'SST'}, {'values': [86, 3086], 'ranges': [], 'other': False, 'result': 'CLN'}, {'values': [87, 3087], 'ranges': [], 'other': False, 'result': 'MSG'}, {'values': [88, 3088], 'ranges': [], 'other': False, 'result': 'KUM'},
+                      {'values': [89, 3089], 'ranges': [], 'other': False, 'result': 'TPI'}, {'values': [90, 3090], 'ranges': [], 'other': False, 'result': 'BTL'}, {'values': [91, 3091], 'ranges': [], 'other': False, 'result': 'KUG'}, {'values': [92, 3092], 'ranges': [], 'other': False, 'result': 'KLG'}, {'values': [93, 3093], 'ranges': [], 'other': False, 'result': 'EDU'}, {'values': [94, 3094], 'ranges': [], 'other': False, 'result': 'STP'},
+                      {'values': [95, 3095], 'ranges': [], 'other': False, 'result': 'TIN'}, {'values': [96, 3096], 'ranges': [], 'other': False, 'result': 'SGK'}, {'values': [97, 3097], 'ranges': [], 'other': False, 'result': 'HSL'}, {'values': [98, 3098], 'ranges': [], 'other': False, 'result': 'TCY'}, {'values': [102, 3102], 'ranges': [], 'other': False, 'result': 'PRJ'}, {'values': [103, 3103], 'ranges': [], 'other': False, 'result': 'JJG'},
+                      {'values': [104, 3104], 'ranges': [], 'other': False, 'result': 'KKL'}, {'values': [105, 3105], 'ranges': [], 'other': False, 'result': 'KTI'}, {'values': [106, 3106], 'ranges': [], 'other': False, 'result': 'CKI'}, {'values': [107, 3107], 'ranges': [], 'other': False, 'result': 'JLT'}, {'values': [108, 3108], 'ranges': [], 'other': False, 'result': 'BSI'}, {'values': [109, 3109], 'ranges': [], 'other': False, 'result': 'KSR'},
+                      {'values': [110, 3110], 'ranges': [], 'other': False, 'result': 'TJJ'}, {'values': [111, 3111], 'ranges': [], 'other': False, 'result': 'AKH'}, {'values': [112, 3112], 'ranges': [], 'other': False, 'result': 'LDO'}, {'values': [113, 3113], 'ranges': [], 'other': False, 'result': 'TML'}, {'values': [114, 3114], 'ranges': [], 'other': False, 'result': 'BBA'}, {'values': [115, 3115], 'ranges': [], 'other': False, 'result': 'KNG'},
+                      {'values': [116, 3116], 'ranges': [], 'other': False, 'result': 'TRI'}, {'values': [117, 3117], 'ranges': [], 'other': False, 'result': 'KKI'}, {'values': [118, 3118], 'ranges': [], 'other': False, 'result': 'TMW'}, {'values': [120, 3120], 'ranges': [], 'other': False, 'result': 'PIH'}, {'values': [121, 3121], 'ranges': [], 'other': False, 'result': 'PRA'}, {'values': [122, 3122], 'ranges': [], 'other': False, 'result': 'SKN'},
+                      {'values': [123, 3123], 'ranges': [], 'other': False, 'result': 'IGN'}, {'values': [124, 3124], 'ranges': [], 'other': False, 'result': 'S14'}, {'values': [125, 3125], 'ranges': [], 'other': False, 'result': 'KJA'}, {'values': [126, 3126], 'ranges': [], 'other': False, 'result': 'PTS'}, {'values': [127, 3127], 'ranges': [], 'other': False, 'result': 'TSM'}, {'values': [128, 3128], 'ranges': [], 'other': False, 'result': 'SGB'},
+                      {'values': [129, 3129], 'ranges': [], 'other': False, 'result': 'BSR'}, {'values': [130, 3130], 'ranges': [], 'other': False, 'result': 'PDG'}, {'values': [131, 3131], 'ranges': [], 'other': False, 'result': 'TMG'}, {'values': [132, 3132], 'ranges': [], 'other': False, 'result': 'CKT'}, {'values': [133, 3133], 'ranges': [], 'other': False, 'result': 'PKG'}, {'values': [134, 3134], 'ranges': [], 'other': False, 'result': 'RPG'},
+                      {'values': [135, 3135], 'ranges': [], 'other': False, 'result': 'BSY'}, {'values': [136, 3136], 'ranges': [], 'other': False, 'result': 'TCS'}, {'values': [137, 3137], 'ranges': [], 'other': False, 'result': 'JPP'}, {'values': [138, 3138], 'ranges': [], 'other': False, 'result': 'WMU'}, {'values': [139, 3139], 'ranges': [], 'other': False, 'result': 'JRT'}, {'values': [140, 3140], 'ranges': [], 'other': False, 'result': 'CPE'},
+                      {'values': [141, 3141], 'ranges': [], 'other': False, 'result': 'STL'}, {'values': [142, 3142], 'ranges': [], 'other': False, 'result': 'KBD'}, {'values': [143, 3143], 'ranges': [], 'other': False, 'result': 'LDU'}, {'values': [144, 3144], 'ranges': [], 'other': False, 'result': 'KHG'}, {'values': [145, 3145], 'ranges': [], 'other': False, 'result': 'BSD'}, {'values': [146, 3146], 'ranges': [], 'other': False, 'result': 'PSG'},
+                      {'values': [147, 3147], 'ranges': [], 'other': False, 'result': 'PNS'}, {'values': [148, 3148], 'ranges': [], 'other': False, 'result': 'PJO'}, {'values': [149, 3149], 'ranges': [], 'other': False, 'result': 'BFT'}, {'values': [150, 3150], 'ranges': [], 'other': False, 'result': 'LMM'}, {'values': [151, 3151], 'ranges': [], 'other': False, 'result': 'SLY'}, {'values': [152, 3152], 'ranges': [], 'other': False, 'result': 'ATR'},
+                      {'values': [153, 3153], 'ranges': [], 'other': False, 'result': 'USJ'}, {'values': [154, 3154], 'ranges': [], 'other': False, 'result': 'BSJ'}, {'values': [155, 3155], 'ranges': [], 'other': False, 'result': 'TTJ'}, {'values': [156, 3156], 'ranges': [], 'other': False, 'result': 'TMR'}, {'values': [157, 3157], 'ranges': [], 'other': False, 'result': 'BPJ'}, {'values': [158, 3158], 'ranges': [], 'other': False, 'result': 'SPL'},
+                      {'values': [159, 3159], 'ranges': [], 'other': False, 'result': 'RLU'}, {'values': [160, 3160], 'ranges': [], 'other': False, 'result': 'MTH'}, {'values': [161, 3161], 'ranges': [], 'other': False, 'result': 'DGG'}, {'values': [162, 3162], 'ranges': [], 'other': False, 'result': 'SEA'}, {'values': [163, 3163], 'ranges': [], 'other': False, 'result': 'JKA'}, {'values': [164, 3164], 'ranges': [], 'other': False, 'result': 'KBS'},
+                      {'values': [165, 3165], 'ranges': [], 'other': False, 'result': 'TKA'}, {'values': [166, 3166], 'ranges': [], 'other': False, 'result': 'PGG'}, {'values': [167, 3167], 'ranges': [], 'other': False, 'result': 'BBG'}, {'values': [168, 3168], 'ranges': [], 'other': False, 'result': 'KLC'}, {'values': [169, 3169], 'ranges': [], 'other': False, 'result': 'CTD'}, {'values': [170, 3170], 'ranges': [], 'other': False, 'result': 'PJA'},
+                      {'values': [171, 3171], 'ranges': [], 'other': False, 'result': 'JMR'}, {'values': [172, 3172], 'ranges': [], 'other': False, 'result': 'TMJ'}, {'values': [173, 3173], 'ranges': [], 'other': False, 'result': 'SCA'}, {'values': [174, 3174], 'ranges': [], 'other': False, 'result': 'BBP'}, {'values': [175, 3175], 'ranges': [], 'other': False, 'result': 'LBG'}, {'values': [176, 3176], 'ranges': [], 'other': False, 'result': 'TPG'},
+                      {'values': [177, 3177], 'ranges': [], 'other': False, 'result': 'JRU'}, {'values': [178, 3178], 'ranges': [], 'other': False, 'result': 'MIN'}, {'values': [179, 3179], 'ranges': [], 'other': False, 'result': 'OUG'}, {'values': [180, 3180], 'ranges': [], 'other': False, 'result': 'KBG'}, {'values': [181, 3181], 'ranges': [], 'other': False, 'result': 'SRO'}, {'values': [182, 3182], 'ranges': [], 'other': False, 'result': 'JPU'},
+                      {'values': [183, 3183], 'ranges': [], 'other': False, 'result': 'JCL'}, {'values': [184, 3184], 'ranges': [], 'other': False, 'result': 'JPN'}, {'values': [185, 3185], 'ranges': [], 'other': False, 'result': 'KCY'}, {'values': [186, 3186], 'ranges': [], 'other': False, 'result': 'JTZ'}, {'values': [188, 3188], 'ranges': [], 'other': False, 'result': 'PLT'}, {'values': [189, 3189], 'ranges': [], 'other': False, 'result': 'BNH'},
+                      {'values': [190, 3190], 'ranges': [], 'other': False, 'result': 'BTR'}, {'values': [191, 3191], 'ranges': [], 'other': False, 'result': 'KPT'}, {'values': [192, 3192], 'ranges': [], 'other': False, 'result': 'MRD'}, {'values': [193, 3193], 'ranges': [], 'other': False, 'result': 'MKH'}, {'values': [194, 3194], 'ranges': [], 'other': False, 'result': 'SRK'}, {'values': [195, 3195], 'ranges': [], 'other': False, 'result': 'BWK'},
+                      {'values': [196, 3196], 'ranges': [], 'other': False, 'result': 'JHL'}, {'values': [197, 3197], 'ranges': [], 'other': False, 'result': 'TNM'}, {'values': [198, 3198], 'ranges': [], 'other': False, 'result': 'TDA'}, {'values': [199, 3199], 'ranges': [], 'other': False, 'result': 'JTH'}, {'values': [201, 3201], 'ranges': [], 'other': False, 'result': 'PDA'}, {'values': [202, 3202], 'ranges': [], 'other': False, 'result': 'RWG'},
+                      {'values': [203, 3203], 'ranges': [], 'other': False, 'result': 'SJM'}, {'values': [204, 3204], 'ranges': [], 'other': False, 'result': 'BTW'}, {'values': [205, 3205], 'ranges': [], 'other': False, 'result': 'SNG'}, {'values': [206, 3206], 'ranges': [], 'other': False, 'result': 'TBM'}, {'values': [207, 3207], 'ranges': [], 'other': False, 'result': 'BCM'}, {'values': [208, 3208], 'ranges': [], 'other': False, 'result': 'JSI'},
+                      {'values': [209, 3209], 'ranges': [], 'other': False, 'result': 'STW'}, {'values': [210, 3210], 'ranges': [], 'other': False, 'result': 'TMM'}, {'values': [211, 3211], 'ranges': [], 'other': False, 'result': 'TPD'}, {'values': [212, 3212], 'ranges': [], 'other': False, 'result': 'JMA'}, {'values': [213, 3213], 'ranges': [], 'other': False, 'result': 'JKB'}, {'values': [214, 3214], 'ranges': [], 'other': False, 'result': 'JGA'},
+                      {'values': [215, 3215], 'ranges': [], 'other': False, 'result': 'JKP'}, {'values': [216, 3216], 'ranges': [], 'other': False, 'result': 'SKI'}, {'values': [217, 3217], 'ranges': [], 'other': False, 'result': 'TMB'}, {'values': [220, 3220], 'ranges': [], 'other': False, 'result': 'GHS'}, {'values': [221, 3221], 'ranges': [], 'other': False, 'result': 'TSK'}, {'values': [222, 3222], 'ranges': [], 'other': False, 'result': 'TDC'},
+                      {'values': [223, 3223], 'ranges': [], 'other': False, 'result': 'TRJ'}, {'values': [224, 3224], 'ranges': [], 'other': False, 'result': 'JAH'}, {'values': [225, 3225], 'ranges': [], 'other': False, 'result': 'TIH'}, {'values': [226, 3226], 'ranges': [], 'other': False, 'result': 'JPR'}, {'values': [227, 3227], 'ranges': [], 'other': False, 'result': 'KSB'}, {'values': [228, 3228], 'ranges': [], 'other': False, 'result': 'INN'},
+                      {'values': [229, 3229], 'ranges': [], 'other': False, 'result': 'TSJ'}, {'values': [230, 3230], 'ranges': [], 'other': False, 'result': 'SSH'}, {'values': [231, 3231], 'ranges': [], 'other': False, 'result': 'BBM'}, {'values': [232, 3232], 'ranges': [], 'other': False, 'result': 'TMD'}, {'values': [233, 3233], 'ranges': [], 'other': False, 'result': 'BEN'}, {'values': [234, 3234], 'ranges': [], 'other': False, 'result': 'SRM'},
+                      {'values': [235, 3235], 'ranges': [], 'other': False, 'result': 'SBM'}, {'values': [236, 3236], 'ranges': [], 'other': False, 'result': 'UYB'}, {'values': [237, 3237], 'ranges': [], 'other': False, 'result': 'KLS'}, {'values': [238, 3238], 'ranges': [], 'other': False, 'result': 'JKT'}, {'values': [239, 3239], 'ranges': [], 'other': False, 'result': 'KMY'}, {'values': [240, 3240], 'ranges': [], 'other': False, 'result': 'KAP'},
+                      {'values': [241, 3241], 'ranges': [], 'other': False, 'result': 'DJA'}, {'values': [242, 3242], 'ranges': [], 'other': False, 'result': 'TKK'}, {'values': [243, 3243], 'ranges': [], 'other': False, 'result': 'KKR'}, {'values': [244, 3244], 'ranges': [], 'other': False, 'result': 'GRT'}, {'values': [245, 3245], 'ranges': [], 'other': False, 'result': 'BDR'}, {'values': [246, 3246], 'ranges': [], 'other': False, 'result': 'BGH'},
+                      {'values': [247, 3247], 'ranges': [], 'other': False, 'result': 'BPR'}, {'values': [249, 3249], 'ranges': [], 'other': False, 'result': 'TAI'}, {'values': [248, 3248], 'ranges': [], 'other': False, 'result': 'JTS'}, {'values': [250, 3250], 'ranges': [], 'other': False, 'result': 'TEA'}, {'values': [251, 3251], 'ranges': [], 'other': False, 'result': 'KPR'}, {'values': [252, 3252], 'ranges': [], 'other': False, 'result': 'TMA'},
+                      {'values': [253, 3253], 'ranges': [], 'other': False, 'result': 'JTT'}, {'values': [254, 3254], 'ranges': [], 'other': False, 'result': 'KPH'}, {'values': [255, 3255], 'ranges': [], 'other': False, 'result': 'SBP'}, {'values': [256, 3256], 'ranges': [], 'other': False, 'result': 'PBR'}, {'values': [257, 3257], 'ranges': [], 'other': False, 'result': 'RAU'}, {'values': [258, 3258], 'ranges': [], 'other': False, 'result': 'JTA'},
+                      {'values': [259, 3259], 'ranges': [], 'other': False, 'result': 'SAN'}, {'values': [260, 3260], 'ranges': [], 'other': False, 'result': 'KDN'}, {'values': [261, 3261], 'ranges': [], 'other': False, 'result': 'GMG'}, {'values': [262, 3262], 'ranges': [], 'other': False, 'result': 'TCT'}, {'values': [263, 3263], 'ranges': [], 'other': False, 'result': 'BTA'}, {'values': [264, 3264], 'ranges': [], 'other': False, 'result': 'JBH'},
+                      {'values': [265, 3265], 'ranges': [], 'other': False, 'result': 'JAI'}, {'values': [266, 3266], 'ranges': [], 'other': False, 'result': 'JDK'}, {'values': [267, 3267], 'ranges': [], 'other': False, 'result': 'TDI'}, {'values': [268, 3268], 'ranges': [], 'other': False, 'result': 'BBT'}, {'values': [269, 3269], 'ranges': [], 'other': False, 'result': 'MKA'}, {'values': [270, 3270], 'ranges': [], 'other': False, 'result': 'BPI'},
+                      {'values': [273, 3273], 'ranges': [], 'other': False, 'result': 'LHA'}, {'values': [277, 3277], 'ranges': [], 'other': False, 'result': 'WSU'}, {'values': [278, 3278], 'ranges': [], 'other': False, 'result': 'JPI'}, {'values': [274, 3274], 'ranges': [], 'other': False, 'result': 'STG'}, {'values': [275, 3275], 'ranges': [], 'other': False, 'result': 'MSL'}, {'values': [276, 3276], 'ranges': [], 'other': False, 'result': 'JAS'},
+                      {'values': [279, 3279], 'ranges': [], 'other': False, 'result': 'PTJ'}, {'values': [280, 3280], 'ranges': [], 'other': False, 'result': 'KDA'}, {'values': [281, 3281], 'ranges': [], 'other': False, 'result': 'PLT'}, {'values': [282, 3282], 'ranges': [], 'other': False, 'result': 'PTT'}, {'values': [283, 3283], 'ranges': [], 'other': False, 'result': 'PSE'}, {'values': [284, 3284], 'ranges': [], 'other': False, 'result': 'BSP'},
+                      {'values': [285, 3285], 'ranges': [], 'other': False, 'result': 'BMC'}, {'values': [286, 3286], 'ranges': [], 'other': False, 'result': 'BIH'}, {'values': [287, 3287], 'ranges': [], 'other': False, 'result': 'SUA'}, {'values': [288, 3288], 'ranges': [], 'other': False, 'result': 'SPT'}, {'values': [289, 3289], 'ranges': [], 'other': False, 'result': 'TEE'}, {'values': [290, 3290], 'ranges': [], 'other': False, 'result': 'TDY'},
+                      {'values': [291, 3291], 'ranges': [], 'other': False, 'result': 'BSL'}, {'values': [292, 3292], 'ranges': [], 'other': False, 'result': 'BMJ'}, {'values': [293, 3293], 'ranges': [], 'other': False, 'result': 'BSA'}, {'values': [294, 3294], 'ranges': [], 'other': False, 'result': 'KKM'}, {'values': [295, 3295], 'ranges': [], 'other': False, 'result': 'BKR'}, {'values': [296, 3296], 'ranges': [], 'other': False, 'result': 'BJL'},
+                      {'values': [701, 3701], 'ranges': [], 'other': False, 'result': 'IKB'}, {'values': [702, 3702], 'ranges': [], 'other': False, 'result': 'IPJ'}, {'values': [703, 3703], 'ranges': [], 'other': False, 'result': 'IWS'}, {'values': [704, 3704], 'ranges': [], 'other': False, 'result': 'IJK'}]},
+ 'CACBRCH': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [2, 18, 35, 38, 40, 41, 53, 66, 120, 124, 128, 129, 141, 148, 169, 170, 225, 226, 230, 232, 236, 248, 262, 267, 802, 812, 816, 818], 'ranges': [], 'other': False, 'result': '911'},
+                       {'values': [3, 15, 19, 22, 26, 29, 36, 46, 56, 69, 83, 94, 96, 97, 701, 118, 122, 125, 131, 132, 136, 138, 145, 151, 155, 157, 162, 163, 270, 167, 168, 173, 178, 179, 195, 198, 180, 196, 197, 202, 220, 229, 241, 252, 280, 811, 815, 822, 103, 821, 825, 269, 284, 285, 288, 289, 702], 'ranges': [], 'other': False, 'result': '912'}, {'values': [27, 42, 60, 68, 88, 121, 154, 177, 204, 206, 255, 801, 826], 'ranges': [], 'other': False, 'result': '916'},
+                       {'values': [6, 54, 107, 114, 126, 150, 159, 171, 205, 253, 265, 266, 808, 817], 'ranges': [], 'other': False, 'result': '915'}, {'values': [7, 37, 52, 59, 61, 79, 89, 105, 110, 147, 174, 176, 216, 217, 222, 286, 804, 805, 287, 290], 'ranges': [], 'other': False, 'result': '914'}, {'values': [20, 25, 43, 78, 81, 92, 109, 127, 133, 135, 153, 199, 201, 203, 221, 240, 250, 268, 814, 820], 'ranges': [], 'other': False, 'result': '913'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': '000'}]},
+ 'CACNAME': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [2, 18, 35, 38, 40, 41, 53, 66, 120, 124, 128, 129, 141, 148, 169, 170, 225, 226, 230, 232, 236, 248, 262, 267, 802, 812, 816, 818], 'ranges': [], 'other': False, 'result': 'CAC-K. LUMPUR '},
+                       {'values': [3, 15, 19, 22, 26, 29, 36, 46, 56, 69, 83, 94, 96, 97, 701, 118, 122, 125, 131, 132, 136, 138, 145, 151, 155, 157, 162, 163, 270, 167, 168, 173, 178, 179, 195, 198, 180, 196, 197, 202, 220, 229, 241, 252, 280, 811, 815, 822, 103, 821, 825, 269, 284, 285, 288, 289, 702], 'ranges': [], 'other': False, 'result': 'CAC-CITY CENTRE'}, {'values': [27, 42, 60, 68, 88, 121, 154, 177, 204, 206, 255, 801, 826], 'ranges': [], 'other': False, 'result': 'CAC-BUTTERWOTH'},
+                       {'values': [6, 54, 107, 114, 126, 150, 159, 171, 205, 253, 265, 266, 808, 817], 'ranges': [], 'other': False, 'result': 'CAC-PENANG'}, {'values': [7, 37, 52, 59, 61, 79, 89, 105, 110, 147, 174, 176, 216, 217, 222, 286, 804, 805, 287, 290], 'ranges': [], 'other': False, 'result': 'CAC-JOHOR BAHRU'}, {'values': [20, 25, 43, 78, 81, 92, 109, 127, 133, 135, 153, 199, 201, 203, 221, 240, 250, 268, 814, 820], 'ranges': [], 'other': False, 'result': 'CAC-KELANG'},
+                       {'values': [], 'ranges': [], 'other': True, 'result': 'NON CAC'}]},
+ 'REGIOFF': {'kind': 'value',
+             'character': False,
+             'rules': [{'values': [3, 22, 40, 46, 53, 56, 120, 122, 129, 136, 155, 168, 169, 170, 173, 220, 225, 226, 232, 252, 262, 802, 818, 284, 285], 'ranges': [], 'other': False, 'result': 'SELWP1'}, {'values': [2, 15, 29, 41, 66, 83, 94, 96, 97, 701, 103, 118, 128, 138, 141, 151, 178, 195, 196, 197, 248, 821, 822], 'ranges': [], 'other': False, 'result': 'SELWP2'},
+                       {'values': [18, 19, 26, 35, 36, 38, 81, 124, 125, 131, 145, 148, 157, 162, 163, 167, 179, 198, 230, 241, 267, 269, 270, 280, 825], 'ranges': [], 'other': False, 'result': 'SELWP3'}, {'values': [20, 25, 31, 43, 69, 73, 78, 92, 109, 127, 133, 135, 153, 180, 199, 201, 202, 203, 221, 235, 240, 250, 268, 814, 820, 279, 288, 289, 702], 'ranges': [], 'other': False, 'result': 'SELWP4'},
+                       {'values': [7, 21, 28, 37, 47, 52, 59, 61, 75, 79, 87, 89, 91, 93, 102, 105, 110, 144, 147, 174, 176, 216, 217, 222, 224, 234, 242, 247, 286, 804, 805, 287, 290], 'ranges': [], 'other': False, 'result': 'JOHOR'}, {'values': [6, 10, 11, 27, 34, 42, 54, 57, 60, 68, 70, 74, 77, 86, 88, 104, 107, 114, 121, 126, 150, 154, 159, 164, 171, 177, 204, 205, 206, 213, 238, 253, 255, 258, 265, 266, 801, 806, 808, 817, 826, 704], 'ranges': [], 'other': False, 'result': 'PNGKDHPLS'},
+                       {'values': [5, 9, 23, 49, 51, 67, 71, 76, 80, 85, 95, 108, 123, 137, 146, 152, 158, 207, 208, 209, 210, 211, 243, 244, 245, 246, 249, 251, 256, 809], 'ranges': [], 'other': False, 'result': 'PERAK'}, {'values': [4, 16, 17, 24, 39, 45, 63, 64, 65, 111, 156, 160, 165, 172, 212, 223, 231, 254, 800, 807], 'ranges': [], 'other': False, 'result': 'MLKNSEM'},
+                       {'values': [8, 13, 14, 30, 48, 106, 113, 116, 117, 139, 233, 237, 239, 257, 260, 261, 263, 264, 277, 827, 819, 703], 'ranges': [], 'other': False, 'result': 'PAHKELTER'}, {'values': [32, 50, 58, 90, 130, 175, 182, 183, 184, 185, 273, 274, 275, 186, 189, 190, 191, 192, 193, 194, 259, 813, 281], 'ranges': [], 'other': False, 'result': 'SARAWAK'},
+                       {'values': [33, 44, 55, 62, 72, 112, 115, 140, 142, 143, 149, 161, 228, 803, 278, 276, 282, 283], 'ranges': [], 'other': False, 'result': 'SABAHLBN'}, {'values': [], 'ranges': [], 'other': True, 'result': 'NON REGION'}]},
+ 'REGNEW': {'kind': 'value',
+            'character': False,
+            'rules': [{'values': [2, 3, 22, 46, 53, 56, 120, 129, 136, 169, 170, 173, 196, 226, 232, 252, 262, 284, 285, 802, 812], 'ranges': [], 'other': False, 'result': 'WS I'}, {'values': [15, 29, 40, 41, 66, 83, 96, 97, 103, 118, 128, 141, 151, 195, 197, 248, 269, 701, 818, 822], 'ranges': [], 'other': False, 'result': 'WS II'}, {'values': [18, 19, 35, 36, 81, 124, 125, 131, 135, 145, 148, 162, 167, 180, 220, 241, 267, 280, 815, 816, 820], 'ranges': [], 'other': False, 'result': 'WS III'},
+                      {'values': [26, 38, 94, 122, 138, 153, 155, 157, 163, 168, 178, 179, 198, 225, 230, 250, 270, 279, 288, 289, 702, 811, 821, 825], 'ranges': [], 'other': False, 'result': 'WS IV'}, {'values': [20, 25, 31, 43, 69, 73, 78, 92, 109, 127, 133, 199, 201, 202, 203, 221, 235, 240, 268, 814], 'ranges': [], 'other': False, 'result': 'WS V'},
+                      {'values': [7, 37, 52, 59, 61, 79, 87, 89, 91, 93, 102, 105, 110, 144, 147, 174, 176, 216, 217, 222, 234, 286, 287, 290, 804, 805], 'ranges': [], 'other': False, 'result': 'S I'}, {'values': [4, 16, 17, 21, 24, 28, 39, 45, 47, 63, 64, 65, 75, 111, 156, 160, 165, 172, 224, 231, 242, 247, 254, 800, 807], 'ranges': [], 'other': False, 'result': 'S II'},
+                      {'values': [6, 10, 34, 54, 70, 74, 77, 86, 104, 107, 114, 126, 150, 159, 171, 205, 238, 258, 265, 266, 806, 808, 817, 704], 'ranges': [], 'other': False, 'result': 'N I'}, {'values': [11, 23, 27, 42, 57, 60, 68, 88, 108, 121, 154, 164, 177, 204, 206, 211, 243, 249, 256, 801, 824, 826], 'ranges': [], 'other': False, 'result': 'N II'},
+                      {'values': [5, 9, 49, 51, 67, 71, 76, 80, 85, 95, 123, 137, 146, 152, 158, 207, 208, 209, 210, 244, 245, 251, 809, 823], 'ranges': [], 'other': False, 'result': 'CTR'}, {'values': [8, 13, 14, 30, 48, 106, 113, 116, 117, 139, 233, 237, 239, 257, 260, 261, 263, 264, 277, 819, 827, 703], 'ranges': [], 'other': False, 'result': 'EST'},
+                      {'values': [32, 50, 58, 90, 130, 175, 182, 183, 184, 185, 273, 274, 275, 186, 189, 190, 191, 192, 193, 194, 259, 281, 813], 'ranges': [], 'other': False, 'result': 'SRW'}, {'values': [33, 44, 55, 62, 72, 112, 115, 140, 142, 143, 149, 161, 228, 278, 276, 282, 283, 803], 'ranges': [], 'other': False, 'result': 'SAB'}, {'values': [], 'ranges': [], 'other': True, 'result': 'OFF'}]},
+ 'CTYPE': {'kind': 'value',
+           'character': True,
+           'rules': [{'values': ['BP', 'BC'], 'ranges': [], 'other': False, 'result': '01'}, {'values': ['BB'], 'ranges': [], 'other': False, 'result': '02'}, {'values': ['BI'], 'ranges': [], 'other': False, 'result': '03'}, {'values': ['BJ'], 'ranges': [], 'other': False, 'result': '07'}, {'values': ['BQ'], 'ranges': [], 'other': False, 'result': '11'}, {'values': ['BM'], 'ranges': [], 'other': False, 'result': '12'}, {'values': ['BN'], 'ranges': [], 'other': False, 'result': '13'},
+                     {'values': ['BG'], 'ranges': [], 'other': False, 'result': '17'}, {'values': ['BR', 'BF', 'BH', 'BZ', 'BU', 'AD', 'BT', 'BV', 'BS'], 'ranges': [], 'other': False, 'result': '20'}, {'values': ['AC', 'DD', 'CG', 'CA', 'CC', 'CB', 'CD', 'CF'], 'ranges': [], 'other': False, 'result': '60'}, {'values': ['DA'], 'ranges': [], 'other': False, 'result': '71'}, {'values': ['DB'], 'ranges': [], 'other': False, 'result': '72'},
+                     {'values': ['DC'], 'ranges': [], 'other': False, 'result': '74'}, {'values': ['EC', 'EA', 'EJ'], 'ranges': [], 'other': False, 'result': '76'}, {'values': ['FA'], 'ranges': [], 'other': False, 'result': '79'}, {'values': ['BW', 'BA', 'BE'], 'ranges': [], 'other': False, 'result': '81'}, {'values': ['EB', 'CE', 'GA'], 'ranges': [], 'other': False, 'result': '85'}]},
+ 'BRCHRVR': {'kind': 'value',
+             'character': True,
+             'rules': [{'values': ['PCS'], 'ranges': [], 'other': False, 'result': 1}, {'values': ['JSS'], 'ranges': [], 'other': False, 'result': 2}, {'values': ['JRC'], 'ranges': [], 'other': False, 'result': 3}, {'values': ['MLK'], 'ranges': [], 'other': False, 'result': 4}, {'values': ['IMO'], 'ranges': [], 'other': False, 'result': 5}, {'values': ['PPG'], 'ranges': [], 'other': False, 'result': 6}, {'values': ['JBU'], 'ranges': [], 'other': False, 'result': 7},
+                       {'values': ['KTN'], 'ranges': [], 'other': False, 'result': 8}, {'values': ['JYK'], 'ranges': [], 'other': False, 'result': 9}, {'values': ['ASR'], 'ranges': [], 'other': False, 'result': 10}, {'values': ['GRN'], 'ranges': [], 'other': False, 'result': 11}, {'values': ['PPH'], 'ranges': [], 'other': False, 'result': 12}, {'values': ['KBU'], 'ranges': [], 'other': False, 'result': 13}, {'values': ['TMH'], 'ranges': [], 'other': False, 'result': 14},
+                       {'values': ['KPG'], 'ranges': [], 'other': False, 'result': 15}, {'values': ['NLI'], 'ranges': [], 'other': False, 'result': 16}, {'values': ['TPN'], 'ranges': [], 'other': False, 'result': 17}, {'values': ['PJN'], 'ranges': [], 'other': False, 'result': 18}, {'values': ['DUA'], 'ranges': [], 'other': False, 'result': 19}, {'values': ['TCL'], 'ranges': [], 'other': False, 'result': 20}, {'values': ['BPT'], 'ranges': [], 'other': False, 'result': 21},
+                       {'values': ['SMY'], 'ranges': [], 'other': False, 'result': 22}, {'values': ['KMT'], 'ranges': [], 'other': False, 'result': 23}, {'values': ['RSH'], 'ranges': [], 'other': False, 'result': 24}, {'values': ['SAM'], 'ranges': [], 'other': False, 'result': 25}, {'values': ['SPG'], 'ranges': [], 'other': False, 'result': 26}, {'values': ['NTL'], 'ranges': [], 'other': False, 'result': 27}, {'values': ['MUA'], 'ranges': [], 'other': False, 'result': 28},
+                       {'values': ['JRL'], 'ranges': [], 'other': False, 'result': 29}, {'values': ['KTU'], 'ranges': [], 'other': False, 'result': 30}, {'values': ['SKC'], 'ranges': [], 'other': False, 'result': 31}, {'values': ['WSS'], 'ranges': [], 'other': False, 'result': 32}, {'values': ['KKU'], 'ranges': [], 'other': False, 'result': 33}, {'values': ['KGR'], 'ranges': [], 'other': False, 'result': 34}, {'values': ['SSA'], 'ranges': [], 'other': False, 'result': 35},
+                       {'values': ['SS2'], 'ranges': [], 'other': False, 'result': 36}, {'values': ['TSA'], 'ranges': [], 'other': False, 'result': 37}, {'values': ['JKL'], 'ranges': [], 'other': False, 'result': 38}, {'values': ['KKG'], 'ranges': [], 'other': False, 'result': 39}, {'values': ['JSB'], 'ranges': [], 'other': False, 'result': 40}, {'values': ['JIH'], 'ranges': [], 'other': False, 'result': 41}, {'values': ['BMM'], 'ranges': [], 'other': False, 'result': 42},
+                       {'values': ['BTG'], 'ranges': [], 'other': False, 'result': 43}, {'values': ['TWU'], 'ranges': [], 'other': False, 'result': 44}, {'values': ['SRB'], 'ranges': [], 'other': False, 'result': 45}, {'values': ['APG'], 'ranges': [], 'other': False, 'result': 46}, {'values': ['SGM'], 'ranges': [], 'other': False, 'result': 47}, {'values': ['MTK'], 'ranges': [], 'other': False, 'result': 48}, {'values': ['JLP'], 'ranges': [], 'other': False, 'result': 49},
+                       {'values': ['MRI'], 'ranges': [], 'other': False, 'result': 50}, {'values': ['SMG'], 'ranges': [], 'other': False, 'result': 51}, {'values': ['UTM'], 'ranges': [], 'other': False, 'result': 52}, {'values': ['TMI'], 'ranges': [], 'other': False, 'result': 53}, {'values': ['BBB'], 'ranges': [], 'other': False, 'result': 54}, {'values': ['LBN'], 'ranges': [], 'other': False, 'result': 55}, {'values': ['KJG'], 'ranges': [], 'other': False, 'result': 56},
+                       {'values': ['SPI'], 'ranges': [], 'other': False, 'result': 57}, {'values': ['SBU'], 'ranges': [], 'other': False, 'result': 58}, {'values': ['PKL'], 'ranges': [], 'other': False, 'result': 59}, {'values': ['BAM'], 'ranges': [], 'other': False, 'result': 60}, {'values': ['KLI'], 'ranges': [], 'other': False, 'result': 61}, {'values': ['SDK'], 'ranges': [], 'other': False, 'result': 62}, {'values': ['GMS'], 'ranges': [], 'other': False, 'result': 63},
+                       {'values': ['PDN'], 'ranges': [], 'other': False, 'result': 64}, {'values': ['BHU'], 'ranges': [], 'other': False, 'result': 65}, {'values': ['BDA'], 'ranges': [], 'other': False, 'result': 66}, {'values': ['CMR'], 'ranges': [], 'other': False, 'result': 67}, {'values': ['SAT'], 'ranges': [], 'other': False, 'result': 68}, {'values': ['BKI'], 'ranges': [], 'other': False, 'result': 69}, {'values': ['PSA'], 'ranges': [], 'other': False, 'result': 70},
+                       {'values': ['BCG'], 'ranges': [], 'other': False, 'result': 71}, {'values': ['PPR'], 'ranges': [], 'other': False, 'result': 72}, {'values': ['SPK'], 'ranges': [], 'other': False, 'result': 73}, {'values': ['SIK'], 'ranges': [], 'other': False, 'result': 74}, {'values': ['CAH'], 'ranges': [], 'other': False, 'result': 75}, {'values': ['PRS'], 'ranges': [], 'other': False, 'result': 76}, {'values': ['PLI'], 'ranges': [], 'other': False, 'result': 77},
+                       {'values': ['SJA'], 'ranges': [], 'other': False, 'result': 78}, {'values': ['MSI'], 'ranges': [], 'other': False, 'result': 79}, {'values': ['MLB'], 'ranges': [], 'other': False, 'result': 80}, {'values': ['SBH'], 'ranges': [], 'other': False, 'result': 81}, {'values': ['MCG'], 'ranges': [], 'other': False, 'result': 82}, {'values': ['JBB'], 'ranges': [], 'other': False, 'result': 83}, {'values': ['PMS'], 'ranges': [], 'other': False, 'result': 84},
+                       {'values': ['SST'], 'ranges': [], 'other': False, 'result': 85}, {'values': ['CLN'], 'ranges': [], 'other': False, 'result': 86}, {'values': ['MSG'], 'ranges': [], 'other': False, 'result': 87}, {'values': ['KUM'], 'ranges': [], 'other': False, 'result': 88}, {'values': ['TPI'], 'ranges': [], 'other': False, 'result': 89}, {'values': ['BTL'], 'ranges': [], 'other': False, 'result': 90}, {'values': ['KUG'], 'ranges': [], 'other': False, 'result': 91},
+                       {'values': ['KLG'], 'ranges': [], 'other': False, 'result': 92}, {'values': ['EDU'], 'ranges': [], 'other': False, 'result': 93}, {'values': ['STP'], 'ranges': [], 'other': False, 'result': 94}, {'values': ['TIN'], 'ranges': [], 'other': False, 'result': 95}, {'values': ['SGK'], 'ranges': [], 'other': False, 'result': 96}, {'values': ['HSL'], 'ranges': [], 'other': False, 'result': 97}, {'values': ['TCY'], 'ranges': [], 'other': False, 'result': 98},
+                       {'values': ['XXX'], 'ranges': [], 'other': False, 'result': 99}, {'values': ['YYY'], 'ranges': [], 'other': False, 'result': 100}, {'values': ['KBR'], 'ranges': [], 'other': False, 'result': 101}, {'values': ['PRJ'], 'ranges': [], 'other': False, 'result': 102}, {'values': ['JJG'], 'ranges': [], 'other': False, 'result': 103}, {'values': ['KKL'], 'ranges': [], 'other': False, 'result': 104}, {'values': ['KTI'], 'ranges': [], 'other': False, 'result': 105},
+                       {'values': ['CKI'], 'ranges': [], 'other': False, 'result': 106}, {'values': ['JLT'], 'ranges': [], 'other': False, 'result': 107}, {'values': ['BSI'], 'ranges': [], 'other': False, 'result': 108}, {'values': ['KSR'], 'ranges': [], 'other': False, 'result': 109}, {'values': ['TJJ'], 'ranges': [], 'other': False, 'result': 110}, {'values': ['AKH'], 'ranges': [], 'other': False, 'result': 111}, {'values': ['LDO'], 'ranges': [], 'other': False, 'result': 112},
+                       {'values': ['TML'], 'ranges': [], 'other': False, 'result': 113}, {'values': ['BBA'], 'ranges': [], 'other': False, 'result': 114}, {'values': ['KNG'], 'ranges': [], 'other': False, 'result': 115}, {'values': ['TRI'], 'ranges': [], 'other': False, 'result': 116}, {'values': ['KKI'], 'ranges': [], 'other': False, 'result': 117}, {'values': ['TMW'], 'ranges': [], 'other': False, 'result': 118}, {'values': ['BNV'], 'ranges': [], 'other': False, 'result': 119},
+                       {'values': ['PIH'], 'ranges': [], 'other': False, 'result': 120}, {'values': ['PRA'], 'ranges': [], 'other': False, 'result': 121}, {'values': ['SKN'], 'ranges': [], 'other': False, 'result': 122}, {'values': ['IGN'], 'ranges': [], 'other': False, 'result': 123}, {'values': ['S14'], 'ranges': [], 'other': False, 'result': 124}, {'values': ['KJA'], 'ranges': [], 'other': False, 'result': 125}, {'values': ['PTS'], 'ranges': [], 'other': False, 'result': 126},
+                       {'values': ['TSM'], 'ranges': [], 'other': False, 'result': 127}, {'values': ['SGB'], 'ranges': [], 'other': False, 'result': 128}, {'values': ['BSR'], 'ranges': [], 'other': False, 'result': 129}, {'values': ['PDG'], 'ranges': [], 'other': False, 'result': 130}, {'values': ['TMG'], 'ranges': [], 'other': False, 'result': 131}, {'values': ['CKT'], 'ranges': [], 'other': False, 'result': 132}, {'values': ['PKG'], 'ranges': [], 'other': False, 'result': 133},
+                       {'values': ['RPG'], 'ranges': [], 'other': False, 'result': 134}, {'values': ['BSY'], 'ranges': [], 'other': False, 'result': 135}, {'values': ['TCS'], 'ranges': [], 'other': False, 'result': 136}, {'values': ['JPP'], 'ranges': [], 'other': False, 'result': 137}, {'values': ['WMU'], 'ranges': [], 'other': False, 'result': 138}, {'values': ['JRT'], 'ranges': [], 'other': False, 'result': 139}, {'values': ['CPE'], 'ranges': [], 'other': False, 'result': 140},
+                       {'values': ['STL'], 'ranges': [], 'other': False, 'result': 141}, {'values': ['KBD'], 'ranges': [], 'other': False, 'result': 142}, {'values': ['LDU'], 'ranges': [], 'other': False, 'result': 143}, {'values': ['KHG'], 'ranges': [], 'other': False, 'result': 144}, {'values': ['BSD'], 'ranges': [], 'other': False, 'result': 145}, {'values': ['PSG'], 'ranges': [], 'other': False, 'result': 146}, {'values': ['PNS'], 'ranges': [], 'other': False, 'result': 147},
+                       {'values': ['PJO'], 'ranges': [], 'other': False, 'result': 148}, {'values': ['BFT'], 'ranges': [], 'other': False, 'result': 149}, {'values': ['LMM'], 'ranges': [], 'other': False, 'result': 150}, {'values': ['SLY'], 'ranges': [], 'other': False, 'result': 151}, {'values': ['ATR'], 'ranges': [], 'other': False, 'result': 152}, {'values': ['USJ'], 'ranges': [], 'other': False, 'result': 153}, {'values': ['BSJ'], 'ranges': [], 'other': False, 'result': 154},
+                       {'values': ['TTJ'], 'ranges': [], 'other': False, 'result': 155}, {'values': ['TMR'], 'ranges': [], 'other': False, 'result': 156}, {'values': ['BPJ'], 'ranges': [], 'other': False, 'result': 157}, {'values': ['SPL'], 'ranges': [], 'other': False, 'result': 158}, {'values': ['RLU'], 'ranges': [], 'other': False, 'result': 159}, {'values': ['MTH'], 'ranges': [], 'other': False, 'result': 160}, {'values': ['DGG'], 'ranges': [], 'other': False, 'result': 161},
+                       {'values': ['SEA'], 'ranges': [], 'other': False, 'result': 162}, {'values': ['JKA'], 'ranges': [], 'other': False, 'result': 163}, {'values': ['KBS'], 'ranges': [], 'other': False, 'result': 164}, {'values': ['TKA'], 'ranges': [], 'other': False, 'result': 165}, {'values': ['PGG'], 'ranges': [], 'other': False, 'result': 166}, {'values': ['BBG'], 'ranges': [], 'other': False, 'result': 167}, {'values': ['KLC'], 'ranges': [], 'other': False, 'result': 168},
+                       {'values': ['CTD'], 'ranges': [], 'other': False, 'result': 169}, {'values': ['PJA'], 'ranges': [], 'other': False, 'result': 170}, {'values': ['JMR'], 'ranges': [], 'other': False, 'result': 171}, {'values': ['TMJ'], 'ranges': [], 'other': False, 'result': 172}, {'values': ['SCA'], 'ranges': [], 'other': False, 'result': 173}, {'values': ['BBP'], 'ranges': [], 'other': False, 'result': 174}, {'values': ['LBG'], 'ranges': [], 'other': False, 'result': 175},
+                       {'values': ['TPG'], 'ranges': [], 'other': False, 'result': 176}, {'values': ['JRU'], 'ranges': [], 'other': False, 'result': 177}, {'values': ['MIN'], 'ranges': [], 'other': False, 'result': 178}, {'values': ['OUG'], 'ranges': [], 'other': False, 'result': 179}, {'values': ['KBG'], 'ranges': [], 'other': False, 'result': 180}, {'values': ['SRO'], 'ranges': [], 'other': False, 'result': 181}, {'values': ['JPU'], 'ranges': [], 'other': False, 'result': 182},
+                       {'values': ['JCL'], 'ranges': [], 'other': False, 'result': 183}, {'values': ['JPN'], 'ranges': [], 'other': False, 'result': 184}, {'values': ['KCY'], 'ranges': [], 'other': False, 'result': 185}, {'values': ['JTZ'], 'ranges': [], 'other': False, 'result': 186}, {'values': ['BNH'], 'ranges': [], 'other': False, 'result': 189}, {'values': ['BTR'], 'ranges': [], 'other': False, 'result': 190}, {'values': ['KPT'], 'ranges': [], 'other': False, 'result': 191},
+                       {'values': ['MRD'], 'ranges': [], 'other': False, 'result': 192}, {'values': ['MKH'], 'ranges': [], 'other': False, 'result': 193}, {'values': ['SRK'], 'ranges': [], 'other': False, 'result': 194}, {'values': ['BWK'], 'ranges': [], 'other': False, 'result': 195}, {'values': ['JHL'], 'ranges': [], 'other': False, 'result': 196}, {'values': ['TNM'], 'ranges': [], 'other': False, 'result': 197}, {'values': ['TDA'], 'ranges': [], 'other': False, 'result': 198},
+                       {'values': ['JTH'], 'ranges': [], 'other': False, 'result': 199}, {'values': ['JSK'], 'ranges': [], 'other': False, 'result': 200}, {'values': ['PDA'], 'ranges': [], 'other': False, 'result': 201}, {'values': ['RWG'], 'ranges': [], 'other': False, 'result': 202}, {'values': ['SJM'], 'ranges': [], 'other': False, 'result': 203}, {'values': ['BTW'], 'ranges': [], 'other': False, 'result': 204}, {'values': ['SNG'], 'ranges': [], 'other': False, 'result': 205},
+                       {'values': ['TBM'], 'ranges': [], 'other': False, 'result': 206}, {'values': ['BCM'], 'ranges': [], 'other': False, 'result': 207}, {'values': ['JSI'], 'ranges': [], 'other': False, 'result': 208}, {'values': ['STW'], 'ranges': [], 'other': False, 'result': 209}, {'values': ['TMM'], 'ranges': [], 'other': False, 'result': 210}, {'values': ['TPD'], 'ranges': [], 'other': False, 'result': 211}, {'values': ['JMA'], 'ranges': [], 'other': False, 'result': 212},
+                       {'values': ['JKB'], 'ranges': [], 'other': False, 'result': 213}, {'values': ['JGA'], 'ranges': [], 'other': False, 'result': 214}, {'values': ['JKP'], 'ranges': [], 'other': False, 'result': 215}, {'values': ['SKI'], 'ranges': [], 'other': False, 'result': 216}, {'values': ['TMB'], 'ranges': [], 'other': False, 'result': 217}, {'values': ['ZZZ'], 'ranges': [], 'other': False, 'result': 218}, {'values': ['BC1'], 'ranges': [], 'other': False, 'result': 219},
+                       {'values': ['GHS'], 'ranges': [], 'other': False, 'result': 220}, {'values': ['TSK'], 'ranges': [], 'other': False, 'result': 221}, {'values': ['TDC'], 'ranges': [], 'other': False, 'result': 222}, {'values': ['TRJ'], 'ranges': [], 'other': False, 'result': 223}, {'values': ['JAH'], 'ranges': [], 'other': False, 'result': 224}, {'values': ['TIH'], 'ranges': [], 'other': False, 'result': 225}, {'values': ['JPR'], 'ranges': [], 'other': False, 'result': 226},
+                       {'values': ['KSB'], 'ranges': [], 'other': False, 'result': 227}, {'values': ['INN'], 'ranges': [], 'other': False, 'result': 228}, {'values': ['TSJ'], 'ranges': [], 'other': False, 'result': 229}, {'values': ['SSH'], 'ranges': [], 'other': False, 'result': 230}, {'values': ['BBM'], 'ranges': [], 'other': False, 'result': 231}, {'values': ['TMD'], 'ranges': [], 'other': False, 'result': 232}, {'values': ['BEN'], 'ranges': [], 'other': False, 'result': 233},
+                       {'values': ['SRM'], 'ranges': [], 'other': False, 'result': 234}, {'values': ['SBM'], 'ranges': [], 'other': False, 'result': 235}, {'values': ['UYB'], 'ranges': [], 'other': False, 'result': 236}, {'values': ['KLS'], 'ranges': [], 'other': False, 'result': 237}, {'values': ['JKT'], 'ranges': [], 'other': False, 'result': 238}, {'values': ['KMY'], 'ranges': [], 'other': False, 'result': 239}, {'values': ['KAP'], 'ranges': [], 'other': False, 'result': 240},
+                       {'values': ['DJA'], 'ranges': [], 'other': False, 'result': 241}, {'values': ['TKK'], 'ranges': [], 'other': False, 'result': 242}, {'values': ['KKR'], 'ranges': [], 'other': False, 'result': 243}, {'values': ['GRT'], 'ranges': [], 'other': False, 'result': 244}, {'values': ['BDR'], 'ranges': [], 'other': False, 'result': 245}, {'values': ['BGH'], 'ranges': [], 'other': False, 'result': 246}, {'values': ['BPR'], 'ranges': [], 'other': False, 'result': 247},
+                       {'values': ['JTS'], 'ranges': [], 'other': False, 'result': 248}, {'values': ['TAI'], 'ranges': [], 'other': False, 'result': 249}, {'values': ['TEA'], 'ranges': [], 'other': False, 'result': 250}, {'values': ['KPR'], 'ranges': [], 'other': False, 'result': 251}, {'values': ['TMA'], 'ranges': [], 'other': False, 'result': 252}, {'values': ['JTT'], 'ranges': [], 'other': False, 'result': 253}, {'values': ['KPH'], 'ranges': [], 'other': False, 'result': 254},
+                       {'values': ['SBP'], 'ranges': [], 'other': False, 'result': 255}, {'values': ['PBR'], 'ranges': [], 'other': False, 'result': 256}, {'values': ['RAU'], 'ranges': [], 'other': False, 'result': 257}, {'values': ['JTA'], 'ranges': [], 'other': False, 'result': 258}, {'values': ['SAN'], 'ranges': [], 'other': False, 'result': 259}, {'values': ['KDN'], 'ranges': [], 'other': False, 'result': 260}, {'values': ['GMG'], 'ranges': [], 'other': False, 'result': 261},
+                       {'values': ['TCT'], 'ranges': [], 'other': False, 'result': 262}, {'values': ['BTA'], 'ranges': [], 'other': False, 'result': 263}, {'values': ['JBH'], 'ranges': [], 'other': False, 'result': 264}, {'values': ['JAI'], 'ranges': [], 'other': False, 'result': 265}, {'values': ['JDK'], 'ranges': [], 'other': False, 'result': 266}, {'values': ['TDI'], 'ranges': [], 'other': False, 'result': 267}, {'values': ['BBT'], 'ranges': [], 'other': False, 'result': 268},
+                       {'values': ['MKA'], 'ranges': [], 'other': False, 'result': 269}, {'values': ['BPI'], 'ranges': [], 'other': False, 'result': 270}, {'values': ['LHA'], 'ranges': [], 'other': False, 'result': 273}, {'values': ['STG'], 'ranges': [], 'other': False, 'result': 274}, {'values': ['MSL'], 'ranges': [], 'other': False, 'result': 275}, {'values': ['JAS'], 'ranges': [], 'other': False, 'result': 276}, {'values': ['WSU'], 'ranges': [], 'other': False, 'result': 277},
+                       {'values': ['JPI'], 'ranges': [], 'other': False, 'result': 278}, {'values': ['PTJ'], 'ranges': [], 'other': False, 'result': 279}, {'values': ['KDA'], 'ranges': [], 'other': False, 'result': 280}, {'values': ['PLT'], 'ranges': [], 'other': False, 'result': 281}, {'values': ['PTT'], 'ranges': [], 'other': False, 'result': 282}, {'values': ['PSE'], 'ranges': [], 'other': False, 'result': 283}, {'values': ['BSP'], 'ranges': [], 'other': False, 'result': 284},
+                       {'values': ['BMC'], 'ranges': [], 'other': False, 'result': 285}, {'values': ['BIH'], 'ranges': [], 'other': False, 'result': 286}, {'values': ['SUA'], 'ranges': [], 'other': False, 'result': 287}, {'values': ['SPT'], 'ranges': [], 'other': False, 'result': 288}, {'values': ['TEE'], 'ranges': [], 'other': False, 'result': 289}, {'values': ['TDY'], 'ranges': [], 'other': False, 'result': 290}, {'values': ['BSL'], 'ranges': [], 'other': False, 'result': 291},
+                       {'values': ['BMJ'], 'ranges': [], 'other': False, 'result': 292}, {'values': ['BSA'], 'ranges': [], 'other': False, 'result': 293}, {'values': ['KKM'], 'ranges': [], 'other': False, 'result': 294}, {'values': ['BKR'], 'ranges': [], 'other': False, 'result': 295}, {'values': ['BJL'], 'ranges': [], 'other': False, 'result': 296}, {'values': ['IKB'], 'ranges': [], 'other': False, 'result': 701}, {'values': ['IPJ'], 'ranges': [], 'other': False, 'result': 702},
+                       {'values': ['IWS'], 'ranges': [], 'other': False, 'result': 703}, {'values': ['IJK'], 'ranges': [], 'other': False, 'result': 704}, {'values': ['H01'], 'ranges': [], 'other': False, 'result': 800}, {'values': ['H02'], 'ranges': [], 'other': False, 'result': 801}, {'values': ['H03'], 'ranges': [], 'other': False, 'result': 802}, {'values': ['H04'], 'ranges': [], 'other': False, 'result': 803}, {'values': ['H05'], 'ranges': [], 'other': False, 'result': 804},
+                       {'values': ['H06'], 'ranges': [], 'other': False, 'result': 805}, {'values': ['H07'], 'ranges': [], 'other': False, 'result': 806}, {'values': ['H08'], 'ranges': [], 'other': False, 'result': 807}, {'values': ['H09'], 'ranges': [], 'other': False, 'result': 808}, {'values': ['H10'], 'ranges': [], 'other': False, 'result': 809}, {'values': ['H11'], 'ranges': [], 'other': False, 'result': 811}, {'values': ['H12'], 'ranges': [], 'other': False, 'result': 812},
+                       {'values': ['H13'], 'ranges': [], 'other': False, 'result': 813}, {'values': ['H14'], 'ranges': [], 'other': False, 'result': 814}, {'values': ['H15'], 'ranges': [], 'other': False, 'result': 815}, {'values': ['H16'], 'ranges': [], 'other': False, 'result': 816}, {'values': ['H17'], 'ranges': [], 'other': False, 'result': 817}, {'values': ['H18'], 'ranges': [], 'other': False, 'result': 818}, {'values': ['H19'], 'ranges': [], 'other': False, 'result': 819},
+                       {'values': ['H20'], 'ranges': [], 'other': False, 'result': 820}, {'values': ['H21'], 'ranges': [], 'other': False, 'result': 821}, {'values': ['H22'], 'ranges': [], 'other': False, 'result': 822}, {'values': ['H23'], 'ranges': [], 'other': False, 'result': 823}, {'values': ['H24'], 'ranges': [], 'other': False, 'result': 824}, {'values': ['H25'], 'ranges': [], 'other': False, 'result': 825}, {'values': ['H26'], 'ranges': [], 'other': False, 'result': 826},
+                       {'values': ['H27'], 'ranges': [], 'other': False, 'result': 827}, {'values': ['H28'], 'ranges': [], 'other': False, 'result': 828}, {'values': ['H44'], 'ranges': [], 'other': False, 'result': 844}, {'values': ['H45'], 'ranges': [], 'other': False, 'result': 845}, {'values': ['H46'], 'ranges': [], 'other': False, 'result': 846}, {'values': ['H47'], 'ranges': [], 'other': False, 'result': 847}, {'values': ['H48'], 'ranges': [], 'other': False, 'result': 848},
+                       {'values': ['H49'], 'ranges': [], 'other': False, 'result': 849}, {'values': ['H50'], 'ranges': [], 'other': False, 'result': 850}, {'values': ['H51'], 'ranges': [], 'other': False, 'result': 851}, {'values': ['H52'], 'ranges': [], 'other': False, 'result': 852}, {'values': ['H53'], 'ranges': [], 'other': False, 'result': 853}, {'values': ['H54'], 'ranges': [], 'other': False, 'result': 854}, {'values': ['H55'], 'ranges': [], 'other': False, 'result': 855},
+                       {'values': ['H56'], 'ranges': [], 'other': False, 'result': 856}, {'values': ['H57'], 'ranges': [], 'other': False, 'result': 857}, {'values': ['H58'], 'ranges': [], 'other': False, 'result': 858}, {'values': ['H59'], 'ranges': [], 'other': False, 'result': 859}, {'values': ['H60'], 'ranges': [], 'other': False, 'result': 860}, {'values': ['H61'], 'ranges': [], 'other': False, 'result': 861}, {'values': ['H62'], 'ranges': [], 'other': False, 'result': 862},
+                       {'values': ['H63'], 'ranges': [], 'other': False, 'result': 863}, {'values': ['HOE'], 'ranges': [], 'other': False, 'result': 884}, {'values': ['CBR'], 'ranges': [], 'other': False, 'result': 902}, {'values': ['CCC'], 'ranges': [], 'other': False, 'result': 903}, {'values': ['SCD'], 'ranges': [], 'other': False, 'result': 904}, {'values': ['SCC'], 'ranges': [], 'other': False, 'result': 905}, {'values': ['CAD'], 'ranges': [], 'other': False, 'result': 906},
+                       {'values': ['SDC'], 'ranges': [], 'other': False, 'result': 907}, {'values': ['ICC'], 'ranges': [], 'other': False, 'result': 908}, {'values': ['PCC'], 'ranges': [], 'other': False, 'result': 909}, {'values': ['JCC'], 'ranges': [], 'other': False, 'result': 910}, {'values': ['KCA'], 'ranges': [], 'other': False, 'result': 911}, {'values': ['CCA'], 'ranges': [], 'other': False, 'result': 912}, {'values': ['LCA'], 'ranges': [], 'other': False, 'result': 913},
+                       {'values': ['JCA'], 'ranges': [], 'other': False, 'result': 914}, {'values': ['PCA'], 'ranges': [], 'other': False, 'result': 915}, {'values': ['BCA'], 'ranges': [], 'other': False, 'result': 916}, {'values': ['KCC'], 'ranges': [], 'other': False, 'result': 917}, {'values': ['MCC'], 'ranges': [], 'other': False, 'result': 918}, {'values': ['HCC'], 'ranges': [], 'other': False, 'result': 919}, {'values': ['LCC'], 'ranges': [], 'other': False, 'result': 920},
+                       {'values': ['TFC'], 'ranges': [], 'other': False, 'result': 992}, {'values': ['XPP'], 'ranges': [], 'other': False, 'result': 993}, {'values': ['XJB'], 'ranges': [], 'other': False, 'result': 994}, {'values': ['SMC'], 'ranges': [], 'other': False, 'result': 996}, {'values': ['CCP'], 'ranges': [], 'other': False, 'result': 997}, {'values': ['CPC'], 'ranges': [], 'other': False, 'result': 998}]}}
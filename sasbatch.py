@@ -0,0 +1,208 @@
+"""Shared batch executor for the steps that produce SAS datasets.
+
+Each converter used to open a saspy.SASsession() for its handful of DATA
+steps.  Converters now queue their steps on the process-wide batch
+returned by shared_batch():
+
+    batch = shared_batch()
+    path = batch.dataset("BILLS", output_dir, "customer_240101", frame,
+                         char_lengths=..., formats=...)
+    for timing in batch.run():
+        print(timing)
+
+and run() executes everything queued so far, in order, on one warm session
+that stays open until the process exits.  Every dataset a job writes, over
+any number of run() calls, goes through that one session.  EIBWBILE,
+EIBKCTRL and EIBMTCSM are still separate scripts run as separate
+processes, so each of them starts its own session.  Sharing one session
+across all three would need a driver that imports them, and EIBWBILE.py
+and EIBKCTRL.py cannot be imported: they keep the JCL and the older
+program variants inline after the current one.
+
+XMIS_SAS_BACKEND selects the session: "native" (the default) writes the
+datasets in-process with saswriter and needs no SAS runtime; "saspy" keeps
+one saspy session for jobs whose output must still come from SAS.  Raw SAS
+code steps (submit) need the saspy backend.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+import pandas as pd
+
+from saswriter import Column, write_dataset
+
+
+BACKEND_VARIABLE = "XMIS_SAS_BACKEND"
+BACKENDS = ("native", "saspy")
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    name: str
+    seconds: float
+    rows: int | None = None
+
+    def __str__(self) -> str:
+        rows = "" if self.rows is None else f"  {self.rows:,} rows"
+        return f"{self.name:<32} {self.seconds:9.3f}s{rows}"
+
+
+@dataclass
+class _Step:
+    name: str
+    action: Callable[[], int | None]
+
+
+@dataclass
+class SASBatch:
+    """Ordered queue of dataset and code steps run on one session."""
+
+    backend: str = "native"
+    timings: list[StepTiming] = field(default_factory=list)
+    _queue: list[_Step] = field(default_factory=list)
+    _session: Any = None
+    _librefs: dict[str, Path] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.backend not in BACKENDS:
+            raise ValueError(f"unknown SAS backend {self.backend!r}; use one of {BACKENDS}")
+
+    def session(self) -> Any:
+        """The warm saspy session, started on first use."""
+        if self._session is None:
+            try:
+                import saspy
+            except ImportError as error:
+                raise RuntimeError(
+                    "The saspy backend requires saspy and a configured SAS runtime"
+                ) from error
+            started = time.perf_counter()
+            self._session = saspy.SASsession()
+            self.timings.append(StepTiming("SAS session start", time.perf_counter() - started))
+        return self._session
+
+    def _check(self, result: Mapping[str, str]) -> None:
+        if "ERROR:" in result.get("LOG", ""):
+            raise RuntimeError(result["LOG"])
+
+    def _libname(self, libref: str, directory: Path) -> None:
+        directory = directory.resolve()
+        if self._librefs.get(libref) == directory:
+            return
+        sas_path = str(directory).replace("'", "''")
+        self._check(self.session().submit(f"libname {libref} '{sas_path}';"))
+        self._librefs[libref] = directory
+
+    def submit(self, name: str, code: str) -> None:
+        """Queue a SAS program (saspy backend only)."""
+        if self.backend != "saspy":
+            raise RuntimeError(f"{name}: SAS code steps need {BACKEND_VARIABLE}=saspy")
+
+        def action() -> None:
+            self._check(self.session().submit(code))
+
+        self._queue.append(_Step(name, action))
+
+    def dataset(
+        self,
+        libref: str,
+        directory: Path,
+        table: str,
+        data: pd.DataFrame | Iterable[pd.DataFrame],
+        char_lengths: Mapping[str, int] | None = None,
+        formats: Mapping[str, str] | None = None,
+        columns: Iterable[Column] | None = None,
+    ) -> Path:
+        """Queue LIBREF.TABLE from a frame or frame chunks; returns the file it becomes.
+
+        columns fixes the SAS variables up front (see saswriter.Column); the
+        saspy backend then takes the character lengths and formats from it.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory.resolve() / f"{table.lower()}.sas7bdat"
+        if columns is not None:
+            columns = list(columns)
+            char_lengths = {c.name: c.length for c in columns if c.kind == "char"}
+            formats = {c.name: c.format for c in columns if c.format}
+
+        def native() -> int:
+            chunks = [data] if isinstance(data, pd.DataFrame) else data
+            rows = 0
+
+            def counted() -> Iterable[pd.DataFrame]:
+                nonlocal rows
+                for chunk in chunks:
+                    rows += len(chunk)
+                    yield chunk
+
+            write_dataset(path, counted(), char_lengths=char_lengths, formats=formats, columns=columns)
+            return rows
+
+        def saspy_step() -> int:
+            frame = data if isinstance(data, pd.DataFrame) else _concat(list(data), columns, table)
+            self._libname(libref, directory)
+            self.session().df2sd(
+                frame,
+                table=table,
+                libref=libref,
+                char_lengths=dict(char_lengths or {}),
+                outfmts=dict(formats or {}),
+            )
+            if not path.is_file():
+                raise RuntimeError(f"SAS did not create the expected file: {path}")
+            return len(frame)
+
+        self._queue.append(_Step(f"{libref}.{table}", native if self.backend == "native" else saspy_step))
+        return path
+
+    def run(self) -> list[StepTiming]:
+        """Execute the queued steps in order; returns this run's timings."""
+        first = len(self.timings)
+        queue, self._queue = self._queue, []
+        if queue and self.backend == "saspy":
+            self.session()
+        for step in queue:
+            started = time.perf_counter()
+            rows = step.action()
+            self.timings.append(StepTiming(step.name, time.perf_counter() - started, rows))
+        return self.timings[first:]
+
+    def close(self) -> None:
+        self._queue.clear()
+        if self._session is not None:
+            try:
+                self._session.endsas()
+            finally:
+                self._session = None
+                self._librefs.clear()
+
+
+def _concat(chunks: list[pd.DataFrame], columns: list[Column] | None, table: str) -> pd.DataFrame:
+    """One frame from streamed chunks; no chunks is an empty frame of columns."""
+    if chunks:
+        return pd.concat(chunks, ignore_index=True)
+    if columns is None:
+        raise ValueError(f"{table}: no rows and no columns to write")
+    return pd.DataFrame({
+        column.name: pd.Series(dtype="float64" if column.kind == "num" else "object")
+        for column in columns
+    })
+
+
+_SHARED: SASBatch | None = None
+
+
+def shared_batch() -> SASBatch:
+    """The process-wide batch; its session is ended when the process exits."""
+    global _SHARED
+    if _SHARED is None:
+        _SHARED = SASBatch(os.environ.get(BACKEND_VARIABLE, "native").lower())
+        atexit.register(_SHARED.close)
+    return _SHARED
@@ -0,0 +1,254 @@
+"""Shared SAS7BDAT reader for the converted jobs.
+
+pd.read_sas decodes every text cell on its own, and the jobs then strip the
+padding again with a per-cell ``.map``.  This reader leaves the text as bytes
+while parsing and decodes each text column in one vectorized step: the column
+is factorized and only its distinct values are decoded and stripped, so code
+columns with a handful of values (BORSTAT, USER5, OPENIND, ...) cost almost
+nothing however many rows the dataset has.
+
+Column names are upper-cased, as every job already did after reading.
+
+When XMIS_SAS_CACHE_DIR is set, each decoded dataset is also kept there as
+Parquet (see ColumnarCache), so a second job reading the same month's file
+loads columns from Parquet instead of parsing SAS7BDAT again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_ENCODING = "latin1"
+# Rows per pd.read_sas chunk when a projection is requested without an
+# explicit chunksize; only the projected columns of each chunk are kept.
+PROJECTION_CHUNKSIZE = 200_000
+
+CACHE_DIR_VARIABLE = "XMIS_SAS_CACHE_DIR"
+CACHE_LIMIT_VARIABLE = "XMIS_SAS_CACHE_MB"
+DEFAULT_CACHE_LIMIT_MB = 8192
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def decode_text(column: pd.Series, encoding: str = DEFAULT_ENCODING, strip: str = "right") -> pd.Series:
+    """Decode and strip a bytes/str column once per distinct value."""
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    if not len(uniques):
+        return column
+    decoded = []
+    for value in uniques:
+        if isinstance(value, bytes):
+            value = value.decode(encoding)
+        if isinstance(value, str):
+            value = value.strip() if strip == "both" else value.rstrip()
+        decoded.append(value)
+    lookup = np.empty(len(decoded) + 1, dtype=object)
+    lookup[:-1] = decoded
+    lookup[-1] = np.nan
+    return pd.Series(lookup[codes], index=column.index, name=column.name, dtype=object)
+
+
+def _project(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        raise KeyError(f"columns not in dataset: {', '.join(missing)}")
+    return frame[columns].copy()
+
+
+def _normalize(
+    frame: pd.DataFrame,
+    columns: list[str] | None,
+    encoding: str,
+    strip: str,
+) -> pd.DataFrame:
+    frame.columns = [str(column).upper() for column in frame.columns]
+    if columns is not None:
+        frame = _project(frame, columns)
+    for column in frame.select_dtypes(include=["object"]).columns:
+        frame[column] = decode_text(frame[column], encoding, strip)
+    return frame
+
+
+def _categorize(frame: pd.DataFrame, categorical: Iterable[str]) -> pd.DataFrame:
+    for column in categorical:
+        column = column.upper()
+        if column in frame and pd.api.types.is_string_dtype(frame[column].dtype):
+            frame[column] = frame[column].astype("category")
+    return frame
+
+
+def _chunks(
+    path: Path,
+    chunksize: int,
+    columns: list[str] | None,
+    encoding: str,
+    categorical: tuple[str, ...],
+    strip: str,
+) -> Iterator[pd.DataFrame]:
+    with pd.read_sas(path, format="sas7bdat", chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield _categorize(_normalize(chunk, columns, encoding, strip), categorical)
+
+
+@dataclass(frozen=True)
+class ColumnarCache:
+    """Parquet copies of decoded SAS7BDAT files with LRU eviction.
+
+    An entry is keyed by the resolved path, size, mtime and a BLAKE2 hash of
+    the file content (plus the decoding options), so a replaced or rewritten
+    input never serves stale data.  Every hit refreshes the entry's mtime;
+    after each store the least recently used entries are deleted until the
+    directory is within max_bytes.
+    """
+
+    directory: Path
+    max_bytes: int
+
+    def key(self, path: Path, encoding: str, strip: str) -> str:
+        path = path.resolve()
+        stat = path.stat()
+        content = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as source:
+            for block in iter(lambda: source.read(HASH_BLOCK_SIZE), b""):
+                content.update(block)
+        fingerprint = f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{content.hexdigest()}|{encoding}|{strip}"
+        return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+    def entry(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def load(self, key: str, columns: list[str] | None) -> pd.DataFrame | None:
+        """The cached frame, with the dtypes the decoded SAS7BDAT file had.
+
+        Parquet brings text back as pandas str and datetimes as
+        datetime64[ms]; the numpy dtypes recorded when the entry was stored
+        are restored so that a hit is indistinguishable from a miss.
+        """
+        import pyarrow.parquet as pq
+
+        entry = self.entry(key)
+        if not entry.is_file():
+            return None
+        schema = pq.read_schema(entry)
+        if columns is not None:
+            missing = [column for column in columns if column not in schema.names]
+            if missing:
+                raise KeyError(f"columns not in dataset: {', '.join(missing)}")
+        frame = pd.read_parquet(entry, columns=columns)
+        stored = {column["name"]: column["numpy_type"] for column in schema.pandas_metadata["columns"]}
+        restored = {
+            name: stored[name]
+            for name in frame.columns
+            if name in stored and str(frame[name].dtype) != stored[name]
+        }
+        os.utime(entry)
+        return frame.astype(restored) if restored else frame
+
+    def store(self, key: str, frame: pd.DataFrame) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self.entry(key)
+        # A temporary file of its own per writer, so concurrent stores of the
+        # same entry (threads or processes) never write into one file.
+        handle, partial = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+        os.close(handle)
+        try:
+            frame.to_parquet(partial, index=False)
+            os.replace(partial, entry)
+        except BaseException:
+            Path(partial).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        entries = sorted(
+            (entry.stat().st_mtime_ns, entry.stat().st_size, entry)
+            for entry in self.directory.glob("*.parquet")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def cache_from_environment() -> ColumnarCache | None:
+    """The cache configured by XMIS_SAS_CACHE_DIR, or None when unset or pyarrow is absent."""
+    directory = os.environ.get(CACHE_DIR_VARIABLE)
+    if not directory or importlib.util.find_spec("pyarrow") is None:
+        return None
+    limit_mb = int(os.environ.get(CACHE_LIMIT_VARIABLE, DEFAULT_CACHE_LIMIT_MB))
+    return ColumnarCache(Path(directory), limit_mb * 1024 * 1024)
+
+
+def _cached(
+    cache: ColumnarCache,
+    path: Path,
+    columns: list[str] | None,
+    encoding: str,
+    strip: str,
+) -> pd.DataFrame:
+    key = cache.key(path, encoding, strip)
+    frame = cache.load(key, columns)
+    if frame is None:
+        frame = _normalize(pd.read_sas(path, format="sas7bdat"), None, encoding, strip)
+        cache.store(key, frame)
+        if columns is not None:
+            frame = _project(frame, columns)
+    return frame
+
+
+def _slices(frame: pd.DataFrame, chunksize: int, categorical: tuple[str, ...]) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(frame), chunksize):
+        yield _categorize(frame.iloc[start:start + chunksize].reset_index(drop=True), categorical)
+
+
+def read_sas(
+    path: Path | str,
+    columns: Iterable[str] | None = None,
+    chunksize: int | None = None,
+    encoding: str = DEFAULT_ENCODING,
+    categorical: Iterable[str] = (),
+    strip: str = "right",
+    use_cache: bool = True,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    """Read a SAS7BDAT file with upper-case names and decoded, stripped text.
+
+    columns     keep only these columns (names are case-insensitive); without
+                a chunksize the file is still parsed in chunks so the unused
+                columns are never held for the whole file.
+    chunksize   return an iterator of DataFrames of at most this many rows.
+    categorical text columns to return as pandas categoricals, for
+                low-cardinality codes such as BORSTAT and USER5.
+    strip       "right" (SAS trailing-blank semantics) or "both".
+    use_cache   go through the XMIS_SAS_CACHE_DIR Parquet cache when one is
+                configured.  A chunked read is served from the cache only
+                on a hit; a miss streams from SAS7BDAT without caching.
+    """
+    path = Path(path)
+    wanted = None if columns is None else [str(column).upper() for column in columns]
+    categorical = tuple(categorical)
+    cache = cache_from_environment() if use_cache else None
+    if cache is not None and chunksize is None:
+        return _categorize(_cached(cache, path, wanted, encoding, strip), categorical)
+    if cache is not None:
+        frame = cache.load(cache.key(path, encoding, strip), wanted)
+        if frame is not None:
+            return _slices(frame, chunksize, categorical)
+    if chunksize is not None:
+        return _chunks(path, chunksize, wanted, encoding, categorical, strip)
+    if wanted is None:
+        frame = _normalize(pd.read_sas(path, format="sas7bdat"), None, encoding, strip)
+    else:
+        parts = list(_chunks(path, PROJECTION_CHUNKSIZE, wanted, encoding, (), strip))
+        frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=wanted)
+    return _categorize(frame, categorical)
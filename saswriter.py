@@ -0,0 +1,552 @@
+"""Native SAS7BDAT writer for the converted jobs.
+
+The jobs used to start a saspy.SASsession() and push every DataFrame through
+df2sd just to materialise a few tables, which needed a licensed SAS runtime
+and spent most of the run in start-up and transfer.  This module writes the
+files directly: uncompressed, 64-bit little-endian (the layout SAS uses on
+Linux x64), numeric columns as 8-byte doubles and character columns as
+blank-padded fixed-length bytes.
+
+Rows are encoded one page at a time, so memory stays bounded by the page size
+(plus the chunk being written) however many rows are streamed:
+
+    with SAS7BDATWriter(path, columns) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+write_dataset() covers the common case of one DataFrame, an iterable of
+DataFrames or an iterable of row mappings, deriving the columns from the data
+plus the job's CHAR_LENGTHS and format declarations.
+
+datetime64 columns are stored with SAS semantics: days since 1960-01-01 when
+the column has a date format (DATE9., DDMMYY8., ...), otherwise seconds since
+1960-01-01 with DATETIME26.6, which is what df2sd did.  Missing numerics are
+written as SAS system missing (.), the NaN bit pattern FFFFFE0000000000
+SAS itself writes, and missing text as blanks.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_ENCODING = "latin1"
+ENCODING_CODES = {"utf-8": 20, "latin1": 29, "cp1252": 62}
+PAGE_SIZE = 65536
+HEADER_SIZE = 65536
+SAS_EPOCH = pd.Timestamp("1960-01-01")
+SAS_RELEASE = "9.0401M6"
+# SAS system missing (.) as the 64-bit pattern SAS stores; any NaN reads
+# back as missing, but PROC COMPARE METHOD=EXACT tells the patterns apart.
+SAS_MISSING_BITS = np.uint64(0xFFFFFE0000000000)
+
+DATE_FORMAT_NAMES = frozenset(
+    {"DATE", "DAY", "DDMMYY", "DDMMYYB", "DDMMYYC", "DDMMYYD", "DDMMYYN", "DDMMYYP", "DDMMYYS",
+     "E8601DA", "MMDDYY", "MMDDYYN", "MMDDYYS", "MONNAME", "MONTH", "MONYY", "QTR", "WEEKDATE",
+     "WEEKDAY", "WORDDATE", "YEAR", "YYMM", "YYMMDD", "YYMMDDN", "YYMMDDS", "YYMON", "YYQ"}
+)
+DEFAULT_DATETIME_FORMAT = "DATETIME26.6"
+
+_FORMAT = re.compile(r"(\$?[A-Z_](?:[A-Z0-9_]*[A-Z_])?|\$)?(\d*)\.(\d*)")
+
+# 64-bit layout constants.
+_INT = 8
+_PAGE_HEADER = 40
+_POINTER = 24
+_META_PAGE = 0x0000
+_DATA_PAGE = 0x0100
+_ROW_SIZE = b"\xf7\xf7\xf7\xf7\x00\x00\x00\x00"
+_COLUMN_SIZE = b"\xf6\xf6\xf6\xf6\x00\x00\x00\x00"
+_COUNTS = b"\x00\xfc\xff\xff\xff\xff\xff\xff"
+_COLUMN_TEXT = b"\xfd\xff\xff\xff\xff\xff\xff\xff"
+_COLUMN_NAME = b"\xff\xff\xff\xff\xff\xff\xff\xff"
+_COLUMN_ATTRIBUTES = b"\xfc\xff\xff\xff\xff\xff\xff\xff"
+_FORMAT_LABEL = b"\xfe\xfb\xff\xff\xff\xff\xff\xff"
+# Signature order of the vectors in the subheader counts subheader.
+_COUNTED = (
+    _COLUMN_ATTRIBUTES,
+    _COLUMN_TEXT,
+    _COLUMN_NAME,
+    b"\xfe\xff\xff\xff\xff\xff\xff\xff",
+    b"\xfb\xff\xff\xff\xff\xff\xff\xff",
+    b"\xfa\xff\xff\xff\xff\xff\xff\xff",
+    b"\xf9\xff\xff\xff\xff\xff\xff\xff",
+)
+_TEXT_BLOCK_LIMIT = 32_000
+_VECTORS_PER_SUBHEADER = 1024
+_CREATOR = b"DATASTEP"
+# Start of column text in the first text block, after the size field,
+# the (empty) compression literal and the creator procedure.
+_FIRST_TEXT_OFFSET = 36
+_CREATOR_OFFSET = 28
+
+
+@dataclass(frozen=True)
+class Column:
+    """One SAS variable: kind is "num" or "char"; length is in bytes."""
+
+    name: str
+    kind: str
+    length: int = 8
+    format: str = ""
+    label: str = ""
+    truncate: bool = True
+
+    def __post_init__(self) -> None:
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]{0,31}", self.name):
+            raise ValueError(f"invalid SAS variable name {self.name!r}")
+        if self.kind not in ("num", "char"):
+            raise ValueError(f"{self.name}: kind must be 'num' or 'char'")
+        if self.kind == "num" and self.length != 8:
+            raise ValueError(f"{self.name}: numeric columns are written as 8-byte doubles")
+        if not 1 <= self.length <= 32767:
+            raise ValueError(f"{self.name}: character length must be 1-32767")
+        format_parts(self.format)
+
+
+def format_parts(fmt: str) -> tuple[str, int, int]:
+    """Split a SAS format such as 'DATE9.' or '20.2' into (name, width, decimals)."""
+    if not fmt:
+        return "", 0, 0
+    match = _FORMAT.fullmatch(fmt.upper())
+    if not match:
+        raise ValueError(f"invalid SAS format {fmt!r}")
+    name, width, decimals = match.groups()
+    return name or "", int(width or 0), int(decimals or 0)
+
+
+def is_date_format(fmt: str) -> bool:
+    return format_parts(fmt)[0] in DATE_FORMAT_NAMES
+
+
+def sas_numbers(values: pd.Series, fmt: str = "") -> np.ndarray:
+    """Numeric column as float64 SAS values, missing as SAS system missing."""
+    numbers = _float_values(values, fmt)
+    missing = np.isnan(numbers)
+    if missing.any():
+        numbers = numbers.astype("<f8", copy=True)
+        numbers.view("<u8")[missing] = SAS_MISSING_BITS
+    return numbers
+
+
+def _float_values(values: pd.Series, fmt: str) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        stamps = pd.to_datetime(values)
+        if getattr(stamps.dt, "tz", None) is not None:
+            stamps = stamps.dt.tz_localize(None)
+        delta = stamps - SAS_EPOCH
+        if is_date_format(fmt):
+            return (delta.dt.floor("D") / pd.Timedelta(days=1)).to_numpy(dtype="float64", na_value=np.nan)
+        return (delta / pd.Timedelta(seconds=1)).to_numpy(dtype="float64", na_value=np.nan)
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values.astype("float64").to_numpy()
+    return pd.to_numeric(values).astype("float64").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def sas_text(values: pd.Series, column: Column, encoding: str) -> np.ndarray:
+    """Character column as blank-padded bytes, encoded once per distinct value."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    encoded = []
+    for value in uniques:
+        raw = str(value).encode(encoding, errors="replace")
+        if len(raw) > column.length:
+            if not column.truncate:
+                raise ValueError(
+                    f"{column.name}: value {value!r} is longer than {column.length} bytes"
+                )
+            raw = raw[:column.length].decode(encoding, errors="ignore").encode(encoding)
+        encoded.append(raw.ljust(column.length))
+    lookup = np.array([*encoded, b" " * column.length], dtype=f"S{column.length}")
+    return lookup[codes]
+
+
+def _char_width(values: pd.Series, encoding: str) -> int:
+    uniques = pd.unique(values.dropna())
+    return max([len(str(value).encode(encoding, errors="replace")) for value in uniques] + [1])
+
+
+def columns_for(
+    frame: pd.DataFrame,
+    char_lengths: Mapping[str, int] | None = None,
+    formats: Mapping[str, str] | None = None,
+    labels: Mapping[str, str] | None = None,
+    encoding: str = DEFAULT_ENCODING,
+) -> list[Column]:
+    """Derive SAS columns from a frame the way df2sd did.
+
+    Columns listed in char_lengths are character with that length (longer
+    values are truncated, as SAS does on assignment).  Other numeric, boolean
+    and datetime columns are numeric; everything else is character as wide
+    as its longest value; when the frame is only the first chunk of a
+    stream, a later, longer value raises instead of being truncated.
+    """
+    char_lengths = char_lengths or {}
+    formats = formats or {}
+    labels = labels or {}
+    columns = []
+    for name in frame.columns:
+        values = frame[name]
+        dtype = values.dtype
+        fmt = formats.get(name, "")
+        label = labels.get(name, "")
+        if name in char_lengths:
+            columns.append(Column(name, "char", int(char_lengths[name]), fmt, label))
+        elif (
+            pd.api.types.is_numeric_dtype(dtype)
+            or pd.api.types.is_bool_dtype(dtype)
+            or pd.api.types.is_datetime64_any_dtype(dtype)
+        ):
+            if pd.api.types.is_datetime64_any_dtype(dtype) and not fmt:
+                fmt = DEFAULT_DATETIME_FORMAT
+            columns.append(Column(name, "num", 8, fmt, label))
+        else:
+            width = _char_width(values, encoding)
+            columns.append(Column(name, "char", width, fmt, label, truncate=False))
+    return columns
+
+
+class _TextStore:
+    """Column text blocks; every entry is referenced as (block, offset, length)."""
+
+    def __init__(self) -> None:
+        first = bytearray(_FIRST_TEXT_OFFSET)
+        first[_CREATOR_OFFSET:_CREATOR_OFFSET + len(_CREATOR)] = _CREATOR
+        self.blocks = [first]
+
+    def add(self, text: bytes) -> tuple[int, int, int]:
+        if not text:
+            return 0, 0, 0
+        padded = text + b" " * (-len(text) % 4)
+        if len(self.blocks[-1]) + len(padded) > _TEXT_BLOCK_LIMIT:
+            self.blocks.append(bytearray(4))
+        block = self.blocks[-1]
+        offset = len(block)
+        block += padded
+        return len(self.blocks) - 1, offset, len(text)
+
+    def subheaders(self) -> list[bytes]:
+        result = []
+        for block in self.blocks:
+            length = _INT + len(block) + 12
+            body = bytearray(block) + bytes(12)
+            struct.pack_into("<H", body, 0, _remainder(length))
+            result.append(_COLUMN_TEXT + bytes(body))
+        return result
+
+
+def _remainder(length: int) -> int:
+    return length - (4 + 2 * _INT)
+
+
+def _vector_subheader(signature: bytes, vectors: list[bytes]) -> bytes:
+    length = 2 * _INT + sum(len(vector) for vector in vectors) + 12
+    head = bytearray(_INT)
+    struct.pack_into("<H", head, 0, _remainder(length))
+    return signature + bytes(head) + b"".join(vectors) + bytes(12)
+
+
+@dataclass
+class _Placement:
+    signature: bytes
+    data: bytes
+    page: int = 0
+    position: int = 0
+    offset: int = 0
+
+
+class SAS7BDATWriter:
+    """Stream rows into a SAS7BDAT file; see the module docstring."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        columns: Iterable[Column],
+        dataset_name: str | None = None,
+        encoding: str = DEFAULT_ENCODING,
+    ) -> None:
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        if not self.columns:
+            raise ValueError("a SAS dataset needs at least one column")
+        names = [column.name.upper() for column in self.columns]
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate column names (SAS names are case-insensitive)")
+        codec = encoding.lower().replace("_", "-")
+        codec = {"latin-1": "latin1", "iso-8859-1": "latin1", "utf8": "utf-8"}.get(codec, codec)
+        if codec not in ENCODING_CODES:
+            raise ValueError(f"unsupported encoding {encoding!r}; use one of {sorted(ENCODING_CODES)}")
+        self.encoding = codec
+        self.dataset_name = (dataset_name or self.path.stem).upper()[:32]
+
+        # SAS stores numeric variables first, then character variables.
+        offsets: dict[str, int] = {}
+        position = 0
+        for column in sorted(self.columns, key=lambda item: item.kind != "num"):
+            offsets[column.name] = position
+            position += column.length
+        self.row_length = position
+        self.offsets = offsets
+        self.page_size = max(PAGE_SIZE, -(-(_PAGE_HEADER + self.row_length) // 4096) * 4096)
+        self.rows_per_page = (self.page_size - _PAGE_HEADER) // self.row_length
+        self.record_dtype = np.dtype(
+            {
+                "names": [column.name for column in self.columns],
+                "formats": ["<f8" if column.kind == "num" else f"S{column.length}" for column in self.columns],
+                "offsets": [offsets[column.name] for column in self.columns],
+                "itemsize": self.row_length,
+            }
+        )
+        self.created = (datetime.now() - datetime(1960, 1, 1)).total_seconds()
+        self.row_count = 0
+        self.data_pages = 0
+        self._pending = bytearray()
+        self._meta_pages = len(self._meta(0))
+        self._file: BinaryIO | None = self.path.open("wb")
+        self._file.seek(HEADER_SIZE + self._meta_pages * self.page_size)
+
+    def __enter__(self) -> "SAS7BDATWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def encode(self, frame: pd.DataFrame) -> bytes:
+        """Encode a chunk as consecutive fixed-length SAS rows."""
+        missing = [column.name for column in self.columns if column.name not in frame.columns]
+        if missing:
+            raise KeyError(f"columns not in frame: {', '.join(missing)}")
+        records = np.zeros(len(frame), dtype=self.record_dtype)
+        for column in self.columns:
+            values = frame[column.name]
+            if column.kind == "num":
+                records[column.name] = sas_numbers(values, column.format)
+            else:
+                records[column.name] = sas_text(values, column, self.encoding)
+        return records.tobytes()
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self._file is None:
+            raise ValueError("writer is closed")
+        self._pending += self.encode(frame)
+        self.row_count += len(frame)
+        page_bytes = self.rows_per_page * self.row_length
+        while len(self._pending) >= page_bytes:
+            self._write_data_page(self._pending[:page_bytes])
+            del self._pending[:page_bytes]
+
+    def _write_data_page(self, rows: bytes | bytearray) -> None:
+        page = bytearray(self.page_size)
+        struct.pack_into("<HHH", page, 32, _DATA_PAGE, len(rows) // self.row_length, 0)
+        page[_PAGE_HEADER:_PAGE_HEADER + len(rows)] = rows
+        self._file.write(page)
+        self.data_pages += 1
+
+    def close(self) -> None:
+        """Flush the last page and write the header and metadata pages."""
+        if self._file is None:
+            return
+        try:
+            if self._pending:
+                self._write_data_page(self._pending)
+                self._pending.clear()
+            meta = self._meta(self.row_count)
+            self._file.seek(0)
+            self._file.write(self._header(len(meta) + self.data_pages))
+            for page in meta:
+                self._file.write(page)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def abort(self) -> None:
+        """Close and remove a partially written file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.path.unlink(missing_ok=True)
+
+    def _header(self, page_count: int) -> bytes:
+        header = bytearray(HEADER_SIZE)
+        header[0:32] = b"\x00" * 12 + b"\xc2\xea\x81\x60\xb3\x14\x11\xcf\xbd\x92\x08\x00\x09\xc7\x31\x8c\x18\x1f\x10\x11"
+        header[32:40] = b"\x33\x22\x00\x33\x33\x01\x02\x31"
+        header[70] = ENCODING_CODES[self.encoding]
+        header[84:92] = b"SAS FILE"
+        header[92:156] = self.dataset_name.encode("ascii", errors="replace").ljust(64)
+        header[156:164] = b"DATA    "
+        # 4 bytes of alignment padding follow at 164.
+        struct.pack_into("<dd", header, 168, self.created, self.created)
+        struct.pack_into("<IIQ", header, 200, HEADER_SIZE, self.page_size, page_count)
+        header[224:232] = SAS_RELEASE.encode("ascii")
+        header[232:248] = b"Linux".ljust(16, b"\x00")
+        header[248:264] = b"x86_64".ljust(16, b"\x00")
+        header[280:296] = b"x86_64".ljust(16, b"\x00")
+        return bytes(header)
+
+    def _subheaders(self, row_count: int) -> list[_Placement]:
+        text = _TextStore()
+        names, attributes, formats = [], [], []
+        for column in self.columns:
+            index, offset, length = text.add(column.name.encode("ascii"))
+            names.append(struct.pack("<HHHH", index, offset, length, 0))
+            attributes.append(
+                struct.pack(
+                    "<QIHBB",
+                    self.offsets[column.name],
+                    column.length,
+                    4 if len(column.name) <= 8 else 12,
+                    1 if column.kind == "num" else 2,
+                    0,
+                )
+            )
+            fmt_name, width, decimals = format_parts(column.format)
+            fmt_ref = text.add(fmt_name.encode("ascii"))
+            label_ref = text.add(column.label.encode(self.encoding, errors="replace"))
+            body = bytearray(64)
+            body[0:8] = _FORMAT_LABEL
+            struct.pack_into("<HH", body, 24, width, decimals)
+            struct.pack_into("<HHH", body, 46, *fmt_ref)
+            struct.pack_into("<HHH", body, 52, *label_ref)
+            formats.append(bytes(body))
+
+        placements = [
+            _Placement(_ROW_SIZE, self._row_size(row_count, 0, 0)),
+            _Placement(_COLUMN_SIZE, _COLUMN_SIZE + struct.pack("<QQ", len(self.columns), 0)),
+            _Placement(_COUNTS, bytes(600)),
+        ]
+        placements += [_Placement(_COLUMN_TEXT, block) for block in text.subheaders()]
+        for start in range(0, len(names), _VECTORS_PER_SUBHEADER):
+            stop = start + _VECTORS_PER_SUBHEADER
+            placements.append(_Placement(_COLUMN_NAME, _vector_subheader(_COLUMN_NAME, names[start:stop])))
+        for start in range(0, len(attributes), _VECTORS_PER_SUBHEADER):
+            stop = start + _VECTORS_PER_SUBHEADER
+            placements.append(
+                _Placement(_COLUMN_ATTRIBUTES, _vector_subheader(_COLUMN_ATTRIBUTES, attributes[start:stop]))
+            )
+        placements += [_Placement(_FORMAT_LABEL, body) for body in formats]
+        return placements
+
+    def _row_size(self, row_count: int, columns_first: int, columns_rest: int) -> bytes:
+        body = bytearray(808)
+        body[0:8] = _ROW_SIZE
+        struct.pack_into("<QQ", body, 40, self.row_length, row_count)
+        struct.pack_into("<QQ", body, 72, columns_first, columns_rest)
+        struct.pack_into("<Q", body, 104, self.page_size)
+        body[128:144] = b"\xff" * 16
+        struct.pack_into("<H", body, 706, len(_CREATOR))
+        return bytes(body)
+
+    def _meta(self, row_count: int) -> list[bytes]:
+        placements = self._subheaders(row_count)
+        pages: list[list[_Placement]] = [[]]
+        low = self.page_size
+        for placement in placements:
+            size = len(placement.data)
+            page = pages[-1]
+            start = (low - size) & ~7
+            if page and start < _PAGE_HEADER + _POINTER * (len(page) + 1):
+                pages.append([])
+                page = pages[-1]
+                low = self.page_size
+                start = (low - size) & ~7
+            if start < _PAGE_HEADER + _POINTER:
+                raise ValueError("subheader does not fit on a page")
+            placement.page, placement.position, placement.offset = len(pages), len(page) + 1, start
+            page.append(placement)
+            low = start
+
+        # The row size subheader has two column counts: the columns described
+        # on the first page that holds format subheaders, and all the others,
+        # however many pages those take.  Readers check that they add up.
+        format_pages = [p.page for p in placements if p.signature == _FORMAT_LABEL]
+        first = format_pages.count(format_pages[0])
+        placements[0].data = self._row_size(row_count, first, len(format_pages) - first)
+        placements[2].data = self._counts(placements)
+
+        result = []
+        for page in pages:
+            buffer = bytearray(self.page_size)
+            struct.pack_into("<HHH", buffer, 32, _META_PAGE, len(page), len(page))
+            for index, placement in enumerate(page):
+                pointer = _PAGE_HEADER + index * _POINTER
+                variable = placement.signature not in (_ROW_SIZE, _COLUMN_SIZE, _COUNTS, _FORMAT_LABEL)
+                struct.pack_into("<QQBB", buffer, pointer, placement.offset, len(placement.data), 0, int(variable))
+                buffer[placement.offset:placement.offset + len(placement.data)] = placement.data
+            result.append(bytes(buffer))
+        return result
+
+    def _counts(self, placements: list[_Placement]) -> bytes:
+        body = bytearray(600)
+        body[0:8] = _COUNTS
+        struct.pack_into("<Q", body, 8, max(len(p.data) for p in placements))
+        struct.pack_into("<Q", body, 16, 4)
+        struct.pack_into("<Q", body, 24, 7)
+        for index, signature in enumerate(_COUNTED):
+            vector = 120 + index * 40
+            body[vector:vector + 8] = signature
+            found = [p for p in placements if p.signature == signature]
+            if found:
+                struct.pack_into(
+                    "<QQQQ", body, vector + 8,
+                    found[0].page, found[0].position, found[-1].page, found[-1].position,
+                )
+        return bytes(body)
+
+
+def _frames(rows: Iterator[Mapping[str, Any]], batch: int) -> Iterator[pd.DataFrame]:
+    while True:
+        chunk = list(islice(rows, batch))
+        if not chunk:
+            return
+        yield pd.DataFrame.from_records(chunk)
+
+
+def write_dataset(
+    path: Path | str,
+    data: pd.DataFrame | Iterable[pd.DataFrame] | Iterable[Mapping[str, Any]],
+    char_lengths: Mapping[str, int] | None = None,
+    formats: Mapping[str, str] | None = None,
+    labels: Mapping[str, str] | None = None,
+    columns: Iterable[Column] | None = None,
+    encoding: str = DEFAULT_ENCODING,
+    dataset_name: str | None = None,
+    batch_rows: int = 50_000,
+) -> Path:
+    """Write a DataFrame, DataFrame chunks or row mappings to a SAS7BDAT file.
+
+    Without explicit columns, the schema comes from the data (see
+    columns_for); for streamed input only the first chunk is inspected, so
+    declare char_lengths for text columns whose width can grow.
+    """
+    path = Path(path)
+    if isinstance(data, pd.DataFrame):
+        chunks: Iterator[pd.DataFrame] = iter([data])
+    else:
+        items = iter(data)
+        head = next(items, None)
+        if head is None:
+            if columns is None:
+                raise ValueError(f"{path.name}: no rows and no columns to write")
+            chunks = iter([])
+        elif isinstance(head, pd.DataFrame):
+            chunks = chain([head], items)
+        else:
+            chunks = _frames(chain([head], items), batch_rows)
+    first = next(chunks, None)
+    if columns is None:
+        columns = columns_for(first, char_lengths, formats, labels, encoding)
+    with SAS7BDATWriter(path, columns, dataset_name, encoding) as writer:
+        for chunk in chain([] if first is None else [first], chunks):
+            writer.write(chunk)
+    return path
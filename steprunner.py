@@ -0,0 +1,259 @@
+"""Concurrent step runner with a shared, projected input cache.
+
+A job is a list of steps, each declaring the input files it reads and
+the columns it needs from each (None for every column, e.g. when the step
+writes the whole frame back out):
+
+    STEPS = [
+        Step("EIBMRB02", eibmrb02, {"DEPO.parquet": ["BRANCH", "CURBAL"]}),
+        Step("EIBMRB03", eibmrb03, {"DEPO_CURRENT.parquet": None}),
+    ]
+    timings = run_steps(STEPS, InputCache("input", STEPS))
+
+InputCache reads every file once (as Parquet unless given another
+reader, e.g. sasio.read_sas), with the union of the columns its readers
+declared, and drops it when its last reader has finished.  A step
+receives a StepInputs view whose frame(name) is projected to that step's
+own declaration, so it sees exactly the columns it would have read on its
+own.  Frames are shared copy-on-write: a step may filter or assign freely
+without affecting the cache or the other steps.
+
+run_steps() starts every step whose dependencies (after=) have finished
+on a thread pool; Parquet decoding and writing release the GIL, and steps
+write disjoint outputs, so the files are the same as a sequential run.
+What a step returns is handed to the steps that run after it through
+inputs.result(name), so a frame can flow from one step to the next
+without a round trip through a file.
+
+Each StepTiming carries the step's wall time and the peak resident set
+size sampled while it ran.  Steps share one process, so the peak covers
+whatever ran alongside; run steps one at a time (max_workers=1) to
+attribute memory to a single step.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    run: Callable[["StepInputs"], Any]
+    inputs: Mapping[str, Sequence[str] | None] = field(default_factory=dict)
+    after: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    name: str
+    seconds: float
+    peak_rss: int | None = None
+
+    def __str__(self) -> str:
+        rss = "" if self.peak_rss is None else f"  peak RSS {self.peak_rss / 2**20:,.0f} MiB"
+        return f"{self.name:<32} {self.seconds:9.3f}s{rss}"
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes (Linux), else None."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _RSSSampler:
+    """Samples the process RSS every interval and keeps a peak per running step."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self._peaks: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample_until_stopped, daemon=True)
+
+    def _record(self) -> None:
+        rss = current_rss()
+        if rss is None:
+            return
+        with self._lock:
+            for name, peak in self._peaks.items():
+                self._peaks[name] = max(peak, rss)
+
+    def _sample_until_stopped(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self._record()
+
+    def __enter__(self) -> "_RSSSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._peaks[name] = 0
+        self._record()
+
+    def end(self, name: str) -> int | None:
+        self._record()
+        with self._lock:
+            return self._peaks.pop(name) or None
+
+
+def read_parquet(path: Path, columns: list[str] | None) -> pd.DataFrame:
+    return pd.read_parquet(path, columns=columns)
+
+
+class InputCache:
+    """Each input file of a set of steps, loaded once on first use."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        steps: Iterable[Step],
+        reader: Callable[[Path, list[str] | None], pd.DataFrame] = read_parquet,
+    ) -> None:
+        self.directory = Path(directory)
+        self.reader = reader
+        self._columns: dict[str, list[str] | None] = {}
+        self._readers: Counter[str] = Counter()
+        for step in steps:
+            for name, columns in step.inputs.items():
+                self._readers[name] += 1
+                if columns is None or self._columns.get(name, []) is None:
+                    self._columns[name] = None
+                else:
+                    known = self._columns.setdefault(name, [])
+                    known.extend(column for column in columns if column not in known)
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._locks = {name: threading.Lock() for name in self._columns}
+        self.reads: Counter[str] = Counter()
+
+    def load(self, name: str) -> pd.DataFrame:
+        if name not in self._locks:
+            raise KeyError(f"{name} is not declared as an input of any step")
+        with self._locks[name]:
+            if name not in self._frames:
+                self._frames[name] = self.reader(self.directory / name, self._columns[name])
+                self.reads[name] += 1
+            return self._frames[name]
+
+    def release(self, step: Step) -> None:
+        """Record that step is done; frames with no readers left are dropped."""
+        for name in step.inputs:
+            with self._locks[name]:
+                self._readers[name] -= 1
+                if self._readers[name] <= 0:
+                    self._frames.pop(name, None)
+
+    def for_step(self, step: Step, results: Mapping[str, Any] | None = None) -> "StepInputs":
+        return StepInputs(self, step, {} if results is None else results)
+
+
+class StepInputs:
+    """One step's view of the cache (projected to its declared columns) and
+    of the results of the steps it runs after."""
+
+    def __init__(self, cache: InputCache, step: Step, results: Mapping[str, Any]) -> None:
+        self._cache = cache
+        self._step = step
+        self._results = results
+
+    def frame(self, name: str) -> pd.DataFrame:
+        if name not in self._step.inputs:
+            raise KeyError(f"{self._step.name} does not declare {name} as an input")
+        frame = self._cache.load(name)
+        columns = self._step.inputs[name]
+        return frame.copy(deep=False) if columns is None else frame[list(columns)]
+
+    def result(self, name: str) -> Any:
+        """What step name returned; it must be listed in this step's after."""
+        if name not in self._step.after:
+            raise KeyError(f"{self._step.name} does not run after {name}")
+        return self._results[name]
+
+
+def standalone_inputs(directory: str | Path, step: Step) -> StepInputs:
+    """Inputs for running one step on its own, outside run_steps()."""
+    return InputCache(directory, [step]).for_step(step)
+
+
+def run_steps(
+    steps: Sequence[Step],
+    cache: InputCache,
+    max_workers: int | None = None,
+) -> list[StepTiming]:
+    """Run steps concurrently in dependency order; returns timings in step order.
+
+    A step's result is kept until every step that runs after it has
+    finished.  The first failure stops new steps from starting and is
+    re-raised once the running ones have finished.
+    """
+    by_name = {step.name: step for step in steps}
+    if len(by_name) != len(steps):
+        raise ValueError("step names must be unique")
+    for step in steps:
+        unknown = [name for name in step.after if name not in by_name]
+        if unknown:
+            raise ValueError(f"{step.name} runs after unknown steps: {', '.join(unknown)}")
+
+    timings: dict[str, StepTiming] = {}
+    results: dict[str, Any] = {}
+    dependents = Counter(name for step in steps for name in step.after)
+    pending = list(steps)
+    running: dict[Future, Step] = {}
+    failure: BaseException | None = None
+
+    def timed(step: Step) -> tuple[StepTiming, Any]:
+        sampler.begin(step.name)
+        started = time.perf_counter()
+        try:
+            result = step.run(cache.for_step(step, results))
+        finally:
+            cache.release(step)
+            peak = sampler.end(step.name)
+        return StepTiming(step.name, time.perf_counter() - started, peak), result
+
+    with _RSSSampler() as sampler, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            if failure is None:
+                ready = [step for step in pending if all(name in timings for name in step.after)]
+                for step in ready:
+                    pending.remove(step)
+                    running[pool.submit(timed, step)] = step
+            if not running:
+                if failure is None:
+                    cycle = ", ".join(step.name for step in pending)
+                    raise ValueError(f"steps wait on each other: {cycle}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                try:
+                    timings[step.name], result = future.result()
+                except BaseException as error:
+                    failure = failure or error
+                    continue
+                if dependents[step.name]:
+                    results[step.name] = result
+                for name in step.after:
+                    dependents[name] -= 1
+                    if not dependents[name]:
+                        results.pop(name, None)
+    if failure is not None:
+        raise failure
+    return [timings[step.name] for step in steps]
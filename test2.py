@@ -107,11 +107,20 @@ def initialize_row(row: pd.Series) -> pd.Series:
     return row
 
 
+def rule78_batch(rem1: Any, rem2: Any, charge: Any, term: Any) -> np.ndarray:
+    """Closed-form rule-of-78 amount for months rem2..rem1; see eifmnp03.rule78_batch."""
+    rem1, rem2, charge, term = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (rem1, rem2, charge, term))
+    )
+    valid = ~(np.isnan(rem1) | np.isnan(rem2) | (term <= 0) | (rem1 < rem2))
+    first, last = np.trunc(rem2), np.trunc(rem1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total = charge * ((last + 1) * (last + 2) - first * (first + 1)) / (term * (term + 1))
+    return np.where(valid, total, 0.0)
+
+
 def rule78_sum(rem1: float, rem2: float, charge: float, term: float) -> float:
-    if any(pd.isna(x) for x in (rem1, rem2)) or term <= 0 or rem1 < rem2:
-        return 0.0
-    months = np.arange(int(rem1), int(rem2) - 1, -1)
-    return float((2 * (months + 1) * charge / (term * (term + 1))).sum())
+    return float(rule78_batch(rem1, rem2, charge, term))
 
 
 def written_off(row: pd.Series) -> pd.Series:
@@ -0,0 +1,22 @@
+"""Shared helpers: the repository root is importable, and job scripts whose
+file names are not module names ("EIBMTCSM.PY as") load from their path."""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_job(filename: str, module_name: str):
+    """Import the job script ROOT/filename as module_name."""
+    loader = importlib.machinery.SourceFileLoader(module_name, str(ROOT / filename))
+    spec = importlib.util.spec_from_loader(module_name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pandas as pd
+
+import EIBMRBDP
+
+
+def test_merge_fcy_takes_fcy_values_only_for_matched_accounts():
+    fcyfd = pd.DataFrame({
+        "ACCTNO": [1, 2, 3],
+        "CURBAL": [10.0, 20.0, 30.0],
+        "CUSTCODE": ["11", "12", "13"],
+        "OPENDT": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+    })
+    fcy = pd.DataFrame({
+        "ACCTNO": [1, 3],
+        "CUSTCODE": ["77", "78"],
+        "OPENDT": pd.to_datetime(["2025-01-15", None]),
+    })
+
+    merged = EIBMRBDP.merge_fcy(fcyfd, fcy)
+
+    assert list(merged.columns) == ["ACCTNO", "CURBAL", "CUSTCODE", "OPENDT"]
+    assert merged["CUSTCODE"].tolist() == ["77", "12", "78"]
+    assert merged["OPENDT"].tolist()[:2] == [pd.Timestamp("2025-01-15"), pd.Timestamp("2024-02-01")]
+    # Matched in FCY with a missing OPENDT: FCY's missing value wins, as in SAS.
+    assert pd.isna(merged["OPENDT"].iloc[2])
+
+
+def test_eibmrb01_reads_the_columns_the_merge_resolves():
+    step = next(step for step in EIBMRBDP.STEPS if step.name == "EIBMRB01")
+    assert {"CUSTCODE", "OPENDT"} <= set(step.inputs["MISFD_FCYFD.parquet"])
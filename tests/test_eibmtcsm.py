@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_job
+
+tcsm = load_job("EIBMTCSM.PY as", "eibmtcsm")
+
+
+def packed(value: int, width: int) -> bytes:
+    sign = "D" if value < 0 else "C"
+    return bytes.fromhex(f"{abs(value):0{2 * width - 1}d}{sign}")
+
+
+def journal_record(trnxcode: int = 1, cardtype: str = "02", status: str = "SA") -> bytes:
+    record = bytearray(" ".encode("cp037") * tcsm.RECORD_LENGTH)
+    record[0:5] = packed(20260930, 5)
+    record[5:9] = packed(123456, 4)
+    record[9:11] = "01".encode("cp037")
+    record[11:14] = packed(42, 3)
+    record[14:18] = (7).to_bytes(4, "big")
+    record[18:20] = trnxcode.to_bytes(2, "big")
+    record[20:28] = packed(15000, 8)
+    record[28:36] = packed(15000, 8)
+    record[37:39] = status.encode("cp037")
+    record[46:49] = " 12".encode("cp037")
+    record[54:56] = cardtype.encode("cp037")
+    record[70:90] = "4000123412341234".ljust(20).encode("cp037")
+    return bytes(record)
+
+
+def test_parse_records_matches_parse_record():
+    raw = [journal_record(), journal_record(3, "01", "RA"), journal_record(129, "04")]
+    records = np.frombuffer(b"".join(raw), dtype=np.uint8).reshape(len(raw), -1)
+    expected = pd.DataFrame([tcsm.parse_record(record, "cp037") for record in raw])
+    pd.testing.assert_frame_equal(tcsm.parse_records(records, "cp037"), expected)
+
+
+def test_parse_records_handles_no_records():
+    frame = tcsm.parse_records(np.empty((0, tcsm.RECORD_LENGTH), dtype=np.uint8), "cp037")
+    assert list(frame.columns) == tcsm.ATMTRNX_COLUMNS
+    assert frame.empty
+
+
+@pytest.mark.parametrize("engine", tcsm.ENGINES)
+def test_cash_only_skips_chunks_without_cash(tmp_path, engine):
+    # The first chunk holds no cash withdrawal at all, the second one does.
+    raw = [journal_record(3), journal_record(1, "01"), journal_record(1), journal_record(2, "03", "SB")]
+    path = tmp_path / "journal.dat"
+    path.write_bytes(b"".join(raw))
+
+    journal = tcsm.JournalStream(path, tcsm.RECORD_LENGTH, "cp037", engine, chunk_records=2)
+    cash = list(journal.cash_only())
+
+    assert journal.records_read == 4
+    assert [len(chunk) for chunk in cash] == [1]
+    assert list(cash[0].columns) == tcsm.CASH_COLUMNS
+    assert cash[0]["TRNXAMT"].tolist() == [150.0]
+
+
+def test_cash_mask_agrees_with_decoded_filter():
+    raw = [journal_record(code, card, status)
+           for code in (1, 2, 3, 129) for card in ("00", "01", "04", " 2") for status in ("SA", "SB", "RA")]
+    records = np.frombuffer(b"".join(raw), dtype=np.uint8).reshape(len(raw), -1)
+    decoded = tcsm.parse_records(records, "cp037")
+    expected = decoded.index.isin(tcsm.cash_transactions(decoded).index)
+    np.testing.assert_array_equal(tcsm.cash_mask(records, "cp037"), expected)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+import eifmnp03
+
+REPORT_DATE = pd.Timestamp("2024-05-31")
+
+
+def sas_date(day: str) -> float:
+    return float((pd.Timestamp(day) - pd.Timestamp("1960-01-01")).days)
+
+
+def account(acctno, **fields):
+    row = {
+        "ACCTNO": acctno, "EXIST": "Y", "LOANTYPE": 128, "CURBAL": 40_000.0, "TERMCHG": 8_400.0,
+        "EARNTERM": 84.0, "NOTETERM": 84.0, "ISSDTE": sas_date("2021-03-15"), "BLDATE": sas_date("2024-01-15"),
+        "IISP": 900.0, "OIP": 120.0, "IISPW": 0.0, "FEETOT2": 60.0, "FEEAMTA": 10.0, "FEEAMT5": 5.0,
+        "FEEAMT": 45.0, "ACCRUAL": 0.0, "MARKETVL": 0.0, "DAYS": 120.0, "BORSTAT": "", "USER5": "",
+        "WRITEOFF": "N", "WDOWNIND": np.nan, "RESCHEIND": "N", "WSUSPEND": np.nan, "WOISUSP": np.nan,
+        "WRECOVER": np.nan, "WRECC": np.nan, "WOIRECV": np.nan, "WOIRECC": np.nan, "WIISPW": np.nan, "WOIW": np.nan,
+    }
+    row.update(fields)
+    return row
+
+
+def iis_fixture() -> pd.DataFrame:
+    rows = [
+        # Existing accounts: HP and other loan types, performing and not.
+        account(1),
+        account(2, LOANTYPE=300, DAYS=400.0, OIP=5.0),
+        account(3, LOANTYPE=300, DAYS=30.0, USER5="N"),
+        account(4, DAYS=30.0, BLDATE=np.nan),
+        account(5, LOANTYPE=720, ACCRUAL=333.33),
+        account(6, BORSTAT="R", TERMCHG=0.0, MARKETVL=10_000.0, DAYS=10.0),
+        account(7, TERMCHG=0.0, DAYS=200.0, LOANTYPE=130),
+        account(8, BORSTAT="F", CURBAL=500.0, IISP=900.0),
+        account(9, LOANTYPE=983, USER5="N", DAYS=30.0, EARNTERM=0.0),
+        # Written off in full, and written down with the IIS/OI reversal.
+        account(10, WRITEOFF="Y", WDOWNIND="N", WSUSPEND=40.0, WOISUSP=4.0, WRECOVER=25.0, WRECC=5.0,
+                WOIRECV=3.0, WOIRECC=1.0),
+        account(11, WRITEOFF="Y", WDOWNIND="Y", WSUSPEND=10.0, WOISUSP=2.0, WIISPW=5_000.0, WOIW=500.0),
+        account(12, BORSTAT="W", IISPW=75.0),
+        # Rescheduled.
+        account(13, RESCHEIND="Y", WSUSPEND=12.0, WOISUSP=1.5, WRECOVER=7.0, WRECC=0.5, WOIRECV=0.25),
+        # Current accounts.
+        account(14, EXIST="N"),
+        account(15, EXIST="N", LOANTYPE=300, BLDATE=np.nan, USER5="N"),
+        account(16, EXIST="N", LOANTYPE=725, ACCRUAL=42.0),
+        account(17, EXIST="N", WRITEOFF="Y", WDOWNIND="N", WRECOVER=8.0, WSUSPEND=3.0),
+        account(18, EXIST="N", RESCHEIND="Y", WSUSPEND=9.0, WRECOVER=1.0),
+        account(19, EXIST="N", ISSDTE=np.nan, CURBAL=np.nan, DAYS=np.nan),
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_columnar_iis_reconciles_with_the_row_engine():
+    assert eifmnp03.reconcile_iis(iis_fixture(), REPORT_DATE) == []
+
+
+def test_fixture_reaches_the_write_off_and_reschedule_branches():
+    existing, current = eifmnp03.calculate_iis(iis_fixture(), REPORT_DATE, "row")
+    existing, current = existing.set_index("ACCTNO"), current.set_index("ACCTNO")
+    assert existing.loc[10, "BORSTAT"] == "W" and existing.loc[10, "IIS"] == 0.0
+    assert existing.loc[10, "IISPW"] == 900.0 + 40.0 - 25.0 - 5.0
+    assert existing.loc[11, "IISPW"] == 5_000.0 and existing.loc[11, "RECOVER"] == 0.0
+    assert existing.loc[12, "IISPW"] == 900.0 and existing.loc[12, "OIW"] == 120.0
+    assert (existing.loc[13, "SUSPEND"], existing.loc[13, "RECOVER"]) == (12.0, 7.0)
+    assert existing.loc[5, "IIS"] == 333.33 and current.loc[16, "IIS"] == 42.0
+    assert existing.loc[1, "IIS"] > 0 and current.loc[14, "IIS"] > 0
+
+
+def test_reconcile_reports_a_one_ulp_difference(monkeypatch):
+    columnar = eifmnp03.calculate_current_frame
+
+    def off_by_one_ulp(loan, report_date):
+        out = columnar(loan, report_date)
+        out["TOTIIS"] = np.nextafter(out["TOTIIS"].to_numpy(), np.inf)
+        return out
+
+    monkeypatch.setattr(eifmnp03, "calculate_current_frame", off_by_one_ulp)
+    assert eifmnp03.reconcile_iis(iis_fixture(), REPORT_DATE) == ["CURRENT.TOTIIS"]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+import eifmnp06
+
+REPORT_DATE = pd.Timestamp("2024-05-31")
+# 2021-03-15 as a SAS date.
+ISSUED = float((pd.Timestamp("2021-03-15") - pd.Timestamp("1960-01-01")).days)
+
+
+def account(acctno, **fields):
+    row = {
+        "ACCTNO": acctno, "EXIST": "Y", "LOANTYPE": 128, "CURBAL": 50_000.0, "TERMCHG": 9_000.0,
+        "EARNTERM": 84.0, "NOTETERM": 84.0, "ISSDTE": ISSUED, "IIS": 1_250.5, "FEEAMT": 0.0,
+        "FEETOT2": 40.0, "FEEAMT8": 310.0, "FEEAMTA": 25.0, "FEEAMT5": 15.0, "APPVALUE": 0.0,
+        "MARKETVL": 0.0, "SPP2": 6_000.0, "DAYS": 120.0, "BORSTAT": "", "USER5": "", "CENSUS7": "",
+        "WRITEOFF": "N", "WDOWNIND": np.nan, "HARDCODE": "N", "RESCHEIND": "", "WREALVL": np.nan,
+        "WSPPL": np.nan, "WSP": np.nan, "WRECOVER": np.nan, "WSPPW": np.nan,
+    }
+    row.update(fields)
+    return row
+
+
+def provision_fixture() -> pd.DataFrame:
+    rows = [
+        # Secured by vehicle value, each SP tier.
+        account(1, APPVALUE=40_000.0, DAYS=95.0),
+        account(2, APPVALUE=40_000.0, DAYS=300.0),
+        account(3, APPVALUE=40_000.0, DAYS=400.0, CENSUS7="9", MARKETVL=12_000.0, LOANTYPE=250),
+        # Unsecured tiers and borrower statuses.
+        account(4, DAYS=100.0, BORSTAT="Y"),
+        account(5, DAYS=280.0, EXIST="N"),
+        account(6, DAYS=30.0, BORSTAT="R", MARKETVL=5_000.0),
+        account(7, DAYS=30.0, BORSTAT="F", LOANTYPE=380, FEEAMT=500.0),
+        account(8, LOANTYPE=983, DAYS=500.0, EARNTERM=0.0),
+        # Hard-coded realisable value and provision.
+        account(9, HARDCODE="Y", APPVALUE=40_000.0, DAYS=200.0, WREALVL=15_000.0, WSPPL=1_111.0, WSP=2_222.0),
+        account(10, HARDCODE="Y", DAYS=400.0, WREALVL=3_000.0, EXIST="N"),
+        # Written off in full, written down with positive and non-positive exposure.
+        account(11, WRITEOFF="Y", WDOWNIND="N", WSPPL=700.0, WRECOVER=150.0),
+        account(12, WRITEOFF="Y", WDOWNIND="Y", DAYS=400.0, WSPPL=800.0, WSPPW=2_000.0, WRECOVER=90.0),
+        account(13, WRITEOFF="Y", WDOWNIND="Y", CURBAL=900.0, IIS=1_000.0, WSPPL=50.0, WSPPW=10.0, SPP2=9_000.0),
+        account(14, BORSTAT="W", DAYS=10.0),
+        # Rescheduled, with and without write-off amounts on file.
+        account(15, RESCHEIND="Y", WRECOVER=300.0, WSPPW=120.0, DAYS=400.0),
+        account(16, RESCHEIND="Y", DAYS=400.0, EXIST="N"),
+        # Missing amounts and dates.
+        account(17, CURBAL=np.nan, ISSDTE=np.nan, SPP2=np.nan, DAYS=np.nan),
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_columnar_provision_reconciles_with_the_row_engine():
+    data = provision_fixture()
+    assert eifmnp06.reconcile_provision(data, REPORT_DATE) == []
+
+
+def test_fixture_reaches_the_write_off_hard_code_and_reschedule_branches():
+    out = eifmnp06.calculate_provision(provision_fixture(), REPORT_DATE, "row").set_index("ACCTNO")
+    assert out.loc[11, "BORSTAT"] == "W" and out.loc[11, "SP"] == 0.0 and out.loc[11, "SPPW"] == 6_000.0 + 700.0 - 150.0
+    assert out.loc[12, "SPPW"] == 2_000.0
+    assert out.loc[13, "SP"] == 0.0 and out.loc[13, "RECOVER"] > 0
+    assert (out.loc[9, "MARKETVL"], out.loc[9, "SPPL"], out.loc[9, "SP"]) == (15_000.0, 1_111.0, 2_222.0)
+    assert (out.loc[15, "RECOVER"], out.loc[15, "SPPW"]) == (300.0, 120.0)
+    assert out.loc[[1, 2, 3, 4, 5], "SP"].gt(0).all()
+
+
+def test_reconcile_reports_a_one_ulp_difference(monkeypatch):
+    columnar = eifmnp06.provision_frame
+
+    def off_by_one_ulp(data, report_date, existing):
+        out = columnar(data, report_date, existing)
+        out["SPPW"] = np.nextafter(out["SPPW"].to_numpy(), np.inf)
+        return out
+
+    monkeypatch.setattr(eifmnp06, "provision_frame", off_by_one_ulp)
+    assert eifmnp06.reconcile_provision(provision_fixture(), REPORT_DATE) == ["SPPW"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+import eifmnp07
+
+REPORT_DATE = pd.Timestamp("2024-05-31")
+# 2021-03-15 as a SAS date.
+ISSUED = float((pd.Timestamp("2021-03-15") - pd.Timestamp("1960-01-01")).days)
+
+
+def account(acctno, **fields):
+    row = {
+        "ACCTNO": acctno, "EXIST": "Y", "LOANTYPE": 128, "CURBALP": 42_000.0, "CURBAL": 40_000.0,
+        "NETBALP": 38_500.0, "FEEAMT": 45.0, "FEETOT2": 60.0, "FEEYTD": 310.0, "FEEPDYTD": 25.0,
+        "TERMCHG": 8_400.0, "EARNTERM": 84.0, "NOTETERM": 84.0, "UHCP": 1_500.0, "DAYS": 120.0,
+        "ISSDTE": ISSUED, "BORSTAT": "", "USER5": "", "WRITEOFF": "N", "WDOWNIND": np.nan,
+        "WACCRINT": np.nan, "WNEWNPL": np.nan, "WRECOVER": np.nan, "WNPLW": np.nan,
+    }
+    row.update(fields)
+    return row
+
+
+def movement_fixture() -> pd.DataFrame:
+    rows = [
+        # Existing performing accounts, including one settled this month.
+        account(1, DAYS=30.0),
+        account(2, DAYS=0.0, CURBAL=0.0),
+        account(3, LOANTYPE=983, DAYS=400.0, EARNTERM=0.0),
+        # Existing non-performing: plain, foreclosed, negative recovery, closed.
+        account(4),
+        account(5, DAYS=30.0, BORSTAT="F"),
+        account(6, DAYS=30.0, USER5="N", CURBALP=30_000.0),
+        account(7, BORSTAT="W", DAYS=10.0),
+        account(8, CURBAL=-50.0, DAYS=10.0),
+        # Written off in full and written down.
+        account(9, WRITEOFF="Y", WDOWNIND="N", WACCRINT=70.0, WNEWNPL=500.0, WRECOVER=150.0),
+        account(10, WRITEOFF="Y", WDOWNIND="Y", WACCRINT=30.0, WNEWNPL=200.0, WRECOVER=90.0, WNPLW=2_000.0),
+        # Current accounts.
+        account(11, EXIST="N"),
+        account(12, EXIST="N", LOANTYPE=993, WACCRINT=5.0, WNEWNPL=15.0),
+        account(13, EXIST="N", WRITEOFF="Y", WDOWNIND="N", WRECOVER=8.0, WNEWNPL=60.0),
+        # Missing amounts and dates.
+        account(14, EXIST="N", ISSDTE=np.nan, CURBAL=np.nan, DAYS=np.nan, EARNTERM=0.0),
+        account(15, ISSDTE=np.nan, NETBALP=np.nan, FEEAMT=np.nan),
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_columnar_movement_reconciles_with_the_row_engine():
+    assert eifmnp07.reconcile_movement(movement_fixture(), REPORT_DATE) == []
+
+
+def test_fixture_reaches_the_performing_write_off_and_current_branches():
+    out = eifmnp07.calculate_movement(movement_fixture(), REPORT_DATE, "row").set_index("ACCTNO")
+    assert (out.loc[1, "PL"], out.loc[1, "NPL"]) == (38_500.0, 0.0)
+    assert (out.loc[2, "RECOVER"], out.loc[2, "PL"]) == (38_500.0, 0.0)
+    assert out.loc[4, "RECOVER"] == 42_000.0 - 40_000.0 + 25.0 and out.loc[4, "NPL"] > 0
+    assert out.loc[5, "CURBALP"] == 42_000.0 - 1_500.0
+    assert out.loc[6, "RECOVER"] == 0.0 and out.loc[6, "CURBALP"] == 40_000.0 - 25.0
+    assert (out.loc[7, "NPLW"], out.loc[7, "NPL"]) == (38_500.0, 0.0)
+    assert out.loc[9, "BORSTAT"] == "W" and out.loc[9, "NPLW"] == 38_500.0 + 500.0 + 70.0 - 150.0
+    assert out.loc[10, "NPLW"] == 2_000.0 and out.loc[10, "ADJUST"] == 0.0
+    assert out.loc[11, "NEWNPL"] == out.loc[11, "NPL"] > 0
+    assert (out.loc[12, "ACCRINT"], out.loc[12, "NEWNPL"]) == (5.0, 15.0)
+
+
+def test_reconcile_reports_a_one_ulp_difference(monkeypatch):
+    columnar = eifmnp07.movement_frame
+
+    def off_by_one_ulp(data, report_date):
+        out = columnar(data, report_date)
+        out["NPL"] = np.nextafter(out["NPL"].to_numpy(), np.inf)
+        return out
+
+    monkeypatch.setattr(eifmnp07, "movement_frame", off_by_one_ulp)
+    assert eifmnp07.reconcile_movement(movement_fixture(), REPORT_DATE) == ["NPL"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fixedwidth import Field, PutField, PutLayout, RecordLayout, convert, put_column
+
+
+def sas_number(raw: str, decimals: int) -> float:
+    """The per-field parser RecordLayout replaced."""
+    raw = raw.strip()
+    if not raw:
+        return np.nan
+    try:
+        if "." in raw:
+            return float(raw)
+        return int(raw) / 10**decimals
+    except ValueError:
+        return np.nan
+
+
+def test_long_explicit_decimal_fields_round_like_float():
+    field = Field("LIMIT", 1, "18.2")
+    generator = random.Random(7)
+    raws = ["9971071120305.8332", "999999999999999.99", "-12345678901234.56"]
+    raws += [f"{generator.randrange(10**14, 10**15)}.{generator.randrange(100):02d}" for _ in range(500)]
+    raws += [f"{generator.randrange(10**12, 10**13)}.{generator.randrange(10**4):04d}" for _ in range(500)]
+    parsed = convert(np.array(raws, dtype="<U18"), field)
+    assert parsed.tolist() == [float(raw) for raw in raws]
+
+
+def test_numbers_follow_the_implied_decimal_rule():
+    layout = RecordLayout.from_input("@1 AMOUNT 18.2 @19 COUNT 4.")
+    fields = [("123456", "12"), ("1234.5", "1.5"), ("123456789012345", ""), ("abc", "x")]
+    lines = [amount.rjust(18) + count.rjust(4) for amount, count in fields]
+    frame = layout.parse(lines)
+    expected = [sas_number(line[:18], 2) for line in lines]
+    np.testing.assert_array_equal(frame["AMOUNT"].to_numpy(), np.array(expected))
+    np.testing.assert_array_equal(frame["COUNT"].to_numpy(), np.array([12.0, 1.5, np.nan, np.nan]))
+
+
+def test_records_parse_in_batches_with_ddmmyy_dates():
+    layout = RecordLayout.from_input("@1 ACCTNO $5. @6 OPENED DDMMYY8. @14 RATE 5.3")
+    lines = [f"{n:<5}{day}{rate:>5}" for n, day, rate in [(1, "31012024", "4250"), (22, "        ", "4.25"), (333, "31022024", "")]]
+    batches = list(layout.parse_batches(iter(lines), 2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    frame = pd.concat(batches, ignore_index=True)
+    assert frame["ACCTNO"].tolist() == ["1", "22", "333"]
+    assert frame["OPENED"].iloc[0] == (pd.Timestamp("2024-01-31") - pd.Timestamp("1960-01-01")).days
+    assert frame["OPENED"].iloc[1:].isna().all()
+    np.testing.assert_array_equal(frame["RATE"].to_numpy(), [4.25, 4.25, np.nan])
+    assert layout.parse_record(lines[0])["ACCTNO"] == "1"
+    with pytest.raises(ValueError, match="batch_size"):
+        next(layout.parse_batches(lines, 0))
+
+
+def test_char_values_are_left_aligned_and_cut_to_width():
+    field = PutField("NAME", 1, "$CHAR5.")
+    values = pd.Series(["AB", "ABCDEFG", None, "ABCDE"])
+    assert put_column(values, field).tolist() == ["AB   ", "ABCDE", "     ", "ABCDE"]
+
+
+def test_numbers_are_right_aligned_zero_filled_and_missing_as_a_point():
+    values = pd.Series([12.5, np.nan, -3.0, 0.004])
+    assert put_column(values, PutField("AMOUNT", 1, "8.2")).tolist() == ["   12.50", "       .", "   -3.00", "    0.00"]
+    assert put_column(values, PutField("AMOUNT", 1, "Z8.2")).tolist() == ["00012.50", "       .", "-0003.00", "00000.00"]
+    counts = pd.Series([7, 12345], dtype="Int64")
+    assert put_column(counts, PutField("COUNT", 1, "Z5.")).tolist() == ["00007", "12345"]
+    assert put_column(pd.Series([7, None], dtype="Int64"), PutField("COUNT", 1, "3.")).tolist() == ["  7", "  ."]
+
+
+def test_a_number_too_wide_for_its_format_raises():
+    values = pd.Series([1.0, 123456.0], index=[10, 11])
+    with pytest.raises(ValueError, match=r"AMOUNT: 123456.0 \(row 11\) does not fit 6.2"):
+        put_column(values, PutField("AMOUNT", 1, "6.2"))
+    with pytest.raises(ValueError, match="does not fit"):
+        put_column(pd.Series([123456]), PutField("COUNT", 1, "Z5."))
+
+
+def test_fields_land_at_their_columns_with_gaps_space_filled(tmp_path):
+    layout = PutLayout.from_put("@020 CAP 8.2 @001 ACCTNO 10. @012 NOTENO Z5. @030 AANO $CHAR4.")
+    assert [field.name for field in layout.fields] == ["ACCTNO", "NOTENO", "CAP", "AANO"]
+    frame = pd.DataFrame({"ACCTNO": [123, 4], "NOTENO": [7, 81], "CAP": [1.5, np.nan], "AANO": ["XY", "LONGER"]})
+    records = layout.format(frame).tolist()
+    assert records == [
+        "       123 00007       1.50  XY  ",
+        "         4 00081          .  LONG",
+    ]
+    assert all(len(record) == layout.record_length == 33 for record in records)
+    assert records[0][11:16] == "00007" and records[0][29:33] == "XY  "
+
+    path = tmp_path / "ccris.txt"
+    assert layout.write(frame, path, chunk_rows=1) == 2
+    assert path.read_text(encoding="ascii") == "\n".join(records) + "\n"
+
+
+def test_overlapping_or_unsupported_put_items_raise():
+    with pytest.raises(ValueError, match="NOTENO @10 overlaps ACCTNO ending at column 10"):
+        PutLayout.from_put("@001 ACCTNO 10. @010 NOTENO Z5.")
+    with pytest.raises(ValueError, match="unsupported format"):
+        PutField("OPENED", 1, "DATE9.")
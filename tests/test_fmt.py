@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import fmt
+import PBBLNFMT
+
+
+def test_format_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        fmt._Format()
+
+    class Incomplete(fmt._Format):
+        def put(self, value, default=None):
+            return value
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_brchcd_matches_pbblnfmt():
+    codes = [1, 2, 3001, 9999, 0]
+    assert [fmt.put("PBBLNFMT.BRCHCD", code, "") for code in codes] == [
+        PBBLNFMT.put(code, "BRCHCD.", "") for code in codes
+    ]
+    assert list(fmt.put_array("PBBLNFMT.BRCHCD", codes, "")) == list(PBBLNFMT.put_series(codes, "BRCHCD.", ""))
+
+
+def test_hit_counts_are_exact_across_threads():
+    registry = fmt.FormatRegistry()
+
+    def look_up(_):
+        for _ in range(200):
+            registry.put("PBBLNFMT.BRCHCD", 3001, "")
+            registry.put_array("PBBLNFMT.BRCHCD", [1, 2], "")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(look_up, range(8)))
+    assert registry.hit_counts() == [("PBBLNFMT.BRCHCD", 8 * 200 * 3)]
+    registry.reset_hit_counts()
+    assert registry.hit_counts() == []
+
+
+def test_eifmnp03_branch_labels_use_the_registry():
+    job = importlib.import_module("eifmnp03")
+    assert job.branch_label(3001, {}) == f"{PBBLNFMT.put(3001, 'BRCHCD.', '')} 3001"
+    assert job.branch_label(7, {7: "MAPPED"}) == "MAPPED 007"
+
+
+def test_each_registry_resolves_names_itself():
+    registry = fmt.FormatRegistry()
+    assert registry.put("PBBLNFMT.BRCHCD", 3001, "") == PBBLNFMT.put(3001, "BRCHCD.", "")
+    assert list(registry.put_array("brchcd.", [1, 2], "")) == list(PBBLNFMT.put_series([1, 2], "BRCHCD.", ""))
+
+
+def test_identical_definitions_share_one_format_across_sources():
+    import PBBDPFMT
+
+    registry = fmt.FormatRegistry()
+    for name in ("SADENOM", "SAPROD", "FDORGMT", "FDRMMT", "FDDENOM", "FDPRD", "RACE", "RMFDORGMT"):
+        deposit, deposit3 = registry.resolve(f"PBBDPFMT.{name}"), registry.resolve(f"PBBDPFMT3.{name}")
+        assert registry.compiled(deposit) is registry.compiled(deposit3)
+    assert registry.put("SADENOM", 204) == PBBDPFMT.sadenom(204) == "I"
+    assert registry.put("PBBDPFMT.FDPROD", 337) != registry.put("PBBDPFMT3.FDPROD", 337)
+
+
+def test_pbbdpfmt_formats_match_the_module_for_numbers():
+    import numpy as np
+    import PBBDPFMT
+
+    codes = [value / 2 for value in range(-20, 2200)] + [1e9, -1e9, np.nan]
+    for name in ("SADENOM", "SAPROD", "FDPROD", "FDPRODD", "RMFDORGMT", "FDDENOM", "FDPRD", "FDORGMT", "FDRMMT"):
+        expected = [getattr(PBBDPFMT, name.lower())(code) for code in codes]
+        assert [fmt.put(f"PBBDPFMT.{name}", code) for code in codes] == expected, name
+        assert list(fmt.put_array(f"PBBDPFMT.{name}", np.array(codes))) == expected, name
+
+
+def test_fingerprint_ignores_how_the_rules_are_written():
+    split = fmt._DepositFormat({"rules": [("1-2", "A"), ("2-3", "A"), ("5", "B"), ("OTHER", "C")]})
+    joined = fmt._DepositFormat({"rules": [("5", "B"), ("1 - 3", "A"), ("OTHER", "C")]})
+    moved = fmt._DepositFormat({"rules": [("1-3.5", "A"), ("5", "B"), ("OTHER", "C")]})
+    assert split.fingerprint == joined.fingerprint != moved.fingerprint
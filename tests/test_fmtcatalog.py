@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fmtcatalog import CATALOG_DIR_VARIABLE, DIGEST_SIZE, CatalogArtifact, LazyCatalog, source_digest, write_artifact
+
+SPECS = {"BRCHCD": {"1": "HOE", "2": "JSS"}, "LNPROD": {"100": "HL"}}
+
+
+def catalog(tmp_path, calls):
+    source = tmp_path / "source" / "FORMATS.py"
+    source.parent.mkdir(exist_ok=True)
+    source.write_text("SPECS = {}\n")
+
+    def load_source():
+        calls.append(threading.get_ident())
+        return SPECS
+
+    return LazyCatalog(source, "formats.fmtcat", load_source)
+
+
+def test_miss_without_cache_dir_leaves_the_source_directory_alone(tmp_path, monkeypatch):
+    monkeypatch.delenv(CATALOG_DIR_VARIABLE, raising=False)
+    calls = []
+    formats = catalog(tmp_path, calls)
+    assert dict(formats) == SPECS
+    assert list((tmp_path / "source").iterdir()) == [formats.source]
+
+
+def test_miss_rebuilds_into_the_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(CATALOG_DIR_VARIABLE, str(tmp_path / "cache"))
+    calls = []
+    assert dict(catalog(tmp_path, calls)) == SPECS
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["formats.fmtcat"]
+    assert dict(catalog(tmp_path, calls)) == SPECS
+    assert len(calls) == 1
+
+
+def test_concurrent_first_use_loads_the_source_once(tmp_path, monkeypatch):
+    monkeypatch.setenv(CATALOG_DIR_VARIABLE, str(tmp_path / "cache"))
+    calls = []
+    formats = catalog(tmp_path, calls)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: formats["BRCHCD"], range(32)))
+    assert results == [SPECS["BRCHCD"]] * 32
+    assert len(calls) == 1
+
+
+def test_concurrent_writers_each_use_their_own_temporary_file(tmp_path):
+    path = tmp_path / "cache" / "formats.fmtcat"
+    digest = b"\0" * DIGEST_SIZE
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: write_artifact(path, SPECS, digest), range(32)))
+    assert [entry.name for entry in path.parent.iterdir()] == ["formats.fmtcat"]
+    artifact = CatalogArtifact(path)
+    assert {name: artifact.get(name) for name in artifact.names()} == SPECS
+
+
+def test_shipped_artifacts_are_current_builds(tmp_path, monkeypatch):
+    import PBBLNFMT
+    import pbbdpfmt3
+
+    monkeypatch.setenv(CATALOG_DIR_VARIABLE, str(tmp_path))
+    catalogs = (
+        (PBBLNFMT.load_catalog(), PBBLNFMT._source_catalog),
+        (pbbdpfmt3._DEFINITIONS, pbbdpfmt3._source_definitions),
+    )
+    for formats, source in catalogs:
+        built = formats.build()
+        artifact = CatalogArtifact(built)
+        assert built.parent == tmp_path
+        assert artifact.digest == source_digest(formats.source)
+        assert artifact.names() == list(source())
+        shipped = formats.source.parent / formats.artifact_name
+        assert shipped.read_bytes() == built.read_bytes(), "rebuild with: python fmtcatalog.py PBBLNFMT pbbdpfmt3"
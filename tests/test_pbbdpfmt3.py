@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import importlib
+
+import pandas as pd
+
+import pbbdpfmt3
+
+
+def test_ddcustcd_array_matches_ddcustcd():
+    values = pd.Series(["01", "02", "77", None, "13", " 41", "xx", 41, 41.0], dtype=object)
+    assert list(pbbdpfmt3.ddcustcd_array(values)) == [pbbdpfmt3.ddcustcd(value) for value in values]
+
+
+def test_eiimrptc_combine_imports_the_array_format():
+    combine = importlib.import_module("EIIMRPTC_COMBINE")
+    assert combine.ddcustcd_array is pbbdpfmt3.ddcustcd_array
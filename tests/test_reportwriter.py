@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from reportwriter import ddmmyy, money, text, whole, write_report
+
+
+def test_report_lines_render_each_column_like_its_f_string(tmp_path):
+    frame = pd.DataFrame({
+        "REPTDATE": pd.to_datetime(["2024-05-31", "2024-06-01"]),
+        "CURCODE": ["USD", "SGD"],
+        "CURBAL": [1234567.891, -0.5],
+        "NO_OF_ACCT": [3, 12],
+    })
+    path = tmp_path / "report.txt"
+    columns = [("REPTDATE", ddmmyy), ("CURCODE", text), ("CURBAL", money), ("NO_OF_ACCT", whole)]
+    assert write_report(str(path), ["HEADER"], frame, columns, chunk_rows=1) == 2
+    assert path.read_text().splitlines() == [
+        "HEADER",
+        "31/05/2024;USD;1,234,567.89;3",
+        "01/06/2024;SGD;-0.50;12",
+    ]
+
+
+def test_a_missing_date_raises_instead_of_going_blank():
+    dates = pd.Series(pd.to_datetime(["2024-05-31", None]), index=[7, 8], name="OPENDT")
+    with pytest.raises(ValueError, match=r"OPENDT: missing date \(row 8\)"):
+        ddmmyy(dates)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from sasbatch import SASBatch
+from saswriter import Column
+
+COLUMNS = [Column("CARDNO", "char", 20), Column("TRNXAMT", "num")]
+
+
+class RecordingSession:
+    """Stands in for a saspy session: df2sd records the frame and creates the file."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.frames = {}
+
+    def submit(self, code):
+        return {"LOG": ""}
+
+    def df2sd(self, frame, table, libref, char_lengths, outfmts):
+        self.frames[table] = frame
+        (self.directory / f"{table.lower()}.sas7bdat").touch()
+
+
+def test_saspy_backend_writes_an_empty_stream(tmp_path):
+    batch = SASBatch("saspy")
+    batch._session = session = RecordingSession(tmp_path)
+    batch.dataset("OUT", tmp_path, "ATM_CASH202609", iter([]), columns=COLUMNS)
+
+    [timing] = batch.run()
+
+    assert timing.rows == 0
+    frame = session.frames["ATM_CASH202609"]
+    assert list(frame.columns) == ["CARDNO", "TRNXAMT"]
+    assert frame.empty
+
+
+def test_native_backend_writes_an_empty_stream(tmp_path):
+    batch = SASBatch("native")
+    path = batch.dataset("OUT", tmp_path, "ATM_CASH202609", iter([]), columns=COLUMNS)
+
+    [timing] = batch.run()
+
+    assert timing.rows == 0
+    frame = pd.read_sas(path, encoding="latin1")
+    assert list(frame.columns) == ["CARDNO", "TRNXAMT"]
+    assert frame.empty
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sasio
+from saswriter import write_dataset
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def sas_file(tmp_path):
+    frame = pd.DataFrame({
+        "acctno": [101.0, 102.0, 103.0],
+        "borstat": ["A", None, "W"],
+        "name": ["ALI BIN ABU", "SITI", ""],
+        "opendt": pd.to_datetime(["2024-01-31", None, "2025-06-30"]),
+    })
+    path = tmp_path / "loan.sas7bdat"
+    write_dataset(path, frame, formats={"opendt": "DATE9."})
+    return path
+
+
+@pytest.mark.parametrize("columns", [None, ["BORSTAT", "OPENDT"]])
+def test_cache_hit_equals_miss(sas_file, tmp_path, monkeypatch, columns):
+    monkeypatch.setenv(sasio.CACHE_DIR_VARIABLE, str(tmp_path / "cache"))
+
+    miss = sasio.read_sas(sas_file, columns=columns)
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+    hit = sasio.read_sas(sas_file, columns=columns)
+
+    pd.testing.assert_frame_equal(hit, miss)
+    assert hit.dtypes.equals(miss.dtypes)
+
+
+def test_chunked_hit_equals_uncached_chunks(sas_file, tmp_path, monkeypatch):
+    uncached = pd.concat(sasio.read_sas(sas_file, chunksize=2, use_cache=False), ignore_index=True)
+    monkeypatch.setenv(sasio.CACHE_DIR_VARIABLE, str(tmp_path / "cache"))
+    sasio.read_sas(sas_file)
+
+    hit = pd.concat(sasio.read_sas(sas_file, chunksize=2), ignore_index=True)
+
+    pd.testing.assert_frame_equal(hit, uncached)
+
+
+def test_store_leaves_no_temporary_files(tmp_path):
+    cache = sasio.ColumnarCache(tmp_path, 1 << 30)
+    cache.store("key", pd.DataFrame({"A": np.arange(3)}))
+    cache.store("key", pd.DataFrame({"A": np.arange(4)}))
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ["key.parquet"]
+    assert len(cache.load("key", None)) == 4
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from saswriter import HEADER_SIZE, SAS7BDATWriter, columns_for, write_dataset
+
+
+def test_wide_dataset_round_trips_with_metadata_on_several_pages(tmp_path, capsys):
+    frame = pd.DataFrame({f"C{index:04d}": np.arange(3, dtype="float64") + index for index in range(2100)})
+    frame["TEXT"] = ["A", "BB", "CCC"]
+    columns = columns_for(frame, labels={"C0000": "FIRST", "C2099": "LAST"}, formats={"C2099": "DATE9."})
+    assert len(SAS7BDATWriter(tmp_path / "probe.sas7bdat", columns)._meta(0)) > 2
+
+    path = write_dataset(tmp_path / "wide.sas7bdat", frame, columns=columns)
+    with pd.read_sas(path, format="sas7bdat", iterator=True, encoding="latin1") as reader:
+        described = reader.columns
+        back = reader.read()
+
+    assert "mismatch" not in capsys.readouterr().out
+    assert [column.name for column in described] == list(frame.columns)
+    assert (described[0].label, described[2099].label, described[2099].format) == ("FIRST", "LAST", "DATE")
+    numbers = list(frame.columns[:2099])
+    pd.testing.assert_frame_equal(back[numbers], frame[numbers])
+    assert list(back["C2099"]) == list(pd.Timestamp("1960-01-01") + pd.to_timedelta(frame["C2099"], unit="D"))
+    assert list(back["TEXT"]) == ["A", "BB", "CCC"]
+
+
+def test_missing_numbers_are_written_as_sas_system_missing(tmp_path):
+    frame = pd.DataFrame({"AMOUNT": [1.5, np.nan, 3.0], "OPENED": pd.to_datetime(["2024-01-31", None, "2024-03-01"])})
+    path = write_dataset(tmp_path / "missing.sas7bdat", frame, formats={"OPENED": "DATE9."})
+    writer = SAS7BDATWriter(tmp_path / "probe.sas7bdat", columns_for(frame, formats={"OPENED": "DATE9."}))
+    writer.abort()
+    data = path.read_bytes()[HEADER_SIZE + writer._meta_pages * writer.page_size:]
+    rows = np.frombuffer(data[40:40 + 3 * writer.row_length], dtype="<u8").reshape(3, 2)
+    assert rows[1].tolist() == [0xFFFFFE0000000000] * 2
+    assert not np.isnan(rows[[0, 2]].view("<f8")).any()
+
+    back = pd.read_sas(path, format="sas7bdat")
+    assert back["AMOUNT"].isna().tolist() == [False, True, False]
+    assert back["OPENED"].isna().tolist() == [False, True, False]
+    assert frame["AMOUNT"].to_numpy().view("<u8")[1] != 0xFFFFFE0000000000